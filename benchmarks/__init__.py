@@ -0,0 +1 @@
+"""Microbenchmarks and regression checks for the uplink hot path."""
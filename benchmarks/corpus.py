@@ -0,0 +1,54 @@
+"""Deterministic packet corpus shared by the benchmark cases."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+
+CORPUS_SEED = 1729
+CORPUS_SIZE = 256
+CORPUS_KEY = b"benchmark-hmac-key"
+CORPUS_TIMESTAMP = datetime(2024, 1, 1, tzinfo=UTC)
+GROUND_STATION = "GS-ALPHA"
+VERBS = ("PING", "STATUS", "ORIENT", "THRUST", "DOWNLINK", "RESET_COMPUTER")
+
+
+@dataclass(frozen=True)
+class Corpus:
+    """Commands and packets for every benchmarked firewall path."""
+
+    commands: tuple[str, ...]
+    valid: tuple[bytes, ...]
+    spoofed: tuple[bytes, ...]
+    malformed: tuple[bytes, ...]
+
+
+def build_corpus(size: int = CORPUS_SIZE, seed: int = CORPUS_SEED) -> Corpus:
+    """
+    Return the same corpus for the same ``size`` and ``seed`` on every run.
+
+    Valid packets are signed with ``CORPUS_KEY`` at ``CORPUS_TIMESTAMP``; spoofed
+    packets carry the same headers signed with another key; malformed packets are
+    truncated valid packets and random byte strings.
+    """
+    rng = random.Random(seed)  # noqa: S311 - reproducible corpus, not cryptography
+    commands = tuple(f"CMD: {rng.choice(VERBS)} {rng.randint(-180, 180):+d}" for _ in range(size))
+    builder = CCSDSPacketBuilder(CORPUS_KEY)
+    rogue = CCSDSPacketBuilder(b"rogue-" + CORPUS_KEY)
+    valid = tuple(
+        builder.build(command, GROUND_STATION, timestamp=CORPUS_TIMESTAMP) for command in commands
+    )
+    spoofed = tuple(
+        rogue.build(command, GROUND_STATION, timestamp=CORPUS_TIMESTAMP) for command in commands
+    )
+    malformed = tuple(
+        packet[: rng.randint(1, len(packet) - 1)] if index % 2 else rng.randbytes(len(packet))
+        for index, packet in enumerate(valid)
+    )
+    return Corpus(commands, valid, spoofed, malformed)
+
+
+__all__ = ["CORPUS_KEY", "CORPUS_SEED", "CORPUS_SIZE", "GROUND_STATION", "Corpus", "build_corpus"]
@@ -0,0 +1,255 @@
+"""Run the hot-path microbenchmarks and compare them with a stored baseline."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from benchmarks.corpus import CORPUS_KEY, CORPUS_TIMESTAMP, GROUND_STATION, Corpus, build_corpus
+from ccsds.packet_builder import CCSDSPacketBuilder
+from ccsds.packet_parser import CCSDSPacketParser
+from crypto.hmac_signer import HMACSigner
+from crypto.keyring import Keyring
+from crypto.verifier import HMACVerifier
+from satellite.firewall import SatelliteFirewall
+from satellite.telemetry import NullTelemetry, TelemetryLogger
+from telemetry_store.writer import TelemetryStoreWriter
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.2
+KEYRING_STATIONS = 1024
+
+# Each case processes a whole pass over its inputs and returns the operation count.
+Case = Callable[[], int]
+
+# Interpreter arguments for the startup cases; each launch counts as one operation, so
+# these report launches per second and catch heavy imports creeping into entry points.
+STARTUP_COMMANDS: dict[str, tuple[str, ...]] = {
+    "startup_satcli_help": ("-m", "cli.satcli", "--help"),
+    "startup_ground_station": ("-c", "import ground.ground_station"),
+    "startup_rogue_transmitter": ("-c", "import attacker.rogue_transmitter"),
+    "startup_satellite_bus": ("-c", "import satellite.satellite_bus"),
+}
+
+
+def launch(arguments: tuple[str, ...]) -> Case:
+    """Return a case that starts a fresh interpreter with ``arguments`` from the repo root."""
+    command = [sys.executable, *arguments]
+
+    def run() -> int:
+        subprocess.run(command, cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL)  # noqa: S603
+        return 1
+
+    return run
+
+
+def build_cases(corpus: Corpus, workdir: Path) -> dict[str, Case]:
+    """Return the benchmark cases keyed by name, bound to ``corpus``."""
+    builder = CCSDSPacketBuilder(CORPUS_KEY)
+    parser = CCSDSPacketParser()
+    signer = HMACSigner(CORPUS_KEY)
+    verifier = HMACVerifier(CORPUS_KEY)
+    # Replay checks and rate limiting are stateful across passes, so the firewall cases
+    # measure parsing, allow-listing and HMAC only; telemetry is benchmarked separately.
+    firewall = SatelliteFirewall(CORPUS_KEY, [GROUND_STATION], NullTelemetry())
+    keyed_firewall = SatelliteFirewall(
+        b"unused", [GROUND_STATION], NullTelemetry(), keyring=build_keyring(workdir)
+    )
+    telemetry = TelemetryLogger(str(workdir / "bench_telemetry.log"), console=False)
+    store = TelemetryStoreWriter(workdir / "bench_store", compress=False)
+    unsigned = [packet[:-32] for packet in corpus.valid]
+    signed = [(packet[:-32], packet[-32:]) for packet in corpus.valid]
+
+    def build() -> int:
+        for command in corpus.commands:
+            builder.build(command, GROUND_STATION)
+        return len(corpus.commands)
+
+    def parse() -> int:
+        for packet in corpus.valid:
+            parser.parse(packet)
+        return len(corpus.valid)
+
+    def sign() -> int:
+        for message in unsigned:
+            signer.sign(message)
+        return len(unsigned)
+
+    def verify() -> int:
+        for message, signature in signed:
+            verifier.verify(message, signature)
+        return len(signed)
+
+    def inspect(packets: tuple[bytes, ...], target: SatelliteFirewall = firewall) -> Case:
+        def run() -> int:
+            for packet in packets:
+                target.inspect(packet, "10.0.0.1")
+            return len(packets)
+
+        return run
+
+    def emit() -> int:
+        for index in range(len(corpus.commands)):
+            telemetry.info("Benchmark event", index=index, ground_station_id=GROUND_STATION)
+        return len(corpus.commands)
+
+    def store_append() -> int:
+        for index in range(len(corpus.commands)):
+            store.append(
+                logging.INFO,
+                CORPUS_TIMESTAMP.timestamp() + index,
+                "Benchmark event",
+                {"index": index, "source_ip": "10.0.0.1", "ground_station_id": GROUND_STATION},
+            )
+        return len(corpus.commands)
+
+    return {
+        "packet_build": build,
+        "packet_parse": parse,
+        "hmac_sign": sign,
+        "hmac_verify": verify,
+        "firewall_inspect_accept": inspect(corpus.valid),
+        "firewall_inspect_spoof": inspect(corpus.spoofed),
+        "firewall_inspect_malformed": inspect(corpus.malformed),
+        "firewall_inspect_keyring": inspect(corpus.valid, keyed_firewall),
+        "telemetry_emit": emit,
+        "telemetry_store_append": store_append,
+        **{name: launch(arguments) for name, arguments in STARTUP_COMMANDS.items()},
+    }
+
+
+def build_keyring(workdir: Path) -> Keyring:
+    """Write a keyring of ``KEYRING_STATIONS`` stations, including the corpus one, and load it."""
+    stations = {
+        f"GS-{index:04d}": {"key_id": "k1", "key": f"key-{index}"}
+        for index in range(KEYRING_STATIONS - 1)
+    }
+    stations[GROUND_STATION] = {"key_id": "k1", "key_hex": CORPUS_KEY.hex()}
+    path = workdir / "bench_keyring.json"
+    path.write_text(json.dumps({"ground_stations": stations}), encoding="utf-8")
+    return Keyring(path)
+
+
+def measure(
+    case: Case, *, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME
+) -> float:
+    """Return the best operations per second of ``repeat`` runs lasting ``min_time`` each."""
+    case()  # warm caches before timing
+    best = 0.0
+    for _ in range(repeat):
+        operations = 0
+        started = time.perf_counter()
+        while True:
+            operations += case()
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        best = max(best, operations / elapsed)
+    return best
+
+
+def run_benchmarks(
+    names: Iterable[str] | None = None,
+    *,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> dict[str, float]:
+    """Run the selected cases (all by default) and return ops/sec keyed by case name."""
+    with tempfile.TemporaryDirectory(prefix="lsucis-bench-") as workdir:
+        cases = build_cases(build_corpus(), Path(workdir))
+        selected = list(names) if names else list(cases)
+        unknown = sorted(set(selected) - set(cases))
+        if unknown:
+            raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+        return {name: measure(cases[name], repeat=repeat, min_time=min_time) for name in selected}
+
+
+def find_regressions(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """Return a message for every case whose ops/sec fell more than ``threshold`` below baseline."""
+    regressions = []
+    for name, ops in results.items():
+        expected = baseline.get(name)
+        if expected and ops < expected * (1.0 - threshold):
+            regressions.append(
+                f"{name}: {ops:,.0f} ops/s is {1.0 - ops / expected:.0%} below "
+                f"baseline {expected:,.0f} ops/s"
+            )
+    return regressions
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    """Return the stored ops/sec per case, or an empty mapping if no baseline exists."""
+    if not path.exists():
+        return {}
+    data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    return {name: float(ops) for name, ops in data.get("results", {}).items()}
+
+
+def save_baseline(path: Path, results: dict[str, float]) -> None:
+    """Write ``results`` to ``path`` with the interpreter and machine they came from."""
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {name: round(ops, 1) for name, ops in sorted(results.items())},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def parse_args() -> argparse.Namespace:
+    """Return parsed CLI arguments for the benchmark runner."""
+    parser = argparse.ArgumentParser(description="Run the uplink hot-path microbenchmarks")
+    parser.add_argument("names", nargs="*", help="Benchmarks to run (default: all)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Fail when ops/sec drops more than this fraction below the baseline",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per case")
+    parser.add_argument(
+        "--min-time", type=float, default=DEFAULT_MIN_TIME, help="Minimum seconds per timed run"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store these results as the new baseline instead of comparing",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmarks, report ops/sec, and return 1 if any case regressed."""
+    args = parse_args()
+    results = run_benchmarks(args.names, repeat=args.repeat, min_time=args.min_time)
+    baseline = load_baseline(args.baseline)
+    for name, ops in results.items():
+        expected = baseline.get(name)
+        change = f"{ops / expected - 1.0:+.1%}" if expected else "no baseline"
+        sys.stdout.write(f"{name:<28} {ops:>14,.0f} ops/s  ({change})\n")
+    if args.update_baseline:
+        save_baseline(args.baseline, {**baseline, **results})
+        sys.stdout.write(f"Baseline written to {args.baseline}\n")
+        return 0
+    regressions = find_regressions(results, baseline, args.threshold)
+    for message in regressions:
+        sys.stderr.write(f"REGRESSION {message}\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
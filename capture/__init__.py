@@ -0,0 +1 @@
+"""Append-only binary capture files for recorded uplink traffic."""
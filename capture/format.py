@@ -0,0 +1,51 @@
+"""
+On-disk layout shared by the capture writer and reader.
+
+A capture is a data file plus a sidecar ``.idx`` index. The data file starts with
+``DATA_MAGIC`` followed by length-prefixed records; each record is a fixed
+``RECORD_HEADER`` followed by the source address, the firewall reason, and the raw
+datagram. The index starts with ``INDEX_MAGIC`` followed by fixed-width
+``(offset, received_at)`` entries, one per record, in append order.
+"""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import NamedTuple
+
+DATA_MAGIC = b"LSUCAP01"
+INDEX_MAGIC = b"LSUIDX01"
+INDEX_SUFFIX = ".idx"
+
+# payload length, received_at, source port, accepted, address length, reason length
+RECORD_HEADER = struct.Struct(">IdHBBH")
+INDEX_ENTRY = struct.Struct(">Qd")
+
+
+class CaptureRecord(NamedTuple):
+    """One recorded datagram with its receive metadata and firewall decision."""
+
+    received_at: float
+    source_ip: str
+    source_port: int
+    accepted: bool
+    reason: str
+    packet: bytes
+
+
+def index_path(path: str | Path) -> Path:
+    """Return the sidecar index path for the capture at ``path``."""
+    path = Path(path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+__all__ = [
+    "DATA_MAGIC",
+    "INDEX_ENTRY",
+    "INDEX_MAGIC",
+    "INDEX_SUFFIX",
+    "RECORD_HEADER",
+    "CaptureRecord",
+    "index_path",
+]
@@ -0,0 +1,198 @@
+"""Memory-mapped reader for capture files with time-range seeking."""
+
+from __future__ import annotations
+
+import bisect
+import mmap
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+
+from capture.format import (
+    DATA_MAGIC,
+    INDEX_ENTRY,
+    INDEX_MAGIC,
+    RECORD_HEADER,
+    CaptureRecord,
+    index_path,
+)
+
+
+class CaptureFormatError(Exception):
+    """Raised when a capture or index file is not in the expected format."""
+
+
+class _IndexTimes:
+    """Sequence view of the receive times stored in a mapped index, for ``bisect``."""
+
+    def __init__(self, index: mmap.mmap | bytes, count: int) -> None:
+        """Wrap ``count`` index entries following the index magic."""
+        self._index = index
+        self._count = count
+
+    def __len__(self) -> int:
+        """Return the number of index entries."""
+        return self._count
+
+    def __getitem__(self, position: int) -> float:
+        """Return the receive time of entry ``position``."""
+        offset = len(INDEX_MAGIC) + position * INDEX_ENTRY.size
+        _, received_at = INDEX_ENTRY.unpack_from(self._index, offset)
+        return float(received_at)
+
+    def __iter__(self) -> Iterator[float]:
+        """Yield the receive times in index order."""
+        return (self[position] for position in range(self._count))
+
+
+class CaptureReader:
+    """
+    Iterate or seek a capture without loading it into memory.
+
+    The data file and index are memory-mapped; records are decoded one at a time.
+    Index entries whose record is missing or incomplete in the data file (for example
+    after a crash between the two buffered writes) are ignored. Receive times come
+    from the wall clock, which can step backwards; if the index is not in time order,
+    range queries scan it linearly instead of bisecting.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Map the capture at ``path`` and its sidecar index, if present."""
+        self.path = Path(path)
+        self._data = self._map(self.path, DATA_MAGIC)
+        index_file = index_path(self.path)
+        self._index = self._map(index_file, INDEX_MAGIC) if index_file.exists() else b""
+        self._end = len(self._data)
+        entries = max(0, len(self._index) - len(INDEX_MAGIC)) // INDEX_ENTRY.size
+        while entries and self._read(self._entry_offset(entries - 1))[0] is None:
+            entries -= 1
+        self._times = _IndexTimes(self._index, entries)
+        self._sorted = self._index_sorted(entries)
+
+    def __enter__(self) -> CaptureReader:
+        """Return the reader for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Unmap the capture files when leaving the context."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of indexed records."""
+        return len(self._times)
+
+    def __iter__(self) -> Iterator[CaptureRecord]:
+        """Yield every complete record in file order, independent of the index."""
+        offset = len(DATA_MAGIC)
+        while True:
+            record, offset = self._read(offset)
+            if record is None:
+                return
+            yield record
+
+    def between(self, start: float, end: float) -> Iterator[CaptureRecord]:
+        """Yield records with ``start <= received_at < end`` in file order using the index."""
+        if not self._sorted:
+            for position, received_at in enumerate(self._times):
+                if start <= received_at < end:
+                    record, _ = self._read(self._entry_offset(position))
+                    if record is None:
+                        return
+                    yield record
+            return
+        position = bisect.bisect_left(self._times, start)
+        while position < len(self._times) and self._times[position] < end:
+            record, _ = self._read(self._entry_offset(position))
+            if record is None:
+                return
+            yield record
+            position += 1
+
+    def time_range(self) -> tuple[float, float] | None:
+        """Return the earliest and latest indexed receive times, or ``None`` if empty."""
+        if not self._times:
+            return None
+        if not self._sorted:
+            return min(self._times), max(self._times)
+        return self._times[0], self._times[len(self._times) - 1]
+
+    def close(self) -> None:
+        """Unmap the data and index files."""
+        for mapping in (self._data, self._index):
+            if isinstance(mapping, mmap.mmap):
+                mapping.close()
+
+    def _entry_offset(self, position: int) -> int:
+        """Return the data-file offset stored in index entry ``position``."""
+        offset, _ = INDEX_ENTRY.unpack_from(
+            self._index, len(INDEX_MAGIC) + position * INDEX_ENTRY.size
+        )
+        return int(offset)
+
+    def _read(self, offset: int) -> tuple[CaptureRecord | None, int]:
+        """Decode the record at ``offset``; return ``None`` for a truncated tail record."""
+        if offset + RECORD_HEADER.size > self._end:
+            return None, self._end
+        payload_length, received_at, port, accepted, address_length, reason_length = (
+            RECORD_HEADER.unpack_from(self._data, offset)
+        )
+        address_start = offset + RECORD_HEADER.size
+        reason_start = address_start + address_length
+        payload_start = reason_start + reason_length
+        record_end = payload_start + payload_length
+        if record_end > self._end:
+            return None, self._end
+        try:
+            source_ip = self._data[address_start:reason_start].decode("ascii")
+            reason = self._data[reason_start:payload_start].decode("utf-8")
+        except UnicodeDecodeError:
+            raise CaptureFormatError(
+                f"{self.path} has a corrupt record at offset {offset}"
+            ) from None
+        record = CaptureRecord(
+            received_at=received_at,
+            source_ip=source_ip,
+            source_port=port,
+            accepted=bool(accepted),
+            reason=reason,
+            packet=self._data[payload_start:record_end],
+        )
+        return record, record_end
+
+    def _index_sorted(self, entries: int) -> bool:
+        """
+        Return whether the first ``entries`` index times never decrease.
+
+        The check runs once per open as one vectorised pass over the mapped index, so
+        range queries know whether they may bisect. NumPy is imported on first use.
+        """
+        if entries < 2:
+            return True
+        import numpy as np
+
+        layout = np.dtype([("offset", ">u8"), ("received_at", ">f8")])
+        times = np.frombuffer(self._index, dtype=layout, offset=len(INDEX_MAGIC), count=entries)
+        received_at = times["received_at"]
+        return bool(np.all(received_at[1:] >= received_at[:-1]))
+
+    @staticmethod
+    def _map(path: Path, magic: bytes) -> mmap.mmap | bytes:
+        """Memory-map ``path`` read-only after checking its magic header."""
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size == 0:
+                return b""
+            mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapping[: len(magic)] != magic:
+            mapping.close()
+            raise CaptureFormatError(f"{path} is not a capture file of the expected format")
+        return mapping
+
+
+__all__ = ["CaptureFormatError", "CaptureReader"]
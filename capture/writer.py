@@ -0,0 +1,87 @@
+"""Buffered, append-only writer for capture files and their time index."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+
+from capture.format import DATA_MAGIC, INDEX_ENTRY, INDEX_MAGIC, RECORD_HEADER, index_path
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+
+class CaptureWriter:
+    """
+    Append datagrams and firewall decisions to a capture file.
+
+    Existing captures are extended rather than truncated. Writes go through large
+    buffers; call :meth:`flush` or :meth:`close` to make them durable. Appends are
+    serialised by a lock, so the async bus's consumer threads may share one writer.
+    """
+
+    def __init__(self, path: str | Path, *, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """Open (or create) the data file and its sidecar index for appending."""
+        self.path = Path(path)
+        self._data = open(self.path, "ab", buffering=buffer_size)
+        self._index = open(index_path(self.path), "ab", buffering=buffer_size)
+        if self._data.tell() == 0:
+            self._data.write(DATA_MAGIC)
+        if self._index.tell() == 0:
+            self._index.write(INDEX_MAGIC)
+        self._offset = self._data.tell()
+        self._lock = threading.Lock()
+        self.records = 0
+
+    def __enter__(self) -> CaptureWriter:
+        """Return the writer for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Flush and close both files when leaving the context."""
+        self.close()
+
+    def append(
+        self,
+        packet: bytes,
+        source_ip: str,
+        source_port: int,
+        accepted: bool,
+        reason: str,
+        received_at: float | None = None,
+    ) -> None:
+        """Append one datagram record and its index entry."""
+        received_at = time.time() if received_at is None else received_at
+        address = source_ip.encode("ascii")
+        reason_bytes = reason.encode("utf-8")
+        header = RECORD_HEADER.pack(
+            len(packet), received_at, source_port, accepted, len(address), len(reason_bytes)
+        )
+        record = b"".join((header, address, reason_bytes, packet))
+        with self._lock:
+            self._data.write(record)
+            self._index.write(INDEX_ENTRY.pack(self._offset, received_at))
+            self._offset += len(record)
+            self.records += 1
+
+    def flush(self) -> None:
+        """Flush buffered records and index entries to the operating system."""
+        with self._lock:
+            self._data.flush()
+            self._index.flush()
+
+    def close(self) -> None:
+        """Flush and close the capture files."""
+        with self._lock:
+            if not self._data.closed:
+                self._data.close()
+                self._index.close()
+
+
+__all__ = ["CaptureWriter", "DEFAULT_BUFFER_SIZE"]
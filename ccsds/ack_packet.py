@@ -0,0 +1,159 @@
+"""
+Signed CCSDS telemetry (packet type 0) packets acknowledging uplinked commands.
+
+An acknowledgement is one stand-alone space packet on its own APID, addressed to one
+ground station. The secondary header holds the creation time, the ground station
+identifier length and the number of entries, followed by the identifier. Each entry
+is a fixed ``ENTRY_HEADER`` (command sequence count, status, command tag, reason
+length) and the UTF-8 rejection reason. The packet ends with an HMAC-SHA256 over
+everything before it, made with the ground station's own command key.
+
+The command tag is the first ``TAG_LENGTH`` bytes of the acknowledged command's HMAC,
+so an entry only matches the exact packet the ground station signed, not an older
+command that reused the same sequence count.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import ByteString, Sequence
+from typing import NamedTuple
+
+from ccsds.packet_parser import (
+    PRIMARY_HEADER_LENGTH,
+    SEQUENCE_STANDALONE,
+    PacketValidationError,
+)
+from crypto.constants import HMAC_DIGEST_LENGTH
+from crypto.hmac_signer import HMACSigner
+from crypto.verifier import HMACVerifier
+
+DEFAULT_ACK_APID = 201
+TAG_LENGTH = 8
+MAX_ENTRIES_PER_ACK = 0xFF
+MAX_REASON_BYTES = 0xFF
+
+STATUS_ACCEPTED = 0
+STATUS_REJECTED = 1
+
+_PRIMARY_HEADER = struct.Struct(">HHH")
+# created, ground station id length, entry count
+ACK_HEADER = struct.Struct(">dBB")
+# sequence count, status, command tag, reason length
+ENTRY_HEADER = struct.Struct(f">HB{TAG_LENGTH}sB")
+
+
+class AckEntry(NamedTuple):
+    """The bus's verdict on one command."""
+
+    sequence_count: int
+    accepted: bool
+    tag: bytes
+    reason: str = ""
+
+
+class CommandAck(NamedTuple):
+    """A decoded and authenticated acknowledgement packet."""
+
+    apid: int
+    sequence_count: int
+    created: float
+    ground_station_id: str
+    entries: list[AckEntry]
+
+
+def command_tag(signature: ByteString) -> bytes:
+    """Return the tag that identifies a command by the leading bytes of its HMAC."""
+    return bytes(memoryview(signature)[:TAG_LENGTH])
+
+
+def build_ack(
+    entries: Sequence[AckEntry],
+    ground_station_id: str,
+    sequence_count: int,
+    created: float,
+    signer: HMACSigner,
+    apid: int = DEFAULT_ACK_APID,
+) -> bytes:
+    """Encode and sign an acknowledgement of ``entries`` for ``ground_station_id``."""
+    if not 0 < len(entries) <= MAX_ENTRIES_PER_ACK:
+        raise ValueError(f"An acknowledgement holds between 1 and {MAX_ENTRIES_PER_ACK} entries")
+    station = ground_station_id.encode("utf-8")
+    parts = [ACK_HEADER.pack(created, len(station), len(entries)), station]
+    for entry in entries:
+        reason = entry.reason.encode("utf-8")[:MAX_REASON_BYTES]
+        reason = reason.decode("utf-8", errors="ignore").encode("utf-8")
+        status = STATUS_ACCEPTED if entry.accepted else STATUS_REJECTED
+        parts.append(
+            ENTRY_HEADER.pack(entry.sequence_count & 0x3FFF, status, entry.tag, len(reason))
+        )
+        parts.append(reason)
+    data = b"".join(parts)
+    first_word = 1 << 11 | (apid & 0x7FF)  # version 0, telemetry type, secondary header
+    header = _PRIMARY_HEADER.pack(
+        first_word,
+        SEQUENCE_STANDALONE << 14 | (sequence_count & 0x3FFF),
+        len(data) + HMAC_DIGEST_LENGTH - 1,
+    )
+    unsigned = header + data
+    return unsigned + signer.sign(unsigned)
+
+
+def decode_ack(packet: ByteString, verifier: HMACVerifier) -> CommandAck:
+    """
+    Authenticate and decode an acknowledgement.
+
+    Raises :class:`PacketValidationError` if the packet is malformed or its HMAC does
+    not verify under ``verifier``; the signature is checked before any field is read.
+    """
+    view = memoryview(packet)
+    minimum = PRIMARY_HEADER_LENGTH + ACK_HEADER.size + HMAC_DIGEST_LENGTH
+    if len(view) < minimum:
+        raise PacketValidationError("Packet too short to contain an acknowledgement")
+    first_word, second_word, packet_length = _PRIMARY_HEADER.unpack_from(view)
+    if first_word >> 11 != 1 or second_word >> 14 != SEQUENCE_STANDALONE:
+        raise PacketValidationError("Not a stand-alone CCSDS telemetry packet")
+    if packet_length + 1 + PRIMARY_HEADER_LENGTH != len(view):
+        raise PacketValidationError("Packet length mismatch")
+    data_end = len(view) - HMAC_DIGEST_LENGTH
+    if not verifier.verify(view[:data_end], view[data_end:]):
+        raise PacketValidationError("Acknowledgement HMAC verification failed")
+    created, station_length, count = ACK_HEADER.unpack_from(view, PRIMARY_HEADER_LENGTH)
+    offset = PRIMARY_HEADER_LENGTH + ACK_HEADER.size + station_length
+    if offset > data_end:
+        raise PacketValidationError("Acknowledgement ground station identifier truncated")
+    try:
+        station = bytes(view[offset - station_length : offset]).decode("utf-8")
+        entries = []
+        for _ in range(count):
+            if offset + ENTRY_HEADER.size > data_end:
+                raise PacketValidationError("Acknowledgement entry header truncated")
+            sequence, status, tag, reason_length = ENTRY_HEADER.unpack_from(view, offset)
+            reason_start = offset + ENTRY_HEADER.size
+            offset = reason_start + reason_length
+            if offset > data_end:
+                raise PacketValidationError("Acknowledgement entry truncated")
+            reason = bytes(view[reason_start:offset]).decode("utf-8")
+            entries.append(AckEntry(sequence, status == STATUS_ACCEPTED, tag, reason))
+    except UnicodeDecodeError as exc:
+        raise PacketValidationError(f"Acknowledgement is not decodable: {exc}") from exc
+    if offset != data_end:
+        raise PacketValidationError("Trailing bytes after the last acknowledgement entry")
+    return CommandAck(first_word & 0x7FF, second_word & 0x3FFF, created, station, entries)
+
+
+__all__ = [
+    "ACK_HEADER",
+    "DEFAULT_ACK_APID",
+    "ENTRY_HEADER",
+    "MAX_ENTRIES_PER_ACK",
+    "MAX_REASON_BYTES",
+    "STATUS_ACCEPTED",
+    "STATUS_REJECTED",
+    "TAG_LENGTH",
+    "AckEntry",
+    "CommandAck",
+    "build_ack",
+    "command_tag",
+    "decode_ack",
+]
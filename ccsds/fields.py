@@ -0,0 +1,74 @@
+"""
+CCSDS command packet field layouts shared by the builder and parser.
+
+The layouts are plain ``(name, data_type, bit_length)`` tuples. The ``ccsdspy``
+``PacketField`` lists (``PRIMARY_HEADER_FIELDS`` and friends) are built from them on
+first attribute access, so importing the packet modules never loads ccsdspy or numpy.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ccsdspy import PacketField
+
+FieldSpec = tuple[str, str, int]
+
+PRIMARY_HEADER_LAYOUT: tuple[FieldSpec, ...] = (
+    ("CCSDS_VERSION_NUMBER", "uint", 3),
+    ("CCSDS_PACKET_TYPE", "uint", 1),
+    ("CCSDS_SECONDARY_FLAG", "uint", 1),
+    ("CCSDS_APID", "uint", 11),
+    ("CCSDS_SEQUENCE_FLAG", "uint", 2),
+    ("CCSDS_SEQUENCE_COUNT", "uint", 14),
+    ("CCSDS_PACKET_LENGTH", "uint", 16),
+)
+
+SECONDARY_HEADER_LAYOUT: tuple[FieldSpec, ...] = (
+    ("TIMESTAMP", "uint", 64),
+    ("GROUND_STATION_ID_LENGTH", "uint", 16),
+)
+
+PAYLOAD_LAYOUT: tuple[FieldSpec, ...] = (("COMMAND_LENGTH", "uint", 16),)
+
+FIELD_LISTS: dict[str, tuple[FieldSpec, ...]] = {
+    "PRIMARY_HEADER_FIELDS": PRIMARY_HEADER_LAYOUT,
+    "SECONDARY_HEADER_FIELDS": SECONDARY_HEADER_LAYOUT,
+    "PAYLOAD_FIELDS": PAYLOAD_LAYOUT,
+}
+
+_built: dict[str, list[PacketField]] = {}
+
+
+def packet_fields(layout: tuple[FieldSpec, ...]) -> list[PacketField]:
+    """Return ``ccsdspy`` field definitions for ``layout``, importing ccsdspy on demand."""
+    from ccsdspy import PacketField
+
+    return [PacketField(name, data_type, bit_length) for name, data_type, bit_length in layout]
+
+
+def field_list(name: str) -> list[PacketField]:
+    """Return the cached ``ccsdspy`` list for a ``FIELD_LISTS`` name, building it once."""
+    fields = _built.get(name)
+    if fields is None:
+        fields = _built[name] = packet_fields(FIELD_LISTS[name])
+    return fields
+
+
+def __getattr__(name: str) -> list[PacketField]:
+    """Resolve ``PRIMARY_HEADER_FIELDS`` and friends on first access (PEP 562)."""
+    if name in FIELD_LISTS:
+        return field_list(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "FIELD_LISTS",
+    "PAYLOAD_LAYOUT",
+    "PRIMARY_HEADER_LAYOUT",
+    "SECONDARY_HEADER_LAYOUT",
+    "FieldSpec",
+    "field_list",
+    "packet_fields",
+]
@@ -1,34 +1,33 @@
-"""CCSDS command packet generation using ccsdspy field definitions."""
+"""CCSDS command packet generation matching the ccsds.fields layouts."""
 
 from __future__ import annotations
 
 import struct
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
-from ccsdspy import PacketField
-
+from ccsds.fields import FIELD_LISTS, field_list
+from ccsds.packet_parser import (
+    PRIMARY_HEADER_LENGTH,
+    SECONDARY_HEADER_LENGTH,
+    SEQUENCE_CONTINUATION,
+    SEQUENCE_FIRST,
+    SEQUENCE_LAST,
+    SEQUENCE_STANDALONE,
+)
 from crypto.constants import HMAC_DIGEST_LENGTH
 from crypto.hmac_signer import HMACSigner
 
-PRIMARY_HEADER_FIELDS: list[PacketField] = [
-    PacketField("CCSDS_VERSION_NUMBER", "uint", 3),
-    PacketField("CCSDS_PACKET_TYPE", "uint", 1),
-    PacketField("CCSDS_SECONDARY_FLAG", "uint", 1),
-    PacketField("CCSDS_APID", "uint", 11),
-    PacketField("CCSDS_SEQUENCE_FLAG", "uint", 2),
-    PacketField("CCSDS_SEQUENCE_COUNT", "uint", 14),
-    PacketField("CCSDS_PACKET_LENGTH", "uint", 16),
-]
+if TYPE_CHECKING:
+    from ccsdspy import PacketField
 
-SECONDARY_HEADER_FIELDS: list[PacketField] = [
-    PacketField("TIMESTAMP", "uint", 64),
-    PacketField("GROUND_STATION_ID_LENGTH", "uint", 16),
-]
+_PRIMARY_HEADER = struct.Struct(">HHH")
+_TIMESTAMP = struct.Struct(">Q")
+_LENGTH_PREFIX = struct.Struct(">H")
 
-PAYLOAD_FIELDS: list[PacketField] = [
-    PacketField("COMMAND_LENGTH", "uint", 16),
-]
+DEFAULT_MAX_SEGMENT_BYTES = 1024
 
 
 @dataclass
@@ -50,10 +49,13 @@ class CCSDSPacketBuilder:
         self.signer = HMACSigner(key)
         self.apid = apid
         self.sequence_count = 0
+        self._ground_station_prefixes: dict[str, bytes] = {}
 
-    def build(self, command: str, ground_station_id: str) -> bytes:
-        """Create a fully signed CCSDS packet ready for transmission."""
-        timestamp = datetime.now(tz=UTC)
+    def build(
+        self, command: str, ground_station_id: str, *, timestamp: datetime | None = None
+    ) -> bytes:
+        """Create a fully signed CCSDS packet, stamped now unless ``timestamp`` is given."""
+        timestamp = timestamp or datetime.now(tz=UTC)
         secondary_header = self._build_secondary_header(timestamp, ground_station_id)
         payload = self._build_payload(command)
 
@@ -68,6 +70,114 @@ class CCSDSPacketBuilder:
         self.sequence_count = (self.sequence_count + 1) % 16384
         return full_packet
 
+    def build_segmented(
+        self,
+        command: str,
+        ground_station_id: str,
+        *,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        timestamp: datetime | None = None,
+    ) -> list[bytes]:
+        """
+        Sign ``command`` once and split it into packets of at most ``max_segment_bytes``.
+
+        The HMAC covers the packet the satellite reassembles: a stand-alone header with
+        the first segment's sequence count followed by every segment's data field. The
+        signature travels at the end of the last segment. The first segment carries the
+        secondary header and command length, which declare the reassembled size. Each
+        segment consumes one sequence count. A command that fits in one packet is
+        returned as a single stand-alone packet.
+        """
+        timestamp = timestamp or datetime.now(tz=UTC)
+        data = self._build_secondary_header(timestamp, ground_station_id) + self._build_payload(
+            command
+        )
+        if PRIMARY_HEADER_LENGTH + len(data) + HMAC_DIGEST_LENGTH <= max_segment_bytes:
+            return [self.build(command, ground_station_id, timestamp=timestamp)]
+        chunk = max_segment_bytes - PRIMARY_HEADER_LENGTH
+        declared = SECONDARY_HEADER_LENGTH + len(ground_station_id.encode("utf-8"))
+        if chunk < declared + _LENGTH_PREFIX.size:
+            raise ValueError("Segments must fit the secondary header and command length")
+
+        first_word = self._first_header_word()
+        first_sequence = self.sequence_count
+        unsigned = (
+            _PRIMARY_HEADER.pack(
+                first_word,
+                SEQUENCE_STANDALONE << 14 | first_sequence,
+                len(data) + HMAC_DIGEST_LENGTH - 1,
+            )
+            + data
+        )
+        data += self.signer.sign(unsigned)
+
+        segments = []
+        for start in range(0, len(data), chunk):
+            body = data[start : start + chunk]
+            if start == 0:
+                flags = SEQUENCE_FIRST
+            elif start + chunk >= len(data):
+                flags = SEQUENCE_LAST
+            else:
+                flags = SEQUENCE_CONTINUATION
+            header = _PRIMARY_HEADER.pack(
+                first_word, flags << 14 | self.sequence_count, len(body) - 1
+            )
+            segments.append(header + body)
+            self.sequence_count = (self.sequence_count + 1) % 16384
+        return segments
+
+    def build_many(self, commands: Iterable[str], ground_station_id: str) -> list[memoryview]:
+        """
+        Build and sign many packets into one preallocated buffer.
+
+        Headers and payloads are written with precompiled ``struct.Struct.pack_into``
+        calls, the encoded ground station prefix is cached across calls, and every
+        packet shares one timestamp. Returns zero-copy ``memoryview`` slices of the
+        shared buffer, one per command, in order.
+        """
+        ground_station_prefix = self._ground_station_prefix(ground_station_id)
+        encoded = [command.encode("utf-8") for command in commands]
+        fixed_length = (
+            _PRIMARY_HEADER.size
+            + _TIMESTAMP.size
+            + len(ground_station_prefix)
+            + _LENGTH_PREFIX.size
+            + HMAC_DIGEST_LENGTH
+        )
+        buffer = bytearray(fixed_length * len(encoded) + sum(map(len, encoded)))
+        view = memoryview(buffer)
+
+        timestamp = int(datetime.now(tz=UTC).timestamp())
+        first_word = self._first_header_word()
+        sign = self.signer.sign
+        packets: list[memoryview] = []
+        offset = 0
+        for command_bytes in encoded:
+            end = offset + fixed_length + len(command_bytes)
+            signature_start = end - HMAC_DIGEST_LENGTH
+            _PRIMARY_HEADER.pack_into(
+                buffer,
+                offset,
+                first_word,
+                0xC000 | (self.sequence_count & 0x3FFF),
+                (end - offset - 7) & 0xFFFF,
+            )
+            cursor = offset + _PRIMARY_HEADER.size
+            _TIMESTAMP.pack_into(buffer, cursor, timestamp)
+            cursor += _TIMESTAMP.size
+            view[cursor : cursor + len(ground_station_prefix)] = ground_station_prefix
+            cursor += len(ground_station_prefix)
+            _LENGTH_PREFIX.pack_into(buffer, cursor, len(command_bytes))
+            cursor += _LENGTH_PREFIX.size
+            view[cursor:signature_start] = command_bytes
+            view[signature_start:end] = sign(view[offset:signature_start])
+
+            packets.append(view[offset:end])
+            self.sequence_count = (self.sequence_count + 1) % 16384
+            offset = end
+        return packets
+
     def describe(self, command: str, ground_station_id: str) -> CommandMetadata:
         """Return the metadata that will be embedded in the next packet."""
         return CommandMetadata(
@@ -78,23 +188,33 @@ class CCSDSPacketBuilder:
             timestamp=datetime.now(tz=UTC),
         )
 
-    def _build_primary_header(self, packet_length: int) -> bytes:
-        """Construct the CCSDS primary header for the next packet."""
+    def _first_header_word(self) -> int:
+        """Return the version, type, secondary-flag, and APID bits of the primary header."""
         version_number = 0
         packet_type = 1  # command
         secondary_header_flag = 1
-        sequence_flags = 3  # stand-alone packet
-
-        first_two_bytes = (
+        return (
             (version_number & 0x7) << 13
             | (packet_type & 0x1) << 12
             | (secondary_header_flag & 0x1) << 11
             | (self.apid & 0x7FF)
         )
-        next_two_bytes = ((sequence_flags & 0x3) << 14) | (self.sequence_count & 0x3FFF)
 
-        primary_header = struct.pack(
-            ">HHH",
+    def _ground_station_prefix(self, ground_station_id: str) -> bytes:
+        """Return the length-prefixed ground station ID, encoding it once per ID."""
+        prefix = self._ground_station_prefixes.get(ground_station_id)
+        if prefix is None:
+            encoded = ground_station_id.encode("utf-8")
+            prefix = _LENGTH_PREFIX.pack(len(encoded)) + encoded
+            self._ground_station_prefixes[ground_station_id] = prefix
+        return prefix
+
+    def _build_primary_header(self, packet_length: int) -> bytes:
+        """Construct the CCSDS primary header for the next packet."""
+        first_two_bytes = self._first_header_word()
+        next_two_bytes = (SEQUENCE_STANDALONE << 14) | (self.sequence_count & 0x3FFF)
+
+        primary_header = _PRIMARY_HEADER.pack(
             first_two_bytes,
             next_two_bytes,
             packet_length & 0xFFFF,
@@ -124,11 +244,16 @@ def asdict(metadata: CommandMetadata) -> dict[str, str]:
     }
 
 
+def __getattr__(name: str) -> list[PacketField]:
+    """Resolve the ``ccsdspy`` field lists lazily from :mod:`ccsds.fields` (PEP 562)."""
+    if name in FIELD_LISTS:
+        return field_list(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
+    "DEFAULT_MAX_SEGMENT_BYTES",
     "CCSDSPacketBuilder",
     "CommandMetadata",
-    "PRIMARY_HEADER_FIELDS",
-    "SECONDARY_HEADER_FIELDS",
-    "PAYLOAD_FIELDS",
     "asdict",
 ]
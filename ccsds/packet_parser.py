@@ -3,43 +3,177 @@
 from __future__ import annotations
 
 import struct
+from collections.abc import ByteString, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
-from ccsdspy import PacketField
-
+from ccsds.fields import (
+    FIELD_LISTS,
+    PRIMARY_HEADER_LAYOUT,
+    SECONDARY_HEADER_LAYOUT,
+    FieldSpec,
+    field_list,
+)
 from crypto.constants import HMAC_DIGEST_LENGTH
 
-# Keep field definitions in sync with packet_builder to demonstrate ccsdspy usage.
-PRIMARY_HEADER_FIELDS = [
-    PacketField("CCSDS_VERSION_NUMBER", "uint", 3),
-    PacketField("CCSDS_PACKET_TYPE", "uint", 1),
-    PacketField("CCSDS_SECONDARY_FLAG", "uint", 1),
-    PacketField("CCSDS_APID", "uint", 11),
-    PacketField("CCSDS_SEQUENCE_FLAG", "uint", 2),
-    PacketField("CCSDS_SEQUENCE_COUNT", "uint", 14),
-    PacketField("CCSDS_PACKET_LENGTH", "uint", 16),
-]
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+    from ccsdspy import PacketField
 
-SECONDARY_HEADER_FIELDS = [
-    PacketField("TIMESTAMP", "uint", 64),
-    PacketField("GROUND_STATION_ID_LENGTH", "uint", 16),
-]
+_PRIMARY_HEADER = struct.Struct(">HHH")
+_SECONDARY_HEADER = struct.Struct(">QH")
+_COMMAND_LENGTH = struct.Struct(">H")
 
-PAYLOAD_FIELDS = [PacketField("COMMAND_LENGTH", "uint", 16)]
+PRIMARY_HEADER_LENGTH = _PRIMARY_HEADER.size
+SECONDARY_HEADER_LENGTH = _SECONDARY_HEADER.size
+
+# Primary header sequence flags.
+SEQUENCE_CONTINUATION = 0
+SEQUENCE_FIRST = 1
+SEQUENCE_LAST = 2
+SEQUENCE_STANDALONE = 3
 
 
-@dataclass
 class ParsedPacket:
-    """Structured view of a decoded CCSDS packet."""
+    """
+    Zero-copy view of a decoded CCSDS packet.
+
+    The view keeps offsets into the original buffer. ``command``, ``ground_station_id``
+    and ``timestamp`` are decoded on first access, so packets rejected early never pay
+    for UTF-8 decoding or ``datetime`` construction.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_ground_station_start",
+        "_ground_station_end",
+        "_command_start",
+        "_command_end",
+        "_command",
+        "_ground_station_id",
+        "_timestamp",
+        "timestamp_seconds",
+        "sequence_count",
+        "apid",
+    )
+
+    def __init__(
+        self,
+        buffer: memoryview,
+        *,
+        ground_station_span: tuple[int, int],
+        command_span: tuple[int, int],
+        timestamp_seconds: int,
+        sequence_count: int,
+        apid: int,
+    ) -> None:
+        """Record the buffer and field offsets resolved by the parser."""
+        self._buffer = buffer
+        self._ground_station_start, self._ground_station_end = ground_station_span
+        self._command_start, self._command_end = command_span
+        self._command: str | None = None
+        self._ground_station_id: str | None = None
+        self._timestamp: datetime | None = None
+        self.timestamp_seconds = timestamp_seconds
+        self.sequence_count = sequence_count
+        self.apid = apid
+
+    @property
+    def ground_station_id_bytes(self) -> memoryview:
+        """Return the raw ground station identifier without decoding it."""
+        return self._buffer[self._ground_station_start : self._ground_station_end]
+
+    @property
+    def ground_station_id(self) -> str:
+        """Return the ground station identifier, decoding it on first access."""
+        if self._ground_station_id is None:
+            self._ground_station_id = _decode(self.ground_station_id_bytes)
+        return self._ground_station_id
+
+    @property
+    def command(self) -> str:
+        """Return the command string, decoding it on first access."""
+        if self._command is None:
+            self._command = _decode(self._buffer[self._command_start : self._command_end])
+        return self._command
+
+    @property
+    def timestamp(self) -> datetime:
+        """Return the secondary header timestamp as an aware UTC datetime."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self.timestamp_seconds, tz=UTC)
+        return self._timestamp
+
+    @property
+    def raw_without_signature(self) -> memoryview:
+        """Return the signed region (headers and payload) of the packet."""
+        return self._buffer[:-HMAC_DIGEST_LENGTH]
+
+    @property
+    def signature(self) -> memoryview:
+        """Return the trailing HMAC signature bytes."""
+        return self._buffer[-HMAC_DIGEST_LENGTH:]
+
+    def __repr__(self) -> str:
+        """Return a debugging representation with decoded fields."""
+        return (
+            f"ParsedPacket(command={self.command!r}, "
+            f"ground_station_id={self.ground_station_id!r}, "
+            f"sequence_count={self.sequence_count}, apid={self.apid})"
+        )
+
+
+def _decode(field: memoryview) -> str:
+    """Decode a UTF-8 text field, replacing invalid bytes rather than raising."""
+    return str(field, "utf-8", "replace")
+
+
+@dataclass(frozen=True)
+class PacketHeaderBatch:
+    """
+    Columnar primary and secondary header fields for many packets.
+
+    Every array is aligned with ``offsets``. ``fields`` holds each decoded column keyed
+    by its field name; the named attributes are views of the same arrays.
+    ``valid`` flags rows whose headers fit in the buffer, carry standalone command
+    values, and declare a length large enough for the ground ID, command length field,
+    and signature.
+    """
+
+    offsets: npt.NDArray[np.int64]
+    fields: dict[str, npt.NDArray[np.unsignedinteger]]
+    valid: npt.NDArray[np.bool_]
+
+    @property
+    def apid(self) -> npt.NDArray[np.unsignedinteger]:
+        """Return the application process identifier column."""
+        return self.fields["CCSDS_APID"]
+
+    @property
+    def sequence_count(self) -> npt.NDArray[np.unsignedinteger]:
+        """Return the 14-bit sequence count column."""
+        return self.fields["CCSDS_SEQUENCE_COUNT"]
 
-    command: str
-    ground_station_id: str
-    timestamp: datetime
-    sequence_count: int
-    apid: int
-    raw_without_signature: bytes
-    signature: bytes
+    @property
+    def packet_length(self) -> npt.NDArray[np.unsignedinteger]:
+        """Return the declared CCSDS packet length column (data field length - 1)."""
+        return self.fields["CCSDS_PACKET_LENGTH"]
+
+    @property
+    def timestamp(self) -> npt.NDArray[np.unsignedinteger]:
+        """Return the secondary header timestamp column in UNIX seconds."""
+        return self.fields["TIMESTAMP"]
+
+    @property
+    def ground_station_id_length(self) -> npt.NDArray[np.unsignedinteger]:
+        """Return the ground station identifier length column."""
+        return self.fields["GROUND_STATION_ID_LENGTH"]
+
+    def __len__(self) -> int:
+        """Return the number of packets in the batch."""
+        return int(self.offsets.size)
 
 
 class PacketValidationError(Exception):
@@ -51,13 +185,14 @@ class CCSDSPacketParser:
 
     signature_length = HMAC_DIGEST_LENGTH
 
-    def parse(self, packet: bytes) -> ParsedPacket:
-        """Decode a CCSDS packet into its constituent headers and payload."""
-        if len(packet) < 6 + self.signature_length:
+    def parse(self, packet: ByteString) -> ParsedPacket:
+        """Decode a CCSDS packet into a lazily-decoded view over ``packet``."""
+        view = memoryview(packet)
+        total_length = len(view)
+        if total_length < PRIMARY_HEADER_LENGTH + self.signature_length:
             raise PacketValidationError("Packet too short to contain CCSDS header and signature")
 
-        primary_header = packet[:6]
-        first_word, second_word, packet_length = struct.unpack(">HHH", primary_header)
+        first_word, second_word, packet_length = _PRIMARY_HEADER.unpack_from(view)
         version = (first_word >> 13) & 0x7
         packet_type = (first_word >> 12) & 0x1
         secondary_header_flag = (first_word >> 11) & 0x1
@@ -67,62 +202,138 @@ class CCSDSPacketParser:
 
         if version != 0 or packet_type != 1 or secondary_header_flag != 1:
             raise PacketValidationError("Unsupported CCSDS header values")
-        if sequence_flags != 3:
-            raise PacketValidationError("Fragmented packets are not supported in this simulator")
+        if sequence_flags != SEQUENCE_STANDALONE:
+            raise PacketValidationError("Segmented packets must be reassembled before parsing")
 
-        expected_total_length = packet_length + 1 + 6
-        if expected_total_length != len(packet):
+        expected_total_length = packet_length + 1 + PRIMARY_HEADER_LENGTH
+        if expected_total_length != total_length:
             raise PacketValidationError(
                 "Packet length mismatch. Expected "
-                f"{expected_total_length} bytes, received {len(packet)}"
+                f"{expected_total_length} bytes, received {total_length}"
             )
 
-        data_field = packet[6:]
-        signature = data_field[-self.signature_length :]
-        secondary_and_payload = data_field[: -self.signature_length]
-
-        if len(secondary_and_payload) < 10:
+        data_end = total_length - self.signature_length
+        ground_station_start = PRIMARY_HEADER_LENGTH + SECONDARY_HEADER_LENGTH
+        if ground_station_start > data_end:
             raise PacketValidationError("Secondary header missing or truncated")
 
-        timestamp_seconds, ground_station_id_length = struct.unpack(
-            ">QH", secondary_and_payload[:10]
+        timestamp_seconds, ground_station_id_length = _SECONDARY_HEADER.unpack_from(
+            view, PRIMARY_HEADER_LENGTH
         )
-        ground_station_end = 10 + ground_station_id_length
-        if ground_station_end > len(secondary_and_payload):
+        ground_station_end = ground_station_start + ground_station_id_length
+        if ground_station_end > data_end:
             raise PacketValidationError("Ground station identifier is incomplete")
 
-        ground_station_id = secondary_and_payload[10:ground_station_end].decode("utf-8")
-        if len(secondary_and_payload) < ground_station_end + 2:
+        payload_start = ground_station_end + _COMMAND_LENGTH.size
+        if payload_start > data_end:
             raise PacketValidationError("Payload command length missing")
 
-        command_length = struct.unpack(
-            ">H", secondary_and_payload[ground_station_end : ground_station_end + 2]
-        )[0]
-        payload_start = ground_station_end + 2
+        (command_length,) = _COMMAND_LENGTH.unpack_from(view, ground_station_end)
         payload_end = payload_start + command_length
-        if payload_end > len(secondary_and_payload):
+        if payload_end > data_end:
             raise PacketValidationError("Payload command bytes truncated")
 
-        command = secondary_and_payload[payload_start:payload_end].decode("utf-8")
-        raw_without_signature = packet[: -self.signature_length]
-
-        timestamp = datetime.fromtimestamp(timestamp_seconds, tz=UTC)
         return ParsedPacket(
-            command=command,
-            ground_station_id=ground_station_id,
-            timestamp=timestamp,
+            view,
+            ground_station_span=(ground_station_start, ground_station_end),
+            command_span=(payload_start, payload_end),
+            timestamp_seconds=timestamp_seconds,
             sequence_count=sequence_count,
             apid=apid,
-            raw_without_signature=raw_without_signature,
-            signature=signature,
         )
 
+    def parse_many(self, buffer: ByteString, offsets: Sequence[int]) -> PacketHeaderBatch:
+        """
+        Decode the headers of every packet starting at ``offsets`` within ``buffer``.
+
+        Fields are extracted with array operations driven by ``PRIMARY_HEADER_LAYOUT``
+        and ``SECONDARY_HEADER_LAYOUT``, so a full capture is decoded without a Python
+        loop over packets. Payloads and signatures are not inspected. NumPy is imported
+        on the first call.
+        """
+        import numpy as np
+
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        starts = np.asarray(offsets, dtype=np.int64).reshape(-1)
+        in_bounds = (starts >= 0) & (starts + _HEADER_BATCH_LENGTH <= data.size)
+
+        headers = np.zeros((starts.size, _HEADER_BATCH_LENGTH), dtype=np.uint8)
+        headers[in_bounds] = data[starts[in_bounds, None] + np.arange(_HEADER_BATCH_LENGTH)]
+
+        fields = {
+            name: _extract_bit_field(headers, bit_offset, bit_length)
+            for name, bit_offset, bit_length in _HEADER_BATCH_LAYOUT
+        }
+
+        total_length = fields["CCSDS_PACKET_LENGTH"].astype(np.int64) + 1 + PRIMARY_HEADER_LENGTH
+        minimum_length = (
+            _HEADER_BATCH_LENGTH
+            + fields["GROUND_STATION_ID_LENGTH"].astype(np.int64)
+            + _COMMAND_LENGTH.size
+            + self.signature_length
+        )
+        valid = (
+            in_bounds
+            & (fields["CCSDS_VERSION_NUMBER"] == 0)
+            & (fields["CCSDS_PACKET_TYPE"] == 1)
+            & (fields["CCSDS_SECONDARY_FLAG"] == 1)
+            & (fields["CCSDS_SEQUENCE_FLAG"] == SEQUENCE_STANDALONE)
+            & (starts + total_length <= data.size)
+            & (total_length >= minimum_length)
+        )
+        return PacketHeaderBatch(offsets=starts, fields=fields, valid=valid)
+
+
+def _field_layout(specs: Sequence[FieldSpec]) -> list[tuple[str, int, int]]:
+    """Return ``(name, bit_offset, bit_length)`` for contiguous packet fields."""
+    layout = []
+    bit_offset = 0
+    for name, _, bit_length in specs:
+        layout.append((name, bit_offset, bit_length))
+        bit_offset += bit_length
+    return layout
+
+
+def _extract_bit_field(
+    headers: npt.NDArray[np.uint8], bit_offset: int, bit_length: int
+) -> npt.NDArray[np.unsignedinteger]:
+    """Extract a big-endian unsigned bit field from every row of ``headers``."""
+    import numpy as np
+
+    first_byte = bit_offset // 8
+    end_byte = (bit_offset + bit_length + 7) // 8
+    if end_byte - first_byte > 8:
+        raise ValueError("Bit fields wider than 64 bits spanning bytes are not supported")
+
+    value = np.zeros(headers.shape[0], dtype=np.uint64)
+    for column in range(first_byte, end_byte):
+        value = (value << np.uint64(8)) | headers[:, column].astype(np.uint64)
+    value >>= np.uint64(end_byte * 8 - bit_offset - bit_length)
+    if bit_length < 64:
+        value &= np.uint64((1 << bit_length) - 1)
+    return value.astype(np.min_scalar_type((1 << bit_length) - 1))
+
+
+_HEADER_BATCH_LAYOUT = _field_layout(PRIMARY_HEADER_LAYOUT + SECONDARY_HEADER_LAYOUT)
+_HEADER_BATCH_LENGTH = PRIMARY_HEADER_LENGTH + SECONDARY_HEADER_LENGTH
+
+
+def __getattr__(name: str) -> list[PacketField]:
+    """Resolve the ``ccsdspy`` field lists lazily from :mod:`ccsds.fields` (PEP 562)."""
+    if name in FIELD_LISTS:
+        return field_list(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "CCSDSPacketParser",
     "ParsedPacket",
+    "PacketHeaderBatch",
     "PacketValidationError",
-    "PRIMARY_HEADER_FIELDS",
-    "SECONDARY_HEADER_FIELDS",
-    "PAYLOAD_FIELDS",
+    "PRIMARY_HEADER_LENGTH",
+    "SECONDARY_HEADER_LENGTH",
+    "SEQUENCE_CONTINUATION",
+    "SEQUENCE_FIRST",
+    "SEQUENCE_LAST",
+    "SEQUENCE_STANDALONE",
 ]
@@ -0,0 +1,281 @@
+"""Bounded-memory reassembly of segmented CCSDS command packets."""
+
+from __future__ import annotations
+
+import struct
+import time
+from collections import Counter, OrderedDict
+from collections.abc import ByteString, Callable
+from dataclasses import dataclass
+
+from ccsds.packet_parser import (
+    PRIMARY_HEADER_LENGTH,
+    SECONDARY_HEADER_LENGTH,
+    SEQUENCE_FIRST,
+    SEQUENCE_LAST,
+    SEQUENCE_STANDALONE,
+)
+from crypto.constants import HMAC_DIGEST_LENGTH
+
+SEGMENT_BUFFERED = "Segment buffered for reassembly"
+SEGMENT_WITHOUT_FIRST = "Segment received without a first segment"
+SEGMENT_OUT_OF_SEQUENCE = "Segment out of sequence"
+SEGMENT_LENGTH_MISMATCH = "Segments do not match the declared packet length"
+FIRST_SEGMENT_INCOMPLETE = "First segment too short to declare the packet length"
+SEGMENTED_PACKET_TOO_LARGE = "Segmented packet exceeds the reassembly size limit"
+REASSEMBLY_MEMORY_EXHAUSTED = "Reassembly memory limit reached"
+REASSEMBLY_TIMED_OUT = "Reassembly timed out"
+
+MAX_PACKET_BYTES = PRIMARY_HEADER_LENGTH + 0x10000
+DEFAULT_MAX_PACKET_BYTES = MAX_PACKET_BYTES
+DEFAULT_MAX_BUFFERED_BYTES = 4 << 20
+DEFAULT_MAX_STREAMS_PER_SOURCE = 4
+DEFAULT_TIMEOUT = 5.0
+
+_HEADER = struct.Struct(">HHH")
+_LENGTH = struct.Struct(">H")
+_GROUND_ID_LENGTH_OFFSET = SECONDARY_HEADER_LENGTH - _LENGTH.size
+_FIXED_LENGTH = PRIMARY_HEADER_LENGTH + SECONDARY_HEADER_LENGTH + _LENGTH.size + HMAC_DIGEST_LENGTH
+
+StreamKey = tuple[str, int]
+
+
+@dataclass
+class ReassemblyStats:
+    """Counters describing reassembly activity."""
+
+    started: int = 0
+    completed: int = 0
+    dropped: int = 0
+    expired: int = 0
+    evicted: int = 0
+
+
+def is_segment(packet: ByteString) -> bool:
+    """Return whether a packet of at least a primary header is part of a segmented packet."""
+    return packet[2] >> 6 != SEQUENCE_STANDALONE
+
+
+class _Stream:
+    """One packet being reassembled: its pre-sized buffer and the next expected segment."""
+
+    __slots__ = ("buffer", "view", "filled", "next_sequence", "updated")
+
+    def __init__(self, buffer: bytearray, filled: int, next_sequence: int, updated: float) -> None:
+        """Track ``buffer`` with ``filled`` bytes written so far."""
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+        self.filled = filled
+        self.next_sequence = next_sequence
+        self.updated = updated
+
+
+class SegmentReassembler:
+    """
+    Reassemble first/continuation/last segments into stand-alone command packets.
+
+    Segments are grouped by ``(source, APID)``. The first segment's secondary header and
+    command length declare the reassembled size, so each packet gets one buffer of
+    exactly that size and every segment's data field is copied straight into place.
+    The completed buffer carries a stand-alone primary header with the first segment's
+    sequence count, ready for the normal parse and HMAC checks; segments themselves are
+    not authenticated.
+
+    Memory is bounded three ways: no packet may exceed ``max_packet_bytes``, a source
+    may reassemble at most ``max_streams_per_source`` packets at once, and all buffers
+    together may not exceed ``max_buffered_bytes``. When the budget is full, each source
+    buffering packets is entitled to an equal share of it: a first segment that fits its
+    source's share evicts the oldest packets of whichever source holds the most memory
+    beyond its own share, and any other first segment that would break a limit is
+    rejected. Spoofed first segments from a few addresses therefore cannot lock every
+    other source out. A packet that receives no segment for ``timeout`` seconds is
+    discarded. Segments are expected to have
+    passed :class:`satellite.prefilter.HeaderPrefilter`, which checks their lengths.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_packet_bytes: int = DEFAULT_MAX_PACKET_BYTES,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+        max_streams_per_source: int = DEFAULT_MAX_STREAMS_PER_SOURCE,
+        timeout: float = DEFAULT_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Configure the size, memory, and time limits."""
+        if not _FIXED_LENGTH < max_packet_bytes <= MAX_PACKET_BYTES:
+            raise ValueError(
+                f"Packet size limit must be between {_FIXED_LENGTH + 1} and "
+                f"{MAX_PACKET_BYTES} bytes"
+            )
+        if max_buffered_bytes < max_packet_bytes or max_streams_per_source < 1 or timeout <= 0:
+            raise ValueError("Reassembly memory, stream, and timeout limits must be positive")
+        self.max_packet_bytes = max_packet_bytes
+        self.max_buffered_bytes = max_buffered_bytes
+        self.max_streams_per_source = max_streams_per_source
+        self.timeout = timeout
+        self.clock = clock
+        self.buffered_bytes = 0
+        self.stats = ReassemblyStats()
+        self._streams: OrderedDict[StreamKey, _Stream] = OrderedDict()
+        self._per_source: Counter[str] = Counter()
+        self._source_bytes: Counter[str] = Counter()
+
+    def __len__(self) -> int:
+        """Return the number of packets currently being reassembled."""
+        return len(self._streams)
+
+    def add(self, segment: ByteString, source: str, now: float | None = None) -> bytearray | str:
+        """
+        Add one segment and return the completed packet or a reason string.
+
+        Returns the reassembled stand-alone packet once the last segment arrives,
+        ``SEGMENT_BUFFERED`` while more segments are expected, or one of this module's
+        rejection reasons. A rejected segment discards the packet it belonged to.
+        """
+        now = self.clock() if now is None else now
+        self.expire(now)
+        first_word, second_word, _ = _HEADER.unpack_from(segment)
+        key = (source, first_word & 0x7FF)
+        flags = second_word >> 14
+        sequence = second_word & 0x3FFF
+        data = memoryview(segment)[PRIMARY_HEADER_LENGTH:]
+        if flags == SEQUENCE_FIRST:
+            return self._start(key, first_word, sequence, data, now)
+
+        stream = self._streams.get(key)
+        if stream is None:
+            return SEGMENT_WITHOUT_FIRST
+        if sequence != stream.next_sequence:
+            self._discard(key)
+            return SEGMENT_OUT_OF_SEQUENCE
+        end = stream.filled + len(data)
+        if end > len(stream.buffer) or (flags == SEQUENCE_LAST) != (end == len(stream.buffer)):
+            self._discard(key)
+            return SEGMENT_LENGTH_MISMATCH
+        stream.view[stream.filled : end] = data
+        if flags == SEQUENCE_LAST:
+            self._release(key)
+            self.stats.completed += 1
+            stream.view.release()
+            return stream.buffer
+        stream.filled = end
+        stream.next_sequence = (sequence + 1) & 0x3FFF
+        stream.updated = now
+        self._streams.move_to_end(key)
+        return SEGMENT_BUFFERED
+
+    def expire(self, now: float | None = None) -> int:
+        """Discard packets idle for ``timeout`` seconds and return how many were dropped."""
+        now = self.clock() if now is None else now
+        expired = 0
+        while self._streams:
+            key, stream = next(iter(self._streams.items()))
+            if now - stream.updated < self.timeout:
+                break
+            self._release(key)
+            expired += 1
+        self.stats.expired += expired
+        return expired
+
+    def _start(
+        self, key: StreamKey, first_word: int, sequence: int, data: memoryview, now: float
+    ) -> str:
+        """Reserve a buffer sized from the first segment's declared lengths."""
+        if key in self._streams:
+            self._discard(key)
+        length_end = SECONDARY_HEADER_LENGTH
+        if len(data) >= length_end:
+            (ground_id_length,) = _LENGTH.unpack_from(data, _GROUND_ID_LENGTH_OFFSET)
+            length_end += ground_id_length + _LENGTH.size
+        if len(data) < length_end:
+            self.stats.dropped += 1
+            return FIRST_SEGMENT_INCOMPLETE
+        (command_length,) = _LENGTH.unpack_from(data, length_end - _LENGTH.size)
+        total = PRIMARY_HEADER_LENGTH + length_end + command_length + HMAC_DIGEST_LENGTH
+        if total > self.max_packet_bytes:
+            self.stats.dropped += 1
+            return SEGMENTED_PACKET_TOO_LARGE
+        if PRIMARY_HEADER_LENGTH + len(data) >= total:
+            self.stats.dropped += 1
+            return SEGMENT_LENGTH_MISMATCH
+        source = key[0]
+        if self._per_source[source] >= self.max_streams_per_source or not self._make_room(
+            source, total
+        ):
+            self.stats.dropped += 1
+            return REASSEMBLY_MEMORY_EXHAUSTED
+
+        buffer = bytearray(total)
+        _HEADER.pack_into(
+            buffer,
+            0,
+            first_word,
+            SEQUENCE_STANDALONE << 14 | sequence,
+            total - PRIMARY_HEADER_LENGTH - 1,
+        )
+        filled = PRIMARY_HEADER_LENGTH + len(data)
+        buffer[PRIMARY_HEADER_LENGTH:filled] = data
+        self._streams[key] = _Stream(buffer, filled, (sequence + 1) & 0x3FFF, now)
+        self._per_source[source] += 1
+        self._source_bytes[source] += total
+        self.buffered_bytes += total
+        self.stats.started += 1
+        return SEGMENT_BUFFERED
+
+    def _make_room(self, source: str, total: int) -> bool:
+        """
+        Free ``total`` bytes of the budget for ``source``, or return False if it may not.
+
+        The budget is split equally between the sources currently buffering, plus
+        ``source``. A source within its share evicts the oldest packets of the source
+        furthest over its own share until the new buffer fits.
+        """
+        if self.buffered_bytes + total <= self.max_buffered_bytes:
+            return True
+        sources = len(self._source_bytes) + (source not in self._source_bytes)
+        share = self.max_buffered_bytes // sources
+        if self._source_bytes[source] + total > share:
+            return False
+        while self.buffered_bytes + total > self.max_buffered_bytes:
+            hog = max(self._source_bytes, key=self._source_bytes.__getitem__)
+            oldest = next(key for key in self._streams if key[0] == hog)
+            self._discard(oldest)
+            self.stats.evicted += 1
+        return True
+
+    def _discard(self, key: StreamKey) -> None:
+        """Drop an unfinished packet after a bad or superseding segment."""
+        self._release(key)
+        self.stats.dropped += 1
+
+    def _release(self, key: StreamKey) -> None:
+        """Forget ``key``'s stream and return its memory to the global budget."""
+        stream = self._streams.pop(key)
+        self.buffered_bytes -= len(stream.buffer)
+        source = key[0]
+        self._per_source[source] -= 1
+        self._source_bytes[source] -= len(stream.buffer)
+        if not self._per_source[source]:
+            del self._per_source[source]
+            del self._source_bytes[source]
+
+
+__all__ = [
+    "DEFAULT_MAX_BUFFERED_BYTES",
+    "DEFAULT_MAX_PACKET_BYTES",
+    "DEFAULT_MAX_STREAMS_PER_SOURCE",
+    "DEFAULT_TIMEOUT",
+    "FIRST_SEGMENT_INCOMPLETE",
+    "MAX_PACKET_BYTES",
+    "REASSEMBLY_MEMORY_EXHAUSTED",
+    "REASSEMBLY_TIMED_OUT",
+    "SEGMENTED_PACKET_TOO_LARGE",
+    "SEGMENT_BUFFERED",
+    "SEGMENT_LENGTH_MISMATCH",
+    "SEGMENT_OUT_OF_SEQUENCE",
+    "SEGMENT_WITHOUT_FIRST",
+    "ReassemblyStats",
+    "SegmentReassembler",
+    "is_segment",
+]
@@ -0,0 +1,152 @@
+"""
+CCSDS telemetry (packet type 0) frames carrying batches of telemetry events.
+
+A frame is one stand-alone space packet. The primary header has the telemetry
+packet type, the secondary header flag, the downlink APID and a per-sender sequence
+count. The secondary header holds the frame creation time and the number of events.
+It is followed by that many events, each a fixed ``EVENT_HEADER`` (creation time,
+level, message length, context length), the UTF-8 message, and the remaining context
+as compact JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from collections.abc import ByteString, Sequence
+from typing import Any, NamedTuple
+
+from ccsds.packet_parser import (
+    PRIMARY_HEADER_LENGTH,
+    SEQUENCE_STANDALONE,
+    PacketValidationError,
+)
+
+DEFAULT_TELEMETRY_APID = 200
+MAX_FRAME_BYTES = PRIMARY_HEADER_LENGTH + 0x10000
+
+_PRIMARY_HEADER = struct.Struct(">HHH")
+# created, event count
+FRAME_HEADER = struct.Struct(">dH")
+# created, level, message length, context length
+EVENT_HEADER = struct.Struct(">dBHH")
+
+FRAME_OVERHEAD = PRIMARY_HEADER_LENGTH + FRAME_HEADER.size
+MIN_FRAME_BYTES = FRAME_OVERHEAD + EVENT_HEADER.size + 64
+MAX_EVENTS_PER_FRAME = 0xFFFF
+TRUNCATED_KEY = "truncated_bytes"
+
+
+class DownlinkEvent(NamedTuple):
+    """One telemetry event decoded from a downlink frame."""
+
+    created: float
+    level: int
+    message: str
+    context: dict[str, Any]
+
+
+class TelemetryFrame(NamedTuple):
+    """A decoded telemetry frame."""
+
+    apid: int
+    sequence_count: int
+    created: float
+    events: list[DownlinkEvent]
+
+
+def encode_event(
+    level: int,
+    created: float,
+    message: str,
+    context: dict[str, Any],
+    max_bytes: int = MAX_FRAME_BYTES - FRAME_OVERHEAD,
+) -> tuple[bytes, bool]:
+    """
+    Encode one event in at most ``max_bytes`` and report whether it had to be shrunk.
+
+    An event that does not fit keeps its time, level and (possibly shortened) message,
+    and its context is replaced by ``{TRUNCATED_KEY: <original context bytes>}``.
+    """
+    encoded_message = message.encode("utf-8")
+    body = json.dumps(context, separators=(",", ":"), default=str).encode("utf-8")
+    truncated = EVENT_HEADER.size + len(encoded_message) + len(body) > max_bytes
+    if truncated:
+        body = json.dumps({TRUNCATED_KEY: len(body)}, separators=(",", ":")).encode("utf-8")
+        room = max(0, max_bytes - EVENT_HEADER.size - len(body))
+        encoded_message = encoded_message[:room].decode("utf-8", errors="ignore").encode("utf-8")
+    header = EVENT_HEADER.pack(created, level & 0xFF, len(encoded_message), len(body))
+    return header + encoded_message + body, truncated
+
+
+def build_frame(
+    events: Sequence[bytes],
+    sequence_count: int,
+    created: float,
+    apid: int = DEFAULT_TELEMETRY_APID,
+) -> bytes:
+    """Wrap already-encoded events in a stand-alone telemetry space packet."""
+    if not 0 < len(events) <= MAX_EVENTS_PER_FRAME:
+        raise ValueError(f"A frame holds between 1 and {MAX_EVENTS_PER_FRAME} events")
+    data = FRAME_HEADER.pack(created, len(events)) + b"".join(events)
+    if PRIMARY_HEADER_LENGTH + len(data) > MAX_FRAME_BYTES:
+        raise ValueError("Telemetry frame exceeds the CCSDS packet length limit")
+    first_word = 1 << 11 | (apid & 0x7FF)  # version 0, telemetry type, secondary header
+    header = _PRIMARY_HEADER.pack(
+        first_word, SEQUENCE_STANDALONE << 14 | (sequence_count & 0x3FFF), len(data) - 1
+    )
+    return header + data
+
+
+def decode_frame(packet: ByteString) -> TelemetryFrame:
+    """Decode a telemetry frame, raising :class:`PacketValidationError` if it is invalid."""
+    view = memoryview(packet)
+    if len(view) < FRAME_OVERHEAD:
+        raise PacketValidationError("Packet too short to contain a telemetry frame header")
+    first_word, second_word, packet_length = _PRIMARY_HEADER.unpack_from(view)
+    if first_word >> 11 != 1 or second_word >> 14 != SEQUENCE_STANDALONE:
+        raise PacketValidationError("Not a stand-alone CCSDS telemetry packet")
+    if packet_length + 1 + PRIMARY_HEADER_LENGTH != len(view):
+        raise PacketValidationError("Packet length mismatch")
+    created, count = FRAME_HEADER.unpack_from(view, PRIMARY_HEADER_LENGTH)
+    events = []
+    offset = FRAME_OVERHEAD
+    for _ in range(count):
+        if offset + EVENT_HEADER.size > len(view):
+            raise PacketValidationError("Telemetry event header truncated")
+        event_created, level, message_length, context_length = EVENT_HEADER.unpack_from(
+            view, offset
+        )
+        message_start = offset + EVENT_HEADER.size
+        context_start = message_start + message_length
+        offset = context_start + context_length
+        if offset > len(view):
+            raise PacketValidationError("Telemetry event truncated")
+        try:
+            message = bytes(view[message_start:context_start]).decode("utf-8")
+            context = json.loads(view[context_start:offset].tobytes())
+        except ValueError as exc:
+            raise PacketValidationError(f"Telemetry event is not decodable: {exc}") from exc
+        if not isinstance(context, dict):
+            raise PacketValidationError("Telemetry event context is not an object")
+        events.append(DownlinkEvent(event_created, level, message, context))
+    if offset != len(view):
+        raise PacketValidationError("Trailing bytes after the last telemetry event")
+    return TelemetryFrame(first_word & 0x7FF, second_word & 0x3FFF, created, events)
+
+
+__all__ = [
+    "DEFAULT_TELEMETRY_APID",
+    "EVENT_HEADER",
+    "FRAME_HEADER",
+    "FRAME_OVERHEAD",
+    "MAX_EVENTS_PER_FRAME",
+    "MAX_FRAME_BYTES",
+    "MIN_FRAME_BYTES",
+    "TRUNCATED_KEY",
+    "DownlinkEvent",
+    "TelemetryFrame",
+    "build_frame",
+    "decode_frame",
+    "encode_event",
+]
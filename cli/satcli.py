@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
+import json
+import logging
 import sys
+from collections.abc import Sequence
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     """Return parsed arguments for orchestrating simulator components."""
     parser = argparse.ArgumentParser(description="Satellite uplink simulator CLI")
     sub = parser.add_subparsers(dest="component", required=True)
@@ -16,19 +18,69 @@ def parse_args() -> argparse.Namespace:
     bus.add_argument("--host", default="127.0.0.1", help="Host to bind")
     bus.add_argument("--port", type=int, default=5000, help="Port to bind")
     bus.add_argument("--key", default=None, help="HMAC key override")
+    bus.add_argument("--keyring", default=None, help="Per-ground-station keyring file")
+    bus.add_argument("--telemetry-store", default=None, help="Binary telemetry store directory")
     bus.add_argument(
         "--allowed-ground-stations",
         nargs="+",
         default=["GS-ALPHA"],
         help="Allowed ground station IDs",
     )
+    bus.add_argument("--mode", choices=["sync", "async"], default="sync", help="Receive mode")
+    bus.add_argument("--queue-size", type=int, default=1024, help="Async ingress queue size")
+    bus.add_argument(
+        "--overflow-policy",
+        choices=["drop-oldest", "drop-newest"],
+        default="drop-oldest",
+        help="Async ingress overflow policy",
+    )
+    bus.add_argument("--consumers", type=int, default=1, help="Async inspection consumers")
+    bus.add_argument("--batch-size", type=int, default=64, help="Datagrams drained per wakeup")
+    bus.add_argument(
+        "--background-telemetry", action="store_true", help="Queue-backed telemetry writer"
+    )
+    bus.add_argument("--no-console", action="store_true", help="Suppress console telemetry")
+    bus.add_argument(
+        "--no-replay-protection", action="store_true", help="Disable anti-replay checks"
+    )
+    bus.add_argument("--replay-state", default="replay_state.json", help="Replay state file")
+    bus.add_argument("--rate-limit", type=float, default=500.0, help="Per-source packets/s")
+    bus.add_argument(
+        "--fair-queuing", action="store_true", help="Fair admission between ground stations"
+    )
+    bus.add_argument(
+        "--priority-apids", type=int, nargs="+", default=[], help="APIDs admitted first"
+    )
+    bus.add_argument(
+        "--acks", action="store_true", help="Acknowledge authenticated commands to the sender"
+    )
+    bus.add_argument("--capture", default=None, help="Record datagrams to a capture file")
+    bus.add_argument(
+        "--downlink-port", type=int, default=None, help="Downlink telemetry frames to this port"
+    )
+    bus.add_argument("--metrics-port", type=int, default=None, help="Prometheus metrics port")
+    bus.add_argument("--workers", type=int, default=1, help="SO_REUSEPORT worker processes")
 
     gs = sub.add_parser("send", help="Send a legitimate command")
-    gs.add_argument("command", help="Command string to send")
+    gs.add_argument("command", nargs="?", help="Command string to send")
+    gs.add_argument("--file", default=None, help="Stream commands from a file ('-' for stdin)")
+    gs.add_argument("--rate", type=float, default=None, help="Target packets per second")
     gs.add_argument("--ground-id", default="GS-ALPHA")
     gs.add_argument("--key", default=None)
     gs.add_argument("--host", default="127.0.0.1")
     gs.add_argument("--port", type=int, default=5000)
+    gs.add_argument(
+        "--max-segment-bytes", type=int, default=None, help="Split larger commands into segments"
+    )
+    gs.add_argument(
+        "--window", type=int, default=0, help="Commands in flight awaiting bus acks (bus --acks)"
+    )
+
+    downlink = sub.add_parser("downlink", help="Receive telemetry downlinked by the bus")
+    downlink.add_argument("--host", default="127.0.0.1", help="Host to bind")
+    downlink.add_argument("--port", type=int, default=5001, help="Port to bind")
+    downlink.add_argument("--duration", type=float, default=None, help="Stop after N seconds")
+    downlink.add_argument("--summary", action="store_true", help="Print only the totals")
 
     rogue = sub.add_parser("attack", help="Run a rogue transmission")
     rogue.add_argument("mode", choices=["spoof", "malformed"], help="Attack type")
@@ -37,58 +89,276 @@ def parse_args() -> argparse.Namespace:
     rogue.add_argument("--host", default="127.0.0.1")
     rogue.add_argument("--port", type=int, default=5000)
 
-    return parser.parse_args()
+    analyze = sub.add_parser("analyze", help="Replay a capture through the firewall offline")
+    analyze.add_argument("capture", help="Capture file recorded with the bus --capture option")
+    analyze.add_argument("--key", default=None, help="HMAC key override")
+    analyze.add_argument("--keyring", default=None, help="Per-ground-station keyring file")
+    analyze.add_argument(
+        "--allowed-ground-stations",
+        nargs="+",
+        default=["GS-ALPHA"],
+        help="Allowed ground station IDs",
+    )
+    analyze.add_argument("--allowed-apids", type=int, nargs="+", default=None)
+    analyze.add_argument(
+        "--no-replay-protection", action="store_true", help="Disable anti-replay checks"
+    )
+    analyze.add_argument("--replay-window", type=int, default=64, help="Replay window size")
+    analyze.add_argument("--freshness", type=float, default=300.0, help="Timestamp tolerance")
+    analyze.add_argument("--rate-limit", type=float, default=500.0, help="Per-source packets/s")
+    analyze.add_argument("--rate-burst", type=float, default=1000.0, help="Per-source burst")
+    analyze.add_argument("--start", type=float, default=None, help="First receive time (epoch)")
+    analyze.add_argument("--end", type=float, default=None, help="Receive time to stop before")
+    analyze.add_argument(
+        "--telemetry-log",
+        default=None,
+        help="Write replayed firewall telemetry to this file (discarded by default)",
+    )
+    # Discarding is now the default; the flag is still accepted for existing scripts.
+    analyze.add_argument("--no-telemetry", action="store_true", help=argparse.SUPPRESS)
+
+    telemetry = sub.add_parser("telemetry", help="Inspect the binary telemetry store")
+    telemetry_sub = telemetry.add_subparsers(dest="telemetry_command", required=True)
+    query = telemetry_sub.add_parser("query", help="Filter stored telemetry events")
+    query.add_argument("store", help="Directory given to the bus --telemetry-store option")
+    query.add_argument("--since", type=float, default=None, help="Only the last N seconds")
+    query.add_argument("--start", type=float, default=None, help="First event time (epoch)")
+    query.add_argument("--end", type=float, default=None, help="Event time to stop before")
+    query.add_argument(
+        "--level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default=None,
+        help="Minimum severity",
+    )
+    query.add_argument("--message", nargs="+", default=(), help="Message substrings to match")
+    query.add_argument("--source-ip", nargs="+", default=(), help="Source IPs to match")
+    query.add_argument("--ground-station", nargs="+", default=(), help="Ground station IDs")
+    query.add_argument("--limit", type=int, default=None, help="Stop after N events")
+    query.add_argument(
+        "--count", action="store_true", help="Print match counts by message instead of events"
+    )
 
+    return parser.parse_args(argv)
 
-def main() -> None:
-    """Entrypoint for the combined satellite simulator CLI."""
-    args = parse_args()
+
+def run_analysis(args: argparse.Namespace) -> dict[str, object]:
+    """
+    Stream a capture through an in-process firewall and return the report.
+
+    Replayed decisions are historical, so their telemetry is discarded unless
+    ``--telemetry-log`` names a file; it never goes to the live bus log.
+    """
+    from capture.reader import CaptureReader
+    from satellite.analysis import analyze_capture
+    from satellite.firewall import SatelliteFirewall
+    from satellite.satellite_bus import BusRunOptions
+    from satellite.telemetry import NullTelemetry, TelemetryLogger
+    from utils.secrets import resolve_hmac_key
+
+    key, _ = resolve_hmac_key(args.key)
+    options = BusRunOptions(
+        replay_protection=not args.no_replay_protection,
+        replay_window=args.replay_window,
+        freshness_seconds=args.freshness,
+        replay_state_path=None,
+        rate_limit=args.rate_limit,
+        rate_burst=args.rate_burst,
+        keyring_path=args.keyring,
+    )
+    if args.telemetry_log is None or args.no_telemetry:
+        telemetry: TelemetryLogger = NullTelemetry()
+    else:
+        telemetry = TelemetryLogger(args.telemetry_log, console=False)
+    firewall = SatelliteFirewall(
+        key,
+        args.allowed_ground_stations,
+        telemetry,
+        replay_guard=options.make_replay_guard(),
+        rate_limiter=options.make_rate_limiter(),
+        allowed_apids=args.allowed_apids,
+        keyring=options.make_keyring(),
+        reassembler=options.make_reassembler(),
+    )
+    with CaptureReader(args.capture) as reader:
+        if args.start is None and args.end is None:
+            records = iter(reader)
+        else:
+            start = float("-inf") if args.start is None else args.start
+            end = float("inf") if args.end is None else args.end
+            records = reader.between(start, end)
+        report = analyze_capture(records, firewall)
+    firewall.close()
+    telemetry.close()
+    return report.to_dict()
+
+
+def run_telemetry_query(args: argparse.Namespace) -> None:
+    """Write matching stored events as JSON lines, or a count summary with ``--count``."""
+    import itertools
+    import time
+    from collections import Counter
+    from datetime import UTC, datetime
+
+    from telemetry_store.reader import TelemetryFilter, TelemetryStoreReader
+
+    start = args.start
+    if args.since is not None:
+        start = max(start or 0.0, time.time() - args.since)
+    criteria = TelemetryFilter(
+        start=start,
+        end=args.end,
+        min_level=logging.getLevelNamesMapping()[args.level] if args.level else 0,
+        messages=tuple(args.message),
+        source_ips=tuple(args.source_ip),
+        ground_stations=tuple(args.ground_station),
+    )
+    reader = TelemetryStoreReader(args.store)
+    events = itertools.islice(reader.query(criteria), args.limit)
+    if args.count:
+        by_message = Counter(event.message for event in events)
+        json.dump({**vars(reader.stats), "by_message": dict(by_message)}, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    for event in events:
+        payload: dict[str, object] = {
+            "timestamp": datetime.fromtimestamp(event.created, tz=UTC).isoformat(),
+            "level": logging.getLevelName(event.level),
+            "message": event.message,
+        }
+        if event.source_ip is not None:
+            payload["source_ip"] = event.source_ip
+        if event.ground_station_id is not None:
+            payload["ground_station_id"] = event.ground_station_id
+        payload.update(event.context)
+        sys.stdout.write(json.dumps(payload) + "\n")
+
+
+def bus_argv(args: argparse.Namespace) -> list[str]:
+    """Translate ``satcli bus`` options into ``satellite.satellite_bus`` arguments."""
+    argv = [
+        "--host",
+        args.host,
+        "--port",
+        str(args.port),
+        "--allowed-ground-stations",
+        *args.allowed_ground_stations,
+        "--mode",
+        args.mode,
+        "--queue-size",
+        str(args.queue_size),
+        "--overflow-policy",
+        args.overflow_policy,
+        "--consumers",
+        str(args.consumers),
+        "--batch-size",
+        str(args.batch_size),
+        "--workers",
+        str(args.workers),
+        "--replay-state",
+        args.replay_state,
+        "--rate-limit",
+        str(args.rate_limit),
+    ]
+    if args.key:
+        argv.extend(["--key", args.key])
+    if args.keyring:
+        argv.extend(["--keyring", args.keyring])
+    if args.telemetry_store:
+        argv.extend(["--telemetry-store", args.telemetry_store])
+    if args.background_telemetry:
+        argv.append("--background-telemetry")
+    if args.no_console:
+        argv.append("--no-console")
+    if args.no_replay_protection:
+        argv.append("--no-replay-protection")
+    if args.fair_queuing:
+        argv.append("--fair-queuing")
+    if args.priority_apids:
+        argv.extend(["--priority-apids", *map(str, args.priority_apids)])
+    if args.acks:
+        argv.append("--acks")
+    if args.capture:
+        argv.extend(["--capture", args.capture])
+    if args.downlink_port is not None:
+        argv.extend(["--downlink-port", str(args.downlink_port)])
+    if args.metrics_port is not None:
+        argv.extend(["--metrics-port", str(args.metrics_port)])
+    return argv
+
+
+def send_argv(args: argparse.Namespace) -> list[str]:
+    """Translate ``satcli send`` options into ``ground.ground_station`` arguments."""
+    argv = [
+        *([args.command] if args.command else []),
+        "--ground-id",
+        args.ground_id,
+        "--host",
+        args.host,
+        "--port",
+        str(args.port),
+    ]
+    if args.key:
+        argv.extend(["--key", args.key])
+    if args.file:
+        argv.extend(["--file", args.file])
+    if args.rate:
+        argv.extend(["--rate", str(args.rate)])
+    if args.max_segment_bytes:
+        argv.extend(["--max-segment-bytes", str(args.max_segment_bytes)])
+    if args.window:
+        argv.extend(["--window", str(args.window)])
+    return argv
+
+
+def downlink_argv(args: argparse.Namespace) -> list[str]:
+    """Translate ``satcli downlink`` options into ``ground.telemetry_receiver`` arguments."""
+    argv = ["--host", args.host, "--port", str(args.port)]
+    if args.duration is not None:
+        argv.extend(["--duration", str(args.duration)])
+    if args.summary:
+        argv.append("--summary")
+    return argv
+
+
+def attack_argv(args: argparse.Namespace) -> list[str]:
+    """Translate ``satcli attack`` options into ``attacker.rogue_transmitter`` arguments."""
+    argv = ["--host", args.host, "--port", str(args.port), args.mode]
+    if args.mode == "spoof":
+        argv.extend([args.command, "--ground-id", args.ground_id])
+    return argv
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """
+    Entrypoint for the combined satellite simulator CLI.
+
+    Components run in this interpreter; each one is imported only when its subcommand
+    is selected, so ``send`` and ``attack`` never load the bus or asyncio.
+    """
+    args = parse_args(argv)
     if args.component == "bus":
-        cmd = [
-            sys.executable,
-            "-m",
-            "satellite.satellite_bus",
-            "--host",
-            args.host,
-            "--port",
-            str(args.port),
-            "--allowed-ground-stations",
-            *args.allowed_ground_stations,
-        ]
-        if args.key:
-            cmd.extend(["--key", args.key])
-        subprocess.run(cmd, check=True)  # noqa: S603
+        from satellite import satellite_bus
+
+        satellite_bus.main(bus_argv(args))
     elif args.component == "send":
-        cmd = [
-            sys.executable,
-            "-m",
-            "ground.ground_station",
-            args.command,
-            "--ground-id",
-            args.ground_id,
-            "--host",
-            args.host,
-            "--port",
-            str(args.port),
-        ]
-        if args.key:
-            cmd.extend(["--key", args.key])
-        subprocess.run(cmd, check=True)  # noqa: S603
+        from ground import ground_station
+
+        ground_station.main(send_argv(args))
+    elif args.component == "downlink":
+        from ground import telemetry_receiver
+
+        telemetry_receiver.main(downlink_argv(args))
     elif args.component == "attack":
-        cmd = [
-            sys.executable,
-            "-m",
-            "attacker.rogue_transmitter",
-            "--host",
-            args.host,
-            "--port",
-            str(args.port),
-            args.mode,
-        ]
-        if args.mode == "spoof":
-            cmd.extend([args.command, "--ground-id", args.ground_id])
-        subprocess.run(cmd, check=True)  # noqa: S603
+        from attacker import rogue_transmitter
+
+        rogue_transmitter.main(attack_argv(args))
+    elif args.component == "analyze":
+        json.dump(run_analysis(args), sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    elif args.component == "telemetry":
+        run_telemetry_query(args)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-from collections.abc import ByteString
-from dataclasses import dataclass
+from collections.abc import ByteString, Iterable
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
@@ -15,18 +15,38 @@ class HMACSigner:
 
     The signer is intentionally small so it can be reused by both the ground
     station and the satellite side without pulling in additional dependencies.
+    The key schedule runs once at construction; every signature starts from a
+    ``copy()`` of that pre-keyed state.
     """
 
     key: bytes
+    _template: hmac.HMAC = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Pre-compute the keyed HMAC state shared by every signature."""
+        object.__setattr__(self, "_template", hmac.new(self.key, digestmod=hashlib.sha256))
 
     def sign(self, message: ByteString) -> bytes:
         """Return the raw HMAC-SHA256 signature for the provided message."""
-        digest = hmac.new(self.key, bytes(message), hashlib.sha256).digest()
-        return digest
+        mac = self._template.copy()
+        mac.update(message)
+        return mac.digest()
+
+    def sign_many(self, messages: Iterable[ByteString]) -> list[bytes]:
+        """Return signatures for each message, reusing the pre-keyed state."""
+        template = self._template
+        signatures = []
+        for message in messages:
+            mac = template.copy()
+            mac.update(message)
+            signatures.append(mac.digest())
+        return signatures
 
     def hexdigest(self, message: ByteString) -> str:
         """Return the hexadecimal representation of the signature."""
-        return hmac.new(self.key, bytes(message), hashlib.sha256).hexdigest()
+        mac = self._template.copy()
+        mac.update(message)
+        return mac.hexdigest()
 
 
 __all__ = ["HMACSigner"]
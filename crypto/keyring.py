@@ -0,0 +1,209 @@
+"""
+Per-ground-station HMAC keys with hot rotation.
+
+A keyring file maps ground station identifiers to their current key and, optionally,
+the key it replaces::
+
+    {
+      "ground_stations": {
+        "GS-ALPHA": {"key_id": "alpha-2026-10", "key": "..."},
+        "GS-BETA": {
+          "key_id": "beta-7",
+          "key_hex": "9f0c...",
+          "previous": {"key_id": "beta-6", "key_hex": "41aa...", "expires_at": 1791331200}
+        }
+      }
+    }
+
+When :meth:`Keyring.reload` sees a station's key change, the outgoing key stays valid
+for the overlap period so packets signed before the ground station switched over are
+still accepted. Stations removed from the file are revoked immediately.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import ByteString, Callable, Mapping
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+from crypto.verifier import HMACVerifier
+
+DEFAULT_OVERLAP_SECONDS = 300.0
+
+
+class KeyringError(ValueError):
+    """Raised when a keyring file cannot be read or is malformed."""
+
+
+@dataclass(frozen=True)
+class StationKey:
+    """One HMAC key for a ground station and its pre-keyed verifier."""
+
+    key_id: str
+    key: bytes = field(repr=False)
+    verifier: HMACVerifier = field(repr=False, compare=False)
+    expires_at: float | None = None
+
+
+@dataclass(frozen=True)
+class StationKeys:
+    """The current key for a ground station and the key it replaced, if still honoured."""
+
+    current: StationKey
+    previous: StationKey | None = None
+
+
+class Keyring:
+    """
+    Ground station keys loaded from a JSON file and swapped atomically on reload.
+
+    Lookups are a single dictionary access on the raw ground station identifier, so
+    verification cost does not depend on how many stations are configured. Verifiers
+    are reused across reloads for keys that did not change.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        overlap: float = DEFAULT_OVERLAP_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Load ``path``; rotated keys stay valid for ``overlap`` seconds of ``clock``."""
+        self.path = Path(path)
+        self.overlap = overlap
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stations: dict[bytes, StationKeys] = {}
+        self._mtime_ns: int | None = None
+        self.reload()
+
+    def __len__(self) -> int:
+        """Return the number of configured ground stations."""
+        return len(self._stations)
+
+    @property
+    def ground_stations(self) -> list[str]:
+        """Return the configured ground station identifiers."""
+        return sorted(station.decode("utf-8") for station in self._stations)
+
+    def lookup(self, ground_station_id: bytes) -> StationKeys | None:
+        """Return the keys for ``ground_station_id``, or ``None`` if it has none."""
+        return self._stations.get(ground_station_id)
+
+    def verify(
+        self,
+        ground_station_id: bytes,
+        message: ByteString,
+        signature: ByteString,
+        now: float | None = None,
+    ) -> bool:
+        """
+        Return True if ``signature`` matches under the station's current or previous key.
+
+        The previous key is only tried after the current one fails and only counts
+        before its ``expires_at``; ``now`` overrides the keyring clock for that check.
+        """
+        keys = self._stations.get(ground_station_id)
+        if keys is None:
+            return False
+        if keys.current.verifier.verify(message, signature):
+            return True
+        previous = keys.previous
+        if previous is None or not previous.verifier.verify(message, signature):
+            return False
+        return previous.expires_at is None or (
+            (self._clock() if now is None else now) < previous.expires_at
+        )
+
+    def changed(self) -> bool:
+        """Return whether the keyring file was modified since it was last loaded."""
+        try:
+            return self.path.stat().st_mtime_ns != self._mtime_ns
+        except OSError:
+            return False
+
+    def reload(self) -> list[str]:
+        """
+        Re-read the keyring file and return the stations whose key was rotated.
+
+        The new key set replaces the old one in a single assignment; if the file is
+        unreadable or malformed, :class:`KeyringError` is raised and the loaded keys are
+        left untouched.
+        """
+        with self._lock:
+            try:
+                mtime_ns = self.path.stat().st_mtime_ns
+                document = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                raise KeyringError(f"Cannot load keyring {self.path}: {exc}") from exc
+            stations, rotated = self._build(document, self._stations, self._clock())
+            self._stations = stations
+            self._mtime_ns = mtime_ns
+            return rotated
+
+    def _build(
+        self, document: Any, loaded: Mapping[bytes, StationKeys], now: float
+    ) -> tuple[dict[bytes, StationKeys], list[str]]:
+        """Return the station keys described by ``document`` and the rotated stations."""
+        entries = document.get("ground_stations") if isinstance(document, dict) else None
+        if not isinstance(entries, dict):
+            raise KeyringError(f"{self.path}: expected a 'ground_stations' object")
+        verifiers = {
+            entry.key: entry.verifier
+            for keys in loaded.values()
+            for entry in (keys.current, keys.previous)
+            if entry is not None
+        }
+        stations: dict[bytes, StationKeys] = {}
+        rotated: list[str] = []
+        for name, spec in entries.items():
+            current = _station_key(name, spec, verifiers)
+            old = loaded.get(name.encode("utf-8"))
+            previous: StationKey | None
+            if "previous" in spec:
+                previous = _station_key(name, spec["previous"], verifiers)
+            elif old is not None and old.current.key != current.key:
+                rotated.append(name)
+                previous = replace(old.current, expires_at=now + self.overlap)
+            else:
+                previous = old.previous if old is not None else None
+            if previous is not None and previous.expires_at is not None:
+                previous = previous if previous.expires_at > now else None
+            stations[name.encode("utf-8")] = StationKeys(current, previous)
+        return stations, rotated
+
+
+def _station_key(station: str, spec: Any, verifiers: dict[bytes, HMACVerifier]) -> StationKey:
+    """Build one key entry, reusing the verifier already built for the same key bytes."""
+    if not isinstance(spec, dict) or not isinstance(spec.get("key_id"), str):
+        raise KeyringError(f"{station}: each key needs a string 'key_id'")
+    try:
+        if "key_hex" in spec:
+            key = bytes.fromhex(spec["key_hex"])
+        else:
+            key = spec["key"].encode("utf-8")
+    except (KeyError, AttributeError, TypeError, ValueError) as exc:
+        raise KeyringError(f"{station}: expected a 'key' string or 'key_hex' value") from exc
+    if not key:
+        raise KeyringError(f"{station}: key {spec['key_id']!r} is empty")
+    expires_at = spec.get("expires_at")
+    if expires_at is not None and not isinstance(expires_at, int | float):
+        raise KeyringError(f"{station}: 'expires_at' must be an epoch timestamp")
+    verifier = verifiers.get(key)
+    if verifier is None:
+        verifier = verifiers[key] = HMACVerifier(key)
+    return StationKey(spec["key_id"], key, verifier, expires_at)
+
+
+__all__ = [
+    "DEFAULT_OVERLAP_SECONDS",
+    "Keyring",
+    "KeyringError",
+    "StationKey",
+    "StationKeys",
+]
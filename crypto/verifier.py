@@ -4,20 +4,41 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-from collections.abc import ByteString
-from dataclasses import dataclass
+from collections.abc import ByteString, Iterable
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
 class HMACVerifier:
-    """Verify HMAC-SHA256 signatures for incoming command packets."""
+    """
+    Verify HMAC-SHA256 signatures for incoming command packets.
+
+    The keyed HMAC state is built once and copied per message, and messages are
+    accepted as ``bytes``, ``bytearray`` or ``memoryview`` without copying.
+    """
 
     key: bytes
+    _template: hmac.HMAC = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Pre-compute the keyed HMAC state shared by every verification."""
+        object.__setattr__(self, "_template", hmac.new(self.key, digestmod=hashlib.sha256))
 
     def verify(self, message: ByteString, signature: ByteString) -> bool:
         """Return True if the signature matches the provided message."""
-        expected = hmac.new(self.key, bytes(message), hashlib.sha256).digest()
-        return hmac.compare_digest(expected, bytes(signature))
+        mac = self._template.copy()
+        mac.update(message)
+        return hmac.compare_digest(mac.digest(), signature)
+
+    def verify_many(self, items: Iterable[tuple[ByteString, ByteString]]) -> list[bool]:
+        """Return a verification result for each ``(message, signature)`` pair."""
+        template = self._template
+        results = []
+        for message, signature in items:
+            mac = template.copy()
+            mac.update(message)
+            results.append(hmac.compare_digest(mac.digest(), signature))
+        return results
 
 
 __all__ = ["HMACVerifier"]
@@ -3,45 +3,297 @@
 from __future__ import annotations
 
 import argparse
+import itertools
+import json
 import logging
+import os
 import socket
+import sys
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import TextIO
 
-from ccsds.packet_builder import CCSDSPacketBuilder
+from ccsds.packet_builder import DEFAULT_MAX_SEGMENT_BYTES, CCSDSPacketBuilder
+from crypto.verifier import HMACVerifier
+from ground.send_window import (
+    DEFAULT_ACK_TIMEOUT,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_WINDOW,
+    AckStats,
+    SendWindow,
+)
 from satellite.telemetry import TelemetryLogger
 from utils.secrets import resolve_hmac_key
 
 DEFAULT_GROUND_STATION_ID = "GS-ALPHA"
 DEFAULT_SATELLITE_ENDPOINT: tuple[str, int] = ("127.0.0.1", 5000)
+DEFAULT_SEQUENCE_STATE = "ground_sequence.json"
+DEFAULT_CHUNK_SIZE = 256
+# Paced chunks hold at most this many seconds of traffic, so no packet is signed
+# much earlier than it is sent and slow streams stay inside the bus freshness window.
+SIGN_AHEAD_SECONDS = 1.0
 
 
 class GroundStation:
     """Send signed CCSDS command packets to the satellite bus over UDP."""
 
-    def __init__(self, key: bytes, ground_station_id: str = DEFAULT_GROUND_STATION_ID) -> None:
-        """Instantiate a ground station with the provided signing key and identifier."""
+    def __init__(
+        self,
+        key: bytes,
+        ground_station_id: str = DEFAULT_GROUND_STATION_ID,
+        *,
+        sequence_state: str | Path | None = None,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        window: int = 0,
+        ack_timeout: float = DEFAULT_ACK_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
+        """
+        Instantiate a ground station with the provided signing key and identifier.
+
+        ``sequence_state`` names a JSON file holding the next sequence count per ground
+        station, so separate invocations continue the counter instead of restarting at
+        zero and tripping the satellite's anti-replay window. The UDP socket is opened
+        on first use, connected to the endpoint, and reused until :meth:`close`.
+        Single commands larger than ``max_segment_bytes`` are sent as segments.
+
+        A ``window`` greater than zero waits for the bus's signed acknowledgements
+        (``satellite_bus --acks``): up to ``window`` commands are in flight at once, and
+        unacknowledged ones are retransmitted after ``ack_timeout`` seconds, at most
+        ``max_retries`` times. Outcomes and round-trip times accumulate in :attr:`acks`.
+        """
         self.builder = CCSDSPacketBuilder(key)
         self.ground_station_id = ground_station_id
+        self.max_segment_bytes = max_segment_bytes
         self.telemetry = TelemetryLogger()
+        self.sequence_state = Path(sequence_state) if sequence_state is not None else None
+        if self.sequence_state is not None:
+            self.builder.sequence_count = self._load_sequences().get(ground_station_id, 0)
+        self.window = window
+        self.ack_timeout = ack_timeout
+        self.max_retries = max_retries
+        self.acks = AckStats()
+        self._socket: socket.socket | None = None
+        self._endpoint: tuple[str, int] | None = None
+
+    def __enter__(self) -> GroundStation:
+        """Return the ground station for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the transport when leaving the context."""
+        self.close()
 
     def send(self, command: str, endpoint: tuple[str, int] = DEFAULT_SATELLITE_ENDPOINT) -> None:
         """Generate, sign, and dispatch a command to the configured satellite endpoint."""
-        packet = self.builder.build(command, self.ground_station_id)
         metadata = self.builder.describe(command, self.ground_station_id)
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
-            sock.sendto(packet, endpoint)
+        packets = self.builder.build_segmented(
+            command, self.ground_station_id, max_segment_bytes=self.max_segment_bytes
+        )
+        sock = self._connect(endpoint)
+        if self.window > 0:
+            send_window = self._open_window(sock)
+            send_window.submit(command, metadata.sequence_count, packets)
+            send_window.drain()
+        else:
+            for packet in packets:
+                self._transmit(sock, packet)
         self.telemetry.info(
             "Command dispatched",
             command=command,
             ground_station_id=self.ground_station_id,
             endpoint=f"{endpoint[0]}:{endpoint[1]}",
             sequence=metadata.sequence_count,
+            **({"segments": len(packets)} if len(packets) > 1 else {}),
         )
+        self._save_sequence()
+
+    def send_many(
+        self,
+        commands: Iterable[str],
+        endpoint: tuple[str, int] = DEFAULT_SATELLITE_ENDPOINT,
+        *,
+        rate: float | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Sign and transmit a stream of commands, optionally paced to ``rate`` packets/s.
+
+        Commands are consumed lazily in chunks of ``chunk_size``: each chunk is signed up
+        front, then sent over the persistent socket on a fixed schedule. When paced, a
+        chunk is cut to ``SIGN_AHEAD_SECONDS`` of traffic and signed only once its first
+        packet is due, so every timestamp is at most that old when it leaves. One
+        telemetry event is emitted per chunk. Returns the number of packets sent.
+
+        With a send ``window``, each packet also waits for room in the window, and the
+        call returns once every command is acknowledged or given up; a summary event
+        reports the outcomes and round-trip percentiles.
+        """
+        sock = self._connect(endpoint)
+        send_window = self._open_window(sock) if self.window > 0 else None
+        interval = 1.0 / rate if rate else 0.0
+        if rate:
+            chunk_size = max(1, min(chunk_size, int(rate * SIGN_AHEAD_SECONDS)))
+        started = time.perf_counter()
+        sent = 0
+        iterator = iter(commands)
+        while chunk := list(itertools.islice(iterator, chunk_size)):
+            if interval:
+                self._pace(started + sent * interval, send_window)
+            first_sequence = self.builder.sequence_count
+            packets = self.builder.build_many(chunk, self.ground_station_id)
+            errors = 0
+            for offset, packet in enumerate(packets):
+                if interval and offset:
+                    self._pace(started + sent * interval, send_window)
+                if send_window is not None:
+                    sequence = (first_sequence + offset) % 16384
+                    transmitted = send_window.submit(chunk[offset], sequence, (packet,))
+                else:
+                    transmitted = self._transmit(sock, packet)
+                if not transmitted:
+                    errors += 1
+                sent += 1
+            elapsed = time.perf_counter() - started
+            self.telemetry.info(
+                "Command batch dispatched",
+                ground_station_id=self.ground_station_id,
+                endpoint=f"{endpoint[0]}:{endpoint[1]}",
+                commands=len(packets),
+                first_sequence=first_sequence,
+                last_sequence=(first_sequence + len(packets) - 1) % 16384,
+                send_errors=errors,
+                achieved_rate=round(sent / elapsed, 1) if elapsed > 0 else None,
+            )
+            self._save_sequence()
+        if send_window is not None:
+            send_window.drain()
+            self.telemetry.info(
+                "Command acknowledgement summary",
+                ground_station_id=self.ground_station_id,
+                endpoint=f"{endpoint[0]}:{endpoint[1]}",
+                window=self.window,
+                **self.acks.summary(),
+            )
+        return sent
+
+    def close(self) -> None:
+        """Close the persistent UDP socket, if one is open."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            self._endpoint = None
+
+    def _connect(self, endpoint: tuple[str, int]) -> socket.socket:
+        """Return a UDP socket connected to ``endpoint``, reusing the existing one."""
+        if self._socket is None or self._endpoint != endpoint:
+            self.close()
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.connect(endpoint)
+            self._endpoint = endpoint
+        return self._socket
+
+    def _pace(self, due: float, send_window: SendWindow | None) -> None:
+        """Wait until ``due`` on the perf counter, servicing acknowledgements meanwhile."""
+        if send_window is not None:
+            send_window.service(self.window, until=due)
+        elif (delay := due - time.perf_counter()) > 0:
+            time.sleep(delay)
+
+    def _open_window(self, sock: socket.socket) -> SendWindow:
+        """Return a send window on ``sock`` that records outcomes in :attr:`acks`."""
+        return SendWindow(
+            sock,
+            HMACVerifier(self.builder.signer.key),
+            self.ground_station_id,
+            depth=self.window,
+            timeout=self.ack_timeout,
+            max_retries=self.max_retries,
+            transmit=self._transmit,
+            stats=self.acks,
+            on_resolved=self._report_outcome,
+        )
+
+    def _report_outcome(
+        self, command: str, sequence_count: int, accepted: bool | None, reason: str
+    ) -> None:
+        """Emit telemetry for a command the satellite rejected or never acknowledged."""
+        if accepted:
+            return
+        self.telemetry.warning(
+            "Command rejected" if accepted is False else "Command acknowledgement timed out",
+            command=command,
+            ground_station_id=self.ground_station_id,
+            sequence=sequence_count,
+            **({"reason": reason} if accepted is False else {"attempts": self.max_retries + 1}),
+        )
+
+    @staticmethod
+    def _transmit(sock: socket.socket, packet: bytes | memoryview) -> bool:
+        """
+        Send ``packet`` on the connected socket and report whether it left the host.
+
+        A connected UDP socket surfaces ICMP port-unreachable errors for earlier
+        datagrams on a later send; that send is retried once.
+        """
+        for _ in range(2):
+            try:
+                sock.send(packet)
+            except ConnectionRefusedError:
+                continue
+            return True
+        return False
+
+    def _load_sequences(self) -> dict[str, int]:
+        """Return the persisted next-sequence map, or an empty map if none exists."""
+        if self.sequence_state is None or not self.sequence_state.exists():
+            return {}
+        return {
+            str(station): int(count)
+            for station, count in json.loads(self.sequence_state.read_text("utf-8")).items()
+        }
+
+    def _save_sequence(self) -> None:
+        """Atomically persist the builder's next sequence count for this ground station."""
+        if self.sequence_state is None:
+            return
+        sequences = self._load_sequences()
+        sequences[self.ground_station_id] = self.builder.sequence_count
+        temporary = self.sequence_state.with_name(self.sequence_state.name + ".tmp")
+        temporary.write_text(json.dumps(sequences), encoding="utf-8")
+        os.replace(temporary, self.sequence_state)
 
 
-def parse_args() -> argparse.Namespace:
+def read_commands(stream: TextIO) -> Iterator[str]:
+    """Yield one command per non-blank line, skipping ``#`` comments."""
+    for line in stream:
+        command = line.strip()
+        if command and not command.startswith("#"):
+            yield command
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     """Return parsed CLI arguments for dispatching a signed command."""
     parser = argparse.ArgumentParser(description="Send authenticated commands to the satellite bus")
-    parser.add_argument("command", help="Command payload, e.g. 'CMD: ORIENT +10'")
+    parser.add_argument("command", nargs="?", help="Command payload, e.g. 'CMD: ORIENT +10'")
+    parser.add_argument(
+        "--file",
+        default=None,
+        help="Stream commands from this file, one per line ('-' reads stdin)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=None,
+        help="Target packets per second when streaming commands (default: unpaced)",
+    )
     parser.add_argument(
         "--ground-id",
         default=DEFAULT_GROUND_STATION_ID,
@@ -63,19 +315,69 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_SATELLITE_ENDPOINT[1],
         help="Satellite UDP port",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--max-segment-bytes",
+        type=int,
+        default=DEFAULT_MAX_SEGMENT_BYTES,
+        help="Send a single command larger than this as CCSDS segments",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=0,
+        help=(
+            "Commands in flight awaiting the bus's acknowledgements (needs satellite_bus "
+            f"--acks; e.g. {DEFAULT_WINDOW}; default 0 sends without waiting)"
+        ),
+    )
+    parser.add_argument(
+        "--ack-timeout",
+        type=float,
+        default=DEFAULT_ACK_TIMEOUT,
+        help="Seconds to wait for an acknowledgement before retransmitting with --window",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DEFAULT_MAX_RETRIES,
+        help="Retransmissions of an unacknowledged command before giving up with --window",
+    )
+    parser.add_argument(
+        "--sequence-state",
+        default=DEFAULT_SEQUENCE_STATE,
+        help="File persisting the next sequence count per ground station ('' disables)",
+    )
+    args = parser.parse_args(argv)
+    if (args.command is None) == (args.file is None):
+        parser.error("provide either a command or --file")
+    return args
 
 
-def main() -> None:
-    """Entry point for sending a single authenticated command."""
-    args = parse_args()
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entry point for sending a single command or streaming commands from a file."""
+    args = parse_args(argv)
     key, used_demo = resolve_hmac_key(args.key)
     if used_demo:
         logging.warning(
             "Using demo HMAC key; set --key or SATCOM_KEY for production-like testing.",
         )
-    ground_station = GroundStation(key=key, ground_station_id=args.ground_id)
-    ground_station.send(args.command, (args.host, args.port))
+    endpoint = (args.host, args.port)
+    with GroundStation(
+        key=key,
+        ground_station_id=args.ground_id,
+        sequence_state=args.sequence_state or None,
+        max_segment_bytes=args.max_segment_bytes,
+        window=args.window,
+        ack_timeout=args.ack_timeout,
+        max_retries=args.retries,
+    ) as ground_station:
+        if args.file is None:
+            ground_station.send(args.command, endpoint)
+        elif args.file == "-":
+            ground_station.send_many(read_commands(sys.stdin), endpoint, rate=args.rate)
+        else:
+            with open(args.file, encoding="utf-8") as stream:
+                ground_station.send_many(read_commands(stream), endpoint, rate=args.rate)
 
 
 if __name__ == "__main__":
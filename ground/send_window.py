@@ -0,0 +1,251 @@
+"""Sliding send window that pipelines commands against the bus's signed acknowledgements."""
+
+from __future__ import annotations
+
+import socket
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from ccsds.ack_packet import CommandAck, command_tag, decode_ack
+from ccsds.packet_parser import PacketValidationError
+from crypto.constants import HMAC_DIGEST_LENGTH
+from crypto.verifier import HMACVerifier
+from satellite.histogram import LatencyHistogram
+
+DEFAULT_WINDOW = 32
+DEFAULT_ACK_TIMEOUT = 0.5
+DEFAULT_MAX_RETRIES = 3
+MAX_ACK_BYTES = 0x10000
+SEQUENCE_MODULUS = 0x4000
+_DONTWAIT = getattr(socket, "MSG_DONTWAIT", None)
+
+# Sends one packet on the connected socket and reports whether it left the host.
+Transmit = Callable[[socket.socket, bytes | memoryview], bool]
+
+
+@dataclass
+class AckStats:
+    """Outcome counters and acknowledgement round-trip times for one ground station."""
+
+    sent: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    retransmissions: int = 0
+    invalid_acks: int = 0
+    unmatched_entries: int = 0
+    rejections: Counter[str] = field(default_factory=Counter)
+    rtt: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def summary(self) -> dict[str, Any]:
+        """Return the counters and RTT percentiles in milliseconds as a dictionary."""
+        return {
+            "sent": self.sent,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "retransmissions": self.retransmissions,
+            "invalid_acks": self.invalid_acks,
+            "unmatched_entries": self.unmatched_entries,
+            "rejections": dict(self.rejections),
+            "rtt_samples": self.rtt.count,
+            "rtt_mean_ms": (
+                round(self.rtt.total / self.rtt.count * 1000, 3) if self.rtt.count else None
+            ),
+            **{
+                f"rtt_p{percentile}_ms": round(self.rtt.quantile(percentile / 100) * 1000, 3)
+                for percentile in (50, 90, 99)
+            },
+        }
+
+
+@dataclass
+class _Outstanding:
+    """A sent command waiting for its acknowledgement."""
+
+    command: str
+    packets: Sequence[bytes | memoryview]
+    tag: bytes
+    first_sent: float
+    deadline: float
+    attempts: int = 1
+
+
+class SendWindow:
+    """
+    Keep up to ``depth`` commands in flight and retire them as acknowledgements arrive.
+
+    Commands are keyed by the sequence count of their first packet and matched to
+    acknowledgement entries by that count and the tag of their HMAC. A command that is
+    not acknowledged within ``timeout`` seconds is retransmitted unchanged, with the
+    timeout doubling on each attempt, and given up after ``max_retries``
+    retransmissions. Round-trip times are only sampled for commands acknowledged on
+    their first transmission, since a reply to a retransmitted command cannot be
+    attributed to one particular send.
+
+    ``on_resolved`` is called with the command, its sequence count, and the accepted
+    flag and reason (``None`` on timeout) whenever a command leaves the window.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        verifier: HMACVerifier,
+        ground_station_id: str,
+        *,
+        depth: int = DEFAULT_WINDOW,
+        timeout: float = DEFAULT_ACK_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        transmit: Transmit,
+        stats: AckStats | None = None,
+        on_resolved: Callable[[str, int, bool | None, str], None] | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Track commands sent on the connected ``sock``; acks are checked with ``verifier``."""
+        if not 0 < depth <= SEQUENCE_MODULUS // 2:
+            raise ValueError(f"Send window depth must be between 1 and {SEQUENCE_MODULUS // 2}")
+        if timeout <= 0:
+            raise ValueError("Acknowledgement timeout must be positive")
+        self.sock = sock
+        self.verifier = verifier
+        self.ground_station_id = ground_station_id
+        self.depth = depth
+        self.timeout = timeout
+        self.max_retries = max(0, max_retries)
+        self.transmit = transmit
+        self.stats = stats or AckStats()
+        self.on_resolved = on_resolved
+        self.clock = clock
+        self._outstanding: dict[int, _Outstanding] = {}
+
+    def __len__(self) -> int:
+        """Return the number of commands awaiting acknowledgement."""
+        return len(self._outstanding)
+
+    def submit(
+        self, command: str, sequence_count: int, packets: Sequence[bytes | memoryview]
+    ) -> bool:
+        """
+        Send one command's packets once the window has room and start its timer.
+
+        Returns whether every packet left the host; the command is tracked either way,
+        so a failed send is retried like a lost one.
+        """
+        self.service(self.depth - 1)
+        sent = all([self.transmit(self.sock, packet) for packet in packets])
+        now = self.clock()
+        self._outstanding[sequence_count] = _Outstanding(
+            command,
+            packets,
+            command_tag(packets[-1][-HMAC_DIGEST_LENGTH:]),
+            now,
+            now + self.timeout,
+        )
+        self.stats.sent += 1
+        self._receive_ready()
+        return sent
+
+    def drain(self) -> None:
+        """Wait until every outstanding command is acknowledged or given up."""
+        self.service(0)
+
+    def service(self, target: int, until: float | None = None) -> None:
+        """
+        Handle acknowledgements and timeouts until at most ``target`` commands remain.
+
+        With ``until``, a :attr:`clock` time, keep servicing the window until then
+        instead, e.g. while pacing transmissions.
+        """
+        while True:
+            now = self.clock()
+            self._expire(now)
+            if until is None and len(self._outstanding) <= target:
+                return
+            wake = min((entry.deadline for entry in self._outstanding.values()), default=None)
+            if until is not None:
+                if now >= until:
+                    return
+                wake = until if wake is None else min(wake, until)
+            if wake is None:
+                return
+            self.sock.settimeout(max(wake - now, 1e-4))
+            try:
+                packet = self.sock.recv(MAX_ACK_BYTES)
+            except (TimeoutError, ConnectionRefusedError):
+                continue
+            finally:
+                self.sock.settimeout(None)
+            self._receive(packet)
+
+    def _receive_ready(self) -> None:
+        """Process acknowledgements that have already arrived, without blocking."""
+        if _DONTWAIT is None:
+            self.sock.setblocking(False)
+        try:
+            while self._outstanding:
+                self._receive(self.sock.recv(MAX_ACK_BYTES, _DONTWAIT or 0))
+        except (BlockingIOError, ConnectionRefusedError):
+            pass
+        finally:
+            if _DONTWAIT is None:
+                self.sock.setblocking(True)
+
+    def _receive(self, packet: bytes) -> CommandAck | None:
+        """Authenticate one acknowledgement and retire the commands it covers."""
+        try:
+            ack = decode_ack(packet, self.verifier)
+        except PacketValidationError:
+            self.stats.invalid_acks += 1
+            return None
+        if ack.ground_station_id != self.ground_station_id:
+            self.stats.invalid_acks += 1
+            return None
+        now = self.clock()
+        for entry in ack.entries:
+            outstanding = self._outstanding.get(entry.sequence_count)
+            if outstanding is None or outstanding.tag != entry.tag:
+                self.stats.unmatched_entries += 1
+                continue
+            del self._outstanding[entry.sequence_count]
+            if outstanding.attempts == 1:
+                self.stats.rtt.observe(now - outstanding.first_sent)
+            if entry.accepted:
+                self.stats.accepted += 1
+            else:
+                self.stats.rejected += 1
+                self.stats.rejections[entry.reason] += 1
+            if self.on_resolved is not None:
+                self.on_resolved(
+                    outstanding.command, entry.sequence_count, entry.accepted, entry.reason
+                )
+        return ack
+
+    def _expire(self, now: float) -> None:
+        """Retransmit commands whose timer ran out, giving up after ``max_retries``."""
+        for sequence_count, outstanding in list(self._outstanding.items()):
+            if outstanding.deadline > now:
+                continue
+            if outstanding.attempts > self.max_retries:
+                del self._outstanding[sequence_count]
+                self.stats.timed_out += 1
+                if self.on_resolved is not None:
+                    self.on_resolved(outstanding.command, sequence_count, None, "")
+                continue
+            for packet in outstanding.packets:
+                self.transmit(self.sock, packet)
+            self.stats.retransmissions += 1
+            outstanding.deadline = now + self.timeout * 2**outstanding.attempts
+            outstanding.attempts += 1
+
+
+__all__ = [
+    "DEFAULT_ACK_TIMEOUT",
+    "DEFAULT_MAX_RETRIES",
+    "DEFAULT_WINDOW",
+    "AckStats",
+    "SendWindow",
+    "Transmit",
+]
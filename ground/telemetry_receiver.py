@@ -0,0 +1,231 @@
+"""Ground-side receiver that decodes and aggregates downlinked CCSDS telemetry frames."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import socket
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from types import TracebackType
+from typing import Any
+
+from ccsds.packet_parser import PacketValidationError
+from ccsds.telemetry_packet import MAX_FRAME_BYTES, DownlinkEvent, TelemetryFrame, decode_frame
+from satellite.downlink import DEFAULT_DOWNLINK_PORT
+
+DEFAULT_RECEIVER_ENDPOINT: tuple[str, int] = ("127.0.0.1", DEFAULT_DOWNLINK_PORT)
+SEQUENCE_MODULUS = 0x4000
+
+Sender = tuple[str, int, int]
+
+
+class TelemetryAggregator:
+    """
+    Running totals over received telemetry frames.
+
+    Frames are counted per sender, identified by source address and APID (each bus
+    worker downlinks with its own socket and sequence counter). A jump forward in a
+    sender's sequence count is counted as lost frames; a count at or behind the last
+    one seen is counted as duplicated or reordered and does not move the counter back.
+    """
+
+    def __init__(self) -> None:
+        """Start with empty totals."""
+        self.frames = 0
+        self.events = 0
+        self.bytes_received = 0
+        self.invalid = 0
+        self.lost_frames = 0
+        self.reordered_frames = 0
+        self.by_level: Counter[str] = Counter()
+        self.by_message: Counter[str] = Counter()
+        self.first_event: float | None = None
+        self.last_event: float | None = None
+        self._next_sequence: dict[Sender, int] = {}
+
+    def add(self, frame: TelemetryFrame, source: tuple[str, int], size: int) -> None:
+        """Account for one decoded frame of ``size`` bytes received from ``source``."""
+        sender = (source[0], source[1], frame.apid)
+        expected = self._next_sequence.get(sender, frame.sequence_count)
+        gap = (frame.sequence_count - expected) % SEQUENCE_MODULUS
+        if gap >= SEQUENCE_MODULUS // 2:
+            self.reordered_frames += 1
+        else:
+            self.lost_frames += gap
+            self._next_sequence[sender] = (frame.sequence_count + 1) % SEQUENCE_MODULUS
+        self.frames += 1
+        self.bytes_received += size
+        self.events += len(frame.events)
+        for event in frame.events:
+            self.by_level[logging.getLevelName(event.level)] += 1
+            self.by_message[event.message] += 1
+            if self.first_event is None or event.created < self.first_event:
+                self.first_event = event.created
+            if self.last_event is None or event.created > self.last_event:
+                self.last_event = event.created
+
+    def summary(self) -> dict[str, Any]:
+        """Return the totals as a JSON-serializable dictionary."""
+        return {
+            "frames": self.frames,
+            "events": self.events,
+            "bytes_received": self.bytes_received,
+            "events_per_frame": round(self.events / self.frames, 2) if self.frames else 0.0,
+            "invalid_frames": self.invalid,
+            "lost_frames": self.lost_frames,
+            "reordered_frames": self.reordered_frames,
+            "senders": len(self._next_sequence),
+            "first_event": _isoformat(self.first_event),
+            "last_event": _isoformat(self.last_event),
+            "by_level": dict(self.by_level),
+            "by_message": dict(self.by_message.most_common()),
+        }
+
+
+class TelemetryReceiver:
+    """Receive telemetry frames on a UDP endpoint and feed them to an aggregator."""
+
+    def __init__(
+        self,
+        endpoint: tuple[str, int] = DEFAULT_RECEIVER_ENDPOINT,
+        aggregator: TelemetryAggregator | None = None,
+    ) -> None:
+        """Bind the receiving socket; port 0 picks a free port, see :attr:`address`."""
+        self.aggregator = aggregator or TelemetryAggregator()
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(endpoint)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Return the bound host and port."""
+        host, port = self.socket.getsockname()[:2]
+        return str(host), int(port)
+
+    def __enter__(self) -> TelemetryReceiver:
+        """Return the receiver for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the socket when leaving the context."""
+        self.close()
+
+    def run(
+        self,
+        on_event: Callable[[DownlinkEvent], None] | None = None,
+        *,
+        duration: float | None = None,
+    ) -> TelemetryAggregator:
+        """
+        Receive frames until ``duration`` seconds pass, or forever, and return the totals.
+
+        Every decoded event is passed to ``on_event``; undecodable datagrams are only
+        counted as invalid.
+        """
+        deadline = None if duration is None else time.monotonic() + duration
+        while True:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.socket.settimeout(remaining)
+            try:
+                packet, source = self.socket.recvfrom(MAX_FRAME_BYTES)
+            except TimeoutError:
+                break
+            self.receive(packet, source, on_event)
+        return self.aggregator
+
+    def receive(
+        self,
+        packet: bytes,
+        source: tuple[str, int],
+        on_event: Callable[[DownlinkEvent], None] | None = None,
+    ) -> TelemetryFrame | None:
+        """Decode and aggregate one datagram, returning its frame if it was valid."""
+        try:
+            frame = decode_frame(packet)
+        except PacketValidationError:
+            self.aggregator.invalid += 1
+            return None
+        self.aggregator.add(frame, source, len(packet))
+        if on_event is not None:
+            for event in frame.events:
+                on_event(event)
+        return frame
+
+    def close(self) -> None:
+        """Close the receiving socket."""
+        self.socket.close()
+
+
+def event_payload(event: DownlinkEvent) -> dict[str, Any]:
+    """Return an event in the JSON shape used by the bus telemetry log."""
+    return {
+        "timestamp": _isoformat(event.created),
+        "level": logging.getLevelName(event.level),
+        "message": event.message,
+        **event.context,
+    }
+
+
+def _isoformat(created: float | None) -> str | None:
+    """Render an epoch time as an ISO 8601 UTC timestamp."""
+    return None if created is None else datetime.fromtimestamp(created, tz=UTC).isoformat()
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Return parsed CLI arguments for the telemetry receiver."""
+    parser = argparse.ArgumentParser(
+        description="Receive telemetry downlinked by the satellite bus"
+    )
+    parser.add_argument(
+        "--host", default=DEFAULT_RECEIVER_ENDPOINT[0], help="Host interface to bind"
+    )
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_RECEIVER_ENDPOINT[1], help="UDP port to bind"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=None,
+        help="Stop after this many seconds (default: run until interrupted)",
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print only the aggregated totals on exit instead of every event",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entry point: print received events as JSON lines, or the totals with --summary."""
+    args = parse_args(argv)
+
+    def print_event(event: DownlinkEvent) -> None:
+        sys.stdout.write(json.dumps(event_payload(event)) + "\n")
+        sys.stdout.flush()
+
+    with TelemetryReceiver((args.host, args.port)) as receiver:
+        try:
+            receiver.run(None if args.summary else print_event, duration=args.duration)
+        except KeyboardInterrupt:
+            pass
+        if args.summary:
+            json.dump(receiver.aggregator.summary(), sys.stdout, indent=2)
+            sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
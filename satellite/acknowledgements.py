@@ -0,0 +1,174 @@
+"""Signed accept/reject acknowledgements returned to ground stations for their commands."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from ccsds.ack_packet import (
+    DEFAULT_ACK_APID,
+    MAX_ENTRIES_PER_ACK,
+    AckEntry,
+    build_ack,
+    command_tag,
+)
+from crypto.hmac_signer import HMACSigner
+from crypto.keyring import Keyring
+from satellite.firewall import FirewallDecision
+from satellite.ingress import Datagram
+from satellite.replay import REPLAY_DETECTED, SEQUENCE_OUTSIDE_WINDOW, STALE_TIMESTAMP
+
+DEFAULT_ACK_CACHE_SIZE = 4096
+
+# Rejections that happen after the HMAC verified, so the command is known to be genuine.
+ACKNOWLEDGED_REJECTIONS = frozenset({REPLAY_DETECTED, SEQUENCE_OUTSIDE_WINDOW, STALE_TIMESTAMP})
+
+# Sends one acknowledgement packet to a ``(host, port)`` address.
+AckSender = Callable[[bytes, tuple[str, int]], object]
+
+_Destination = tuple[str, int, str]
+
+
+@dataclass
+class AckStats:
+    """Counters describing acknowledgements sent by one bus."""
+
+    packets: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    resent: int = 0
+    unsigned: int = 0
+    send_errors: int = 0
+
+
+class CommandAcknowledger:
+    """
+    Acknowledge authenticated commands back to the datagram's source address.
+
+    Only decisions about commands whose HMAC verified are acknowledged: accepted
+    commands, and genuine commands the replay guard refused. Anything that failed
+    parsing, the allow list, or authentication gets no reply, so the bus never answers
+    spoofed traffic. Entries for one ground station and source address in a batch share
+    one packet, signed with that station's current key.
+
+    Accepted commands are remembered by ``(ground station, sequence count)`` in a
+    bounded LRU cache. A retransmission of one of them is rejected by the replay guard
+    as a duplicate; when its tag matches the cached command, the original acceptance is
+    acknowledged again instead, so a lost acknowledgement does not turn into a reported
+    rejection. Without a replay guard a retransmission is simply accepted again.
+    """
+
+    def __init__(
+        self,
+        key: bytes,
+        *,
+        keyring: Keyring | None = None,
+        apid: int = DEFAULT_ACK_APID,
+        cache_size: int = DEFAULT_ACK_CACHE_SIZE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Sign with ``key``, or with each station's current key when ``keyring`` is set."""
+        self.keyring = keyring
+        self.apid = apid
+        self.cache_size = max(1, cache_size)
+        self.clock = clock
+        self.stats = AckStats()
+        self.sequence_count = 0
+        self._signer = HMACSigner(key)
+        self._signers: dict[bytes, HMACSigner] = {}
+        self._accepted: OrderedDict[tuple[str, int], bytes] = OrderedDict()
+        self._send: AckSender | None = None
+        self._lock = threading.Lock()
+
+    def attach(self, send: AckSender | None) -> None:
+        """Send acknowledgements through ``send``, usually the bus's bound socket."""
+        self._send = send
+
+    def acknowledge(
+        self, datagrams: Sequence[Datagram], decisions: Sequence[FirewallDecision]
+    ) -> int:
+        """Send the acknowledgements for a batch of decisions and return how many packets."""
+        send = self._send
+        if send is None:
+            return 0
+        grouped: dict[_Destination, list[AckEntry]] = {}
+        with self._lock:
+            for datagram, decision in zip(datagrams, decisions, strict=True):
+                entry = self._entry(decision)
+                if entry is None or decision.packet is None:
+                    continue
+                station = decision.packet.ground_station_id
+                destination = (datagram.source_ip, datagram.source_port, station)
+                grouped.setdefault(destination, []).append(entry)
+            packets = []
+            for (host, port, station), entries in grouped.items():
+                signer = self._signer_for(station)
+                if signer is None:
+                    self.stats.unsigned += len(entries)
+                    continue
+                for start in range(0, len(entries), MAX_ENTRIES_PER_ACK):
+                    chunk = entries[start : start + MAX_ENTRIES_PER_ACK]
+                    packet = build_ack(
+                        chunk, station, self.sequence_count, self.clock(), signer, self.apid
+                    )
+                    self.sequence_count = (self.sequence_count + 1) & 0x3FFF
+                    packets.append((packet, (host, port)))
+        sent = errors = 0
+        for packet, address in packets:
+            try:
+                send(packet, address)
+            except OSError:
+                errors += 1
+                continue
+            sent += 1
+        with self._lock:
+            self.stats.send_errors += errors
+            self.stats.packets += sent
+        return sent
+
+    def _entry(self, decision: FirewallDecision) -> AckEntry | None:
+        """Return the entry acknowledging ``decision``, or ``None`` if it gets no reply."""
+        parsed = decision.packet
+        if parsed is None or decision.pending:
+            return None
+        if not decision.accepted and decision.reason not in ACKNOWLEDGED_REJECTIONS:
+            return None
+        key = (parsed.ground_station_id, parsed.sequence_count)
+        tag = command_tag(parsed.signature)
+        if decision.accepted:
+            self._accepted[key] = tag
+            self._accepted.move_to_end(key)
+            if len(self._accepted) > self.cache_size:
+                self._accepted.popitem(last=False)
+            self.stats.accepted += 1
+            return AckEntry(parsed.sequence_count, True, tag)
+        if decision.reason == REPLAY_DETECTED and self._accepted.get(key) == tag:
+            self.stats.resent += 1
+            return AckEntry(parsed.sequence_count, True, tag)
+        self.stats.rejected += 1
+        return AckEntry(parsed.sequence_count, False, tag, decision.reason)
+
+    def _signer_for(self, ground_station_id: str) -> HMACSigner | None:
+        """Return the signer for a station's current key, or ``None`` if it has none."""
+        if self.keyring is None:
+            return self._signer
+        keys = self.keyring.lookup(ground_station_id.encode("utf-8"))
+        if keys is None:
+            return None
+        key = keys.current.key
+        signer = self._signers.get(key)
+        if signer is None:
+            signer = self._signers[key] = HMACSigner(key)
+        return signer
+
+
+__all__ = [
+    "ACKNOWLEDGED_REJECTIONS",
+    "DEFAULT_ACK_CACHE_SIZE",
+    "AckSender",
+    "AckStats",
+    "CommandAcknowledger",
+]
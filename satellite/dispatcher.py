@@ -0,0 +1,446 @@
+"""Route accepted commands to handlers on a bounded worker pool, off the receive path."""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import importlib
+import itertools
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from satellite.telemetry import TelemetryLogger
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from ccsds.packet_parser import ParsedPacket
+    from satellite.metrics import BusMetrics
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PENDING = 256
+DEFAULT_HANDLER_TIMEOUT = 5.0
+DEFAULT_CONCURRENCY = 1
+DEFAULT_SHUTDOWN_TIMEOUT = DEFAULT_HANDLER_TIMEOUT
+EXECUTORS = ("thread", "process")
+
+COMPLETED = "completed"
+FAILED = "failed"
+TIMED_OUT = "timed_out"
+DROPPED = "dropped"
+UNKNOWN_VERB = "unknown_verb"
+
+
+class CommandInvocation(NamedTuple):
+    """
+    An accepted command as handed to its handler.
+
+    It holds decoded copies of the packet fields rather than a view of the receive
+    buffer, so it can be queued and pickled for a process pool. ``deadline`` is the
+    ``time.monotonic()`` value at which the handler's timeout expires; long-running
+    handlers may check it to stop early.
+    """
+
+    verb: str
+    arguments: str
+    command: str
+    ground_station_id: str
+    sequence_count: int
+    apid: int
+    deadline: float
+
+
+Handler = Callable[[CommandInvocation], Any]
+
+
+@dataclass(frozen=True)
+class HandlerSpec:
+    """A handler with its timeout and the number of invocations it may run at once."""
+
+    handler: Handler
+    timeout: float = DEFAULT_HANDLER_TIMEOUT
+    concurrency: int = DEFAULT_CONCURRENCY
+
+
+@dataclass
+class DispatchStats:
+    """Counters describing command dispatch activity."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    dropped: int = 0
+    unknown: int = 0
+
+
+def command_verb(command: str) -> tuple[str, str]:
+    """
+    Split a command into its upper-cased verb and the remaining arguments.
+
+    A leading ``TYPE:`` tag is skipped, so ``"CMD: ORIENT +10"`` has the verb
+    ``ORIENT`` and the arguments ``"+10"``.
+    """
+    tag, separator, rest = command.partition(":")
+    if not separator or " " in tag.strip():
+        rest = command
+    verb, _, arguments = rest.strip().partition(" ")
+    return verb.upper(), arguments.strip()
+
+
+def load_handlers(spec: str) -> Mapping[str, Handler | HandlerSpec]:
+    """Import a ``module:attribute`` dispatch table of handlers keyed by verb."""
+    module_name, _, attribute = spec.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Handler table must be given as module:attribute, not {spec!r}")
+    table = getattr(importlib.import_module(module_name), attribute)
+    if not isinstance(table, Mapping):
+        raise ValueError(f"{spec} is not a mapping of command verbs to handlers")
+    return table
+
+
+@dataclass(eq=False)
+class _Route:
+    """A compiled dispatch table entry with its running count and waiting invocations."""
+
+    verb: str
+    spec: HandlerSpec
+    running: int = 0
+    waiting: deque[tuple[CommandInvocation, float]] = field(default_factory=deque)
+
+
+@dataclass(eq=False)
+class _Execution:
+    """One invocation submitted to the pool."""
+
+    route: _Route
+    invocation: CommandInvocation
+    queued_at: float
+    started: float
+    done: bool = False
+    timed_out: bool = False
+
+
+# An execution handed to the pool, with the future that reports its outcome.
+_Launch = tuple[_Execution, Future[Any]]
+
+
+class CommandDispatcher:
+    """
+    Run handlers for accepted commands on a bounded thread or process pool.
+
+    ``handlers`` maps command verbs to a handler or a :class:`HandlerSpec`; it is
+    compiled once into a dispatch table. :meth:`submit` never blocks: it starts the
+    handler if its route has a free concurrency slot, queues it behind the route's
+    running invocations otherwise, and drops it once ``max_pending`` commands are
+    queued or running. A watchdog thread reports handlers that overrun their timeout.
+    Python cannot interrupt a running handler, so an overrunning handler keeps its
+    slot until it returns; the per-route concurrency limit confines a hung handler to
+    its own slots. Execution latency is recorded per verb in ``metrics``, separately
+    from the firewall stages. An invocation the pool refuses, for example because a
+    process pool broke, releases its slot and counts as failed. :attr:`stats` is only
+    updated under the dispatcher's lock, since pool callbacks and the watchdog run on
+    their own threads. :meth:`close` waits at most ``shutdown_timeout`` seconds for
+    running handlers.
+    """
+
+    def __init__(
+        self,
+        handlers: Mapping[str, Handler | HandlerSpec],
+        telemetry: TelemetryLogger,
+        *,
+        workers: int = DEFAULT_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        executor: str = "thread",
+        metrics: BusMetrics | None = None,
+        shutdown_timeout: float = DEFAULT_SHUTDOWN_TIMEOUT,
+    ) -> None:
+        """Compile the dispatch table and start the pool and the timeout watchdog."""
+        if executor not in EXECUTORS:
+            raise ValueError(f"Executor must be one of {', '.join(EXECUTORS)}")
+        if workers < 1 or max_pending < 1:
+            raise ValueError("Dispatcher workers and pending limit must be at least 1")
+        self.routes = {
+            verb.upper(): _Route(
+                verb.upper(), spec if isinstance(spec, HandlerSpec) else HandlerSpec(spec)
+            )
+            for verb, spec in handlers.items()
+        }
+        self.telemetry = telemetry
+        self.metrics = metrics
+        self.max_pending = max_pending
+        self.shutdown_timeout = shutdown_timeout
+        self.stats = DispatchStats()
+        self.pending = 0
+        self._executor: Executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="command-handler")
+            if executor == "thread"
+            else ProcessPoolExecutor(max_workers=workers)
+        )
+        self._condition = threading.Condition()
+        self._deadlines: list[tuple[float, int, _Execution]] = []
+        self._order = itertools.count()
+        self._closed = False
+        self._watchdog = threading.Thread(target=self._watch, name="command-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def submit(self, packet: ParsedPacket) -> bool:
+        """Queue an accepted packet's command for its handler; return False if refused."""
+        verb, arguments = command_verb(packet.command)
+        route = self.routes.get(verb)
+        if route is None:
+            with self._condition:
+                self.stats.unknown += 1
+            self._record(UNKNOWN_VERB, UNKNOWN_VERB, None)
+            self.telemetry.warning(
+                "Unknown command verb",
+                verb=verb,
+                command=packet.command,
+                ground_station_id=packet.ground_station_id,
+            )
+            return False
+        now = time.monotonic()
+        invocation = CommandInvocation(
+            verb,
+            arguments,
+            packet.command,
+            packet.ground_station_id,
+            packet.sequence_count,
+            packet.apid,
+            0.0,
+        )
+        started: list[_Launch] = []
+        refused: list[tuple[CommandInvocation, BaseException]] = []
+        with self._condition:
+            if self._closed or self.pending >= self.max_pending:
+                accepted = False
+                self.stats.dropped += 1
+            else:
+                accepted = True
+                self.pending += 1
+                self.stats.submitted += 1
+                route.waiting.append((invocation, now))
+                started, refused = self._start_waiting(route)
+        self._follow(started, refused)
+        if refused:
+            return False
+        if not accepted:
+            self._record(verb, DROPPED, None)
+            self.telemetry.warning(
+                "Command dropped: dispatch queue full",
+                verb=verb,
+                ground_station_id=packet.ground_station_id,
+                sequence=packet.sequence_count,
+                pending=self.pending,
+            )
+        return accepted
+
+    def close(self) -> None:
+        """
+        Drop queued invocations, wait for running handlers, and report the totals.
+
+        Invocations still queued in the pool are cancelled and count as dropped. Handlers
+        still running after ``shutdown_timeout`` are abandoned: process pool workers are
+        terminated, while a thread handler keeps running until it returns.
+        """
+        with self._condition:
+            self._closed = True
+            abandoned = sum(len(route.waiting) for route in self.routes.values())
+            for route in self.routes.values():
+                route.waiting.clear()
+            self.pending -= abandoned
+            self.stats.dropped += abandoned
+            self._condition.notify_all()
+        processes = self._worker_processes()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._condition:
+            self._condition.wait_for(lambda: self.pending <= 0, self.shutdown_timeout)
+            running = self.pending
+        if running:
+            self.telemetry.critical(
+                "Command handlers abandoned at shutdown",
+                running=running,
+                timeout_seconds=self.shutdown_timeout,
+            )
+            for process in processes:
+                process.terminate()
+            for process in processes:
+                process.join(self.shutdown_timeout)
+        self._watchdog.join()
+        stats = self.stats
+        self.telemetry.info(
+            "Command dispatcher stopped",
+            submitted=stats.submitted,
+            completed=stats.completed,
+            failed=stats.failed,
+            timed_out=stats.timed_out,
+            dropped=stats.dropped,
+            unknown=stats.unknown,
+            abandoned=running,
+        )
+
+    def _worker_processes(self) -> list[BaseProcess]:
+        """Return the process pool's workers, which shutting the pool down forgets."""
+        if not isinstance(self._executor, ProcessPoolExecutor):
+            return []
+        # The pool exposes no public way to stop busy workers before Python 3.14.
+        return list((self._executor._processes or {}).values())
+
+    def _start_waiting(
+        self, route: _Route
+    ) -> tuple[list[_Launch], list[tuple[CommandInvocation, BaseException]]]:
+        """
+        Start ``route``'s waiting invocations while it has free slots; the caller holds the lock.
+
+        Returns the started executions with their futures, which the caller passes to
+        :meth:`_follow` once it has released the lock, and the invocations the pool
+        refused with the error it raised. Each refused invocation has already released
+        its slot and pending count and counts as failed.
+        """
+        started: list[_Launch] = []
+        refused: list[tuple[CommandInvocation, BaseException]] = []
+        while route.waiting and route.running < route.spec.concurrency and not self._closed:
+            invocation, queued_at = route.waiting.popleft()
+            route.running += 1
+            try:
+                started.append(self._start(route, invocation, queued_at))
+            except RuntimeError as error:
+                route.running -= 1
+                self.pending -= 1
+                self.stats.failed += 1
+                refused.append((invocation, error))
+        return started, refused
+
+    def _start(self, route: _Route, invocation: CommandInvocation, queued_at: float) -> _Launch:
+        """Submit ``invocation`` to the pool and arm its timeout; the caller holds the lock."""
+        started = time.monotonic()
+        invocation = invocation._replace(deadline=started + route.spec.timeout)
+        execution = _Execution(route, invocation, queued_at, started)
+        future = self._executor.submit(route.spec.handler, invocation)
+        heapq.heappush(self._deadlines, (invocation.deadline, next(self._order), execution))
+        self._condition.notify_all()
+        return execution, future
+
+    def _follow(
+        self, started: list[_Launch], refused: list[tuple[CommandInvocation, BaseException]]
+    ) -> None:
+        """
+        Watch started executions for completion and report refused ones, without the lock.
+
+        A future that already finished runs its callback right here, which takes the
+        lock again, so this must not be called while holding it.
+        """
+        for execution, future in started:
+            future.add_done_callback(functools.partial(self._finished, execution))
+        self._report_refused(refused)
+
+    def _report_refused(self, refused: list[tuple[CommandInvocation, BaseException]]) -> None:
+        """Report invocations the pool would not accept as failed handlers."""
+        for invocation, error in refused:
+            self._record(invocation.verb, FAILED, None)
+            self.telemetry.warning(
+                "Command handler failed",
+                error=repr(error),
+                verb=invocation.verb,
+                ground_station_id=invocation.ground_station_id,
+                sequence=invocation.sequence_count,
+            )
+
+    def _finished(self, execution: _Execution, future: Future[Any]) -> None:
+        """Report a finished invocation and start the next one waiting on its route."""
+        elapsed = time.monotonic() - execution.started
+        route = execution.route
+        cancelled = future.cancelled()
+        error = None if cancelled else future.exception()
+        failed = error is not None
+        with self._condition:
+            execution.done = True
+            self.pending -= 1
+            route.running -= 1
+            if cancelled:
+                self.stats.dropped += 1
+            elif failed:
+                self.stats.failed += 1
+            else:
+                self.stats.completed += 1
+            started, refused = self._start_waiting(route)
+            self._condition.notify_all()
+        self._follow(started, refused)
+        invocation = execution.invocation
+        if cancelled:
+            self._record(invocation.verb, DROPPED, None)
+            return
+        context = {
+            "verb": invocation.verb,
+            "ground_station_id": invocation.ground_station_id,
+            "sequence": invocation.sequence_count,
+            "duration_ms": round(elapsed * 1000, 3),
+            "queued_ms": round((execution.started - execution.queued_at) * 1000, 3),
+        }
+        if failed:
+            self._record(invocation.verb, FAILED, elapsed)
+            self.telemetry.warning("Command handler failed", error=repr(error), **context)
+            return
+        outcome = TIMED_OUT if execution.timed_out else COMPLETED
+        self._record(invocation.verb, outcome, elapsed)
+        result = future.result()
+        if result is not None:
+            context["result"] = result if isinstance(result, str | int | float) else repr(result)
+        self.telemetry.info(
+            "Command executed" if outcome == COMPLETED else "Command executed after timeout",
+            **context,
+        )
+
+    def _watch(self) -> None:
+        """Report invocations still running at their deadline until the dispatcher closes."""
+        while True:
+            expired: list[_Execution] = []
+            with self._condition:
+                while not expired:
+                    if self._closed:
+                        return
+                    now = time.monotonic()
+                    while self._deadlines and self._deadlines[0][0] <= now:
+                        _, _, execution = heapq.heappop(self._deadlines)
+                        if not execution.done:
+                            execution.timed_out = True
+                            self.stats.timed_out += 1
+                            expired.append(execution)
+                    if not expired:
+                        wait = self._deadlines[0][0] - now if self._deadlines else None
+                        self._condition.wait(wait)
+            for execution in expired:
+                invocation = execution.invocation
+                self.telemetry.critical(
+                    "Command handler timed out",
+                    verb=invocation.verb,
+                    ground_station_id=invocation.ground_station_id,
+                    sequence=invocation.sequence_count,
+                    timeout_seconds=execution.route.spec.timeout,
+                )
+
+    def _record(self, verb: str, outcome: str, seconds: float | None) -> None:
+        """Count the outcome and execution latency in the bus metrics, if collected."""
+        if self.metrics is not None:
+            self.metrics.record_execution(verb, outcome, seconds)
+
+
+__all__ = [
+    "DEFAULT_HANDLER_TIMEOUT",
+    "DEFAULT_MAX_PENDING",
+    "DEFAULT_SHUTDOWN_TIMEOUT",
+    "DEFAULT_WORKERS",
+    "EXECUTORS",
+    "CommandDispatcher",
+    "CommandInvocation",
+    "DispatchStats",
+    "Handler",
+    "HandlerSpec",
+    "command_verb",
+    "load_handlers",
+]
@@ -0,0 +1,150 @@
+"""Telemetry sink that downlinks events to the ground as batched CCSDS telemetry frames."""
+
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from ccsds.telemetry_packet import (
+    DEFAULT_TELEMETRY_APID,
+    FRAME_OVERHEAD,
+    MAX_EVENTS_PER_FRAME,
+    MAX_FRAME_BYTES,
+    MIN_FRAME_BYTES,
+    build_frame,
+    encode_event,
+)
+from satellite.telemetry import TelemetryRecord, expand_records
+
+DEFAULT_DOWNLINK_PORT = 5001
+DEFAULT_MAX_FRAME_BYTES = 1024
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_MIN_LEVEL = logging.INFO
+
+
+@dataclass
+class DownlinkStats:
+    """Counters describing downlinked telemetry."""
+
+    events: int = 0
+    frames: int = 0
+    bytes_sent: int = 0
+    truncated: int = 0
+    filtered: int = 0
+    send_errors: int = 0
+
+
+class DownlinkSink:
+    """
+    Pack telemetry events into CCSDS telemetry frames and send them to a ground endpoint.
+
+    Events below ``min_level`` are skipped and aggregated events such as ``"Firewall
+    batch inspected"`` are split into their nested events, as in the telemetry store.
+    Encoded events accumulate in one pending frame of at most ``max_frame_bytes``; it
+    is sent as soon as the next event would not fit, and a flush thread sends a
+    partially filled frame every ``flush_interval`` seconds, so an event waits at most
+    that long. An event larger than a frame keeps its message and loses its context.
+    Send failures are counted rather than reported as telemetry, which would feed back
+    into this sink.
+    """
+
+    def __init__(
+        self,
+        endpoint: tuple[str, int],
+        *,
+        apid: int = DEFAULT_TELEMETRY_APID,
+        max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        min_level: int = DEFAULT_MIN_LEVEL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Open the downlink socket and start the flush thread."""
+        if not MIN_FRAME_BYTES <= max_frame_bytes <= MAX_FRAME_BYTES:
+            raise ValueError(
+                f"Telemetry frames must be between {MIN_FRAME_BYTES} and {MAX_FRAME_BYTES} bytes"
+            )
+        if flush_interval <= 0:
+            raise ValueError("Downlink flush interval must be positive")
+        self.endpoint = endpoint
+        self.apid = apid
+        self.max_frame_bytes = max_frame_bytes
+        self.flush_interval = flush_interval
+        self.min_level = min_level
+        self.clock = clock
+        self.stats = DownlinkStats()
+        self.sequence_count = 0
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._pending: list[bytes] = []
+        self._pending_bytes = FRAME_OVERHEAD
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._run, name="telemetry-downlink", daemon=True)
+        self._flusher.start()
+
+    def write(self, records: Sequence[TelemetryRecord]) -> None:
+        """Add ``records`` to the pending frame, sending every frame that fills up."""
+        budget = self.max_frame_bytes - FRAME_OVERHEAD
+        for level, created, message, context in expand_records(records):
+            if level < self.min_level:
+                self.stats.filtered += 1
+                continue
+            event, truncated = encode_event(level, created, message, context, budget)
+            with self._lock:
+                if (
+                    self._pending_bytes + len(event) > self.max_frame_bytes
+                    or len(self._pending) == MAX_EVENTS_PER_FRAME
+                ):
+                    self._send_pending()
+                self._pending.append(event)
+                self._pending_bytes += len(event)
+                self.stats.events += 1
+                self.stats.truncated += truncated
+
+    def flush(self) -> None:
+        """Send the pending frame now, if it holds any events."""
+        with self._lock:
+            self._send_pending()
+
+    def close(self) -> None:
+        """Stop the flush thread, send the last frame, and close the socket."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._flusher.join()
+        self.flush()
+        self._socket.close()
+
+    def _run(self) -> None:
+        """Send the pending frame every ``flush_interval`` seconds until closed."""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def _send_pending(self) -> None:
+        """Frame and send the pending events; the caller holds the lock."""
+        if not self._pending:
+            return
+        frame = build_frame(self._pending, self.sequence_count, self.clock(), self.apid)
+        self._pending = []
+        self._pending_bytes = FRAME_OVERHEAD
+        self.sequence_count = (self.sequence_count + 1) & 0x3FFF
+        try:
+            self._socket.sendto(frame, self.endpoint)
+        except OSError:
+            self.stats.send_errors += 1
+            return
+        self.stats.frames += 1
+        self.stats.bytes_sent += len(frame)
+
+
+__all__ = [
+    "DEFAULT_DOWNLINK_PORT",
+    "DEFAULT_FLUSH_INTERVAL",
+    "DEFAULT_MAX_FRAME_BYTES",
+    "DEFAULT_MIN_LEVEL",
+    "DownlinkSink",
+    "DownlinkStats",
+]
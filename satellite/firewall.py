@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import logging
+import time
+from collections import Counter
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from typing import Any
 
 from ccsds.packet_parser import CCSDSPacketParser, PacketValidationError, ParsedPacket
+from ccsds.reassembly import (
+    REASSEMBLY_TIMED_OUT,
+    SEGMENT_BUFFERED,
+    SegmentReassembler,
+    is_segment,
+)
+from crypto.keyring import Keyring
 from crypto.verifier import HMACVerifier
+from satellite.metrics import ALLOW_LIST, HMAC, PARSE, TELEMETRY, BusMetrics
+from satellite.prefilter import (
+    GROUND_ID_NOT_AUTHORIZED,
+    SOURCE_RATE_LIMITED,
+    HeaderPrefilter,
+    RejectionSummary,
+    claimed_ground_station,
+)
+from satellite.ratelimit import TokenBucketLimiter
+from satellite.replay import ReplayGuard
 from satellite.telemetry import TelemetryLogger
 
+TelemetryEvent = tuple[int, str, dict[str, Any]]
+
 
 @dataclass
 class FirewallDecision:
@@ -18,61 +41,299 @@ class FirewallDecision:
     reason: str
     packet: ParsedPacket | None = None
 
+    @property
+    def pending(self) -> bool:
+        """Return whether the packet was a segment held for reassembly, not a verdict."""
+        return self.reason == SEGMENT_BUFFERED
+
+
+Outcome = tuple[FirewallDecision, TelemetryEvent | None]
+
 
 class SatelliteFirewall:
     """Validate CCSDS command packets using HMAC and ground station allow-lists."""
 
     def __init__(
-        self, key: bytes, allowed_ground_stations: Iterable[str], telemetry: TelemetryLogger
+        self,
+        key: bytes,
+        allowed_ground_stations: Iterable[str],
+        telemetry: TelemetryLogger,
+        *,
+        replay_guard: ReplayGuard | None = None,
+        rate_limiter: TokenBucketLimiter | None = None,
+        allowed_apids: Iterable[int] | None = None,
+        metrics: BusMetrics | None = None,
+        keyring: Keyring | None = None,
+        reassembler: SegmentReassembler | None = None,
     ) -> None:
-        """Configure signature verification, allow list, and telemetry handlers."""
+        """
+        Configure signature verification, allow list, and telemetry handlers.
+
+        Every packet first passes a :class:`HeaderPrefilter` (header fields, optional
+        ``allowed_apids``, and ground station allow list) and then the optional
+        per-source ``rate_limiter``; both reject without parsing and are reported in a
+        periodic summary rather than per packet. When ``replay_guard`` is provided,
+        authenticated packets must also pass its sequence-window and freshness checks.
+        ``metrics`` collects decision counters and per-stage latencies; without it the
+        only instrumentation cost is a ``None`` check per stage. With a ``keyring``, each
+        packet is verified against its ground station's own keys instead of ``key``, and
+        stations without keyring entries fail authentication; the keyring's stations also
+        replace ``allowed_ground_stations`` and are re-read by
+        :meth:`refresh_ground_stations` after a reload. A ``reassembler`` accepts
+        segmented packets: each segment is pre-filtered and rate limited, and the
+        reassembled packet is then inspected, and authenticated, as a whole.
+        """
         self.verifier = HMACVerifier(key)
+        self.keyring = keyring
+        self.replay_guard = replay_guard
+        self.rate_limiter = rate_limiter
+        if keyring is not None:
+            allowed_ground_stations = keyring.ground_stations
         self.allowed_ground_stations: set[str] = set(allowed_ground_stations)
+        self.reassembler = reassembler
+        self.prefilter = HeaderPrefilter(
+            (station.encode("utf-8") for station in self.allowed_ground_stations),
+            allowed_apids,
+            segments=reassembler is not None,
+        )
         self.parser = CCSDSPacketParser()
         self.telemetry = telemetry
+        self.rejections = RejectionSummary(telemetry)
+        self.metrics = metrics
+
+    def refresh_ground_stations(self) -> None:
+        """Make the allow list match the keyring's stations after it was reloaded."""
+        if self.keyring is None:
+            return
+        stations = set(self.keyring.ground_stations)
+        self.prefilter.allowed_ground_stations = frozenset(
+            station.encode("utf-8") for station in stations
+        )
+        self.allowed_ground_stations = stations
+
+    def inspect(
+        self, packet: bytes, source_ip: str, *, now: float | None = None
+    ) -> FirewallDecision:
+        """
+        Parse, validate, and authorize an incoming packet.
+
+        Header checks, the allow list, and rate limiting run on raw bytes before parsing,
+        and HMAC verification runs over a view of the received buffer, so text fields are
+        only decoded when telemetry or the caller reads them. ``now`` overrides the clock
+        used by rate limiting and replay freshness, e.g. when replaying a capture.
+        """
+        metrics = self.metrics
+        screened = self._screen(packet, source_ip, now)
+        if isinstance(screened, ParsedPacket):
+            started = time.perf_counter() if metrics is not None else 0.0
+            verified = self._verify(screened, now)
+            if metrics is not None:
+                metrics.observe(HMAC, time.perf_counter() - started)
+            decision, event = self._authorize(screened, source_ip, verified, now)
+        else:
+            decision, event = screened
+        if event is not None:
+            level, message, context = event
+            started = time.perf_counter() if metrics is not None else 0.0
+            self.telemetry.emit(level, message, **context)
+            if metrics is not None:
+                metrics.observe(TELEMETRY, time.perf_counter() - started)
+        if metrics is not None and not decision.pending:
+            metrics.record(decision.accepted, decision.reason)
+        return decision
+
+    def inspect_batch(self, datagrams: Sequence[tuple[bytes, str]]) -> list[FirewallDecision]:
+        """
+        Inspect a burst of ``(packet, source_ip)`` datagrams as a group.
+
+        Every packet is parsed and allow-list filtered first, the survivors are verified
+        together with :meth:`HMACVerifier.verify_many`, and a single aggregated telemetry
+        event carries the per-packet events for the whole batch.
+        """
+        outcomes: list[Outcome | None] = []
+        candidates: list[tuple[int, ParsedPacket]] = []
+        for index, (packet, source_ip) in enumerate(datagrams):
+            screened = self._screen(packet, source_ip)
+            if isinstance(screened, ParsedPacket):
+                candidates.append((index, screened))
+                outcomes.append(None)
+            else:
+                outcomes.append(screened)
+
+        metrics = self.metrics
+        started = time.perf_counter() if metrics is not None else 0.0
+        if self.keyring is None:
+            verified = self.verifier.verify_many(
+                (parsed.raw_without_signature, parsed.signature) for _, parsed in candidates
+            )
+        else:
+            verified = [self._verify(parsed) for _, parsed in candidates]
+        if metrics is not None and candidates:
+            metrics.observe(
+                HMAC, (time.perf_counter() - started) / len(candidates), len(candidates)
+            )
+        for (index, parsed), is_valid in zip(candidates, verified, strict=True):
+            outcomes[index] = self._authorize(parsed, datagrams[index][1], is_valid)
+
+        resolved = [outcome for outcome in outcomes if outcome is not None]
+        started = time.perf_counter() if metrics is not None else 0.0
+        emitted = self._emit_batch(resolved)
+        decisions = [decision for decision, _ in resolved]
+        if metrics is not None:
+            if emitted:
+                metrics.observe(TELEMETRY, time.perf_counter() - started)
+            for decision in decisions:
+                if not decision.pending:
+                    metrics.record(decision.accepted, decision.reason)
+        return decisions
+
+    def _screen(
+        self, packet: bytes | bytearray, source_ip: str, now: float | None = None
+    ) -> ParsedPacket | Outcome:
+        """
+        Pre-filter, rate limit, and parse the packet, returning a rejection on failure.
+
+        Segments are handed to the reassembler; only the completed packet, pre-filtered
+        again as a stand-alone packet, goes on to be parsed.
+        """
+        metrics = self.metrics
+        started = time.perf_counter() if metrics is not None else 0.0
+        reason = self.prefilter.check(packet)
+        if reason is None and self.rate_limiter and not self.rate_limiter.allow(source_ip, now):
+            reason = SOURCE_RATE_LIMITED
+        if reason is None and self.reassembler is not None and is_segment(packet):
+            expired = self.reassembler.expire(now)
+            if expired:
+                self.rejections.record(REASSEMBLY_TIMED_OUT, expired)
+            reassembled = self.reassembler.add(packet, source_ip, now)
+            if isinstance(reassembled, str):
+                reason = reassembled
+            else:
+                packet = reassembled
+                reason = self.prefilter.check(packet)
+        if metrics is not None:
+            parse_started = time.perf_counter()
+            metrics.observe(ALLOW_LIST, parse_started - started)
+        if reason == SEGMENT_BUFFERED:
+            return FirewallDecision(False, reason), None
+        if reason == GROUND_ID_NOT_AUTHORIZED:
+            self.rejections.record(
+                reason, source_ip=source_ip, ground_station_id=claimed_ground_station(packet)
+            )
+            return FirewallDecision(False, reason), None
+        if reason is not None:
+            self.rejections.record(reason)
+            return FirewallDecision(False, reason), None
 
-    def inspect(self, packet: bytes, source_ip: str) -> FirewallDecision:
-        """Parse, validate, and authorize an incoming packet."""
         try:
             parsed = self.parser.parse(packet)
         except PacketValidationError as exc:
-            self.telemetry.warning(
+            return FirewallDecision(False, str(exc)), (
+                logging.WARNING,
                 "Packet Decode Failure",
-                source_ip=source_ip,
-                error=str(exc),
+                {"source_ip": source_ip, "error": str(exc)},
             )
-            return FirewallDecision(False, str(exc))
-
-        if parsed.ground_station_id not in self.allowed_ground_stations:
-            reason = "Ground station ID not authorized"
-            self.telemetry.critical(
-                "CRITICAL SECURITY ALERT: Unauthorized ground station",
-                source_ip=source_ip,
-                ground_station_id=parsed.ground_station_id,
-                reason=reason,
-                command=parsed.command,
-            )
-            return FirewallDecision(False, reason, parsed)
+        finally:
+            if metrics is not None:
+                metrics.observe(PARSE, time.perf_counter() - parse_started)
+        return parsed
+
+    def _verify(self, parsed: ParsedPacket, now: float | None = None) -> bool:
+        """Check the packet's HMAC with the shared key or its ground station's keyring entry."""
+        if self.keyring is None:
+            return self.verifier.verify(parsed.raw_without_signature, parsed.signature)
+        return self.keyring.verify(
+            bytes(parsed.ground_station_id_bytes),
+            parsed.raw_without_signature,
+            parsed.signature,
+            now,
+        )
 
-        if not self.verifier.verify(parsed.raw_without_signature, parsed.signature):
+    def _authorize(
+        self, parsed: ParsedPacket, source_ip: str, verified: bool, now: float | None = None
+    ) -> Outcome:
+        """Apply HMAC and replay checks to an allow-listed packet and return the decision."""
+        if not verified:
             reason = "HMAC verification failed"
-            self.telemetry.critical(
+            return FirewallDecision(False, reason, parsed), (
+                logging.CRITICAL,
                 "CRITICAL SECURITY ALERT: Uplink Spoof Attempt Detected",
-                source_ip=source_ip,
-                ground_station_id=parsed.ground_station_id,
-                command=parsed.command,
-                reason=reason,
+                {
+                    "source_ip": source_ip,
+                    "ground_station_id": parsed.ground_station_id,
+                    "command": parsed.command,
+                    "reason": reason,
+                },
             )
-            return FirewallDecision(False, reason, parsed)
 
-        self.telemetry.info(
+        if self.replay_guard is not None:
+            replay_reason = self.replay_guard.check(
+                parsed.ground_station_id,
+                parsed.apid,
+                parsed.sequence_count,
+                parsed.timestamp_seconds,
+                now=now,
+            )
+            if replay_reason is not None:
+                return FirewallDecision(False, replay_reason, parsed), (
+                    logging.CRITICAL,
+                    "CRITICAL SECURITY ALERT: Replay Attempt Detected",
+                    {
+                        "source_ip": source_ip,
+                        "ground_station_id": parsed.ground_station_id,
+                        "command": parsed.command,
+                        "sequence": parsed.sequence_count,
+                        "reason": replay_reason,
+                    },
+                )
+
+        return FirewallDecision(True, "Command accepted", parsed), (
+            logging.INFO,
             "Command accepted",
-            source_ip=source_ip,
-            command=parsed.command,
-            ground_station_id=parsed.ground_station_id,
-            sequence=parsed.sequence_count,
+            {
+                "source_ip": source_ip,
+                "command": parsed.command,
+                "ground_station_id": parsed.ground_station_id,
+                "sequence": parsed.sequence_count,
+            },
+        )
+
+    def close(self) -> None:
+        """Report pending pre-filter rejections and persist replay window state."""
+        self.rejections.close()
+        if self.replay_guard is not None:
+            self.replay_guard.close()
+
+    def _emit_batch(self, outcomes: Sequence[Outcome]) -> bool:
+        """
+        Write one telemetry event summarising every outcome in a batch.
+
+        Fast-path rejections carry no event of their own; a batch made up only of them
+        is left to the periodic pre-filter summary. Segments buffered for reassembly are
+        counted as pending rather than rejected. Returns whether an event was written.
+        """
+        events = [event for _, event in outcomes if event is not None]
+        if not events:
+            return False
+        pending = sum(decision.pending for decision, _ in outcomes)
+        rejected = Counter(
+            decision.reason
+            for decision, _ in outcomes
+            if not decision.accepted and not decision.pending
+        )
+        self.telemetry.emit(
+            max(level for level, _, _ in events),
+            "Firewall batch inspected",
+            packets=len(outcomes),
+            accepted=len(outcomes) - sum(rejected.values()) - pending,
+            pending=pending,
+            rejected=dict(rejected),
+            events=[
+                {"level": logging.getLevelName(level), "message": message, **context}
+                for level, message, context in events
+            ],
         )
-        return FirewallDecision(True, "Command accepted", parsed)
+        return True
 
 
 __all__ = ["SatelliteFirewall", "FirewallDecision"]
@@ -0,0 +1,52 @@
+"""
+Log2-bucketed latency histogram shared by bus metrics and ground station RTT stats.
+
+This module has no imports from the rest of the package, so the ground station can
+record latencies without loading the bus, its ingress queues, or asyncio.
+"""
+
+from __future__ import annotations
+
+import bisect
+
+# Upper bounds from 1 microsecond doubling to ~33 seconds, so slow command handlers and
+# round trips still land in a finite bucket; one extra slot counts anything slower.
+BUCKET_BOUNDS: tuple[float, ...] = tuple(1e-6 * 2**exponent for exponent in range(26))
+
+
+class LatencyHistogram:
+    """Fixed log2-bucketed latency histogram; observing is a bisect and two adds."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self) -> None:
+        """Start with every bucket empty."""
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float, times: int = 1) -> None:
+        """Record ``times`` observations of ``seconds``."""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += times
+        self.total += seconds * times
+        self.count += times
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Return the bucket upper bound covering ``fraction`` of observations.
+
+        Observations beyond the last bound report that bound, which is then a lower
+        limit, so summaries stay finite and serialise as JSON.
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, bucket in zip(BUCKET_BOUNDS, self.counts, strict=False):
+            seen += bucket
+            if seen >= rank:
+                return bound
+        return BUCKET_BOUNDS[-1]
+
+
+__all__ = ["BUCKET_BOUNDS", "LatencyHistogram"]
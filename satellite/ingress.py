@@ -0,0 +1,123 @@
+"""Bounded ingress queueing for the asyncio satellite bus mode."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, NamedTuple, Protocol
+
+
+class Datagram(NamedTuple):
+    """A received datagram with the address it came from and its arrival time."""
+
+    packet: bytes
+    source_ip: str
+    source_port: int = 0
+    received_at: float = 0.0
+
+
+class OverflowPolicy(StrEnum):
+    """What to discard when a datagram arrives at a full ingress queue."""
+
+    DROP_OLDEST = "drop-oldest"
+    DROP_NEWEST = "drop-newest"
+
+
+@dataclass
+class IngressStats:
+    """Counters describing ingress queue activity."""
+
+    received: int = 0
+    dropped: int = 0
+    processed: int = 0
+
+
+class DatagramQueue(Protocol):
+    """The queue interface the async receive path and its consumers rely on."""
+
+    @property
+    def stats(self) -> IngressStats:
+        """Return the queue's activity counters."""
+
+    def put(self, datagram: Datagram) -> bool:
+        """Enqueue a datagram without blocking; return False if it was dropped."""
+
+    async def get(self) -> Datagram:
+        """Wait for and return the next datagram."""
+
+    def get_nowait_batch(self, limit: int) -> list[Datagram]:
+        """Return up to ``limit`` already-queued datagrams without waiting."""
+
+    def task_done(self) -> None:
+        """Mark a previously fetched datagram as processed."""
+
+    def qsize(self) -> int:
+        """Return the number of datagrams waiting for inspection."""
+
+
+class IngressQueue:
+    """Bounded FIFO of received datagrams that never blocks the receiver."""
+
+    def __init__(self, maxsize: int, policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST) -> None:
+        """Create a queue holding at most ``maxsize`` datagrams."""
+        if maxsize < 1:
+            raise ValueError("Ingress queue size must be at least 1")
+        self.policy = policy
+        self.stats = IngressStats()
+        self._queue: asyncio.Queue[Datagram] = asyncio.Queue(maxsize)
+
+    def put(self, datagram: Datagram) -> bool:
+        """Enqueue a datagram, applying the overflow policy; return False if it was dropped."""
+        self.stats.received += 1
+        if self._queue.full():
+            self.stats.dropped += 1
+            if self.policy is OverflowPolicy.DROP_NEWEST:
+                return False
+            self._queue.get_nowait()
+            self._queue.task_done()
+        self._queue.put_nowait(datagram)
+        return True
+
+    async def get(self) -> Datagram:
+        """Wait for and return the oldest queued datagram."""
+        return await self._queue.get()
+
+    def get_nowait_batch(self, limit: int) -> list[Datagram]:
+        """Return up to ``limit`` already-queued datagrams without waiting."""
+        batch: list[Datagram] = []
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    def task_done(self) -> None:
+        """Mark a previously fetched datagram as processed."""
+        self.stats.processed += 1
+        self._queue.task_done()
+
+    def qsize(self) -> int:
+        """Return the number of datagrams waiting for inspection."""
+        return self._queue.qsize()
+
+
+class IngressProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol that only enqueues packets; inspection happens elsewhere."""
+
+    def __init__(self, queue: DatagramQueue) -> None:
+        """Attach the protocol to the queue that receives every datagram."""
+        self.queue = queue
+
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        """Hand the datagram to the ingress queue without further processing."""
+        self.queue.put(Datagram(data, str(addr[0]), int(addr[1]), time.time()))
+
+
+__all__ = [
+    "Datagram",
+    "DatagramQueue",
+    "IngressProtocol",
+    "IngressQueue",
+    "IngressStats",
+    "OverflowPolicy",
+]
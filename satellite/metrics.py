@@ -0,0 +1,334 @@
+"""Low-overhead counters, stage latency histograms, and a Prometheus endpoint."""
+
+from __future__ import annotations
+
+import threading
+import urllib.parse
+from collections import Counter
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from satellite.histogram import BUCKET_BOUNDS, LatencyHistogram
+from satellite.ingress import IngressStats
+from satellite.scheduler import AdmissionStats
+from satellite.telemetry import TelemetryLogger
+
+if TYPE_CHECKING:
+    from http.server import BaseHTTPRequestHandler
+
+PARSE = "parse"
+ALLOW_LIST = "allow_list"
+HMAC = "hmac"
+TELEMETRY = "telemetry"
+STAGES = (PARSE, ALLOW_LIST, HMAC, TELEMETRY)
+
+DEFAULT_METRICS_HOST = "127.0.0.1"
+DEFAULT_SUMMARY_INTERVAL = 60.0
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# An endpoint route maps GET query parameters to (status, content type, body).
+Route = Callable[[dict[str, str]], tuple[int, str, bytes]]
+
+
+class BusMetrics:
+    """
+    Packet counters and per-stage latency histograms for one bus instance.
+
+    Command execution is tracked apart from the firewall stages: outcomes are counted
+    per ``(verb, outcome)`` and handler latency is kept in one histogram per verb.
+
+    Firewall counters and stage latencies are plain additions made under the bus's
+    inspection lock; execution outcomes arrive from dispatcher threads and take a
+    lock of their own. Values read concurrently from another thread may be off by
+    in-flight observations.
+    """
+
+    def __init__(self) -> None:
+        """Create zeroed counters and one histogram per stage."""
+        self.received = 0
+        self.accepted = 0
+        self.rejected: Counter[str] = Counter()
+        self.stages = {stage: LatencyHistogram() for stage in STAGES}
+        self.ingress: IngressStats | None = None
+        self.executed: Counter[tuple[str, str]] = Counter()
+        self.executions: dict[str, LatencyHistogram] = {}
+        self._execution_lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float, times: int = 1) -> None:
+        """Record the latency of ``stage``."""
+        self.stages[stage].observe(seconds, times)
+
+    def record(self, accepted: bool, reason: str) -> None:
+        """Count one firewall decision."""
+        self.received += 1
+        if accepted:
+            self.accepted += 1
+        else:
+            self.rejected[reason] += 1
+
+    def record_execution(self, verb: str, outcome: str, seconds: float | None = None) -> None:
+        """Count one command dispatch outcome and, if it ran, its handler latency."""
+        with self._execution_lock:
+            self.executed[verb, outcome] += 1
+            if seconds is not None:
+                histogram = self.executions.get(verb)
+                if histogram is None:
+                    histogram = self.executions[verb] = LatencyHistogram()
+                histogram.observe(seconds)
+
+    @property
+    def queue_dropped(self) -> int:
+        """Return datagrams dropped by the async ingress queue, if one is attached."""
+        return self.ingress.dropped if self.ingress is not None else 0
+
+    def summary(self) -> dict[str, Any]:
+        """Return counters and per-stage latency percentiles in microseconds."""
+        summary = {
+            "received": self.received,
+            "accepted": self.accepted,
+            "rejected": dict(self.rejected),
+            "queue_dropped": self.queue_dropped,
+            "stages": {
+                stage: _latency_summary(histogram) for stage, histogram in self.stages.items()
+            },
+        }
+        if self.executed:
+            outcomes: dict[str, dict[str, int]] = {}
+            for (verb, outcome), count in sorted(self.executed.items()):
+                outcomes.setdefault(verb, {})[outcome] = count
+            summary["executions"] = {
+                verb: {
+                    "outcomes": counts,
+                    **(_latency_summary(self.executions[verb]) if verb in self.executions else {}),
+                }
+                for verb, counts in outcomes.items()
+            }
+        return summary
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP satellite_bus_packets_received_total Datagrams inspected by the firewall.",
+            "# TYPE satellite_bus_packets_received_total counter",
+            f"satellite_bus_packets_received_total {self.received}",
+            "# HELP satellite_bus_packets_accepted_total Commands accepted by the firewall.",
+            "# TYPE satellite_bus_packets_accepted_total counter",
+            f"satellite_bus_packets_accepted_total {self.accepted}",
+            "# HELP satellite_bus_packets_rejected_total Datagrams rejected, by reason.",
+            "# TYPE satellite_bus_packets_rejected_total counter",
+        ]
+        lines.extend(
+            f'satellite_bus_packets_rejected_total{{reason="{_escape(reason)}"}} {count}'
+            for reason, count in sorted(self.rejected.items())
+        )
+        lines += [
+            "# HELP satellite_bus_queue_dropped_total Datagrams dropped by the ingress queue.",
+            "# TYPE satellite_bus_queue_dropped_total counter",
+            f"satellite_bus_queue_dropped_total {self.queue_dropped}",
+        ]
+        if isinstance(self.ingress, AdmissionStats):
+            lines += [
+                "# HELP satellite_bus_admission_dropped_total Datagrams dropped by full "
+                "admission queues, by ground station and class.",
+                "# TYPE satellite_bus_admission_dropped_total counter",
+            ]
+            lines.extend(
+                f'satellite_bus_admission_dropped_total{{ground_station="{_escape(station)}",'
+                f'class="{priority_class}"}} {count}'
+                for (priority_class, station), count in sorted(self.ingress.queue_dropped.items())
+            )
+        lines += [
+            "# HELP satellite_bus_stage_latency_seconds Firewall stage latency.",
+            "# TYPE satellite_bus_stage_latency_seconds histogram",
+        ]
+        for stage, histogram in self.stages.items():
+            lines += _histogram_lines(
+                "satellite_bus_stage_latency_seconds", f'stage="{stage}"', histogram
+            )
+        lines += [
+            "# HELP satellite_bus_commands_total Accepted commands by verb and dispatch outcome.",
+            "# TYPE satellite_bus_commands_total counter",
+        ]
+        lines.extend(
+            f'satellite_bus_commands_total{{verb="{_escape(verb)}",outcome="{outcome}"}} {count}'
+            for (verb, outcome), count in sorted(self.executed.items())
+        )
+        lines += [
+            "# HELP satellite_bus_command_execution_seconds Command handler latency by verb.",
+            "# TYPE satellite_bus_command_execution_seconds histogram",
+        ]
+        for verb, histogram in sorted(self.executions.items()):
+            lines += _histogram_lines(
+                "satellite_bus_command_execution_seconds", f'verb="{_escape(verb)}"', histogram
+            )
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Local HTTP endpoint serving ``/metrics`` and any extra routes on a daemon thread."""
+
+    def __init__(
+        self,
+        metrics: BusMetrics,
+        port: int,
+        host: str = DEFAULT_METRICS_HOST,
+        routes: dict[str, Route] | None = None,
+    ) -> None:
+        """Bind ``host:port`` (port 0 picks a free one) and start serving."""
+        from http.server import ThreadingHTTPServer
+
+        self.routes: dict[str, Route] = {
+            "/metrics": lambda _: (200, CONTENT_TYPE, metrics.render().encode("utf-8")),
+            **(routes or {}),
+        }
+        handler = _handler_for(self.routes)
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self.address: tuple[str, int] = self._server.server_address[:2]  # type: ignore[assignment]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop serving and release the listening socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+class MetricsReporter:
+    """Emit ``"Bus metrics summary"`` telemetry every ``interval`` seconds and on close."""
+
+    def __init__(
+        self,
+        metrics: BusMetrics,
+        telemetry: TelemetryLogger,
+        interval: float = DEFAULT_SUMMARY_INTERVAL,
+    ) -> None:
+        """Start the reporting thread."""
+        self.metrics = metrics
+        self.telemetry = telemetry
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-reporter", daemon=True)
+        self._thread.start()
+
+    def report(self) -> None:
+        """Emit the current metrics summary."""
+        self.telemetry.info("Bus metrics summary", **self.metrics.summary())
+
+    def close(self) -> None:
+        """Stop the reporting thread and emit a final summary."""
+        self._stopped.set()
+        self._thread.join()
+        self.report()
+
+    def _run(self) -> None:
+        """Report until closed."""
+        while not self._stopped.wait(self.interval):
+            self.report()
+
+
+class MetricsExporter:
+    """Expose a :class:`BusMetrics` over HTTP and as periodic summary telemetry."""
+
+    def __init__(
+        self,
+        metrics: BusMetrics,
+        telemetry: TelemetryLogger,
+        *,
+        port: int | None = None,
+        host: str = DEFAULT_METRICS_HOST,
+        summary_interval: float = DEFAULT_SUMMARY_INTERVAL,
+        routes: dict[str, Route] | None = None,
+    ) -> None:
+        """Serve on ``port`` when it is set; report every ``summary_interval`` when positive."""
+        self.metrics = metrics
+        self.server = MetricsServer(metrics, port, host, routes) if port is not None else None
+        self.reporter = (
+            MetricsReporter(metrics, telemetry, summary_interval) if summary_interval > 0 else None
+        )
+        if self.server is not None:
+            telemetry.info(
+                "Metrics endpoint listening",
+                endpoint=f"http://{self.server.address[0]}:{self.server.address[1]}/metrics",
+            )
+
+    def close(self) -> None:
+        """Stop the endpoint and emit the final summary."""
+        if self.server is not None:
+            self.server.close()
+        if self.reporter is not None:
+            self.reporter.close()
+
+
+def _latency_summary(histogram: LatencyHistogram) -> dict[str, Any]:
+    """Return a histogram's count, mean, and percentiles in microseconds."""
+    return {
+        "count": histogram.count,
+        "mean_us": (round(histogram.total / histogram.count * 1e6, 2) if histogram.count else 0.0),
+        "p50_us": round(histogram.quantile(0.5) * 1e6, 2),
+        "p99_us": round(histogram.quantile(0.99) * 1e6, 2),
+    }
+
+
+def _histogram_lines(name: str, labels: str, histogram: LatencyHistogram) -> list[str]:
+    """Return the cumulative bucket, sum, and count samples of one labelled histogram."""
+    lines = []
+    cumulative = 0
+    for bound, bucket in zip(BUCKET_BOUNDS, histogram.counts, strict=False):
+        cumulative += bucket
+        lines.append(f'{name}_bucket{{{labels},le="{bound:.6g}"}} {cumulative}')
+    lines += [
+        f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}',
+        f"{name}_sum{{{labels}}} {histogram.total:.9f}",
+        f"{name}_count{{{labels}}} {histogram.count}",
+    ]
+    return lines
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _handler_for(routes: dict[str, Route]) -> type[BaseHTTPRequestHandler]:
+    """Build a request handler class dispatching GET paths to ``routes``."""
+    from http.server import BaseHTTPRequestHandler
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            """Serve the route registered for the request path."""
+            path, _, query = self.path.partition("?")
+            route = routes.get(path)
+            if route is None:
+                status, content_type, body = 404, "text/plain", b"not found\n"
+            else:
+                status, content_type, body = route(dict(urllib.parse.parse_qsl(query)))
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            """Silence per-request access logging."""
+
+    return _Handler
+
+
+__all__ = [
+    "ALLOW_LIST",
+    "BUCKET_BOUNDS",
+    "HMAC",
+    "PARSE",
+    "STAGES",
+    "TELEMETRY",
+    "BusMetrics",
+    "LatencyHistogram",
+    "MetricsExporter",
+    "MetricsReporter",
+    "MetricsServer",
+    "Route",
+]
@@ -0,0 +1,245 @@
+"""Header-only screening and rejection accounting for the firewall fast path."""
+
+from __future__ import annotations
+
+import logging
+import struct
+import threading
+import time
+from collections import Counter
+from collections.abc import ByteString, Iterable
+
+from ccsds.packet_parser import (
+    PRIMARY_HEADER_LENGTH,
+    SECONDARY_HEADER_LENGTH,
+    SEQUENCE_FIRST,
+    SEQUENCE_STANDALONE,
+)
+from crypto.constants import HMAC_DIGEST_LENGTH
+from satellite.telemetry import TelemetryLogger
+
+PACKET_TOO_SHORT = "Packet too short to contain CCSDS header and signature"
+UNSUPPORTED_HEADER = "Unsupported CCSDS header values"
+APID_NOT_AUTHORIZED = "APID not authorized"
+FRAGMENTED_PACKET = "Segmented packets are not accepted without reassembly"
+LENGTH_MISMATCH = "Packet length mismatch"
+GROUND_ID_INCOMPLETE = "Ground station identifier is incomplete"
+GROUND_ID_NOT_AUTHORIZED = "Ground station ID not authorized"
+SOURCE_RATE_LIMITED = "Source rate limit exceeded"
+
+DEFAULT_SUMMARY_INTERVAL = 10.0
+DEFAULT_MAX_ALERTS = 64
+DEFAULT_TOP_SOURCES = 5
+UNAUTHORIZED_ALERT = "CRITICAL SECURITY ALERT: Unauthorized ground station"
+_MAX_TRACKED_SOURCES = 1024
+
+_HEADER = struct.Struct(">HHH")
+_GROUND_ID_LENGTH = struct.Struct(">H")
+_GROUND_ID_START = PRIMARY_HEADER_LENGTH + SECONDARY_HEADER_LENGTH
+_MINIMUM_LENGTH = _GROUND_ID_START + HMAC_DIGEST_LENGTH
+_COMMAND_HEADER_BITS = 0x1800  # version 0, command packet, secondary header present
+_SEQUENCE_FLAG_BITS = 0xC000
+_STANDALONE_BITS = SEQUENCE_STANDALONE << 14
+_FIRST_SEGMENT_BITS = SEQUENCE_FIRST << 14
+
+
+class HeaderPrefilter:
+    """
+    Reject packets using only the primary header and ground station ID bytes.
+
+    No ``ParsedPacket``, exception, or decoded string is created; every rejection
+    returns one of this module's constant reason strings. With ``segments`` set,
+    first, continuation, and last segments pass the header, APID, and length checks
+    instead of being rejected; first segments must also carry an allowed ground
+    station ID, while the other segments are left to the reassembler.
+    """
+
+    def __init__(
+        self,
+        allowed_ground_stations: Iterable[bytes],
+        allowed_apids: Iterable[int] | None = None,
+        *,
+        segments: bool = False,
+    ) -> None:
+        """Configure the ground station and optional APID allow lists."""
+        self.allowed_ground_stations = frozenset(allowed_ground_stations)
+        self.allowed_apids = frozenset(allowed_apids) if allowed_apids is not None else None
+        self.segments = segments
+
+    def check(self, packet: ByteString) -> str | None:
+        """Return a rejection reason, or ``None`` if the packet should be fully inspected."""
+        size = len(packet)
+        if size < (PRIMARY_HEADER_LENGTH + 1 if self.segments else _MINIMUM_LENGTH):
+            return PACKET_TOO_SHORT
+        first_word, second_word, packet_length = _HEADER.unpack_from(packet)
+        if first_word & 0xF800 != _COMMAND_HEADER_BITS:
+            return UNSUPPORTED_HEADER
+        if self.allowed_apids is not None and first_word & 0x7FF not in self.allowed_apids:
+            return APID_NOT_AUTHORIZED
+        sequence_flags = second_word & _SEQUENCE_FLAG_BITS
+        if sequence_flags == _STANDALONE_BITS:
+            if size < _MINIMUM_LENGTH:
+                return PACKET_TOO_SHORT
+            data_end = size - HMAC_DIGEST_LENGTH
+        elif not self.segments:
+            return FRAGMENTED_PACKET
+        else:
+            data_end = size
+        if packet_length + 1 + PRIMARY_HEADER_LENGTH != size:
+            return LENGTH_MISMATCH
+        if sequence_flags not in (_STANDALONE_BITS, _FIRST_SEGMENT_BITS):
+            return None
+        if size < _GROUND_ID_START:
+            return GROUND_ID_INCOMPLETE
+        (ground_id_length,) = _GROUND_ID_LENGTH.unpack_from(packet, _GROUND_ID_START - 2)
+        ground_id_end = _GROUND_ID_START + ground_id_length
+        if ground_id_end > data_end:
+            return GROUND_ID_INCOMPLETE
+        if bytes(packet[_GROUND_ID_START:ground_id_end]) not in self.allowed_ground_stations:
+            return GROUND_ID_NOT_AUTHORIZED
+        return None
+
+
+def claimed_ground_station(packet: ByteString) -> str | None:
+    """Return the ground station ID a packet claims, or ``None`` if it cannot be located."""
+    if len(packet) < _GROUND_ID_START:
+        return None
+    (ground_id_length,) = _GROUND_ID_LENGTH.unpack_from(packet, _GROUND_ID_START - 2)
+    ground_id_end = _GROUND_ID_START + ground_id_length
+    if ground_id_end > len(packet):
+        return None
+    return bytes(packet[_GROUND_ID_START:ground_id_end]).decode("utf-8", errors="replace")
+
+
+class RejectionSummary:
+    """
+    Count fast-path rejections and report them as one periodic telemetry event.
+
+    A background timer emits the summary every ``interval`` seconds while rejections
+    are pending, so a lone rejected packet is still reported. Packets claiming an
+    unauthorized ground station also raise a CRITICAL alert for the first such packet
+    from each source per interval, at most ``max_alerts`` per interval, and the
+    summary lists the ``top_sources`` most frequent ``(source IP, ground ID)`` pairs.
+    Counts may be recorded from several threads.
+    """
+
+    def __init__(
+        self,
+        telemetry: TelemetryLogger,
+        interval: float = DEFAULT_SUMMARY_INTERVAL,
+        *,
+        max_alerts: int = DEFAULT_MAX_ALERTS,
+        top_sources: int = DEFAULT_TOP_SOURCES,
+    ) -> None:
+        """Emit at most one summary every ``interval`` seconds."""
+        self.telemetry = telemetry
+        self.interval = interval
+        self.max_alerts = max_alerts
+        self.top_sources = top_sources
+        self.counts: Counter[str] = Counter()
+        self.unauthorized: Counter[tuple[str, str]] = Counter()
+        self._alerted: set[str] = set()
+        self._next_report = time.monotonic() + interval
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._timer: threading.Thread | None = None
+
+    def record(
+        self,
+        reason: str,
+        count: int = 1,
+        *,
+        source_ip: str | None = None,
+        ground_station_id: str | None = None,
+    ) -> None:
+        """
+        Count ``count`` rejections and emit the summary if the interval has elapsed.
+
+        Pass the ``source_ip`` and claimed ``ground_station_id`` of packets rejected for
+        an unauthorized ground station so they can be alerted on and summarised.
+        """
+        alert = False
+        with self._lock:
+            self.counts[reason] += count
+            if reason == GROUND_ID_NOT_AUTHORIZED and source_ip is not None:
+                station = ground_station_id or ""
+                if (source_ip, station) in self.unauthorized or len(
+                    self.unauthorized
+                ) < _MAX_TRACKED_SOURCES:
+                    self.unauthorized[source_ip, station] += count
+                if source_ip not in self._alerted and len(self._alerted) < self.max_alerts:
+                    self._alerted.add(source_ip)
+                    alert = True
+            due = time.monotonic() >= self._next_report
+            if self._timer is None and not self._stopped.is_set():
+                self._timer = threading.Thread(
+                    target=self._run, name="prefilter-summary", daemon=True
+                )
+                self._timer.start()
+        if alert:
+            self.telemetry.critical(
+                UNAUTHORIZED_ALERT,
+                source_ip=source_ip,
+                ground_station_id=ground_station_id,
+                reason=reason,
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Emit and reset the pending counts, if there are any."""
+        with self._lock:
+            self._next_report = time.monotonic() + self.interval
+            self._alerted.clear()
+            if not self.counts:
+                return
+            counts, self.counts = self.counts, Counter()
+            unauthorized, self.unauthorized = self.unauthorized, Counter()
+        level = (
+            logging.CRITICAL
+            if counts[GROUND_ID_NOT_AUTHORIZED] or counts[SOURCE_RATE_LIMITED]
+            else logging.WARNING
+        )
+        top = [
+            {"source_ip": source_ip, "ground_station_id": station, "count": total}
+            for (source_ip, station), total in unauthorized.most_common(self.top_sources)
+        ]
+        self.telemetry.emit(
+            level,
+            "Pre-filter rejections",
+            rejected=dict(counts),
+            total=sum(counts.values()),
+            interval_seconds=self.interval,
+            **({"unauthorized_sources": top} if top else {}),
+        )
+
+    def close(self) -> None:
+        """Stop the background timer and emit any pending counts."""
+        self._stopped.set()
+        if self._timer is not None:
+            self._timer.join()
+        self.flush()
+
+    def _run(self) -> None:
+        """Flush on schedule until :meth:`close` is called."""
+        while not self._stopped.wait(max(0.0, self._next_report - time.monotonic())):
+            if time.monotonic() >= self._next_report:
+                self.flush()
+
+
+__all__ = [
+    "APID_NOT_AUTHORIZED",
+    "DEFAULT_MAX_ALERTS",
+    "DEFAULT_TOP_SOURCES",
+    "FRAGMENTED_PACKET",
+    "GROUND_ID_INCOMPLETE",
+    "GROUND_ID_NOT_AUTHORIZED",
+    "LENGTH_MISMATCH",
+    "PACKET_TOO_SHORT",
+    "SOURCE_RATE_LIMITED",
+    "UNAUTHORIZED_ALERT",
+    "UNSUPPORTED_HEADER",
+    "HeaderPrefilter",
+    "RejectionSummary",
+    "claimed_ground_station",
+]
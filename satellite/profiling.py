@@ -0,0 +1,202 @@
+"""On-demand sampling and allocation profiling for a running satellite bus."""
+
+from __future__ import annotations
+
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import UTC, datetime
+from pathlib import Path
+from types import CodeType, FrameType
+
+from satellite.telemetry import TelemetryLogger
+
+DEFAULT_PROFILE_SECONDS = 30.0
+DEFAULT_SAMPLE_INTERVAL = 0.005
+DEFAULT_MEMORY_TOP = 50
+PROFILE_SIGNAL = getattr(signal, "SIGUSR1", None)
+
+
+class SamplingProfiler:
+    """
+    Sample every other thread's Python stack at a fixed interval.
+
+    Stacks are aggregated in the collapsed ``frame;frame;frame count`` format read by
+    flame graph tools. Sampling only reads ``sys._current_frames()``, so the profiled
+    threads keep running undisturbed.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        """Sample once every ``interval`` seconds."""
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._labels: dict[CodeType, str] = {}
+
+    def run(self, duration: float, stop: threading.Event | None = None) -> None:
+        """Sample for ``duration`` seconds, or until ``stop`` is set."""
+        stop = stop or threading.Event()
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline and not stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Record the current stack of every thread except the caller."""
+        current = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident != current:
+                self.stacks[self._collapse(names.get(ident, str(ident)), frame)] += 1
+        self.samples += 1
+
+    def write(self, path: Path) -> None:
+        """Write the collapsed stacks, most frequent first."""
+        with open(path, "w", encoding="utf-8") as handle:
+            for stack, count in self.stacks.most_common():
+                handle.write(f"{stack} {count}\n")
+
+    def _collapse(self, thread_name: str, frame: FrameType | None) -> str:
+        """Return ``thread;outermost;...;innermost`` for ``frame``."""
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = (
+                    f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+                )
+            labels.append(label)
+            frame = frame.f_back
+        labels.append(thread_name)
+        return ";".join(reversed(labels))
+
+
+class ProfileController:
+    """
+    Run one profiling session at a time on a background thread.
+
+    Sessions are started with :meth:`trigger`, from the ``SIGUSR1`` handler installed by
+    :meth:`install_signal_handler`, or from the ``/profile`` metrics route. Results are
+    written to ``output_dir`` and announced with a ``"Profile written"`` event.
+    """
+
+    def __init__(
+        self,
+        output_dir: str | Path,
+        telemetry: TelemetryLogger,
+        *,
+        duration: float = DEFAULT_PROFILE_SECONDS,
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+        memory: bool = False,
+    ) -> None:
+        """Configure default session length, sampling interval, and memory diffing."""
+        self.output_dir = Path(output_dir)
+        self.telemetry = telemetry
+        self.duration = duration
+        self.interval = interval
+        self.memory = memory
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return whether a session is in progress."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def trigger(self, duration: float | None = None, memory: bool | None = None) -> bool:
+        """Start a session unless one is running; return whether it was started."""
+        with self._lock:
+            if self.running:
+                return False
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._session,
+                args=(
+                    self.duration if duration is None else duration,
+                    self.memory if memory is None else memory,
+                ),
+                name="bus-profiler",
+                daemon=True,
+            )
+            self._thread.start()
+            return True
+
+    def install_signal_handler(self) -> bool:
+        """Start a default session on ``SIGUSR1``; return False where that is unavailable."""
+        if PROFILE_SIGNAL is None or threading.current_thread() is not threading.main_thread():
+            return False
+        signal.signal(PROFILE_SIGNAL, lambda signum, frame: self.trigger())
+        return True
+
+    def route(self, query: dict[str, str]) -> tuple[int, str, bytes]:
+        """Metrics endpoint handler: ``/profile?seconds=N&memory=1`` starts a session."""
+        try:
+            duration = float(query["seconds"]) if "seconds" in query else None
+        except ValueError:
+            return 400, "text/plain", b"seconds must be a number\n"
+        memory = query["memory"] not in ("0", "false") if "memory" in query else None
+        if not self.trigger(duration, memory):
+            return 409, "text/plain", b"profiling session already running\n"
+        return 202, "text/plain", b"profiling started\n"
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Block until the current session, if any, has written its results."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def close(self) -> None:
+        """Cut a running session short and wait for its results to be written."""
+        self._stop.set()
+        self.wait()
+
+    def _session(self, duration: float, memory: bool) -> None:
+        """Sample (and optionally diff allocations) for ``duration`` seconds, then write."""
+        stamp = f"{datetime.now(tz=UTC):%Y%m%dT%H%M%SZ}-{os.getpid()}"
+        started_tracing = memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        before = tracemalloc.take_snapshot() if memory else None
+        profiler = SamplingProfiler(self.interval)
+        started = time.monotonic()
+        profiler.run(duration, self._stop)
+        elapsed = time.monotonic() - started
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stacks_path = self.output_dir / f"profile-{stamp}.collapsed"
+        profiler.write(stacks_path)
+        context: dict[str, object] = {
+            "stacks": str(stacks_path),
+            "samples": profiler.samples,
+            "duration_seconds": round(elapsed, 3),
+        }
+        if before is not None:
+            memory_path = self.output_dir / f"memory-{stamp}.txt"
+            _write_memory_diff(memory_path, before, tracemalloc.take_snapshot())
+            context["memory"] = str(memory_path)
+            if started_tracing:
+                tracemalloc.stop()
+        self.telemetry.info("Profile written", **context)
+
+
+def _write_memory_diff(
+    path: Path, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot
+) -> None:
+    """Write the allocation sites whose size grew most between two snapshots."""
+    with open(path, "w", encoding="utf-8") as handle:
+        for stat in after.compare_to(before, "lineno")[:DEFAULT_MEMORY_TOP]:
+            handle.write(f"{stat}\n")
+
+
+__all__ = [
+    "DEFAULT_PROFILE_SECONDS",
+    "DEFAULT_SAMPLE_INTERVAL",
+    "PROFILE_SIGNAL",
+    "ProfileController",
+    "SamplingProfiler",
+]
@@ -0,0 +1,65 @@
+"""Per-source token-bucket rate limiting for the satellite firewall."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+DEFAULT_RATE = 500.0
+DEFAULT_BURST = 1000.0
+DEFAULT_MAX_SOURCES = 4096
+
+
+class _Bucket:
+    """Token count and refill timestamp for one source."""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        """Start the bucket with ``tokens`` available at time ``updated``."""
+        self.tokens = tokens
+        self.updated = updated
+
+
+class TokenBucketLimiter:
+    """
+    Limit packets per source IP with independent token buckets.
+
+    Each source may send ``burst`` packets at once and ``rate`` packets per second
+    sustained. At most ``max_sources`` buckets are kept; the least recently seen source
+    is evicted first, so spoofed source addresses cannot grow memory without bound.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: float = DEFAULT_BURST,
+        max_sources: int = DEFAULT_MAX_SOURCES,
+    ) -> None:
+        """Configure the refill rate, bucket depth, and tracked source limit."""
+        if rate <= 0 or burst < 1:
+            raise ValueError("Rate must be positive and burst at least one packet")
+        self.rate = rate
+        self.burst = burst
+        self.max_sources = max_sources
+        self._buckets: OrderedDict[str, _Bucket] = OrderedDict()
+
+    def allow(self, source: str, now: float | None = None) -> bool:
+        """Consume a token for ``source`` and return whether the packet may proceed."""
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(source)
+        if bucket is None:
+            bucket = self._buckets[source] = _Bucket(self.burst, now)
+            if len(self._buckets) > self.max_sources:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(source)
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate)
+            bucket.updated = now
+        if bucket.tokens < 1:
+            return False
+        bucket.tokens -= 1
+        return True
+
+
+__all__ = ["DEFAULT_BURST", "DEFAULT_MAX_SOURCES", "DEFAULT_RATE", "TokenBucketLimiter"]
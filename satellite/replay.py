@@ -0,0 +1,404 @@
+"""Constant-memory anti-replay windows for authenticated command packets."""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Mapping
+from contextlib import AbstractContextManager
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import Any
+
+SEQUENCE_MODULUS = 1 << 14
+DEFAULT_WINDOW_SIZE = 64
+DEFAULT_FRESHNESS_SECONDS = 300.0
+DEFAULT_SNAPSHOT_INTERVAL = 1.0
+DEFAULT_SHARED_SLOTS = 4096
+DEFAULT_LOCK_STRIPES = 64
+MAX_SHARED_GROUND_ID_BYTES = 64
+
+REPLAY_DETECTED = "Replay detected"
+SEQUENCE_OUTSIDE_WINDOW = "Sequence count outside replay window"
+STALE_TIMESTAMP = "Timestamp outside freshness window"
+REPLAY_STATE_EXHAUSTED = "Replay state capacity exhausted"
+
+WindowKey = tuple[str, int]
+
+# Each shared slot is a key (used flag, APID, ground ID length, ground ID), then the
+# window (top, top timestamp, epoch timestamp), then the window bitmap.
+_SLOT_KEY = struct.Struct(f">BHH{MAX_SHARED_GROUND_ID_BYTES}s")
+_SLOT_WINDOW = struct.Struct(">Hqq")
+_SLOT_HEADER_SIZE = _SLOT_KEY.size + _SLOT_WINDOW.size
+
+
+class _Window:
+    """Sliding bitmap over recently accepted sequence counts for one sender."""
+
+    __slots__ = ("top", "bitmap", "top_timestamp", "epoch_timestamp")
+
+    def __init__(self, top: int, bitmap: int, top_timestamp: int, epoch_timestamp: int) -> None:
+        """Store the highest accepted count, its bitmap, and the epoch timestamps."""
+        self.top = top
+        self.bitmap = bitmap
+        self.top_timestamp = top_timestamp
+        self.epoch_timestamp = epoch_timestamp
+
+
+class SharedReplayState:
+    """
+    Replay windows in shared memory so forked bus workers share one state.
+
+    ``SO_REUSEPORT`` picks a worker from the datagram's source address, so a captured
+    packet re-sent from another port can reach a worker that never saw the original.
+    Every ``(ground station, APID)`` window is a fixed-size slot in one shared array,
+    found by open addressing on a CRC of its key, and each slot is guarded by one of
+    ``stripes`` cross-process locks, so workers checking different senders rarely
+    contend and a check never leaves the process. Slots are claimed under a separate
+    insert lock and never freed. Ground IDs longer than
+    ``MAX_SHARED_GROUND_ID_BYTES`` bytes or more than ``slots`` senders cannot be
+    tracked; their packets are rejected rather than left unprotected.
+    """
+
+    def __init__(
+        self,
+        context: BaseContext,
+        *,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        slots: int = DEFAULT_SHARED_SLOTS,
+        stripes: int = DEFAULT_LOCK_STRIPES,
+    ) -> None:
+        """Allocate the table from ``context``, which must be used to fork the workers."""
+        if slots < 1 or stripes < 1:
+            raise ValueError("Shared replay state needs at least one slot and one lock")
+        self.window_size = window_size
+        self.slots = slots
+        self._bitmap_bytes = (window_size + 7) // 8
+        self._slot_size = _SLOT_HEADER_SIZE + self._bitmap_bytes
+        self._table = memoryview(context.RawArray("B", slots * self._slot_size)).cast("B")
+        self._locks = [context.Lock() for _ in range(stripes)]
+        self._insert_lock = context.Lock()
+        self._generation = context.RawValue("Q", 0)
+        self._offsets: dict[WindowKey, int] = {}
+        self._offsets_generation = 0
+
+    def lock_for(self, key: WindowKey) -> AbstractContextManager[Any]:
+        """Return the lock that guards ``key``'s window across processes."""
+        return self._locks[self._hash(key) % len(self._locks)]
+
+    def get(self, key: WindowKey) -> _Window | None:
+        """Return a copy of ``key``'s window, if any; the caller holds its lock."""
+        offset = self._cached_offset(key)
+        return None if offset is None else self._read(offset)
+
+    def __setitem__(self, key: WindowKey, window: _Window) -> None:
+        """
+        Store ``window`` for ``key``, claiming a slot if needed; the caller holds its lock.
+
+        Raises ``OverflowError`` when the key cannot be stored.
+        """
+        offset = self._cached_offset(key)
+        if offset is None:
+            with self._insert_lock:
+                offset = self._find(key, claim=True)
+            if offset is None:
+                raise OverflowError("Shared replay state cannot track this sender")
+            self._offsets[key] = offset
+        self._write(offset, window)
+
+    def copy(self) -> dict[WindowKey, _Window]:
+        """Return every stored window, each read under its lock."""
+        windows: dict[WindowKey, _Window] = {}
+        for index in range(self.slots):
+            offset = index * self._slot_size
+            if not self._table[offset]:
+                continue
+            key = self._read_key(offset)
+            with self.lock_for(key):
+                windows[key] = self._read(offset)
+        return windows
+
+    def replace(self, windows: Mapping[WindowKey, _Window], *, only_if_empty: bool = False) -> bool:
+        """Replace every window with ``windows``; return False if skipped as not empty."""
+        with self._insert_lock:
+            used = any(self._table[index * self._slot_size] for index in range(self.slots))
+            if only_if_empty and used:
+                return False
+            self._table[:] = bytes(len(self._table))
+            self._generation.value += 1
+            for key, window in windows.items():
+                offset = self._find(key, claim=True)
+                if offset is not None:
+                    self._write(offset, window)
+        return True
+
+    def _cached_offset(self, key: WindowKey) -> int | None:
+        """
+        Return ``key``'s slot offset, remembering it in this process once found.
+
+        Slots never move, so the cache is only dropped after :meth:`replace` rewrote
+        the table in some process.
+        """
+        if self._offsets_generation != self._generation.value:
+            self._offsets.clear()
+            self._offsets_generation = self._generation.value
+        offset = self._offsets.get(key)
+        if offset is None:
+            offset = self._find(key)
+            if offset is not None:
+                self._offsets[key] = offset
+        return offset
+
+    def _hash(self, key: WindowKey) -> int:
+        """Return a hash of ``key`` that is the same in every process."""
+        return zlib.crc32(key[0].encode("utf-8"), key[1])
+
+    def _find(self, key: WindowKey, *, claim: bool = False) -> int | None:
+        """
+        Return the offset of ``key``'s slot, or ``None`` if it has none.
+
+        With ``claim``, an empty slot is taken for ``key`` instead; the caller holds the
+        insert lock.
+        """
+        ground_id = key[0].encode("utf-8")
+        if len(ground_id) > MAX_SHARED_GROUND_ID_BYTES:
+            return None
+        home = self._hash(key)
+        for step in range(self.slots):
+            offset = (home + step) % self.slots * self._slot_size
+            used, apid, length, stored = _SLOT_KEY.unpack_from(self._table, offset)
+            if not used:
+                if not claim:
+                    return None
+                _SLOT_KEY.pack_into(self._table, offset, 0, key[1], len(ground_id), ground_id)
+                self._table[offset] = 1
+                return offset
+            if apid == key[1] and stored[:length] == ground_id:
+                return offset
+        return None
+
+    def _read_key(self, offset: int) -> WindowKey:
+        """Decode the key stored in the slot at ``offset``."""
+        _, apid, length, stored = _SLOT_KEY.unpack_from(self._table, offset)
+        return stored[:length].decode("utf-8"), apid
+
+    def _read(self, offset: int) -> _Window:
+        """Decode the window stored in the slot at ``offset``."""
+        top, top_timestamp, epoch_timestamp = _SLOT_WINDOW.unpack_from(
+            self._table, offset + _SLOT_KEY.size
+        )
+        start = offset + _SLOT_HEADER_SIZE
+        bitmap = int.from_bytes(self._table[start : start + self._bitmap_bytes], "big")
+        return _Window(top, bitmap, top_timestamp, epoch_timestamp)
+
+    def _write(self, offset: int, window: _Window) -> None:
+        """Encode ``window`` into the slot at ``offset``."""
+        _SLOT_WINDOW.pack_into(
+            self._table,
+            offset + _SLOT_KEY.size,
+            window.top,
+            window.top_timestamp,
+            window.epoch_timestamp,
+        )
+        start = offset + _SLOT_HEADER_SIZE
+        self._table[start : start + self._bitmap_bytes] = window.bitmap.to_bytes(
+            self._bitmap_bytes, "big"
+        )
+
+
+class ReplayGuard:
+    """
+    IPsec-style anti-replay windows keyed by ``(ground station, APID)``.
+
+    Each window keeps the highest accepted 14-bit sequence count and a ``window_size``
+    bitmap of the counts just below it, so checks are O(1) with fixed memory per
+    sender. Packets must also carry a timestamp within ``freshness_seconds`` of the
+    receiver clock. A repeated or lower count with a strictly newer timestamp is
+    treated as the sender restarting its counter: the window starts a new epoch and
+    anything timestamped before that epoch is rejected. Counts ahead of the window
+    must not be older than the newest accepted packet, so a fresh capture cannot
+    come back as "ahead" once a fast sender's 14-bit counter has wrapped; within one
+    timestamp second the count alone decides.
+
+    With ``snapshot_path`` set, window state is reloaded at construction and written
+    atomically at most every ``snapshot_interval`` seconds and on :meth:`close`. With
+    ``shared``, windows live in a :class:`SharedReplayState` of the same window size;
+    the snapshot is only reloaded into it while it is still empty.
+    """
+
+    def __init__(
+        self,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        freshness_seconds: float = DEFAULT_FRESHNESS_SECONDS,
+        *,
+        snapshot_path: str | Path | None = None,
+        snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+        shared: SharedReplayState | None = None,
+    ) -> None:
+        """Configure the window geometry and optional on-disk persistence."""
+        if not 1 <= window_size < SEQUENCE_MODULUS // 2:
+            raise ValueError("Replay window size must be between 1 and 8191")
+        self.window_size = window_size
+        self.freshness_seconds = freshness_seconds
+        self.snapshot_path = Path(snapshot_path) if snapshot_path is not None else None
+        self.snapshot_interval = snapshot_interval
+        if shared is not None and shared.window_size != window_size:
+            raise ValueError("Shared replay state was sized for a different window")
+        self._mask = (1 << window_size) - 1
+        self._shared = shared
+        self._windows: dict[WindowKey, _Window] | SharedReplayState = (
+            {} if shared is None else shared
+        )
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._last_saved = 0.0
+        if self.snapshot_path is not None and self.snapshot_path.exists():
+            snapshot = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            if shared is None:
+                self.restore(snapshot)
+            else:
+                shared.replace(self._decode(snapshot), only_if_empty=True)
+
+    def check(
+        self,
+        ground_station_id: str,
+        apid: int,
+        sequence_count: int,
+        timestamp_seconds: int,
+        now: float | None = None,
+    ) -> str | None:
+        """Return a rejection reason, or ``None`` after recording the packet as seen."""
+        now = time.time() if now is None else now
+        if abs(now - timestamp_seconds) > self.freshness_seconds:
+            return STALE_TIMESTAMP
+
+        key = (ground_station_id, apid)
+        lock = self._lock if self._shared is None else self._shared.lock_for(key)
+        with lock:
+            reason = self._update(key, sequence_count, timestamp_seconds)
+        if reason is None:
+            self._dirty = True
+        if reason is None and self.snapshot_path is not None:
+            self._maybe_save()
+        return reason
+
+    def _update(self, key: WindowKey, sequence_count: int, timestamp: int) -> str | None:
+        """Apply the sliding-window rules for one sender; caller holds the lock."""
+        window = self._windows.get(key)
+        if window is None:
+            try:
+                self._windows[key] = _Window(sequence_count, 1, timestamp, timestamp)
+            except OverflowError:
+                return REPLAY_STATE_EXHAUSTED
+            return None
+        if timestamp < window.epoch_timestamp:
+            return REPLAY_DETECTED
+
+        ahead = (sequence_count - window.top) % SEQUENCE_MODULUS
+        if 0 < ahead < SEQUENCE_MODULUS // 2:
+            # Counts only look ahead modulo 2**14; a packet signed before the newest
+            # accepted one is from an earlier lap of the counter, not a new command.
+            if timestamp < window.top_timestamp:
+                return REPLAY_DETECTED
+            window.bitmap = ((window.bitmap << ahead) | 1) & self._mask
+            window.top = sequence_count
+            window.top_timestamp = max(window.top_timestamp, timestamp)
+            self._windows[key] = window
+            return None
+
+        if timestamp > window.top_timestamp:
+            window.top, window.bitmap = sequence_count, 1
+            window.top_timestamp = window.epoch_timestamp = timestamp
+            self._windows[key] = window
+            return None
+
+        behind = (window.top - sequence_count) % SEQUENCE_MODULUS
+        if behind >= self.window_size:
+            return SEQUENCE_OUTSIDE_WINDOW
+        bit = 1 << behind
+        if window.bitmap & bit:
+            return REPLAY_DETECTED
+        window.bitmap |= bit
+        self._windows[key] = window  # shared windows are copies; write the update back
+        return None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serialisable copy of every window."""
+        with self._lock:
+            current = self._windows.copy()
+            windows = [
+                {
+                    "ground_station_id": ground_station_id,
+                    "apid": apid,
+                    "top": window.top,
+                    "bitmap": window.bitmap,
+                    "top_timestamp": window.top_timestamp,
+                    "epoch_timestamp": window.epoch_timestamp,
+                }
+                for (ground_station_id, apid), window in current.items()
+            ]
+        return {"window_size": self.window_size, "windows": windows}
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        """Replace the current windows with those from :meth:`snapshot` output."""
+        windows = self._decode(snapshot)
+        if self._shared is not None:
+            self._shared.replace(windows)
+            return
+        with self._lock:
+            self._windows = windows
+
+    def _decode(self, snapshot: dict[str, Any]) -> dict[WindowKey, _Window]:
+        """Return the windows described by :meth:`snapshot` output."""
+        return {
+            (entry["ground_station_id"], int(entry["apid"])): _Window(
+                int(entry["top"]),
+                int(entry["bitmap"]) & self._mask,
+                int(entry["top_timestamp"]),
+                int(entry["epoch_timestamp"]),
+            )
+            for entry in snapshot.get("windows", [])
+        }
+
+    def save(self) -> None:
+        """Atomically write the current windows to ``snapshot_path``."""
+        if self.snapshot_path is None:
+            return
+        temporary = self.snapshot_path.with_name(f"{self.snapshot_path.name}.{os.getpid()}.tmp")
+        with self._save_lock:
+            self._dirty = False
+            temporary.write_text(json.dumps(self.snapshot()), encoding="utf-8")
+            os.replace(temporary, self.snapshot_path)
+            self._last_saved = time.monotonic()
+
+    def close(self) -> None:
+        """Persist any state accepted since the last snapshot."""
+        if self._dirty:
+            self.save()
+
+    def _maybe_save(self) -> None:
+        """Save the snapshot when it is dirty and the interval has elapsed."""
+        if self._dirty and time.monotonic() - self._last_saved >= self.snapshot_interval:
+            self.save()
+
+
+__all__ = [
+    "DEFAULT_FRESHNESS_SECONDS",
+    "DEFAULT_LOCK_STRIPES",
+    "DEFAULT_SHARED_SLOTS",
+    "DEFAULT_SNAPSHOT_INTERVAL",
+    "DEFAULT_WINDOW_SIZE",
+    "MAX_SHARED_GROUND_ID_BYTES",
+    "REPLAY_DETECTED",
+    "REPLAY_STATE_EXHAUSTED",
+    "SEQUENCE_OUTSIDE_WINDOW",
+    "STALE_TIMESTAMP",
+    "ReplayGuard",
+    "SharedReplayState",
+    "WindowKey",
+]
@@ -0,0 +1,92 @@
+"""Reload the bus keyring when its file changes or on ``SIGHUP``."""
+
+from __future__ import annotations
+
+import signal
+import threading
+from collections.abc import Callable
+
+from crypto.keyring import Keyring, KeyringError
+from satellite.telemetry import TelemetryLogger
+
+DEFAULT_CHECK_INTERVAL = 2.0
+RELOAD_SIGNAL = getattr(signal, "SIGHUP", None)
+
+
+class KeyringWatcher:
+    """
+    Poll a :class:`Keyring` file for changes and reload it off the packet path.
+
+    A reload request from :meth:`install_signal_handler` only wakes the watcher thread,
+    so the signal handler never does file I/O. Failed reloads keep the previous keys
+    and are reported as telemetry; successful ones call ``on_reload``, which the bus
+    uses to refresh its ground station allow list.
+    """
+
+    def __init__(
+        self,
+        keyring: Keyring,
+        telemetry: TelemetryLogger,
+        *,
+        interval: float = DEFAULT_CHECK_INTERVAL,
+        on_reload: Callable[[], None] | None = None,
+    ) -> None:
+        """Start the watcher thread, checking the file every ``interval`` seconds."""
+        self.keyring = keyring
+        self.telemetry = telemetry
+        self.interval = interval
+        self.on_reload = on_reload
+        self._requested = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="keyring-watcher", daemon=True)
+        self._thread.start()
+
+    def request_reload(self) -> None:
+        """Ask the watcher thread to reload the keyring now."""
+        self._requested.set()
+
+    def install_signal_handler(self) -> bool:
+        """Reload on ``SIGHUP``; return False where that is unavailable."""
+        if RELOAD_SIGNAL is None or threading.current_thread() is not threading.main_thread():
+            return False
+        signal.signal(RELOAD_SIGNAL, lambda signum, frame: self.request_reload())
+        return True
+
+    def reload(self, trigger: str) -> bool:
+        """Reload the keyring, emit telemetry about the outcome, and return success."""
+        try:
+            rotated = self.keyring.reload()
+        except KeyringError as exc:
+            self.telemetry.warning("Keyring reload failed", trigger=trigger, error=str(exc))
+            return False
+        if self.on_reload is not None:
+            self.on_reload()
+        self.telemetry.info(
+            "Keyring reloaded",
+            trigger=trigger,
+            ground_stations=len(self.keyring),
+            rotated=rotated,
+            overlap_seconds=self.keyring.overlap,
+        )
+        return True
+
+    def close(self) -> None:
+        """Stop the watcher thread."""
+        self._stopped.set()
+        self._requested.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Reload on request or when the file's modification time changes, until closed."""
+        while True:
+            requested = self._requested.wait(self.interval)
+            if self._stopped.is_set():
+                return
+            self._requested.clear()
+            if requested:
+                self.reload("signal")
+            elif self.keyring.changed():
+                self.reload("file change")
+
+
+__all__ = ["DEFAULT_CHECK_INTERVAL", "KeyringWatcher", "RELOAD_SIGNAL"]
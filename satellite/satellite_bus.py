@@ -3,57 +3,703 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import socket
-from collections.abc import Iterable
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
-from satellite.firewall import SatelliteFirewall
-from satellite.telemetry import TelemetryLogger
+from capture.writer import CaptureWriter
+from ccsds.reassembly import DEFAULT_MAX_BUFFERED_BYTES, DEFAULT_TIMEOUT, SegmentReassembler
+from crypto.keyring import DEFAULT_OVERLAP_SECONDS, Keyring
+from satellite.acknowledgements import DEFAULT_ACK_CACHE_SIZE, CommandAcknowledger
+from satellite.dispatcher import (
+    DEFAULT_HANDLER_TIMEOUT,
+    DEFAULT_MAX_PENDING,
+    DEFAULT_WORKERS,
+    EXECUTORS,
+    CommandDispatcher,
+    HandlerSpec,
+    load_handlers,
+)
+from satellite.downlink import (
+    DEFAULT_DOWNLINK_PORT,
+    DEFAULT_FLUSH_INTERVAL,
+    DEFAULT_MAX_FRAME_BYTES,
+    DEFAULT_MIN_LEVEL,
+    DownlinkSink,
+)
+from satellite.firewall import FirewallDecision, SatelliteFirewall
+from satellite.ingress import (
+    Datagram,
+    DatagramQueue,
+    IngressProtocol,
+    IngressQueue,
+    OverflowPolicy,
+)
+from satellite.metrics import (
+    DEFAULT_METRICS_HOST,
+    DEFAULT_SUMMARY_INTERVAL,
+    BusMetrics,
+    MetricsExporter,
+)
+from satellite.profiling import (
+    DEFAULT_PROFILE_SECONDS,
+    DEFAULT_SAMPLE_INTERVAL,
+    ProfileController,
+)
+from satellite.ratelimit import DEFAULT_BURST, DEFAULT_RATE, TokenBucketLimiter
+from satellite.replay import (
+    DEFAULT_FRESHNESS_SECONDS,
+    DEFAULT_SNAPSHOT_INTERVAL,
+    DEFAULT_WINDOW_SIZE,
+    ReplayGuard,
+    SharedReplayState,
+)
+from satellite.rotation import DEFAULT_CHECK_INTERVAL, KeyringWatcher
+from satellite.scheduler import DEFAULT_PRIORITY_SHARE, DEFAULT_QUEUE_DEPTH, AdmissionScheduler
+from satellite.telemetry import DEFAULT_QUEUE_SIZE as DEFAULT_TELEMETRY_QUEUE_SIZE
+from satellite.telemetry import TelemetryLogger, TelemetrySink, TelemetryStoreSink
+from telemetry_store.writer import (
+    DEFAULT_SEGMENT_BYTES,
+    DEFAULT_SEGMENT_SECONDS,
+    TelemetryStoreWriter,
+)
 from utils.secrets import resolve_hmac_key
 
 DEFAULT_ALLOWED = ("GS-ALPHA",)
 DEFAULT_ENDPOINT: tuple[str, int] = ("127.0.0.1", 5000)
+DEFAULT_QUEUE_SIZE = 1024
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_ADMISSION_DRAIN = 1024
+DEFAULT_REPLAY_STATE = "replay_state.json"
+MAX_DATAGRAM_SIZE = 8192
+_DONTWAIT = getattr(socket, "MSG_DONTWAIT", None)
+
+
+@dataclass
+class BusStats:
+    """Packet counters maintained by a single bus instance."""
+
+    received: int = 0
+    accepted: int = 0
+    rejected: int = 0
 
 
 class SatelliteBus:
     """UDP-based simulation of a satellite command bus."""
 
     def __init__(
-        self, key: bytes, allowed_ground_ids: Iterable[str], endpoint: tuple[str, int]
+        self,
+        key: bytes,
+        allowed_ground_ids: Iterable[str],
+        endpoint: tuple[str, int],
+        *,
+        reuse_port: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        telemetry: TelemetryLogger | None = None,
+        replay_guard: ReplayGuard | None = None,
+        rate_limiter: TokenBucketLimiter | None = None,
+        allowed_apids: Iterable[int] | None = None,
+        capture: CaptureWriter | None = None,
+        metrics: BusMetrics | None = None,
+        keyring: Keyring | None = None,
+        reassembler: SegmentReassembler | None = None,
+        dispatcher: CommandDispatcher | None = None,
+        scheduler: AdmissionScheduler | None = None,
+        acknowledger: CommandAcknowledger | None = None,
     ) -> None:
-        """Initialize the UDP listener, firewall, and telemetry emitters."""
-        self.telemetry = TelemetryLogger()
-        self.firewall = SatelliteFirewall(key, allowed_ground_ids, telemetry=self.telemetry)
+        """
+        Initialize the UDP listener, firewall, and telemetry emitters.
+
+        ``reuse_port`` sets ``SO_REUSEPORT`` so several worker processes can bind the
+        same endpoint and let the kernel spread datagrams between them. ``batch_size``
+        caps how many already-readable datagrams are drained and inspected per wakeup.
+        When ``capture`` is set, every datagram is recorded with its firewall decision.
+        ``metrics`` receives firewall counters, stage latencies, and ingress drops.
+        A ``keyring`` replaces ``key`` with per-ground-station keys, and a
+        ``reassembler`` lets the firewall accept commands split across segments.
+        Accepted commands are handed to ``dispatcher``, when given, which runs their
+        handlers on its own pool so the receive loop never waits for execution.
+        A ``scheduler`` admits received datagrams to the firewall in fair order
+        between ground stations instead of arrival order, in both receive modes.
+        An ``acknowledger`` returns signed accept/reject acknowledgements for
+        authenticated commands to their source address from the listening socket.
+
+        Firewall inspection and the bus counters are serialised by a bus-level lock,
+        so async consumer threads only overlap in capture, acknowledgement, and
+        command execution.
+        """
+        self.telemetry = telemetry or TelemetryLogger()
+        self.firewall = SatelliteFirewall(
+            key,
+            allowed_ground_ids,
+            telemetry=self.telemetry,
+            replay_guard=replay_guard,
+            rate_limiter=rate_limiter,
+            allowed_apids=allowed_apids,
+            metrics=metrics,
+            keyring=keyring,
+            reassembler=reassembler,
+        )
+        self.metrics = metrics
         self.endpoint = endpoint
+        self.reuse_port = reuse_port
+        self.batch_size = max(1, batch_size)
+        self.stats = BusStats()
+        self._inspect_lock = threading.Lock()
+        self.ingress: DatagramQueue | None = None
+        self.capture = capture
+        self.dispatcher = dispatcher
+        self.scheduler = scheduler
+        self.acknowledger = acknowledger
 
     def run(self) -> None:
         """Start the UDP listener and dispatch packets through the firewall."""
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            if self.reuse_port:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             sock.bind(self.endpoint)
-            self.telemetry.info(
-                "Satellite bus listening",
-                endpoint=f"{self.endpoint[0]}:{self.endpoint[1]}",
-                allowed_ground_stations=list(self.firewall.allowed_ground_stations),
-            )
+            self._announce()
+            if self.acknowledger is not None:
+                self.acknowledger.attach(sock.sendto)
+            if self.scheduler is not None and self.metrics is not None:
+                self.metrics.ingress = self.scheduler.stats
             while True:
                 try:
-                    packet, addr = sock.recvfrom(8192)
-                    decision = self.firewall.inspect(packet, addr[0])
-                    if decision.accepted and decision.packet:
-                        self.telemetry.info(
-                            "Executing command",
-                            command=decision.packet.command,
-                            ground_station_id=decision.packet.ground_station_id,
-                        )
+                    if self.scheduler is None:
+                        packet, addr = sock.recvfrom(MAX_DATAGRAM_SIZE)
+                        batch = self._drain(sock, [Datagram(packet, addr[0], addr[1], time.time())])
+                    else:
+                        batch = self._admit(sock, self.scheduler)
+                    if len(batch) == 1:
+                        self.handle(batch[0])
+                    else:
+                        self.handle_batch(batch)
                 except KeyboardInterrupt:
                     self.telemetry.info("Satellite bus shutting down on operator request")
                     break
                 except OSError as exc:
                     self.telemetry.critical("Socket error", error=str(exc))
                     break
+        if self.scheduler is not None:
+            self._report_ingress(self.scheduler)
+
+    def run_async(
+        self,
+        *,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        consumers: int = 1,
+    ) -> None:
+        """Run the asyncio datagram mode until interrupted by the operator."""
+        try:
+            asyncio.run(
+                self.serve(
+                    queue_size=queue_size, overflow_policy=overflow_policy, consumers=consumers
+                )
+            )
+        except KeyboardInterrupt:
+            self.telemetry.info("Satellite bus shutting down on operator request")
+
+    async def serve(
+        self,
+        *,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        consumers: int = 1,
+    ) -> None:
+        """
+        Receive datagrams on the event loop and inspect them in consumer tasks.
+
+        Reception only appends to a bounded :class:`IngressQueue`, or to the bus
+        ``scheduler`` when one is set; consumer tasks hand each packet to a thread pool
+        for firewall inspection and telemetry, so slow downstream stages never hold up
+        the socket. With several ``consumers`` only the work after inspection runs in
+        parallel; see :meth:`__init__`.
+        """
+        loop = asyncio.get_running_loop()
+        ingress = self.ingress = self.scheduler or IngressQueue(queue_size, overflow_policy)
+        if self.metrics is not None:
+            self.metrics.ingress = ingress.stats
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: IngressProtocol(ingress),
+            local_addr=self.endpoint,
+            reuse_port=self.reuse_port or None,
+        )
+        if self.acknowledger is not None:
+            self.acknowledger.attach(
+                lambda packet, address: loop.call_soon_threadsafe(transport.sendto, packet, address)
+            )
+        self._announce(mode="async", queue_size=queue_size, overflow_policy=str(overflow_policy))
+        executor = ThreadPoolExecutor(max_workers=consumers, thread_name_prefix="bus-consumer")
+        tasks = [asyncio.create_task(self._consume(ingress, executor)) for _ in range(consumers)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            transport.close()
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=True)
+            if self.scheduler is not None:
+                self._report_ingress(self.scheduler)
+            else:
+                stats = ingress.stats
+                self.telemetry.info(
+                    "Ingress queue statistics",
+                    received=stats.received,
+                    dropped=stats.dropped,
+                    processed=stats.processed,
+                    overflow_policy=str(overflow_policy),
+                )
+
+    async def _consume(self, queue: DatagramQueue, executor: ThreadPoolExecutor) -> None:
+        """Inspect queued datagrams, a batch at a time, until the task is cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            batch.extend(queue.get_nowait_batch(self.batch_size - 1))
+            try:
+                if len(batch) == 1:
+                    await loop.run_in_executor(executor, self.handle, batch[0])
+                else:
+                    await loop.run_in_executor(executor, self.handle_batch, batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _admit(self, sock: socket.socket, scheduler: AdmissionScheduler) -> list[Datagram]:
+        """
+        Queue every readable datagram in ``scheduler`` and return the next batch it admits.
+
+        The socket is read ahead of inspection so that a flood from one ground station
+        waits in its own queue while the scheduler picks the next batch fairly; a
+        blocking receive only happens when nothing is queued.
+        """
+        received: list[Datagram] = []
+        if not scheduler.qsize():
+            packet, addr = sock.recvfrom(MAX_DATAGRAM_SIZE)
+            received.append(Datagram(packet, addr[0], addr[1], time.time()))
+        for datagram in self._drain(sock, received, DEFAULT_ADMISSION_DRAIN):
+            scheduler.put(datagram)
+        batch = scheduler.get_nowait_batch(self.batch_size)
+        scheduler.stats.processed += len(batch)
+        return batch
+
+    def _report_ingress(self, scheduler: AdmissionScheduler) -> None:
+        """Emit the admission scheduler's totals and per-queue drops."""
+        stats = scheduler.stats
+        self.telemetry.info(
+            "Admission scheduler statistics",
+            received=stats.received,
+            dropped=stats.dropped,
+            processed=stats.processed,
+            queue_dropped={
+                f"{priority_class}/{station}": count
+                for (priority_class, station), count in sorted(stats.queue_dropped.items())
+            },
+        )
+
+    def _drain(
+        self, sock: socket.socket, batch: list[Datagram], limit: int | None = None
+    ) -> list[Datagram]:
+        """Append already-readable datagrams to ``batch``, up to ``limit`` or the batch size."""
+        limit = self.batch_size if limit is None else limit
+        if limit == 1:
+            return batch
+        if _DONTWAIT is None:
+            sock.setblocking(False)
+        try:
+            while len(batch) < limit:
+                packet, addr = sock.recvfrom(MAX_DATAGRAM_SIZE, _DONTWAIT or 0)
+                batch.append(Datagram(packet, addr[0], addr[1], time.time()))
+        except BlockingIOError:
+            pass
+        finally:
+            if _DONTWAIT is None:
+                sock.setblocking(True)
+        return batch
+
+    def handle(self, datagram: Datagram) -> FirewallDecision:
+        """Inspect a single datagram and execute it when the firewall accepts it."""
+        with self._inspect_lock:
+            decision = self.firewall.inspect(datagram.packet, datagram.source_ip)
+            self.stats.received += 1
+            if not decision.accepted:
+                self.stats.rejected += not decision.pending
+            elif decision.packet:
+                self.stats.accepted += 1
+        if self.capture is not None:
+            self._record(self.capture, datagram, decision)
+        if self.acknowledger is not None:
+            self.acknowledger.acknowledge((datagram,), (decision,))
+        if decision.accepted and decision.packet:
+            self.telemetry.info(
+                "Executing command",
+                command=decision.packet.command,
+                ground_station_id=decision.packet.ground_station_id,
+            )
+            if self.dispatcher is not None:
+                self.dispatcher.submit(decision.packet)
+        return decision
+
+    def handle_batch(self, datagrams: list[Datagram]) -> list[FirewallDecision]:
+        """Inspect a burst of datagrams together and execute the accepted commands."""
+        with self._inspect_lock:
+            decisions = self.firewall.inspect_batch(
+                [(datagram.packet, datagram.source_ip) for datagram in datagrams]
+            )
+            executed = [
+                decision.packet
+                for decision in decisions
+                if decision.accepted and decision.packet is not None
+            ]
+            pending = sum(decision.pending for decision in decisions)
+            self.stats.received += len(datagrams)
+            self.stats.accepted += len(executed)
+            self.stats.rejected += len(decisions) - len(executed) - pending
+        if self.capture is not None:
+            for datagram, decision in zip(datagrams, decisions, strict=True):
+                self._record(self.capture, datagram, decision)
+        if self.acknowledger is not None:
+            self.acknowledger.acknowledge(datagrams, decisions)
+        if executed:
+            self.telemetry.info(
+                "Executing command batch",
+                commands=[
+                    {"command": packet.command, "ground_station_id": packet.ground_station_id}
+                    for packet in executed
+                ],
+            )
+            if self.dispatcher is not None:
+                for packet in executed:
+                    self.dispatcher.submit(packet)
+        return decisions
+
+    def close(self) -> None:
+        """Finish running commands, then persist firewall state, capture, and telemetry."""
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+        if self.acknowledger is not None:
+            self.acknowledger.attach(None)
+            stats = self.acknowledger.stats
+            self.telemetry.info(
+                "Command acknowledgement statistics",
+                packets=stats.packets,
+                accepted=stats.accepted,
+                rejected=stats.rejected,
+                resent=stats.resent,
+                unsigned=stats.unsigned,
+                send_errors=stats.send_errors,
+            )
+        self.firewall.close()
+        if self.capture is not None:
+            self.capture.close()
+        self.telemetry.close()
+
+    @staticmethod
+    def _record(capture: CaptureWriter, datagram: Datagram, decision: FirewallDecision) -> None:
+        """Append ``datagram`` and the firewall's verdict on it to ``capture``."""
+        capture.append(
+            datagram.packet,
+            datagram.source_ip,
+            datagram.source_port,
+            decision.accepted,
+            decision.reason,
+            received_at=datagram.received_at,
+        )
+
+    def _announce(self, **context: object) -> None:
+        """Emit the listening telemetry event for the bound endpoint."""
+        self.telemetry.info(
+            "Satellite bus listening",
+            endpoint=f"{self.endpoint[0]}:{self.endpoint[1]}",
+            allowed_ground_stations=list(self.firewall.allowed_ground_stations),
+            **context,
+        )
+
+
+@dataclass(frozen=True)
+class BusRunOptions:
+    """Receive-mode settings shared by single-process and multi-worker launches."""
+
+    mode: str = "sync"
+    batch_size: int = DEFAULT_BATCH_SIZE
+    queue_size: int = DEFAULT_QUEUE_SIZE
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    consumers: int = 1
+    background_telemetry: bool = False
+    telemetry_queue_size: int = DEFAULT_TELEMETRY_QUEUE_SIZE
+    console_telemetry: bool = True
+    telemetry_store: str | None = None
+    telemetry_segment_bytes: int = DEFAULT_SEGMENT_BYTES
+    telemetry_segment_seconds: float = DEFAULT_SEGMENT_SECONDS
+    downlink_host: str = DEFAULT_ENDPOINT[0]
+    downlink_port: int | None = None
+    downlink_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES
+    downlink_flush_interval: float = DEFAULT_FLUSH_INTERVAL
+    downlink_level: int = DEFAULT_MIN_LEVEL
+    replay_protection: bool = True
+    replay_window: int = DEFAULT_WINDOW_SIZE
+    freshness_seconds: float = DEFAULT_FRESHNESS_SECONDS
+    replay_state_path: str | None = DEFAULT_REPLAY_STATE
+    replay_snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL
+    rate_limit: float = DEFAULT_RATE
+    rate_burst: float = DEFAULT_BURST
+    allowed_apids: tuple[int, ...] | None = None
+    capture_path: str | None = None
+    metrics: bool = False
+    metrics_host: str = DEFAULT_METRICS_HOST
+    metrics_port: int | None = None
+    metrics_interval: float = DEFAULT_SUMMARY_INTERVAL
+    profiling: bool = False
+    profile_seconds: float = DEFAULT_PROFILE_SECONDS
+    profile_interval: float = DEFAULT_SAMPLE_INTERVAL
+    profile_memory: bool = False
+    keyring_path: str | None = None
+    keyring_overlap: float = DEFAULT_OVERLAP_SECONDS
+    keyring_check_interval: float = DEFAULT_CHECK_INTERVAL
+    reassembly: bool = True
+    reassembly_memory: int = DEFAULT_MAX_BUFFERED_BYTES
+    reassembly_timeout: float = DEFAULT_TIMEOUT
+    handlers: str | None = None
+    dispatch_workers: int = DEFAULT_WORKERS
+    dispatch_executor: str = "thread"
+    dispatch_queue_size: int = DEFAULT_MAX_PENDING
+    handler_timeout: float = DEFAULT_HANDLER_TIMEOUT
+    fair_queuing: bool = False
+    queue_depth: int = DEFAULT_QUEUE_DEPTH
+    priority_apids: tuple[int, ...] = ()
+    priority_share: float = DEFAULT_PRIORITY_SHARE
+    queue_weights: tuple[tuple[str, float], ...] = ()
+    acknowledgements: bool = False
+    ack_cache_size: int = DEFAULT_ACK_CACHE_SIZE
+
+    def make_capture(self, suffix: str = "") -> CaptureWriter | None:
+        """Build the capture writer for ``capture_path + suffix``, if capturing."""
+        if not self.capture_path:
+            return None
+        return CaptureWriter(self.capture_path + suffix)
+
+    def make_rate_limiter(self) -> TokenBucketLimiter | None:
+        """Build the per-source limiter, or ``None`` when ``rate_limit`` is zero."""
+        if self.rate_limit <= 0:
+            return None
+        return TokenBucketLimiter(self.rate_limit, self.rate_burst)
+
+    def make_telemetry(self) -> TelemetryLogger:
+        """Build the telemetry logger with the binary store and downlink sinks, if configured."""
+        sinks: list[TelemetrySink] = []
+        if self.telemetry_store:
+            writer = TelemetryStoreWriter(
+                self.telemetry_store,
+                max_segment_bytes=self.telemetry_segment_bytes,
+                max_segment_seconds=self.telemetry_segment_seconds,
+            )
+            sinks.append(TelemetryStoreSink(writer))
+        if self.downlink_port is not None:
+            sinks.append(
+                DownlinkSink(
+                    (self.downlink_host, self.downlink_port),
+                    max_frame_bytes=self.downlink_frame_bytes,
+                    flush_interval=self.downlink_flush_interval,
+                    min_level=self.downlink_level,
+                )
+            )
+        return TelemetryLogger(
+            background=self.background_telemetry,
+            queue_size=self.telemetry_queue_size,
+            console=self.console_telemetry,
+            sinks=sinks,
+        )
+
+    def make_replay_guard(
+        self, suffix: str = "", shared: SharedReplayState | None = None
+    ) -> ReplayGuard | None:
+        """
+        Build the anti-replay guard, persisting to ``replay_state_path + suffix``.
 
+        Bus workers pass the supervisor's ``shared`` state so that they all check one
+        set of windows.
+        """
+        if not self.replay_protection:
+            return None
+        return ReplayGuard(
+            self.replay_window,
+            self.freshness_seconds,
+            snapshot_path=self.replay_state_path + suffix if self.replay_state_path else None,
+            snapshot_interval=self.replay_snapshot_interval,
+            shared=shared,
+        )
+
+    def make_keyring(self) -> Keyring | None:
+        """Load the per-ground-station keyring, if one is configured."""
+        if not self.keyring_path:
+            return None
+        return Keyring(self.keyring_path, overlap=self.keyring_overlap)
+
+    def make_reassembler(self) -> SegmentReassembler | None:
+        """Build the segment reassembler, or ``None`` when segmented packets are refused."""
+        if not self.reassembly:
+            return None
+        return SegmentReassembler(
+            max_buffered_bytes=self.reassembly_memory, timeout=self.reassembly_timeout
+        )
+
+    def make_dispatcher(
+        self, telemetry: TelemetryLogger, metrics: BusMetrics | None = None
+    ) -> CommandDispatcher | None:
+        """
+        Load the ``handlers`` dispatch table and start its pool, if one is configured.
+
+        Plain handler functions in the table get ``handler_timeout``; entries that are
+        already :class:`HandlerSpec` keep their own limits. Closing the dispatcher waits
+        at most ``handler_timeout`` for running handlers.
+        """
+        if not self.handlers:
+            return None
+        table = {
+            verb: spec if isinstance(spec, HandlerSpec) else HandlerSpec(spec, self.handler_timeout)
+            for verb, spec in load_handlers(self.handlers).items()
+        }
+        dispatcher = CommandDispatcher(
+            table,
+            telemetry,
+            workers=self.dispatch_workers,
+            max_pending=self.dispatch_queue_size,
+            executor=self.dispatch_executor,
+            metrics=metrics,
+            shutdown_timeout=self.handler_timeout,
+        )
+        telemetry.info(
+            "Command dispatcher started",
+            handlers=self.handlers,
+            verbs=sorted(dispatcher.routes),
+            executor=self.dispatch_executor,
+            workers=self.dispatch_workers,
+        )
+        return dispatcher
+
+    def make_scheduler(self, ground_stations: Iterable[str]) -> AdmissionScheduler | None:
+        """Build the per-ground-station admission scheduler, if fair queuing is enabled."""
+        if not self.fair_queuing:
+            return None
+        return AdmissionScheduler(
+            ground_stations,
+            priority_apids=self.priority_apids,
+            priority_share=self.priority_share,
+            weights=dict(self.queue_weights),
+            max_depth=self.queue_depth,
+            policy=self.overflow_policy,
+        )
+
+    def make_acknowledger(
+        self, key: bytes, keyring: Keyring | None = None
+    ) -> CommandAcknowledger | None:
+        """Build the command acknowledger, signing with ``key`` or the bus ``keyring``."""
+        if not self.acknowledgements:
+            return None
+        return CommandAcknowledger(key, keyring=keyring, cache_size=self.ack_cache_size)
+
+    def make_metrics(self) -> BusMetrics | None:
+        """Build the metrics registry when metrics or the endpoint are enabled."""
+        return BusMetrics() if self.metrics or self.metrics_port is not None else None
+
+    def start(self, bus: SatelliteBus, worker_index: int = 0) -> None:
+        """
+        Run ``bus`` in the configured receive mode until it stops.
+
+        When the bus collects metrics they are exported for the duration of the run;
+        workers serve them on ``metrics_port + worker_index``. With ``profiling``,
+        ``SIGUSR1`` or ``GET /profile`` on the metrics endpoint starts a profiling
+        session whose results are written next to the telemetry log. A keyring is
+        reloaded when its file changes or on ``SIGHUP``.
+        """
+        profiler = self.make_profiler(bus.telemetry)
+        watcher = self.make_keyring_watcher(bus)
+        exporter = None
+        if bus.metrics is not None:
+            port = self.metrics_port
+            exporter = MetricsExporter(
+                bus.metrics,
+                bus.telemetry,
+                port=port + worker_index if port else port,
+                host=self.metrics_host,
+                summary_interval=self.metrics_interval,
+                routes={"/profile": profiler.route} if profiler is not None else None,
+            )
+        try:
+            if self.mode == "async":
+                bus.run_async(
+                    queue_size=self.queue_size,
+                    overflow_policy=self.overflow_policy,
+                    consumers=self.consumers,
+                )
+            else:
+                bus.run()
+        finally:
+            if exporter is not None:
+                exporter.close()
+            if profiler is not None:
+                profiler.close()
+            if watcher is not None:
+                watcher.close()
+
+    def make_keyring_watcher(self, bus: SatelliteBus) -> KeyringWatcher | None:
+        """Watch the bus keyring for changes and install the reload signal handler."""
+        keyring = bus.firewall.keyring
+        if keyring is None:
+            return None
+        watcher = KeyringWatcher(
+            keyring,
+            bus.telemetry,
+            interval=self.keyring_check_interval,
+            on_reload=bus.firewall.refresh_ground_stations,
+        )
+        bus.telemetry.info(
+            "Keyring loaded",
+            path=str(keyring.path),
+            ground_stations=len(keyring),
+            signal="SIGHUP" if watcher.install_signal_handler() else None,
+        )
+        return watcher
+
+    def make_profiler(self, telemetry: TelemetryLogger) -> ProfileController | None:
+        """Build the profiling controller and install its signal handler, if enabled."""
+        if not self.profiling:
+            return None
+        profiler = ProfileController(
+            telemetry.path.parent,
+            telemetry,
+            duration=self.profile_seconds,
+            interval=self.profile_interval,
+            memory=self.profile_memory,
+        )
+        telemetry.info(
+            "Profiling hooks installed",
+            signal="SIGUSR1" if profiler.install_signal_handler() else None,
+            output_dir=str(profiler.output_dir.resolve()),
+        )
+        return profiler
+
+
+def queue_weight(value: str) -> tuple[str, float]:
+    """Parse one ``GS=WEIGHT`` argument of ``--queue-weights``."""
+    station, separator, weight = value.rpartition("=")
+    try:
+        if not separator or not station or float(weight) <= 0:
+            raise ValueError(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected GS=WEIGHT with a positive weight, not {value!r}"
+        ) from None
+    return station, float(weight)
 
-def parse_args() -> argparse.Namespace:
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     """Return parsed CLI arguments for the satellite bus simulator."""
     parser = argparse.ArgumentParser(description="Run the satellite bus UDP listener")
     parser.add_argument(
@@ -61,31 +707,406 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="HMAC secret; defaults to SATCOM_KEY env var or built-in demo value",
     )
+    parser.add_argument(
+        "--keyring",
+        default=None,
+        metavar="PATH",
+        help="JSON file of per-ground-station keys, reloaded on change or SIGHUP",
+    )
+    parser.add_argument(
+        "--key-overlap",
+        type=float,
+        default=DEFAULT_OVERLAP_SECONDS,
+        help="Seconds a rotated-out keyring key is still accepted",
+    )
     parser.add_argument(
         "--allowed-ground-stations",
         nargs="+",
         default=list(DEFAULT_ALLOWED),
-        help="Space-separated list of allowed ground station identifiers",
+        help="Space-separated list of allowed ground station identifiers (--keyring overrides)",
     )
     parser.add_argument("--host", default=DEFAULT_ENDPOINT[0], help="Host interface to bind")
     parser.add_argument("--port", type=int, default=DEFAULT_ENDPOINT[1], help="UDP port to bind")
-    return parser.parse_args()
+    parser.add_argument(
+        "--mode",
+        choices=["sync", "async"],
+        default="sync",
+        help="Blocking receive loop or asyncio datagram mode with a bounded ingress queue",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help="Ingress queue capacity in async mode",
+    )
+    parser.add_argument(
+        "--overflow-policy",
+        choices=[policy.value for policy in OverflowPolicy],
+        default=OverflowPolicy.DROP_OLDEST.value,
+        help="Datagram discarded when the async ingress queue is full",
+    )
+    parser.add_argument(
+        "--consumers", type=int, default=1, help="Inspection consumer tasks in async mode"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Maximum readable datagrams drained and inspected together per wakeup",
+    )
+    parser.add_argument(
+        "--background-telemetry",
+        action="store_true",
+        help="Format and write telemetry on a background thread fed by a bounded queue",
+    )
+    parser.add_argument(
+        "--telemetry-queue-size",
+        type=int,
+        default=DEFAULT_TELEMETRY_QUEUE_SIZE,
+        help="Queued telemetry events before new ones are dropped (background mode)",
+    )
+    parser.add_argument(
+        "--no-console",
+        action="store_true",
+        help="Write telemetry only to telemetry.log, not the console",
+    )
+    parser.add_argument(
+        "--telemetry-store",
+        default=None,
+        metavar="DIR",
+        help="Also write telemetry to a rotated, compressed binary store in this directory",
+    )
+    parser.add_argument(
+        "--telemetry-segment-mb",
+        type=float,
+        default=DEFAULT_SEGMENT_BYTES / (1 << 20),
+        help="Rotate telemetry store segments after this many MiB",
+    )
+    parser.add_argument(
+        "--telemetry-segment-seconds",
+        type=float,
+        default=DEFAULT_SEGMENT_SECONDS,
+        help="Rotate telemetry store segments after this many seconds of events",
+    )
+    parser.add_argument(
+        "--downlink-port",
+        type=int,
+        default=None,
+        help=f"Also send telemetry as CCSDS telemetry frames to this UDP port "
+        f"(the ground receiver defaults to {DEFAULT_DOWNLINK_PORT})",
+    )
+    parser.add_argument(
+        "--downlink-host",
+        default=DEFAULT_ENDPOINT[0],
+        help="Ground host receiving downlinked telemetry",
+    )
+    parser.add_argument(
+        "--downlink-frame-bytes",
+        type=int,
+        default=DEFAULT_MAX_FRAME_BYTES,
+        help="Largest telemetry frame; events are packed into frames up to this size",
+    )
+    parser.add_argument(
+        "--downlink-flush-interval",
+        type=float,
+        default=DEFAULT_FLUSH_INTERVAL,
+        help="Seconds a partially filled telemetry frame may wait before it is sent",
+    )
+    parser.add_argument(
+        "--downlink-level",
+        choices=["INFO", "WARNING", "CRITICAL"],
+        default=logging.getLevelName(DEFAULT_MIN_LEVEL),
+        help="Least severe telemetry event that is downlinked",
+    )
+    parser.add_argument(
+        "--no-replay-protection",
+        action="store_true",
+        help="Disable the sequence-count and timestamp anti-replay checks",
+    )
+    parser.add_argument(
+        "--replay-window",
+        type=int,
+        default=DEFAULT_WINDOW_SIZE,
+        help="Sequence counts tracked below the highest accepted count per ground station",
+    )
+    parser.add_argument(
+        "--freshness",
+        type=float,
+        default=DEFAULT_FRESHNESS_SECONDS,
+        help="Maximum allowed difference in seconds between packet and bus clocks",
+    )
+    parser.add_argument(
+        "--replay-state",
+        default=DEFAULT_REPLAY_STATE,
+        help="File used to persist replay windows across restarts ('' disables)",
+    )
+    parser.add_argument(
+        "--replay-snapshot-interval",
+        type=float,
+        default=DEFAULT_SNAPSHOT_INTERVAL,
+        help="Minimum seconds between replay window snapshots (0 saves every acceptance)",
+    )
+    parser.add_argument(
+        "--allowed-apids",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Accept only these APIDs (default: any APID)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=DEFAULT_RATE,
+        help="Sustained packets per second allowed per source IP (0 disables)",
+    )
+    parser.add_argument(
+        "--rate-burst",
+        type=float,
+        default=DEFAULT_BURST,
+        help="Packets a source IP may send in a burst before rate limiting applies",
+    )
+    parser.add_argument(
+        "--no-reassembly",
+        action="store_true",
+        help="Reject segmented packets instead of reassembling them",
+    )
+    parser.add_argument(
+        "--reassembly-memory-kb",
+        type=int,
+        default=DEFAULT_MAX_BUFFERED_BYTES >> 10,
+        help="KiB of buffers shared by all packets being reassembled",
+    )
+    parser.add_argument(
+        "--reassembly-timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="Seconds without a new segment before a partial packet is discarded",
+    )
+    parser.add_argument(
+        "--handlers",
+        default=None,
+        metavar="MODULE:TABLE",
+        help="Dispatch table mapping command verbs to handlers, run off the receive path",
+    )
+    parser.add_argument(
+        "--dispatch-workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Threads or processes running command handlers",
+    )
+    parser.add_argument(
+        "--dispatch-executor",
+        choices=EXECUTORS,
+        default="thread",
+        help="Run handlers in a thread pool or a process pool",
+    )
+    parser.add_argument(
+        "--dispatch-queue-size",
+        type=int,
+        default=DEFAULT_MAX_PENDING,
+        help="Commands queued or running before new ones are dropped",
+    )
+    parser.add_argument(
+        "--handler-timeout",
+        type=float,
+        default=DEFAULT_HANDLER_TIMEOUT,
+        help="Seconds before a running handler is reported as timed out",
+    )
+    parser.add_argument(
+        "--fair-queuing",
+        action="store_true",
+        help="Admit datagrams to the firewall fairly between ground stations, not FIFO",
+    )
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=DEFAULT_QUEUE_DEPTH,
+        help="Datagrams held per ground-station queue with --fair-queuing",
+    )
+    parser.add_argument(
+        "--priority-apids",
+        type=int,
+        nargs="+",
+        default=[],
+        help="Safety-critical APIDs admitted ahead of other traffic with --fair-queuing",
+    )
+    parser.add_argument(
+        "--priority-share",
+        type=float,
+        default=DEFAULT_PRIORITY_SHARE,
+        help="Largest fraction of admitted bytes priority APIDs may take while others wait",
+    )
+    parser.add_argument(
+        "--queue-weights",
+        type=queue_weight,
+        nargs="+",
+        default=[],
+        metavar="GS=WEIGHT",
+        help="Relative share of inspection capacity per ground station (default 1)",
+    )
+    parser.add_argument(
+        "--acks",
+        action="store_true",
+        help="Return signed accept/reject acknowledgements to ground stations",
+    )
+    parser.add_argument(
+        "--ack-cache-size",
+        type=int,
+        default=DEFAULT_ACK_CACHE_SIZE,
+        help="Accepted commands remembered to re-acknowledge retransmissions with --acks",
+    )
+    parser.add_argument(
+        "--capture",
+        default=None,
+        metavar="PATH",
+        help="Record every datagram and firewall decision to this capture file",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Collect counters and stage latencies and emit periodic summary telemetry",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics on this local port (implies --metrics; +N per worker)",
+    )
+    parser.add_argument(
+        "--metrics-host", default=DEFAULT_METRICS_HOST, help="Interface for the metrics endpoint"
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=DEFAULT_SUMMARY_INTERVAL,
+        help="Seconds between metrics summary events (0 disables)",
+    )
+    parser.add_argument(
+        "--profiling",
+        action="store_true",
+        help="Profile on SIGUSR1 or GET /profile on the metrics endpoint",
+    )
+    parser.add_argument(
+        "--profile-seconds",
+        type=float,
+        default=DEFAULT_PROFILE_SECONDS,
+        help="Default length of a triggered profiling session",
+    )
+    parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=DEFAULT_SAMPLE_INTERVAL,
+        help="Seconds between stack samples during a profiling session",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Also write a tracemalloc allocation diff for each profiling session",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes sharing the endpoint via SO_REUSEPORT",
+    )
+    return parser.parse_args(argv)
 
 
-def main() -> None:
+def main(argv: Sequence[str] | None = None) -> None:
     """Entry point for running the satellite bus listener."""
-    args = parse_args()
+    args = parse_args(argv)
     key, used_demo = resolve_hmac_key(args.key)
-    if used_demo:
+    if used_demo and not args.keyring:
         logging.warning(
             "Using demo HMAC key; configure SATCOM_KEY or --key for stronger testing.",
         )
+    options = BusRunOptions(
+        mode=args.mode,
+        batch_size=args.batch_size,
+        queue_size=args.queue_size,
+        overflow_policy=OverflowPolicy(args.overflow_policy),
+        consumers=args.consumers,
+        background_telemetry=args.background_telemetry,
+        telemetry_queue_size=args.telemetry_queue_size,
+        console_telemetry=not args.no_console,
+        telemetry_store=args.telemetry_store,
+        telemetry_segment_bytes=int(args.telemetry_segment_mb * (1 << 20)),
+        telemetry_segment_seconds=args.telemetry_segment_seconds,
+        downlink_host=args.downlink_host,
+        downlink_port=args.downlink_port,
+        downlink_frame_bytes=args.downlink_frame_bytes,
+        downlink_flush_interval=args.downlink_flush_interval,
+        downlink_level=logging.getLevelNamesMapping()[args.downlink_level],
+        replay_protection=not args.no_replay_protection,
+        replay_window=args.replay_window,
+        freshness_seconds=args.freshness,
+        replay_state_path=args.replay_state or None,
+        replay_snapshot_interval=args.replay_snapshot_interval,
+        rate_limit=args.rate_limit,
+        rate_burst=args.rate_burst,
+        reassembly=not args.no_reassembly,
+        reassembly_memory=args.reassembly_memory_kb << 10,
+        reassembly_timeout=args.reassembly_timeout,
+        handlers=args.handlers,
+        dispatch_workers=args.dispatch_workers,
+        dispatch_executor=args.dispatch_executor,
+        dispatch_queue_size=args.dispatch_queue_size,
+        handler_timeout=args.handler_timeout,
+        fair_queuing=args.fair_queuing,
+        queue_depth=args.queue_depth,
+        priority_apids=tuple(args.priority_apids),
+        priority_share=args.priority_share,
+        queue_weights=tuple(args.queue_weights),
+        acknowledgements=args.acks,
+        ack_cache_size=args.ack_cache_size,
+        allowed_apids=tuple(args.allowed_apids) if args.allowed_apids else None,
+        capture_path=args.capture,
+        metrics=args.metrics,
+        metrics_host=args.metrics_host,
+        metrics_port=args.metrics_port,
+        metrics_interval=args.metrics_interval,
+        profiling=args.profiling,
+        profile_seconds=args.profile_seconds,
+        profile_interval=args.profile_interval,
+        profile_memory=args.profile_memory,
+        keyring_path=args.keyring,
+        keyring_overlap=args.key_overlap,
+    )
+    if args.workers > 1:
+        from satellite.workers import WorkerSupervisor
+
+        WorkerSupervisor(
+            key=key,
+            allowed_ground_ids=args.allowed_ground_stations,
+            endpoint=(args.host, args.port),
+            workers=args.workers,
+            options=options,
+        ).run()
+        return
+    telemetry = options.make_telemetry()
+    metrics = options.make_metrics()
+    keyring = options.make_keyring()
     bus = SatelliteBus(
         key=key,
         allowed_ground_ids=args.allowed_ground_stations,
         endpoint=(args.host, args.port),
+        batch_size=options.batch_size,
+        telemetry=telemetry,
+        replay_guard=options.make_replay_guard(),
+        rate_limiter=options.make_rate_limiter(),
+        allowed_apids=options.allowed_apids,
+        capture=options.make_capture(),
+        metrics=metrics,
+        keyring=keyring,
+        reassembler=options.make_reassembler(),
+        dispatcher=options.make_dispatcher(telemetry, metrics),
+        scheduler=options.make_scheduler(args.allowed_ground_stations),
+        acknowledger=options.make_acknowledger(key, keyring),
     )
-    bus.run()
+    try:
+        options.start(bus)
+    finally:
+        bus.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,247 @@
+"""Fair admission of received datagrams between ground stations ahead of HMAC checks."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from collections import Counter, OrderedDict, deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+from ccsds.packet_parser import PRIMARY_HEADER_LENGTH, SEQUENCE_FIRST, SEQUENCE_STANDALONE
+from satellite.ingress import Datagram, IngressStats, OverflowPolicy
+from satellite.prefilter import claimed_ground_station
+
+DEFAULT_QUANTUM = 1024
+DEFAULT_QUEUE_DEPTH = 256
+DEFAULT_SEGMENT_OWNERS = 1024
+DEFAULT_PRIORITY_SHARE = 0.75
+DEFAULT_PRIORITY_BURST = 8192
+PRIORITY = "priority"
+NORMAL = "normal"
+UNCLASSIFIED = "<unclassified>"
+
+_HEADER = struct.Struct(">HH")
+
+QueueKey = tuple[str, str]
+
+
+@dataclass
+class AdmissionStats(IngressStats):
+    """Ingress counters plus drops per ``(class, ground station)`` queue."""
+
+    queue_dropped: Counter[QueueKey] = field(default_factory=Counter)
+
+
+class _StationQueue:
+    """One ground station's FIFO within a class and its deficit-round-robin credit."""
+
+    __slots__ = ("datagrams", "deficit", "quantum")
+
+    def __init__(self, quantum: int) -> None:
+        """Start empty with no credit."""
+        self.datagrams: deque[Datagram] = deque()
+        self.deficit = 0
+        self.quantum = quantum
+
+
+class _PriorityClass:
+    """The station queues of one priority class and the round-robin order of busy ones."""
+
+    __slots__ = ("queues", "active")
+
+    def __init__(self) -> None:
+        """Start with no queues."""
+        self.queues: dict[str, _StationQueue] = {}
+        self.active: deque[_StationQueue] = deque()
+
+
+class AdmissionScheduler:
+    """
+    Per-ground-station queues served by deficit round robin, with priority classes.
+
+    Each datagram is classified from its raw header: packets for ``priority_apids``
+    go to the priority class, which is served first, and within a class each
+    claimed ground station in ``ground_stations`` has its own queue. Any other or
+    unreadable ground ID shares one ``UNCLASSIFIED`` queue, so a spoofed flood can only
+    fill its own queue. Queues are served in deficit-round-robin order, each turn
+    crediting ``quantum`` bytes times the station's weight, so stations share
+    inspection capacity by bytes rather than by arrival order. Every queue holds at
+    most ``max_depth`` datagrams; overflow follows ``policy`` within that queue and
+    is counted per queue. Segments after the first inherit the queue of their
+    ``(source, APID)`` first segment to stay in order.
+
+    The APID is not authenticated yet, so the priority class is bounded: while normal
+    traffic is waiting, it may take at most ``priority_share`` of the admitted bytes,
+    after a burst of up to ``priority_burst`` bytes. A spoofed flood on a priority APID
+    therefore cannot starve the normal queues. A share of 1 restores strict priority.
+
+    The queue is a drop-in replacement for :class:`satellite.ingress.IngressQueue`.
+    It is not thread-safe: use it from one thread or one event loop.
+    """
+
+    def __init__(
+        self,
+        ground_stations: Iterable[str],
+        *,
+        priority_apids: Iterable[int] = (),
+        weights: Mapping[str, float] | None = None,
+        quantum: int = DEFAULT_QUANTUM,
+        max_depth: int = DEFAULT_QUEUE_DEPTH,
+        policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST,
+        priority_share: float = DEFAULT_PRIORITY_SHARE,
+        priority_burst: int = DEFAULT_PRIORITY_BURST,
+    ) -> None:
+        """Configure the known ground stations, priority APIDs, weights, and limits."""
+        if quantum < 1 or max_depth < 1:
+            raise ValueError("Quantum and queue depth must be at least 1")
+        if not 0 < priority_share <= 1 or priority_burst < 0:
+            raise ValueError("Priority share must be in (0, 1] and the burst non-negative")
+        weights = weights or {}
+        if any(weight <= 0 for weight in weights.values()):
+            raise ValueError("Queue weights must be positive")
+        self.ground_stations = frozenset(ground_stations)
+        self.priority_apids = frozenset(priority_apids)
+        self.max_depth = max_depth
+        self.policy = policy
+        self.priority_share = priority_share
+        self.priority_burst = priority_burst
+        self.stats = AdmissionStats()
+        self._quanta = {
+            station: max(1, round(quantum * weights.get(station, 1.0)))
+            for station in (*self.ground_stations, UNCLASSIFIED)
+        }
+        self._classes = {PRIORITY: _PriorityClass(), NORMAL: _PriorityClass()}
+        self._segment_owners: OrderedDict[tuple[str, int], str] = OrderedDict()
+        self._size = 0
+        self._priority_credit = float(priority_burst)
+        self._ready: asyncio.Event | None = None
+
+    def put(self, datagram: Datagram) -> bool:
+        """Queue a datagram behind its station's earlier ones; return False if dropped."""
+        self.stats.received += 1
+        priority_class, station = self.classify(datagram)
+        classes = self._classes[priority_class]
+        queue = classes.queues.get(station)
+        if queue is None:
+            queue = classes.queues[station] = _StationQueue(self._quanta[station])
+        if len(queue.datagrams) >= self.max_depth:
+            self.stats.dropped += 1
+            self.stats.queue_dropped[priority_class, station] += 1
+            if self.policy is OverflowPolicy.DROP_NEWEST:
+                return False
+            queue.datagrams.popleft()
+            self._size -= 1
+        if not queue.datagrams:
+            classes.active.append(queue)
+        queue.datagrams.append(datagram)
+        self._size += 1
+        if self._ready is not None:
+            self._ready.set()
+        return True
+
+    def classify(self, datagram: Datagram) -> QueueKey:
+        """Return the ``(class, ground station)`` queue a datagram belongs to."""
+        packet = datagram.packet
+        if len(packet) < PRIMARY_HEADER_LENGTH:
+            return NORMAL, UNCLASSIFIED
+        first_word, second_word = _HEADER.unpack_from(packet)
+        apid = first_word & 0x7FF
+        priority_class = PRIORITY if apid in self.priority_apids else NORMAL
+        sequence_flags = second_word >> 14
+        if sequence_flags not in (SEQUENCE_STANDALONE, SEQUENCE_FIRST):
+            return priority_class, self._segment_owners.get(
+                (datagram.source_ip, apid), UNCLASSIFIED
+            )
+        station = claimed_ground_station(packet)
+        if station not in self.ground_stations or station is None:
+            station = UNCLASSIFIED
+        if sequence_flags == SEQUENCE_FIRST:
+            owners = self._segment_owners
+            owners[datagram.source_ip, apid] = station
+            owners.move_to_end((datagram.source_ip, apid))
+            if len(owners) > DEFAULT_SEGMENT_OWNERS:
+                owners.popitem(last=False)
+        return priority_class, station
+
+    def get_nowait(self) -> Datagram | None:
+        """Return the next datagram in priority and deficit-round-robin order, if any."""
+        priority, normal = self._classes[PRIORITY], self._classes[NORMAL]
+        if not priority.active and not normal.active:
+            return None
+        if priority.active and (
+            not normal.active or self.priority_share >= 1 or self._priority_credit > 0
+        ):
+            datagram = self._serve(priority)
+            if normal.active:
+                self._priority_credit -= len(datagram.packet)
+            return datagram
+        datagram = self._serve(normal)
+        if self.priority_share < 1:
+            earned = len(datagram.packet) * self.priority_share / (1 - self.priority_share)
+            self._priority_credit = min(self._priority_credit + earned, self.priority_burst)
+        return datagram
+
+    def _serve(self, priority_class: _PriorityClass) -> Datagram:
+        """Pop the next datagram of a busy class in deficit-round-robin order."""
+        active = priority_class.active
+        while True:
+            queue = active[0]
+            size = len(queue.datagrams[0].packet)
+            if queue.deficit < size:
+                queue.deficit += queue.quantum
+                active.rotate(-1)
+                continue
+            datagram = queue.datagrams.popleft()
+            self._size -= 1
+            queue.deficit -= size
+            if not queue.datagrams:
+                queue.deficit = 0
+                active.popleft()
+            return datagram
+
+    def get_nowait_batch(self, limit: int) -> list[Datagram]:
+        """Return up to ``limit`` queued datagrams in scheduling order without waiting."""
+        batch: list[Datagram] = []
+        while len(batch) < limit and (datagram := self.get_nowait()) is not None:
+            batch.append(datagram)
+        return batch
+
+    async def get(self) -> Datagram:
+        """Wait for and return the next datagram in scheduling order."""
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        while (datagram := self.get_nowait()) is None:
+            self._ready.clear()
+            await self._ready.wait()
+        return datagram
+
+    def task_done(self) -> None:
+        """Mark a previously fetched datagram as processed."""
+        self.stats.processed += 1
+
+    def qsize(self) -> int:
+        """Return the number of datagrams waiting across all queues."""
+        return self._size
+
+    def depths(self) -> dict[QueueKey, int]:
+        """Return the current depth of every non-empty queue."""
+        return {
+            (name, station): len(queue.datagrams)
+            for name, priority_class in self._classes.items()
+            for station, queue in priority_class.queues.items()
+            if queue.datagrams
+        }
+
+
+__all__ = [
+    "DEFAULT_PRIORITY_BURST",
+    "DEFAULT_PRIORITY_SHARE",
+    "DEFAULT_QUANTUM",
+    "DEFAULT_QUEUE_DEPTH",
+    "NORMAL",
+    "PRIORITY",
+    "UNCLASSIFIED",
+    "AdmissionScheduler",
+    "AdmissionStats",
+]
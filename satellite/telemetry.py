@@ -2,41 +2,106 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import queue
+import sys
+import threading
+import time
+from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, TextIO
+
+if TYPE_CHECKING:
+    from telemetry_store.writer import TelemetryStoreWriter
+
+DEFAULT_PATH = "telemetry.log"
+DEFAULT_QUEUE_SIZE = 8192
+DRAIN_BATCH_SIZE = 256
+
+TelemetryRecord = tuple[int, float, str, dict[str, Any]]
+
+
+class TelemetrySink(Protocol):
+    """Additional destination that receives raw telemetry records alongside the log."""
+
+    def write(self, records: Sequence[TelemetryRecord]) -> None:
+        """Store a batch of ``(level, created, message, context)`` records."""
+
+    def close(self) -> None:
+        """Flush and release the sink."""
+
+
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%dT%H:%M:%SZ",
+)
 
 
 class TelemetryLogger:
-    """Structured telemetry logger writing to file and stdout."""
+    """
+    Structured telemetry logger writing to file and stdout.
 
-    def __init__(self, path: str = "telemetry.log") -> None:
-        """Configure file and stream handlers for structured telemetry output."""
-        self.logger = logging.getLogger("telemetry")
-        if not self.logger.handlers:
-            self.logger.setLevel(logging.INFO)
-            formatter = logging.Formatter(
-                fmt="%(asctime)s | %(levelname)s | %(message)s",
-                datefmt="%Y-%m-%dT%H:%M:%SZ",
-            )
-
-            file_handler = logging.FileHandler(path)
-            file_handler.setFormatter(formatter)
-            stream_handler = logging.StreamHandler()
-            stream_handler.setFormatter(formatter)
+    With ``background=True`` the caller only enqueues a ``(level, time, message,
+    context)`` tuple; timestamp formatting, JSON encoding and buffered writes happen on
+    a listener thread. Events arriving at a full queue are counted in ``dropped``.
+    ``sinks`` receive every record as well; in background mode they are written on the
+    listener thread, a batch at a time.
+    """
 
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        *,
+        background: bool = False,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        console: bool = True,
+        sinks: Iterable[TelemetrySink] = (),
+    ) -> None:
+        """Configure file and stream handlers for structured telemetry output."""
+        self.path = Path(path)
+        # Unregistered logger: each instance keeps its own handlers, so a later logger
+        # with another path or console setting is not bound to the first one's.
+        self.logger = logging.Logger("telemetry", logging.INFO)
+        self.sinks = tuple(sinks)
+        self._listener: TelemetryListener | None = None
+        if background:
+            streams: list[TextIO] = [open(path, "a", encoding="utf-8")]
+            if console:
+                streams.append(sys.stderr)
+            self._listener = TelemetryListener(streams, queue_size, self.sinks)
+        else:
+            file_handler = logging.FileHandler(path, delay=True)
+            file_handler.setFormatter(_FORMATTER)
             self.logger.addHandler(file_handler)
-            self.logger.addHandler(stream_handler)
+
+            if console:
+                stream_handler = logging.StreamHandler()
+                stream_handler.setFormatter(_FORMATTER)
+                self.logger.addHandler(stream_handler)
+
+    @property
+    def dropped(self) -> int:
+        """Return how many events were discarded because the queue was full."""
+        return self._listener.dropped if self._listener else 0
 
     def emit(self, level: int, message: str, **context: Any) -> None:
         """Emit a structured telemetry event at the given log level."""
+        if self._listener is not None:
+            self._listener.submit((level, time.time(), message, context))
+            return
         payload: dict[str, Any] = {
             "timestamp": datetime.now(tz=UTC).isoformat(),
             "message": message,
             **context,
         }
         self.logger.log(level, json.dumps(payload))
+        if self.sinks:
+            records = ((level, time.time(), message, context),)
+            for sink in self.sinks:
+                sink.write(records)
 
     def info(self, message: str, **context: Any) -> None:
         """Record an informational telemetry event."""
@@ -50,5 +115,169 @@ class TelemetryLogger:
         """Record a critical telemetry event."""
         self.emit(logging.CRITICAL, message, **context)
 
+    def close(self) -> None:
+        """Flush every queued event, stop the background listener, and close the sinks."""
+        if self._listener is not None:
+            self._listener.stop()
+            return
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+        for sink in self.sinks:
+            sink.close()
+
+
+class NullTelemetry(TelemetryLogger):
+    """Telemetry sink that discards every event, for offline analysis at full speed."""
+
+    def __init__(self) -> None:
+        """Create a logger that opens no files and installs no handlers."""
+        self.path = Path(DEFAULT_PATH)
+        self.logger = logging.Logger("telemetry.null")
+        self.sinks = ()
+        self._listener = None
+
+    def emit(self, level: int, message: str, **context: Any) -> None:
+        """Discard the event."""
+
+
+class TelemetryListener:
+    """Background thread that formats queued telemetry records and writes them in batches."""
+
+    def __init__(
+        self,
+        streams: list[TextIO],
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        sinks: Sequence[TelemetrySink] = (),
+    ) -> None:
+        """Start the listener thread writing to ``streams`` and ``sinks``."""
+        self.streams = streams
+        self.sinks = sinks
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._queue: queue.Queue[TelemetryRecord | None] = queue.Queue(queue_size)
+        self._thread = threading.Thread(target=self._run, name="telemetry-listener", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def submit(self, record: TelemetryRecord) -> bool:
+        """Enqueue a record without blocking; return False if it had to be dropped."""
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def stop(self) -> None:
+        """Write everything still queued, close the streams and sinks, and join the thread."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+        for stream in self.streams:
+            if stream not in (sys.stdout, sys.stderr):
+                stream.close()
+        for sink in self.sinks:
+            sink.close()
+
+    def _run(self) -> None:
+        """Drain the queue in batches until the shutdown sentinel arrives."""
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while len(batch) < DRAIN_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = [record for record in batch if record is not None]
+            running = len(records) == len(batch)
+            if self.dropped > self._reported_dropped:
+                records.append(self._drop_notice())
+            self._write("".join(self._format(record) for record in records))
+            if records:
+                for sink in self.sinks:
+                    sink.write(records)
+
+    def _drop_notice(self) -> TelemetryRecord:
+        """Return a warning record describing events dropped since the last notice."""
+        newly_dropped = self.dropped - self._reported_dropped
+        self._reported_dropped += newly_dropped
+        return (
+            logging.WARNING,
+            time.time(),
+            "Telemetry events dropped",
+            {"dropped": newly_dropped, "total_dropped": self._reported_dropped},
+        )
+
+    def _write(self, text: str) -> None:
+        """Write a block of formatted lines to every stream and flush once."""
+        if not text:
+            return
+        for stream in self.streams:
+            stream.write(text)
+            stream.flush()
+
+    @staticmethod
+    def _format(record: TelemetryRecord) -> str:
+        """Render a queued record exactly as the synchronous handlers would."""
+        level, created, message, context = record
+        payload: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(created, tz=UTC).isoformat(),
+            "message": message,
+            **context,
+        }
+        log_record = logging.LogRecord(
+            "telemetry", level, __file__, 0, json.dumps(payload), None, None
+        )
+        log_record.created = created
+        log_record.msecs = (created - int(created)) * 1000
+        return _FORMATTER.format(log_record) + "\n"
+
+
+class TelemetryStoreSink:
+    """
+    Write telemetry records to a binary :class:`TelemetryStoreWriter`.
+
+    Aggregated events that carry an ``events`` list, such as ``"Firewall batch
+    inspected"``, are stored as the summary plus one record per nested event, so each
+    alert stays queryable by its own source IP and ground station.
+    """
+
+    def __init__(self, writer: TelemetryStoreWriter) -> None:
+        """Wrap ``writer``; the sink closes it on :meth:`close`."""
+        self.writer = writer
+
+    def write(self, records: Sequence[TelemetryRecord]) -> None:
+        """Append ``records`` to the store, expanding aggregated events."""
+        self.writer.append_many(expand_records(records))
+
+    def close(self) -> None:
+        """Close the store's current segment and finish pending compression."""
+        self.writer.close()
+
+
+def expand_records(records: Sequence[TelemetryRecord]) -> Iterable[TelemetryRecord]:
+    """Yield each record, followed by the nested events of aggregated records."""
+    levels = logging.getLevelNamesMapping()
+    for level, created, message, context in records:
+        events = context.get("events")
+        if not isinstance(events, list):
+            yield level, created, message, context
+            continue
+        yield level, created, message, {k: v for k, v in context.items() if k != "events"}
+        for event in events:
+            nested = dict(event)
+            nested_level = levels.get(nested.pop("level", ""), logging.INFO)
+            yield nested_level, created, str(nested.pop("message", "")), nested
+
 
-__all__ = ["TelemetryLogger"]
+__all__ = [
+    "NullTelemetry",
+    "TelemetryListener",
+    "TelemetryLogger",
+    "TelemetrySink",
+    "TelemetryStoreSink",
+    "expand_records",
+]
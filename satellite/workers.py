@@ -0,0 +1,290 @@
+"""Multi-process satellite bus workers sharing one UDP endpoint via SO_REUSEPORT."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from collections.abc import Iterable, MutableSequence
+from dataclasses import dataclass, fields
+from multiprocessing.process import BaseProcess
+from types import FrameType
+
+from satellite.profiling import PROFILE_SIGNAL
+from satellite.replay import SharedReplayState
+from satellite.rotation import RELOAD_SIGNAL
+from satellite.satellite_bus import BusRunOptions, BusStats, SatelliteBus
+from satellite.telemetry import TelemetryLogger
+
+STAT_FIELDS = tuple(field.name for field in fields(BusStats))
+DEFAULT_MIN_UPTIME = 10.0
+DEFAULT_MAX_RESTART_DELAY = 60.0
+
+
+@dataclass(frozen=True)
+class WorkerConfig:
+    """Everything a forked worker needs to build its own bus and firewall."""
+
+    key: bytes
+    allowed_ground_ids: tuple[str, ...]
+    endpoint: tuple[str, int]
+    options: BusRunOptions
+    publish_interval: float
+
+
+def aggregate_stats(shared: MutableSequence[int], workers: int) -> list[BusStats]:
+    """Return the per-worker counters currently published to shared memory."""
+    width = len(STAT_FIELDS)
+    return [BusStats(*shared[index * width : (index + 1) * width]) for index in range(workers)]
+
+
+def _publish_stats(
+    bus: SatelliteBus, shared: MutableSequence[int], index: int, interval: float
+) -> None:
+    """Copy the worker's counters into its shared-memory slot until the process exits."""
+    width = len(STAT_FIELDS)
+    while True:
+        values = [getattr(bus.stats, name) for name in STAT_FIELDS]
+        shared[index * width : (index + 1) * width] = values
+        time.sleep(interval)
+
+
+def _interrupt(signum: int, frame: object) -> None:
+    """Translate supervisor termination into the bus's operator-shutdown path."""
+    raise KeyboardInterrupt
+
+
+def _worker_main(
+    index: int,
+    config: WorkerConfig,
+    shared: MutableSequence[int],
+    replay_state: SharedReplayState | None = None,
+) -> None:
+    """Run one bus instance bound with SO_REUSEPORT inside a worker process."""
+    signal.signal(signal.SIGTERM, _interrupt)
+    telemetry = config.options.make_telemetry()
+    metrics = config.options.make_metrics()
+    keyring = config.options.make_keyring()
+    bus = SatelliteBus(
+        key=config.key,
+        allowed_ground_ids=config.allowed_ground_ids,
+        endpoint=config.endpoint,
+        reuse_port=True,
+        batch_size=config.options.batch_size,
+        telemetry=telemetry,
+        replay_guard=config.options.make_replay_guard(shared=replay_state),
+        rate_limiter=config.options.make_rate_limiter(),
+        allowed_apids=config.options.allowed_apids,
+        capture=config.options.make_capture(suffix=f".worker{index}"),
+        metrics=metrics,
+        keyring=keyring,
+        reassembler=config.options.make_reassembler(),
+        dispatcher=config.options.make_dispatcher(telemetry, metrics),
+        scheduler=config.options.make_scheduler(config.allowed_ground_ids),
+        acknowledger=config.options.make_acknowledger(config.key, keyring),
+    )
+    publisher = threading.Thread(
+        target=_publish_stats,
+        args=(bus, shared, index, config.publish_interval),
+        name=f"bus-worker-{index}-stats",
+        daemon=True,
+    )
+    publisher.start()
+    try:
+        config.options.start(bus, worker_index=index)
+    finally:
+        bus.close()
+
+
+class WorkerSupervisor:
+    """
+    Fork bus workers, restart any that exit, and aggregate their statistics.
+
+    A worker that exits within ``min_uptime`` seconds of starting counts as a failed
+    start; each consecutive one doubles the wait before the next attempt, from twice
+    ``restart_delay`` up to ``max_restart_delay``, so a worker that cannot start (for
+    example, a bad keyring or a port it cannot bind) is not forked in a tight loop.
+    """
+
+    def __init__(
+        self,
+        key: bytes,
+        allowed_ground_ids: Iterable[str],
+        endpoint: tuple[str, int],
+        workers: int,
+        *,
+        options: BusRunOptions | None = None,
+        restart_delay: float = 1.0,
+        stats_interval: float = 30.0,
+        min_uptime: float = DEFAULT_MIN_UPTIME,
+        max_restart_delay: float = DEFAULT_MAX_RESTART_DELAY,
+    ) -> None:
+        """Describe the worker pool; nothing is started until :meth:`run`."""
+        if workers < 1:
+            raise ValueError("At least one worker is required")
+        if not hasattr(socket, "SO_REUSEPORT"):
+            raise RuntimeError("SO_REUSEPORT is not available on this platform")
+        self.config = WorkerConfig(
+            key=key,
+            allowed_ground_ids=tuple(allowed_ground_ids),
+            endpoint=endpoint,
+            options=options or BusRunOptions(),
+            publish_interval=min(1.0, stats_interval),
+        )
+        self.workers = workers
+        self.restart_delay = restart_delay
+        self.stats_interval = stats_interval
+        self.min_uptime = min_uptime
+        self.max_restart_delay = max_restart_delay
+        self.restarts = 0
+        self.retired = BusStats()
+        self.telemetry = TelemetryLogger(console=self.config.options.console_telemetry)
+        self._context = multiprocessing.get_context("fork")
+        self._shared: MutableSequence[int] = self._context.Array(
+            "Q", workers * len(STAT_FIELDS), lock=False
+        )
+        self._processes: list[BaseProcess | None] = [None] * workers
+        self._started_at = [0.0] * workers
+        self._failed_starts = [0] * workers
+        self._restart_at: list[float | None] = [None] * workers
+        self._replay_state: SharedReplayState | None = None
+
+    def run(self) -> None:
+        """
+        Start every worker and supervise them until interrupted by the operator.
+
+        With replay protection, the workers share one set of replay windows in shared
+        memory, since the kernel may hand a re-sent packet to any worker.
+        """
+        if self.config.options.replay_protection:
+            self._replay_state = SharedReplayState(
+                self._context, window_size=self.config.options.replay_window
+            )
+        for index in range(self.workers):
+            self._spawn(index)
+        if self.config.options.profiling and PROFILE_SIGNAL is not None:
+            signal.signal(PROFILE_SIGNAL, self._forward_signal)
+        if self.config.options.keyring_path and RELOAD_SIGNAL is not None:
+            signal.signal(RELOAD_SIGNAL, self._forward_signal)
+        self.telemetry.info(
+            "Satellite bus workers started",
+            endpoint=f"{self.config.endpoint[0]}:{self.config.endpoint[1]}",
+            workers=self.workers,
+            mode=self.config.options.mode,
+        )
+        next_report = time.monotonic() + self.stats_interval
+        try:
+            while True:
+                time.sleep(self.restart_delay)
+                self._restart_exited()
+                if time.monotonic() >= next_report:
+                    self.report()
+                    next_report = time.monotonic() + self.stats_interval
+        except KeyboardInterrupt:
+            self.telemetry.info("Satellite bus supervisor shutting down on operator request")
+        finally:
+            self._stop_all()
+            self.report()
+
+    def report(self) -> list[BusStats]:
+        """
+        Emit aggregated worker counters as telemetry and return the per-worker values.
+
+        Totals include counters last published by workers that have since been restarted.
+        """
+        per_worker = aggregate_stats(self._shared, self.workers)
+        totals = {
+            name: getattr(self.retired, name) + sum(getattr(stats, name) for stats in per_worker)
+            for name in STAT_FIELDS
+        }
+        self.telemetry.info(
+            "Satellite bus worker statistics",
+            workers=[vars(stats) for stats in per_worker],
+            restarts=self.restarts,
+            **totals,
+        )
+        return per_worker
+
+    def _forward_signal(self, signum: int, frame: FrameType | None) -> None:
+        """Relay a profiling or keyring reload signal to every live worker."""
+        for process in self._processes:
+            if process is not None and process.pid is not None and process.is_alive():
+                os.kill(process.pid, signum)
+
+    def _spawn(self, index: int, now: float | None = None) -> None:
+        """Fork worker ``index`` and record its process handle and start time."""
+        process = self._context.Process(
+            target=_worker_main,
+            args=(index, self.config, self._shared, self._replay_state),
+            name=f"bus-worker-{index}",
+        )
+        process.start()
+        self._processes[index] = process
+        self._started_at[index] = time.monotonic() if now is None else now
+        self._restart_at[index] = None
+
+    def _restart_exited(self, now: float | None = None) -> None:
+        """
+        Replace any worker process that is no longer alive, once its backoff has passed.
+
+        ``now`` overrides the monotonic clock used for uptime and backoff, e.g. in tests.
+        """
+        now = time.monotonic() if now is None else now
+        for index, process in enumerate(self._processes):
+            if process is not None and not process.is_alive():
+                self._processes[index] = None
+                self._retire_stats(index)
+                if now - self._started_at[index] < self.min_uptime:
+                    self._failed_starts[index] += 1
+                else:
+                    self._failed_starts[index] = 0
+                delay = self._backoff(self._failed_starts[index])
+                self._restart_at[index] = now + delay
+                self.telemetry.warning(
+                    "Satellite bus worker exited; restarting",
+                    worker=index,
+                    exitcode=process.exitcode,
+                    failed_starts=self._failed_starts[index],
+                    delay_seconds=delay,
+                )
+                process.close()
+            restart_at = self._restart_at[index]
+            if restart_at is not None and now >= restart_at:
+                self.restarts += 1
+                self._spawn(index, now)
+
+    def _backoff(self, failed_starts: int) -> float:
+        """Return the wait before restarting a worker after ``failed_starts`` failed starts."""
+        if not failed_starts:
+            return 0.0
+        return min(self.restart_delay * 2.0**failed_starts, self.max_restart_delay)
+
+    def _retire_stats(self, index: int) -> None:
+        """Fold an exited worker's last published counters into the retired totals."""
+        width = len(STAT_FIELDS)
+        final = self._shared[index * width : (index + 1) * width]
+        for name, value in zip(STAT_FIELDS, final, strict=True):
+            setattr(self.retired, name, getattr(self.retired, name) + value)
+        self._shared[index * width : (index + 1) * width] = [0] * width
+
+    def _stop_all(self) -> None:
+        """Terminate and reap every worker process."""
+        for process in self._processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            if process is not None:
+                process.join(timeout=5)
+
+
+__all__ = [
+    "DEFAULT_MAX_RESTART_DELAY",
+    "DEFAULT_MIN_UPTIME",
+    "STAT_FIELDS",
+    "WorkerConfig",
+    "WorkerSupervisor",
+    "aggregate_stats",
+]
@@ -0,0 +1 @@
+"""Segmented binary telemetry store with time-indexed queries."""
@@ -0,0 +1,73 @@
+"""
+On-disk layout shared by the telemetry store writer and reader.
+
+A store is a directory of segments. Each writer (one per bus process) appends to its
+own stream of segments named ``<stream>-<sequence>.tlm``; closed segments are
+compressed to ``.tlm.gz`` while their sidecar ``.tlm.idx`` index stays uncompressed.
+
+A segment starts with ``DATA_MAGIC`` followed by records. Each record is a fixed
+``RECORD_HEADER`` followed by the message, source IP, ground station ID and the
+remaining context as compact JSON. The filterable fields live in the header and
+plain byte strings, so a query can reject a record without decoding its JSON. The
+index starts with ``INDEX_MAGIC`` followed by ``(offset, latest_time)`` entries for
+every ``INDEX_STRIDE``-th record, where ``latest_time`` is the newest event time seen
+in the segment up to that record. Closing a segment appends one more entry with the
+``END_OF_SEGMENT`` offset, carrying the newest event time in the whole segment.
+"""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import Any, NamedTuple
+
+DATA_MAGIC = b"LSUTLM01"
+INDEX_MAGIC = b"LSUTIX01"
+SEGMENT_SUFFIX = ".tlm"
+INDEX_SUFFIX = ".idx"
+COMPRESSED_SUFFIX = ".gz"
+INDEX_STRIDE = 32
+END_OF_SEGMENT = (1 << 64) - 1
+
+# created, level, source IP length, ground station length, message length, context length
+RECORD_HEADER = struct.Struct(">dBBBHI")
+INDEX_ENTRY = struct.Struct(">Qd")
+
+# Context keys promoted to fixed record fields.
+SOURCE_IP_KEY = "source_ip"
+GROUND_STATION_KEY = "ground_station_id"
+
+
+class TelemetryEvent(NamedTuple):
+    """One stored telemetry event."""
+
+    created: float
+    level: int
+    message: str
+    source_ip: str | None
+    ground_station_id: str | None
+    context: dict[str, Any]
+
+
+def index_path(segment: str | Path) -> Path:
+    """Return the sidecar index path for ``segment``, compressed or not."""
+    segment = Path(segment)
+    name = segment.name.removesuffix(COMPRESSED_SUFFIX)
+    return segment.with_name(name + INDEX_SUFFIX)
+
+
+__all__ = [
+    "COMPRESSED_SUFFIX",
+    "DATA_MAGIC",
+    "END_OF_SEGMENT",
+    "GROUND_STATION_KEY",
+    "INDEX_ENTRY",
+    "INDEX_MAGIC",
+    "INDEX_STRIDE",
+    "INDEX_SUFFIX",
+    "RECORD_HEADER",
+    "SEGMENT_SUFFIX",
+    "SOURCE_IP_KEY",
+    "TelemetryEvent",
+    "index_path",
+]
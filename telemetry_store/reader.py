@@ -0,0 +1,227 @@
+"""Time-indexed queries over a telemetry store directory."""
+
+from __future__ import annotations
+
+import bisect
+import gzip
+import heapq
+import itertools
+import json
+import mmap
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from telemetry_store.format import (
+    COMPRESSED_SUFFIX,
+    DATA_MAGIC,
+    END_OF_SEGMENT,
+    INDEX_ENTRY,
+    INDEX_MAGIC,
+    RECORD_HEADER,
+    SEGMENT_SUFFIX,
+    TelemetryEvent,
+    index_path,
+)
+
+
+class TelemetryStoreError(Exception):
+    """Raised when a segment or index file is not in the expected format."""
+
+
+@dataclass(frozen=True)
+class TelemetryFilter:
+    """
+    Criteria for a telemetry query; empty criteria match everything.
+
+    ``min_level`` keeps events at or above a logging level, ``messages`` matches any
+    substring of the message, and ``source_ips`` / ``ground_stations`` match exactly.
+    """
+
+    start: float | None = None
+    end: float | None = None
+    min_level: int = 0
+    messages: tuple[str, ...] = ()
+    source_ips: tuple[str, ...] = ()
+    ground_stations: tuple[str, ...] = ()
+
+
+@dataclass
+class QueryStats:
+    """Work done by the most recent query."""
+
+    segments: int = 0
+    segments_skipped: int = 0
+    records_scanned: int = 0
+    matched: int = 0
+
+
+class _Matcher:
+    """A :class:`TelemetryFilter` pre-encoded for comparison against raw record bytes."""
+
+    def __init__(self, criteria: TelemetryFilter) -> None:
+        """Encode the string criteria once per query."""
+        self.start = float("-inf") if criteria.start is None else criteria.start
+        self.end = float("inf") if criteria.end is None else criteria.end
+        self.min_level = criteria.min_level
+        self.messages = tuple(message.encode("utf-8") for message in criteria.messages)
+        self.source_ips = frozenset(ip.encode("utf-8") for ip in criteria.source_ips)
+        self.ground_stations = frozenset(gs.encode("utf-8") for gs in criteria.ground_stations)
+
+
+class SegmentReader:
+    """
+    Read one segment, plain or gzipped, guided by its uncompressed index.
+
+    The index alone decides whether the segment can hold events in a time range, so
+    compressed segments outside the range are never decompressed. A segment that is
+    still being written has no closing index entry and is scanned up to its last
+    complete record.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Load the segment's index; the data is opened on the first scan."""
+        self.path = Path(path)
+        index = index_path(self.path).read_bytes()
+        if index[: len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise TelemetryStoreError(f"{index_path(self.path)} is not a telemetry index")
+        usable = len(index) - (len(index) - len(INDEX_MAGIC)) % INDEX_ENTRY.size
+        entries = list(INDEX_ENTRY.iter_unpack(index[len(INDEX_MAGIC) : usable]))
+        self.closed = bool(entries) and entries[-1][0] == END_OF_SEGMENT
+        self._newest = float(entries.pop()[1]) if self.closed else float("inf")
+        self._offsets = [int(offset) for offset, _ in entries]
+        self._latest = [float(latest) for _, latest in entries]
+
+    def time_range(self) -> tuple[float, float]:
+        """Return the first event time and the newest one (infinite while still open)."""
+        if not self._latest:
+            return float("-inf"), self._newest
+        return self._latest[0], self._newest
+
+    def scan(self, matcher: _Matcher, stats: QueryStats) -> Iterator[TelemetryEvent]:
+        """Yield the segment's events that satisfy ``matcher``, in file order."""
+        first, last = self.time_range()
+        if last < matcher.start or first >= matcher.end:
+            stats.segments_skipped += 1
+            return
+        data = self._load()
+        try:
+            position = max(0, bisect.bisect_left(self._latest, matcher.start) - 1)
+            offset = self._offsets[position] if self._offsets else len(DATA_MAGIC)
+            stop_position = bisect.bisect_left(self._latest, matcher.end)
+            stop = len(data)
+            if stop_position < len(self._offsets):
+                stop = min(stop, self._offsets[stop_position])
+            yield from _scan(data, offset, stop, matcher, stats)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    def _load(self) -> mmap.mmap | bytes:
+        """Map the plain segment or decompress the gzipped one, checking its magic."""
+        if self.path.name.endswith(COMPRESSED_SUFFIX):
+            data: mmap.mmap | bytes = gzip.decompress(self.path.read_bytes())
+        else:
+            with open(self.path, "rb") as handle:
+                if os.fstat(handle.fileno()).st_size == 0:
+                    return b""
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if data[: len(DATA_MAGIC)] != DATA_MAGIC:
+            raise TelemetryStoreError(f"{self.path} is not a telemetry segment")
+        return data
+
+
+def _scan(
+    data: mmap.mmap | bytes, offset: int, stop: int, matcher: _Matcher, stats: QueryStats
+) -> Iterator[TelemetryEvent]:
+    """Decode matching records between ``offset`` and ``stop``, skipping the rest unread."""
+    end = len(data)
+    header_size = RECORD_HEADER.size
+    while offset < stop and offset + header_size <= end:
+        created, level, ip_length, gs_length, message_length, context_length = (
+            RECORD_HEADER.unpack_from(data, offset)
+        )
+        message_start = offset + header_size
+        ip_start = message_start + message_length
+        gs_start = ip_start + ip_length
+        context_start = gs_start + gs_length
+        record_end = context_start + context_length
+        if record_end > end:
+            return
+        offset = record_end
+        stats.records_scanned += 1
+        if not matcher.start <= created < matcher.end or level < matcher.min_level:
+            continue
+        if matcher.source_ips and data[ip_start:gs_start] not in matcher.source_ips:
+            continue
+        if matcher.ground_stations and data[gs_start:context_start] not in (
+            matcher.ground_stations
+        ):
+            continue
+        message = data[message_start:ip_start]
+        if matcher.messages and not any(needle in message for needle in matcher.messages):
+            continue
+        stats.matched += 1
+        yield TelemetryEvent(
+            created=created,
+            level=level,
+            message=message.decode("utf-8", "replace"),
+            source_ip=data[ip_start:gs_start].decode("utf-8") or None,
+            ground_station_id=data[gs_start:context_start].decode("utf-8", "replace") or None,
+            context=json.loads(data[context_start:record_end]),
+        )
+
+
+class TelemetryStoreReader:
+    """Query every writer stream in a telemetry store directory, merged by event time."""
+
+    def __init__(self, directory: str | Path) -> None:
+        """Remember the store directory; segments are listed per query."""
+        self.directory = Path(directory)
+        self.stats = QueryStats()
+
+    def segments(self) -> dict[str, list[Path]]:
+        """Return each stream's segments in write order, preferring compressed copies."""
+        found: dict[str, Path] = {}
+        for path in sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}*")):
+            name = path.name.removesuffix(COMPRESSED_SUFFIX)
+            if name.endswith(SEGMENT_SUFFIX) and (
+                name not in found or path.name.endswith(COMPRESSED_SUFFIX)
+            ):
+                found[name] = path
+        streams: dict[str, list[Path]] = {}
+        for name, path in sorted(found.items()):
+            stream = name.removesuffix(SEGMENT_SUFFIX).rpartition("-")[0]
+            streams.setdefault(stream, []).append(path)
+        return streams
+
+    def query(self, criteria: TelemetryFilter | None = None) -> Iterator[TelemetryEvent]:
+        """Yield matching events from all streams in event-time order."""
+        matcher = _Matcher(criteria or TelemetryFilter())
+        self.stats = QueryStats()
+        streams = [
+            itertools.chain.from_iterable(self._scan_segment(path, matcher) for path in paths)
+            for paths in self.segments().values()
+        ]
+        return heapq.merge(*streams, key=lambda event: event.created)
+
+    def _scan_segment(self, path: Path, matcher: _Matcher) -> Iterable[TelemetryEvent]:
+        """Scan one segment, following it to its compressed name if it was just rotated."""
+        self.stats.segments += 1
+        try:
+            yield from SegmentReader(path).scan(matcher, self.stats)
+        except FileNotFoundError:
+            compressed = path.with_name(path.name + COMPRESSED_SUFFIX)
+            if path.name.endswith(COMPRESSED_SUFFIX) or not compressed.exists():
+                raise
+            yield from SegmentReader(compressed).scan(matcher, self.stats)
+
+
+__all__ = [
+    "QueryStats",
+    "SegmentReader",
+    "TelemetryFilter",
+    "TelemetryStoreError",
+    "TelemetryStoreReader",
+]
@@ -0,0 +1,247 @@
+"""Segmented telemetry store writer with rotation and background compression."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from telemetry_store.format import (
+    COMPRESSED_SUFFIX,
+    DATA_MAGIC,
+    END_OF_SEGMENT,
+    GROUND_STATION_KEY,
+    INDEX_ENTRY,
+    INDEX_MAGIC,
+    INDEX_STRIDE,
+    RECORD_HEADER,
+    SEGMENT_SUFFIX,
+    SOURCE_IP_KEY,
+    index_path,
+)
+
+DEFAULT_SEGMENT_BYTES = 64 << 20
+DEFAULT_SEGMENT_SECONDS = 3600.0
+DEFAULT_BUFFER_SIZE = 1 << 16
+_SHORT_FIELD_MAX = 0xFF
+_MESSAGE_MAX = 0xFFFF
+
+StoredRecord = tuple[int, float, str, dict[str, Any]]
+
+
+class SegmentCompressor:
+    """Background thread that gzips closed segments and replaces the originals."""
+
+    def __init__(self) -> None:
+        """Start the compressor thread."""
+        self.compressed = 0
+        self._queue: queue.Queue[Path | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="telemetry-compressor", daemon=True)
+        self._thread.start()
+
+    def submit(self, segment: Path) -> None:
+        """Queue ``segment`` for compression."""
+        self._queue.put(segment)
+
+    def close(self) -> None:
+        """Compress everything already queued and stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Compress queued segments until the shutdown sentinel arrives."""
+        while (segment := self._queue.get()) is not None:
+            compress_segment(segment)
+            self.compressed += 1
+
+
+def compress_segment(segment: Path) -> Path:
+    """
+    Gzip ``segment`` next to itself and remove the original.
+
+    The compressed file appears under its final name only once complete, so readers
+    see either the plain or the compressed segment, never a partial one.
+    """
+    target = segment.with_name(segment.name + COMPRESSED_SUFFIX)
+    partial = target.with_name(target.name + ".tmp")
+    with open(segment, "rb") as source, gzip.open(partial, "wb") as sink:
+        shutil.copyfileobj(source, sink)
+    os.replace(partial, target)
+    segment.unlink()
+    return target
+
+
+class TelemetryStoreWriter:
+    """
+    Append telemetry events to size- and time-bounded segments in ``directory``.
+
+    A segment is closed once it holds ``max_segment_bytes`` or spans
+    ``max_segment_seconds`` of event time; closed segments are gzipped on a background
+    thread when ``compress`` is set. Appends are serialised with a lock, so a writer
+    may be shared by several emitting threads.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        max_segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+        compress: bool = True,
+        stream: str | None = None,
+    ) -> None:
+        """Create ``directory`` if needed; the first segment opens on the first append."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_seconds = max_segment_seconds
+        self.stream = stream or f"{int(time.time())}-{os.getpid()}"
+        self.records = 0
+        self.segments = 0
+        self._compressor = SegmentCompressor() if compress else None
+        self._lock = threading.Lock()
+        self._sequence = self._last_sequence()
+        self._segment: Path | None = None
+        self._data: BinaryIO | None = None
+        self._index: BinaryIO | None = None
+        self._offset = 0
+        self._segment_records = 0
+        self._segment_started = 0.0
+        self._latest = 0.0
+
+    def append(self, level: int, created: float, message: str, context: dict[str, Any]) -> None:
+        """Append one event, rotating to a new segment first if the current one is full."""
+        with self._lock:
+            self._append(level, created, message, context)
+
+    def append_many(self, records: Iterable[StoredRecord]) -> None:
+        """Append ``(level, created, message, context)`` events under one lock acquisition."""
+        with self._lock:
+            for level, created, message, context in records:
+                self._append(level, created, message, context)
+
+    def flush(self) -> None:
+        """Flush buffered records and index entries to the operating system."""
+        with self._lock:
+            if self._data is not None and self._index is not None:
+                self._data.flush()
+                self._index.flush()
+
+    def close(self) -> None:
+        """Close the current segment and wait for pending compression to finish."""
+        with self._lock:
+            self._close_segment()
+        if self._compressor is not None:
+            self._compressor.close()
+            self._compressor = None
+
+    def _append(self, level: int, created: float, message: str, context: dict[str, Any]) -> None:
+        """Encode one event into the current segment; the caller holds the lock."""
+        data, index = self._data, self._index
+        if data is None or index is None or self._rotation_due(created):
+            data, index = self._open_segment(created)
+        extra = dict(context)
+        source_ip = _promote(extra, SOURCE_IP_KEY)
+        ground_station = _promote(extra, GROUND_STATION_KEY)
+        message_bytes = message.encode("utf-8")[:_MESSAGE_MAX]
+        body = json.dumps(extra, separators=(",", ":"), default=str).encode("utf-8")
+        self._latest = max(self._latest, created)
+        if self._segment_records % INDEX_STRIDE == 0:
+            index.write(INDEX_ENTRY.pack(self._offset, self._latest))
+        header = RECORD_HEADER.pack(
+            created,
+            min(level, _SHORT_FIELD_MAX),
+            len(source_ip),
+            len(ground_station),
+            len(message_bytes),
+            len(body),
+        )
+        data.write(header)
+        data.write(message_bytes)
+        data.write(source_ip)
+        data.write(ground_station)
+        data.write(body)
+        self._offset += (
+            len(header) + len(message_bytes) + len(source_ip) + len(ground_station) + len(body)
+        )
+        self._segment_records += 1
+        self.records += 1
+
+    def _rotation_due(self, created: float) -> bool:
+        """Return whether the current segment has reached its size or time limit."""
+        return (
+            self._offset >= self.max_segment_bytes
+            or created - self._segment_started >= self.max_segment_seconds
+        )
+
+    def _open_segment(self, created: float) -> tuple[BinaryIO, BinaryIO]:
+        """Close the current segment and start the next one in this writer's stream."""
+        self._close_segment()
+        self._sequence += 1
+        segment = self.directory / f"{self.stream}-{self._sequence:06d}{SEGMENT_SUFFIX}"
+        data = self._data = open(segment, "wb", buffering=DEFAULT_BUFFER_SIZE)
+        index = self._index = open(index_path(segment), "wb", buffering=DEFAULT_BUFFER_SIZE)
+        data.write(DATA_MAGIC)
+        index.write(INDEX_MAGIC)
+        self._segment = segment
+        self._offset = len(DATA_MAGIC)
+        self._segment_records = 0
+        self._segment_started = created
+        self._latest = created
+        self.segments += 1
+        return data, index
+
+    def _close_segment(self) -> None:
+        """
+        Close the current segment, if any, and queue it for compression.
+
+        A final ``END_OF_SEGMENT`` index entry records the newest event time in the
+        segment, so readers can skip it without opening the data.
+        """
+        if self._data is None or self._index is None or self._segment is None:
+            return
+        self._index.write(INDEX_ENTRY.pack(END_OF_SEGMENT, self._latest))
+        self._data.close()
+        self._index.close()
+        if self._compressor is not None:
+            self._compressor.submit(self._segment)
+        self._data = self._index = self._segment = None
+
+    def _last_sequence(self) -> int:
+        """Return the highest segment number already used by this writer's stream."""
+        pattern = re.compile(rf"{re.escape(self.stream)}-(\d+){re.escape(SEGMENT_SUFFIX)}")
+        sequences = [
+            int(match.group(1))
+            for path in self.directory.iterdir()
+            if (match := pattern.match(path.name))
+        ]
+        return max(sequences, default=0)
+
+
+def _promote(context: dict[str, Any], key: str) -> bytes:
+    """Remove a short string field from ``context`` and return it encoded, or ``b""``."""
+    value = context.get(key)
+    if not isinstance(value, str):
+        return b""
+    encoded = value.encode("utf-8")
+    if len(encoded) > _SHORT_FIELD_MAX:
+        return b""
+    del context[key]
+    return encoded
+
+
+__all__ = [
+    "DEFAULT_SEGMENT_BYTES",
+    "DEFAULT_SEGMENT_SECONDS",
+    "SegmentCompressor",
+    "TelemetryStoreWriter",
+    "compress_segment",
+]
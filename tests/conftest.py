@@ -1,6 +1,35 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+class RecordingTelemetry:
+    """Telemetry stand-in that keeps emitted events in memory."""
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, level, message, **context):
+        self.events.append((level, message, context))
+
+    def info(self, message, **context):
+        self.emit(20, message, **context)
+
+    def warning(self, message, **context):
+        self.emit(30, message, **context)
+
+    def critical(self, message, **context):
+        self.emit(50, message, **context)
+
+    def messages(self):
+        return [message for _, message, _ in self.events]
+
+
+@pytest.fixture
+def telemetry():
+    return RecordingTelemetry()
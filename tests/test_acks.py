@@ -0,0 +1,137 @@
+import socket
+import threading
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from ccsds.ack_packet import AckEntry, build_ack, command_tag, decode_ack
+from ccsds.packet_builder import CCSDSPacketBuilder
+from ccsds.packet_parser import PacketValidationError
+from cli import satcli
+from crypto.hmac_signer import HMACSigner
+from crypto.verifier import HMACVerifier
+from ground.ground_station import GroundStation
+from satellite.acknowledgements import CommandAcknowledger
+from satellite.ingress import Datagram
+from satellite.replay import REPLAY_DETECTED, ReplayGuard
+from satellite.satellite_bus import SatelliteBus
+
+KEY = b"ack-test-key"
+
+
+def make_bus(telemetry):
+    return SatelliteBus(
+        KEY,
+        ["GS-ALPHA"],
+        ("127.0.0.1", 0),
+        telemetry=telemetry,
+        replay_guard=ReplayGuard(),
+        acknowledger=CommandAcknowledger(KEY),
+    )
+
+
+def test_bus_signs_acks_for_authenticated_commands_only(telemetry):
+    bus = make_bus(telemetry)
+    sent = []
+    bus.acknowledger.attach(lambda packet, address: sent.append((packet, address)))
+    builder = CCSDSPacketBuilder(KEY)
+    first, second = builder.build("CMD: ONE", "GS-ALPHA"), builder.build("CMD: TWO", "GS-ALPHA")
+    spoofed = CCSDSPacketBuilder(b"wrong-key").build("CMD: EVIL", "GS-ALPHA")
+    datagrams = [Datagram(packet, "10.0.0.1", 4000, 0.0) for packet in (first, second, spoofed)]
+    bus.handle_batch(datagrams)
+    bus.handle(Datagram(first, "10.0.0.1", 4000, 0.0))
+    builder.sequence_count = 1
+    bus.handle(Datagram(builder.build("CMD: OTHER", "GS-ALPHA"), "10.0.0.1", 4000, 0.0))
+
+    verifier = HMACVerifier(KEY)
+    acks = [decode_ack(packet, verifier) for packet, _ in sent]
+    assert {address for _, address in sent} == {("10.0.0.1", 4000)}
+    assert [ack.sequence_count for ack in acks] == [0, 1, 2]
+    assert [len(ack.entries) for ack in acks] == [2, 1, 1]
+    assert acks[0].entries[0] == AckEntry(0, True, command_tag(first[-32:]), "")
+    assert acks[1].entries[0].accepted and bus.acknowledger.stats.resent == 1
+    assert acks[2].entries[0][1:] == (False, acks[2].entries[0].tag, REPLAY_DETECTED)
+    assert bus.stats.accepted == 2
+    with pytest.raises(PacketValidationError):
+        decode_ack(sent[0][0], HMACVerifier(b"wrong-key"))
+    with pytest.raises(PacketValidationError):
+        decode_ack(sent[0][0][:-1] + bytes([sent[0][0][-1] ^ 1]), verifier)
+    assert (bus.acknowledger.stats.packets, bus.acknowledger.stats.rejected) == (3, 1)
+
+
+def test_window_retransmits_lost_commands_and_acks(tmp_path, monkeypatch, telemetry):
+    monkeypatch.chdir(tmp_path)
+    bus = make_bus(telemetry)
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    server.settimeout(0.5)
+    dropped = {"command": 0, "ack": 0}
+
+    def lossy_send(packet, address):
+        ack = decode_ack(packet, HMACVerifier(KEY))
+        if not dropped["ack"] and any(entry.sequence_count == 3 for entry in ack.entries):
+            dropped["ack"] += 1
+            return
+        server.sendto(packet, address)
+
+    def serve():
+        while True:
+            try:
+                packet, address = server.recvfrom(8192)
+            except (TimeoutError, OSError):
+                return
+            if not dropped["command"] and packet[3] == 2:
+                dropped["command"] += 1
+                continue
+            bus.handle(Datagram(packet, address[0], address[1], 0.0))
+
+    bus.acknowledger.attach(lossy_send)
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    commands = [f"CMD: STEP {index}" for index in range(10)]
+    with GroundStation(KEY, window=4, ack_timeout=0.2) as station:
+        station.telemetry = telemetry
+        assert station.send_many(commands, server.getsockname(), chunk_size=4) == 10
+        restarted = GroundStation(KEY, window=1, ack_timeout=0.2)
+        restarted.telemetry = telemetry
+        # Backdate so the reused count is not taken for a counter restart.
+        build = restarted.builder.build_segmented
+        past = datetime.now(tz=UTC) - timedelta(seconds=10)
+        monkeypatch.setattr(
+            restarted.builder,
+            "build_segmented",
+            lambda *args, **kwargs: build(*args, **kwargs, timestamp=past),
+        )
+        restarted.send("CMD: AGAIN", server.getsockname())
+        restarted.close()
+    thread.join()
+    server.close()
+
+    summary = station.acks.summary()
+    assert (summary["accepted"], summary["retransmissions"], summary["timed_out"]) == (10, 2, 0)
+    assert summary["rtt_samples"] == 8 and summary["rtt_p99_ms"] >= summary["rtt_p50_ms"] > 0
+    assert restarted.acks.rejections == {REPLAY_DETECTED: 1}
+    assert bus.stats.accepted == 10 and bus.acknowledger.stats.resent == 1
+    assert "Command acknowledgement summary" in telemetry.messages()
+    assert "Command rejected" in telemetry.messages()
+
+
+def test_unacknowledged_commands_time_out_after_retries(tmp_path, monkeypatch, telemetry):
+    monkeypatch.chdir(tmp_path)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as silent:
+        silent.bind(("127.0.0.1", 0))
+        forged = build_ack(
+            [AckEntry(0, True, b"\x00" * 8)], "GS-ALPHA", 0, 0.0, HMACSigner(b"wrong-key")
+        )
+        with GroundStation(KEY, window=2, ack_timeout=0.01, max_retries=1) as station:
+            station.telemetry = telemetry
+            station._connect(silent.getsockname())
+            silent.sendto(forged, station._socket.getsockname())
+            station.send_many(["CMD: A", "CMD: B", "CMD: C"], silent.getsockname())
+
+    stats = station.acks
+    assert (stats.sent, stats.timed_out, stats.retransmissions) == (3, 3, 3)
+    assert stats.accepted == 0 and stats.invalid_acks == 1 and stats.rtt.count == 0
+    assert telemetry.messages().count("Command acknowledgement timed out") == 3
+    args = satcli.parse_args(["send", "CMD: PING", "--window", "8"])
+    assert satcli.send_argv(args)[-2:] == ["--window", "8"]
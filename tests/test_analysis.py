@@ -0,0 +1,59 @@
+import time
+
+from capture.reader import CaptureReader
+from capture.writer import CaptureWriter
+from ccsds.packet_builder import CCSDSPacketBuilder
+from ccsds.reassembly import SEGMENT_BUFFERED, SegmentReassembler
+from satellite.analysis import UNKNOWN_GROUND_STATION, analyze_capture
+from satellite.firewall import SatelliteFirewall
+from satellite.prefilter import GROUND_ID_NOT_AUTHORIZED, PACKET_TOO_SHORT
+from satellite.replay import REPLAY_DETECTED, STALE_TIMESTAMP, ReplayGuard
+from satellite.telemetry import NullTelemetry
+
+KEY = b"analysis-test-key"
+
+
+def test_analyze_capture_uses_recorded_time_and_tallies_outcomes(tmp_path):
+    builder = CCSDSPacketBuilder(KEY)
+    sent_at = time.time()
+    first = builder.build("PING", "GS-ALPHA")
+    second = builder.build("STATUS", "GS-ALPHA")
+    spoofed = CCSDSPacketBuilder(b"wrong-key").build("PING", "GS-ALPHA")
+    rogue = builder.build("PING", "GS-ROGUE")
+    segments = builder.build_segmented("TBL: LOAD " + "A" * 600, "GS-ALPHA", max_segment_bytes=256)
+    path = tmp_path / "uplink.cap"
+    with CaptureWriter(path) as writer:
+        for offset, packet in enumerate([first, first, spoofed, rogue, b"\x00"]):
+            writer.append(packet, "10.0.0.1", 4000, True, "recorded", received_at=sent_at + offset)
+        for segment in segments:
+            writer.append(segment, "10.0.0.2", 4000, True, "recorded", received_at=sent_at + 5)
+        writer.append(second, "10.0.0.1", 4000, True, "recorded", received_at=sent_at + 1000)
+
+    firewall = SatelliteFirewall(
+        KEY,
+        ["GS-ALPHA"],
+        NullTelemetry(),
+        replay_guard=ReplayGuard(freshness_seconds=300),
+        reassembler=SegmentReassembler(),
+    )
+    with CaptureReader(path) as reader:
+        report = analyze_capture(reader, firewall)
+
+    pending = len(segments) - 1
+    assert report.packets == 6 + len(segments) and report.accepted == 2
+    assert report.pending == report.reasons[SEGMENT_BUFFERED] == pending and report.rejected == 5
+    assert report.reasons[REPLAY_DETECTED] == 1
+    assert report.reasons["HMAC verification failed"] == 1
+    assert report.reasons[GROUND_ID_NOT_AUTHORIZED] == 1
+    assert report.reasons[PACKET_TOO_SHORT] == 1
+    assert report.reasons[STALE_TIMESTAMP] == 1
+    summary = report.to_dict()
+    assert summary["ground_stations"]["GS-ALPHA"] == {
+        "accepted": 2,
+        "rejected": 3,
+        "pending": pending,
+    }
+    assert summary["ground_stations"]["GS-ROGUE"] == {"accepted": 0, "rejected": 1, "pending": 0}
+    assert summary["pending"] == pending and summary["rejected"] == 5
+    assert summary["ground_stations"][UNKNOWN_GROUND_STATION]["rejected"] == 1
+    assert summary["capture_span_seconds"] == 1000
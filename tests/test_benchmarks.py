@@ -0,0 +1,26 @@
+from benchmarks.corpus import build_corpus
+from benchmarks.run import find_regressions, run_benchmarks
+from ccsds.packet_parser import CCSDSPacketParser
+
+
+def test_corpus_is_deterministic_and_valid():
+    first, second = build_corpus(size=16), build_corpus(size=16)
+
+    assert first == second
+    assert CCSDSPacketParser().parse(first.valid[0]).command == first.commands[0]
+    assert first.spoofed[0][:-32] == first.valid[0][:-32]
+
+
+def test_regressions_respect_threshold():
+    baseline = {"packet_parse": 1000.0, "hmac_sign": 1000.0}
+    results = {"packet_parse": 800.0, "hmac_sign": 700.0, "new_case": 5.0}
+
+    regressions = find_regressions(results, baseline, threshold=0.25)
+
+    assert len(regressions) == 1 and regressions[0].startswith("hmac_sign")
+
+
+def test_selected_benchmarks_report_ops_per_second():
+    results = run_benchmarks(["packet_parse"], repeat=1, min_time=0.001)
+
+    assert list(results) == ["packet_parse"] and results["packet_parse"] > 0
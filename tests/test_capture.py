@@ -0,0 +1,136 @@
+import threading
+
+import pytest
+
+from capture.format import DATA_MAGIC, RECORD_HEADER, index_path
+from capture.reader import CaptureFormatError, CaptureReader
+from capture.writer import CaptureWriter
+from ccsds.packet_builder import CCSDSPacketBuilder
+from satellite.ingress import Datagram
+from satellite.satellite_bus import SatelliteBus
+
+KEY = b"capture-test-key"
+START = 1_700_000_000.0
+
+
+def test_capture_round_trip_and_seek_by_time(tmp_path):
+    path = tmp_path / "uplink.cap"
+    with CaptureWriter(path) as writer:
+        for index in range(10):
+            writer.append(
+                bytes([index]) * 4,
+                "10.0.0.1",
+                4000 + index,
+                index % 2 == 0,
+                "ok" if index % 2 == 0 else "rejected",
+                received_at=START + index,
+            )
+
+    with CaptureReader(path) as reader:
+        records = list(reader)
+        assert len(reader) == 10
+        assert reader.time_range() == (START, START + 9)
+        window = list(reader.between(START + 3, START + 6))
+
+    assert [record.source_port for record in records] == list(range(4000, 4010))
+    assert records[3].packet == b"\x03" * 4
+    assert records[3].reason == "rejected" and not records[3].accepted
+    assert [record.received_at for record in window] == [START + 3, START + 4, START + 5]
+
+
+def test_seek_by_time_survives_a_clock_stepping_backwards(tmp_path):
+    path = tmp_path / "uplink.cap"
+    offsets = [0, 1, 2, 3, -5, -4, 4, 5]
+    with CaptureWriter(path) as writer:
+        for port, offset in enumerate(offsets):
+            writer.append(b"x", "10.0.0.1", port, True, "ok", received_at=START + offset)
+
+    with CaptureReader(path) as reader:
+        window = [record.source_port for record in reader.between(START - 4, START + 2)]
+        assert reader.time_range() == (START - 5, START + 5)
+
+    assert window == [0, 1, 5]
+
+
+def test_reader_ignores_truncated_tail_and_reopened_writer_appends(tmp_path):
+    path = tmp_path / "uplink.cap"
+    with CaptureWriter(path) as writer:
+        writer.append(b"first", "10.0.0.1", 1, True, "ok", received_at=START)
+    with CaptureWriter(path) as writer:
+        writer.append(b"second", "10.0.0.1", 2, True, "ok", received_at=START + 1)
+    with open(path, "r+b") as handle:
+        handle.truncate(path.stat().st_size - 2)
+
+    with CaptureReader(path) as reader:
+        assert [record.packet for record in reader] == [b"first"]
+        assert len(reader) == 1
+    assert index_path(path).exists()
+
+
+def test_bus_records_datagrams_with_decisions(tmp_path, telemetry):
+    path = tmp_path / "bus.cap"
+    bus = SatelliteBus(
+        KEY,
+        ["GS-ALPHA"],
+        ("127.0.0.1", 0),
+        telemetry=telemetry,
+        capture=CaptureWriter(path),
+    )
+    packet = CCSDSPacketBuilder(KEY).build("PING", "GS-ALPHA")
+    bus.handle(Datagram(packet, "10.0.0.7", 5555, START))
+    bus.handle_batch([Datagram(b"\x00", "10.0.0.8", 6666, START + 1)])
+    bus.capture.close()
+
+    with CaptureReader(path) as reader:
+        records = list(reader)
+    assert [(record.source_ip, record.source_port) for record in records] == [
+        ("10.0.0.7", 5555),
+        ("10.0.0.8", 6666),
+    ]
+    assert records[0].accepted and records[0].packet == packet
+    assert not records[1].accepted
+
+
+def test_concurrent_appends_keep_records_and_index_intact(tmp_path):
+    path = tmp_path / "uplink.cap"
+    with CaptureWriter(path) as writer:
+
+        def append_many(worker):
+            for index in range(2000):
+                writer.append(
+                    bytes([worker]) * (index % 7 + 1),
+                    f"10.0.0.{worker}",
+                    index,
+                    True,
+                    "é" * (index % 3),
+                    received_at=START + index,
+                )
+
+        threads = [threading.Thread(target=append_many, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    with CaptureReader(path) as reader:
+        records = list(reader)
+        window = list(reader.between(START, START + 10))
+
+    assert len(records) == len(reader) == 8000
+    assert all(
+        record.packet == bytes([int(record.source_ip[-1])]) * len(record.packet)
+        for record in records
+    )
+    assert len(window) == 40
+
+
+def test_corrupt_record_text_raises_a_format_error(tmp_path):
+    path = tmp_path / "uplink.cap"
+    with CaptureWriter(path) as writer:
+        writer.append(b"packet", "10.0.0.1", 1, True, "ok", received_at=START)
+    data = bytearray(path.read_bytes())
+    data[len(DATA_MAGIC) + RECORD_HEADER.size] = 0xFF
+    path.write_bytes(data)
+
+    with pytest.raises(CaptureFormatError, match="corrupt record at offset 8"):
+        CaptureReader(path)
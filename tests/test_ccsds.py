@@ -1,5 +1,7 @@
+from ccsds import packet_parser
+from ccsds.fields import PRIMARY_HEADER_LAYOUT
 from ccsds.packet_builder import CCSDSPacketBuilder
-from ccsds.packet_parser import CCSDSPacketParser
+from ccsds.packet_parser import CCSDSPacketParser, PacketValidationError
 from crypto.verifier import HMACVerifier
 
 KEY = b"integration-test-key"
@@ -30,3 +32,70 @@ def test_parser_rejects_tampering():
 
     verifier = HMACVerifier(KEY)
     assert not verifier.verify(parsed.raw_without_signature, parsed.signature)
+
+
+def test_parser_returns_zero_copy_view():
+    builder = CCSDSPacketBuilder(KEY)
+    packet = builder.build("CMD: PING", "GS-ALPHA")
+
+    parsed = CCSDSPacketParser().parse(packet)
+
+    assert parsed.raw_without_signature.obj is packet
+    assert parsed.signature.obj is packet
+    assert parsed.ground_station_id_bytes == b"GS-ALPHA"
+    assert parsed.timestamp.timestamp() == parsed.timestamp_seconds
+
+
+def test_parser_rejects_truncated_packet():
+    builder = CCSDSPacketBuilder(KEY)
+    packet = builder.build("CMD: PING", "GS-ALPHA")
+
+    try:
+        CCSDSPacketParser().parse(packet[:-1])
+    except PacketValidationError as exc:
+        assert "length mismatch" in str(exc)
+    else:
+        raise AssertionError("Expected PacketValidationError for a truncated packet")
+
+
+def test_parse_many_decodes_header_columns():
+    builder = CCSDSPacketBuilder(KEY, apid=7)
+    packets = [builder.build(f"CMD: STEP {index}", "GS-ALPHA") for index in range(4)]
+    capture = b"".join(packets) + b"\x00\x01\x02"
+    offsets = [0]
+    for packet in packets:
+        offsets.append(offsets[-1] + len(packet))
+
+    batch = CCSDSPacketParser().parse_many(capture, offsets)
+
+    assert len(batch) == 5
+    assert batch.apid[:4].tolist() == [7, 7, 7, 7]
+    assert batch.sequence_count[:4].tolist() == [0, 1, 2, 3]
+    assert batch.packet_length[:4].tolist() == [len(packet) - 7 for packet in packets]
+    assert batch.ground_station_id_length[:4].tolist() == [8, 8, 8, 8]
+    assert batch.valid.tolist() == [True, True, True, True, False]
+
+
+def test_build_many_matches_single_packet_layout():
+    builder = CCSDSPacketBuilder(KEY, apid=9)
+    builder.sequence_count = 16383
+    commands = ["CMD: ORIENT +10", "CMD: PING", ""]
+
+    packets = builder.build_many(commands, "GS-ALPHA")
+
+    parser = CCSDSPacketParser()
+    verifier = HMACVerifier(KEY)
+    parsed = [parser.parse(packet) for packet in packets]
+    assert [packet.command for packet in parsed] == commands
+    assert [packet.sequence_count for packet in parsed] == [16383, 0, 1]
+    assert all(packet.apid == 9 for packet in parsed)
+    assert all(packet.obj is packets[0].obj for packet in packets)
+    assert all(verifier.verify(item.raw_without_signature, item.signature) for item in parsed)
+    assert builder.sequence_count == 2
+
+
+def test_packet_field_lists_are_built_on_first_access():
+    fields = packet_parser.PRIMARY_HEADER_FIELDS
+
+    assert len(fields) == len(PRIMARY_HEADER_LAYOUT)
+    assert packet_parser.PRIMARY_HEADER_FIELDS is fields
@@ -0,0 +1,73 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from capture.writer import CaptureWriter
+from ccsds.packet_builder import CCSDSPacketBuilder
+from cli import satcli
+from satellite import satellite_bus
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_entry_points_do_not_import_numpy_or_ccsdspy():
+    probe = (
+        "import sys, cli.satcli, ground.ground_station, attacker.rogue_transmitter, "
+        "satellite.satellite_bus; "
+        "print(','.join(m for m in ('numpy', 'ccsdspy') if m in sys.modules))"
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", probe], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_satcli_send_does_not_load_the_bus_or_asyncio(tmp_path):
+    probe = (
+        "import sys; from cli import satcli; "
+        "satcli.main(['send', 'CMD: PING', '--port', '9', '--window', '0']); "
+        "print(','.join(sorted(m for m in sys.modules if m == 'asyncio' or m in "
+        "('satellite.satellite_bus', 'satellite.ingress', 'satellite.metrics'))))"
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", probe],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(REPO_ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_bus_options_pass_through_to_the_bus_parser():
+    args = satcli.parse_args(
+        ["bus", "--port", "6000", "--mode", "async", "--no-console", "--metrics-port", "9200"]
+    )
+
+    bus_args = satellite_bus.parse_args(satcli.bus_argv(args))
+
+    assert (bus_args.port, bus_args.mode, bus_args.no_console) == (6000, "async", True)
+    assert bus_args.metrics_port == 9200 and bus_args.allowed_ground_stations == ["GS-ALPHA"]
+
+
+def test_satcli_analyze_never_writes_to_the_bus_telemetry_log(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    capture = tmp_path / "uplink.cap"
+    with CaptureWriter(capture) as writer:
+        packet = CCSDSPacketBuilder(b"analysis-key").build("PING", "GS-ROGUE")
+        writer.append(packet, "10.0.0.7", 4000, False, "recorded")
+    argv = ["analyze", str(capture), "--key", "analysis-key"]
+
+    report = satcli.run_analysis(satcli.parse_args(argv))
+    assert report["rejected"] == 1
+    assert not (tmp_path / "telemetry.log").exists()
+
+    replay_log = tmp_path / "replay.log"
+    satcli.run_analysis(satcli.parse_args([*argv, "--telemetry-log", str(replay_log)]))
+    assert "Unauthorized ground station" in replay_log.read_text()
+    assert not (tmp_path / "telemetry.log").exists()
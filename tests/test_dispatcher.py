@@ -0,0 +1,204 @@
+import os
+import threading
+import time
+from concurrent.futures import BrokenExecutor
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+from ccsds.packet_parser import CCSDSPacketParser
+from satellite.dispatcher import CommandDispatcher, HandlerSpec, command_verb
+from satellite.ingress import Datagram
+from satellite.metrics import BusMetrics
+from satellite.satellite_bus import BusRunOptions, SatelliteBus
+
+KEY = b"dispatcher-test-key"
+
+
+def handler_pid(invocation):
+    return os.getpid()
+
+
+def handler_pong(invocation):
+    return "PONG"
+
+
+def handler_hang(invocation):
+    time.sleep(60)
+
+
+HANDLERS = {"ping": handler_pong, "PID": handler_pid, "HANG": handler_hang}
+
+
+BUILDER = CCSDSPacketBuilder(KEY)
+
+
+def packet(command):
+    return CCSDSPacketParser().parse(BUILDER.build(command, "GS-ALPHA"))
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_slow_handlers_never_block_the_receive_path(telemetry):
+    release = threading.Event()
+    started = []
+    handlers = {
+        "ORIENT": HandlerSpec(
+            lambda invocation: started.append(invocation.arguments) or release.wait(2), 5.0, 1
+        ),
+        "PING": lambda invocation: "PONG",
+    }
+    metrics = BusMetrics()
+    dispatcher = CommandDispatcher(handlers, telemetry, workers=4, metrics=metrics)
+    bus = SatelliteBus(
+        KEY,
+        ["GS-ALPHA"],
+        ("127.0.0.1", 0),
+        telemetry=telemetry,
+        metrics=metrics,
+        dispatcher=dispatcher,
+    )
+    builder = CCSDSPacketBuilder(KEY)
+
+    began = time.perf_counter()
+    for angle in ("+1", "+2", "+3"):
+        bus.handle(Datagram(builder.build(f"CMD: ORIENT {angle}", "GS-ALPHA"), "10.0.0.1"))
+    bus.handle_batch(
+        [Datagram(builder.build("CMD: PING", "GS-ALPHA"), "10.0.0.1") for _ in range(2)]
+    )
+    receive_seconds = time.perf_counter() - began
+
+    assert wait_for(lambda: metrics.executed["PING", "completed"] == 2)
+    assert started == ["+1"] and len(dispatcher.routes["ORIENT"].waiting) == 2
+    release.set()
+    assert wait_for(lambda: metrics.executed["ORIENT", "completed"] == 3)
+    dispatcher.close()
+
+    assert receive_seconds < 0.5 and started == ["+1", "+2", "+3"]
+    assert bus.stats.accepted == 5 and dispatcher.pending == 0
+    assert metrics.executions["ORIENT"].count == 3
+    assert metrics.stages["hmac"].count == 5
+    assert 'satellite_bus_command_execution_seconds_count{verb="PING"} 2' in metrics.render()
+    executed = [ctx for _, msg, ctx in telemetry.events if msg == "Command executed"]
+    assert {ctx["verb"] for ctx in executed} == {"ORIENT", "PING"}
+    assert [ctx["result"] for ctx in executed if ctx["verb"] == "PING"] == ["PONG", "PONG"]
+
+
+def test_timeouts_failures_overflow_and_unknown_verbs_are_reported(telemetry):
+    release = threading.Event()
+
+    def fail(invocation):
+        raise RuntimeError("thruster offline")
+
+    metrics = BusMetrics()
+    dispatcher = CommandDispatcher(
+        {
+            "HANG": HandlerSpec(lambda invocation: release.wait(2), timeout=0.05, concurrency=2),
+            "FIRE": fail,
+        },
+        telemetry,
+        max_pending=3,
+        metrics=metrics,
+    )
+
+    results = [dispatcher.submit(packet(command)) for command in ["CMD: HANG"] * 4]
+    assert wait_for(lambda: metrics.executed["HANG", "dropped"] == 1)
+    assert wait_for(lambda: dispatcher.stats.timed_out == 2)
+    release.set()
+    assert wait_for(lambda: dispatcher.pending == 0)
+    assert dispatcher.submit(packet("CMD: FIRE"))
+    assert not dispatcher.submit(packet("CMD: SELF_DESTRUCT"))
+    assert wait_for(lambda: dispatcher.stats.failed == 1)
+    dispatcher.close()
+
+    assert results == [True, True, True, False]
+    assert metrics.executed["HANG", "timed_out"] == 2
+    assert metrics.executed["HANG", "completed"] == 1
+    assert metrics.executed["unknown_verb", "unknown_verb"] == 1
+    messages = telemetry.messages()
+    assert messages.count("Command handler timed out") == 2
+    assert "Unknown command verb" in messages and "Command handler failed" in messages
+    assert telemetry.events[-1][2]["submitted"] == 4
+
+
+def test_a_refused_submission_releases_its_slot_and_counts_as_failed(telemetry):
+    release = threading.Event()
+    handlers = {"HOLD": HandlerSpec(lambda invocation: release.wait(2), 5.0, 1), **HANDLERS}
+    metrics = BusMetrics()
+    dispatcher = CommandDispatcher(handlers, telemetry, workers=2, metrics=metrics)
+    pool_submit = dispatcher._executor.submit
+
+    def broken(*args, **kwargs):
+        raise BrokenExecutor("pool is broken")
+
+    assert dispatcher.submit(packet("CMD: HOLD 1")) and dispatcher.submit(packet("CMD: HOLD 2"))
+    dispatcher._executor.submit = broken
+    assert not dispatcher.submit(packet("CMD: PING"))
+    release.set()
+    assert wait_for(lambda: dispatcher.stats.failed == 2)
+    dispatcher._executor.submit = pool_submit
+    assert dispatcher.submit(packet("CMD: HOLD 3")) and dispatcher.submit(packet("CMD: PING"))
+    assert wait_for(lambda: dispatcher.stats.completed == 3)
+    dispatcher.close()
+
+    stats = dispatcher.stats
+    assert (stats.submitted, stats.completed, stats.failed, stats.dropped) == (5, 3, 2, 0)
+    assert dispatcher.pending == 0 and dispatcher.routes["HOLD"].running == 0
+    assert metrics.executed["PING", "failed"] == 1 and metrics.executed["HOLD", "failed"] == 1
+    assert telemetry.messages().count("Command handler failed") == 2
+
+
+def test_bus_options_load_a_handler_table_for_a_process_pool(telemetry):
+    options = BusRunOptions(
+        handlers=f"{__name__}:HANDLERS", dispatch_executor="process", dispatch_workers=1
+    )
+    dispatcher = options.make_dispatcher(telemetry)
+
+    dispatcher.submit(packet("CMD: PID"))
+    dispatcher.submit(packet("cmd: ping now"))
+    assert wait_for(lambda: dispatcher.stats.completed == 2, timeout=10)
+    dispatcher.close()
+
+    executed = {ctx["verb"]: ctx for _, msg, ctx in telemetry.events if msg == "Command executed"}
+    assert executed["PID"]["result"] != os.getpid()
+    assert executed["PING"]["result"] == "PONG"
+    assert command_verb("CMD: ORIENT +10") == ("ORIENT", "+10")
+    assert command_verb("noop") == ("NOOP", "")
+
+
+def test_close_abandons_hung_thread_handlers_after_the_timeout(telemetry):
+    release = threading.Event()
+    handlers = {"HOLD": HandlerSpec(lambda invocation: release.wait(5), 5.0, 2)}
+    dispatcher = CommandDispatcher(handlers, telemetry, workers=1, shutdown_timeout=0.1)
+    try:
+        assert dispatcher.submit(packet("CMD: HOLD 1")) and dispatcher.submit(packet("CMD: HOLD 2"))
+        began = time.monotonic()
+        dispatcher.close()
+        closing_seconds = time.monotonic() - began
+    finally:
+        release.set()
+
+    assert closing_seconds < 1.0
+    assert dispatcher.stats.dropped == 1
+    alerts = [ctx for _, msg, ctx in telemetry.events if msg.startswith("Command handlers aban")]
+    assert alerts[0]["running"] == 1
+    assert telemetry.events[-1][2]["abandoned"] == 1
+
+
+def test_close_terminates_hung_process_workers(telemetry):
+    dispatcher = CommandDispatcher(
+        {"HANG": handler_hang}, telemetry, workers=1, executor="process", shutdown_timeout=0.5
+    )
+    assert dispatcher.submit(packet("CMD: HANG"))
+    workers = list(dispatcher._executor._processes.values())
+    assert wait_for(lambda: workers and all(worker.is_alive() for worker in workers), timeout=10)
+
+    began = time.monotonic()
+    dispatcher.close()
+
+    assert time.monotonic() - began < 5.0
+    assert not any(worker.is_alive() for worker in workers)
+    assert "Command handlers abandoned at shutdown" in telemetry.messages()
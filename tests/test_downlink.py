@@ -0,0 +1,83 @@
+import json
+import logging
+
+import pytest
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+from ccsds.packet_parser import PacketValidationError
+from ccsds.telemetry_packet import TRUNCATED_KEY, build_frame, decode_frame, encode_event
+from cli import satcli
+from ground.telemetry_receiver import TelemetryReceiver
+from satellite.downlink import DownlinkSink
+from satellite.telemetry import TelemetryLogger
+
+
+def test_events_are_packed_into_frames_within_the_mtu_budget(tmp_path):
+    with TelemetryReceiver(("127.0.0.1", 0)) as receiver:
+        sink = DownlinkSink(receiver.address, max_frame_bytes=512, flush_interval=60.0)
+        telemetry = TelemetryLogger(
+            str(tmp_path / "telemetry.log"), background=True, console=False, sinks=[sink]
+        )
+        for index in range(200):
+            telemetry.info("Command accepted", ground_station_id="GS-ALPHA", sequence=index)
+        telemetry.warning(
+            "Firewall batch inspected",
+            packets=2,
+            events=[
+                {"level": "CRITICAL", "message": "Spoof Attempt", "source_ip": "10.9.9.9"},
+                {"level": "DEBUG", "message": "Trace", "source_ip": "10.0.0.1"},
+            ],
+        )
+        telemetry.critical("Oversized", blob="X" * 2000)
+        telemetry.close()
+        received = []
+        aggregator = receiver.run(received.append, duration=0.3)
+
+    assert sink.stats.frames <= 40 and sink.stats.bytes_sent <= 512 * sink.stats.frames
+    assert sink.stats.filtered == 1 and sink.stats.truncated == 1
+    assert [event.context["sequence"] for event in received[:200]] == list(range(200))
+    assert [event.message for event in received[200:]] == [
+        "Firewall batch inspected",
+        "Spoof Attempt",
+        "Oversized",
+    ]
+    assert received[-1].context == {TRUNCATED_KEY: 2000 + len('{"blob":""}')}
+    assert aggregator.frames == sink.stats.frames and aggregator.lost_frames == 0
+    summary = aggregator.summary()
+    assert summary["events"] == 203 and summary["events_per_frame"] > 5
+    assert summary["by_level"] == {"INFO": 200, "WARNING": 1, "CRITICAL": 2}
+
+
+def test_partial_frames_are_flushed_on_the_interval():
+    with TelemetryReceiver(("127.0.0.1", 0)) as receiver:
+        sink = DownlinkSink(receiver.address, flush_interval=0.05, min_level=logging.WARNING)
+        sink.write([(logging.WARNING, 1000.0, "Rate limit exceeded", {"source_ip": "10.0.0.7"})])
+        sink.write([(logging.INFO, 1000.1, "Command accepted", {})])
+        received = []
+        receiver.run(received.append, duration=0.5)
+        sink.close()
+
+    assert [event.message for event in received] == ["Rate limit exceeded"]
+    assert received[0].created == 1000.0 and sink.stats.frames == 1
+
+
+def test_receiver_counts_lost_reordered_and_invalid_frames(capsys):
+    events = [encode_event(logging.INFO, 1.0, "Tick", {"n": 1})[0]]
+    receiver = TelemetryReceiver(("127.0.0.1", 0))
+    for sequence in (0, 1, 4, 2, 5):
+        receiver.receive(build_frame(events, sequence, 2.0), ("10.0.0.1", 5001))
+    receiver.receive(build_frame(events, 9, 2.0, apid=201), ("10.0.0.1", 5001))
+    receiver.receive(CCSDSPacketBuilder(b"k").build("CMD: PING", "GS-ALPHA"), ("10.0.0.1", 9))
+    receiver.receive(build_frame(events, 6, 2.0)[:-1], ("10.0.0.1", 5001))
+    receiver.close()
+
+    summary = receiver.aggregator.summary()
+    assert (summary["frames"], summary["lost_frames"], summary["reordered_frames"]) == (6, 2, 1)
+    assert summary["invalid_frames"] == 2 and summary["senders"] == 2
+    with pytest.raises(PacketValidationError):
+        decode_frame(build_frame(events, 0, 2.0) + b"\x00")
+    frame = decode_frame(build_frame(events, 7, 2.0))
+    assert (frame.sequence_count, frame.events[0].context) == (7, {"n": 1})
+
+    satcli.main(["downlink", "--port", "0", "--duration", "0.05", "--summary"])
+    assert json.loads(capsys.readouterr().out)["frames"] == 0
@@ -0,0 +1,153 @@
+import logging
+import os
+import time
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+from ccsds.reassembly import SegmentReassembler
+from satellite.firewall import SatelliteFirewall
+from satellite.prefilter import (
+    APID_NOT_AUTHORIZED,
+    GROUND_ID_NOT_AUTHORIZED,
+    SOURCE_RATE_LIMITED,
+    UNAUTHORIZED_ALERT,
+    HeaderPrefilter,
+    RejectionSummary,
+)
+from satellite.ratelimit import TokenBucketLimiter
+
+KEY = b"firewall-test-key"
+
+
+def test_inspect_accepts_signed_packet(telemetry):
+    firewall = SatelliteFirewall(KEY, ["GS-ALPHA"], telemetry=telemetry)
+    packet = CCSDSPacketBuilder(KEY).build("CMD: ORIENT +10", "GS-ALPHA")
+
+    decision = firewall.inspect(packet, "10.0.0.1")
+
+    assert decision.accepted
+    assert decision.packet.command == "CMD: ORIENT +10"
+    assert telemetry.messages() == ["Command accepted"]
+
+
+def test_inspect_batch_matches_per_packet_decisions(telemetry):
+    firewall = SatelliteFirewall(KEY, ["GS-ALPHA"], telemetry=telemetry)
+    legit = CCSDSPacketBuilder(KEY)
+    datagrams = [
+        (legit.build("CMD: ONE", "GS-ALPHA"), "10.0.0.1"),
+        (CCSDSPacketBuilder(os.urandom(16)).build("CMD: SPOOF", "GS-ALPHA"), "10.0.0.2"),
+        (legit.build("CMD: TWO", "GS-OMEGA"), "10.0.0.3"),
+        (os.urandom(24), "10.0.0.4"),
+        (legit.build("CMD: THREE", "GS-ALPHA"), "10.0.0.1"),
+    ]
+
+    decisions = firewall.inspect_batch(datagrams)
+
+    assert [decision.reason for decision in decisions] == [
+        "Command accepted",
+        "HMAC verification failed",
+        "Ground station ID not authorized",
+        "Packet too short to contain CCSDS header and signature",
+        "Command accepted",
+    ]
+    assert telemetry.messages() == [UNAUTHORIZED_ALERT, "Firewall batch inspected"]
+    level, message, context = telemetry.events[1]
+    assert level == 50
+    assert message == "Firewall batch inspected"
+    assert context["accepted"] == 2
+    assert len(context["events"]) == 3
+    assert sum(firewall.rejections.counts.values()) == 2
+
+
+def test_batch_event_counts_buffered_segments_as_pending(telemetry):
+    firewall = SatelliteFirewall(
+        KEY, ["GS-ALPHA"], telemetry=telemetry, reassembler=SegmentReassembler()
+    )
+    segments = CCSDSPacketBuilder(KEY).build_segmented(
+        "TBL: LOAD " + "A" * 600, "GS-ALPHA", max_segment_bytes=256
+    )
+    spoofed = CCSDSPacketBuilder(os.urandom(16)).build("CMD: SPOOF", "GS-ALPHA")
+
+    firewall.inspect_batch(
+        [*((segment, "10.0.0.1") for segment in segments), (spoofed, "10.0.0.2")]
+    )
+
+    _, _, context = telemetry.events[0]
+    assert context["packets"] == len(segments) + 1 and context["accepted"] == 1
+    assert context["pending"] == len(segments) - 1
+    assert context["rejected"] == {"HMAC verification failed": 1}
+
+
+def test_prefilter_rejects_on_header_and_ground_id_bytes():
+    prefilter = HeaderPrefilter([b"GS-ALPHA"], allowed_apids=[100])
+    builder = CCSDSPacketBuilder(KEY)
+
+    assert prefilter.check(builder.build("CMD: PING", "GS-ALPHA")) is None
+    assert prefilter.check(builder.build("CMD: PING", "GS-BETA")) == GROUND_ID_NOT_AUTHORIZED
+    assert prefilter.check(CCSDSPacketBuilder(KEY, apid=7).build("CMD: PING", "GS-ALPHA")) == (
+        APID_NOT_AUTHORIZED
+    )
+
+
+def test_fast_rejections_are_summarised_not_logged_per_packet(telemetry):
+    firewall = SatelliteFirewall(KEY, ["GS-ALPHA"], telemetry=telemetry)
+
+    for _ in range(50):
+        assert not firewall.inspect(os.urandom(24), "10.0.0.66").accepted
+    assert telemetry.events == []
+
+    firewall.close()
+    level, message, context = telemetry.events[-1]
+    assert message == "Pre-filter rejections"
+    assert context["total"] == 50
+
+
+def test_token_bucket_limits_each_source_independently():
+    limiter = TokenBucketLimiter(rate=10, burst=2)
+
+    assert [limiter.allow("10.0.0.1", now=0.0) for _ in range(3)] == [True, True, False]
+    assert limiter.allow("10.0.0.2", now=0.0)
+    assert limiter.allow("10.0.0.1", now=0.1)
+
+
+def test_rate_limited_source_does_not_reach_hmac(telemetry):
+    limiter = TokenBucketLimiter(rate=1, burst=1)
+    firewall = SatelliteFirewall(KEY, ["GS-ALPHA"], telemetry=telemetry, rate_limiter=limiter)
+    builder = CCSDSPacketBuilder(KEY)
+
+    assert firewall.inspect(builder.build("CMD: ONE", "GS-ALPHA"), "10.0.0.1").accepted
+    decision = firewall.inspect(builder.build("CMD: TWO", "GS-ALPHA"), "10.0.0.1")
+
+    assert decision.reason == SOURCE_RATE_LIMITED
+    assert firewall.inspect(builder.build("CMD: THREE", "GS-ALPHA"), "10.0.0.2").accepted
+
+
+def test_unauthorized_ground_ids_alert_and_flush_without_more_traffic(telemetry):
+    firewall = SatelliteFirewall(KEY, ["GS-ALPHA"], telemetry=telemetry)
+    firewall.rejections = RejectionSummary(telemetry, interval=0.05)
+    evil = CCSDSPacketBuilder(KEY).build("CMD: PING", "GS-EVIL")
+
+    for _ in range(3):
+        assert firewall.inspect(evil, "10.6.6.6").reason == GROUND_ID_NOT_AUTHORIZED
+    alerts = list(telemetry.events)
+    deadline = time.monotonic() + 2
+    while "Pre-filter rejections" not in telemetry.messages() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    firewall.close()
+
+    assert alerts == [
+        (
+            logging.CRITICAL,
+            UNAUTHORIZED_ALERT,
+            {
+                "source_ip": "10.6.6.6",
+                "ground_station_id": "GS-EVIL",
+                "reason": GROUND_ID_NOT_AUTHORIZED,
+            },
+        )
+    ]
+    level, _, context = telemetry.events[1]
+    assert level == logging.CRITICAL and context["total"] == 3
+    assert context["unauthorized_sources"] == [
+        {"source_ip": "10.6.6.6", "ground_station_id": "GS-EVIL", "count": 3}
+    ]
+    assert telemetry.messages().count("Pre-filter rejections") == 1
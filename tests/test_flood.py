@@ -0,0 +1,65 @@
+import socket
+
+import pytest
+
+from attacker.flood import FloodMix, FloodPlan, flood, generate_packets
+from ccsds.packet_builder import CCSDSPacketBuilder
+from satellite.firewall import SatelliteFirewall
+from satellite.prefilter import GROUND_ID_NOT_AUTHORIZED
+from satellite.replay import REPLAY_DETECTED, ReplayGuard
+
+KEY = b"flood-test-key"
+
+
+def test_mix_parsing_and_validation():
+    mix = FloodMix.parse("spoof=4, malformed=3,replay=2,unauthorized")
+
+    assert mix.weights() == (4.0, 3.0, 2.0, 1.0)
+    with pytest.raises(ValueError, match="Unknown attack kind"):
+        FloodMix.parse("jam=1")
+    with pytest.raises(ValueError, match="not all zero"):
+        FloodMix.parse("spoof=0")
+
+
+def test_generated_traffic_is_rejected_for_the_intended_reason(telemetry):
+    captured = CCSDSPacketBuilder(KEY).build("PING", "GS-ALPHA")
+    plan = FloodPlan(
+        endpoint=("127.0.0.1", 9),
+        mix=FloodMix.parse("spoof,malformed,replay,unauthorized"),
+        rate=None,
+        duration=0.0,
+        pool_size=200,
+        replay_packets=(captured,),
+        seed=7,
+    )
+    packets, kinds = generate_packets(plan)
+    firewall = SatelliteFirewall(KEY, ["GS-ALPHA"], telemetry, replay_guard=ReplayGuard())
+    firewall.inspect(captured, "10.0.0.1")
+
+    decisions = {kind: set() for kind in kinds}
+    for packet, kind in zip(packets, kinds, strict=True):
+        decisions[kind].add(firewall.inspect(packet, "10.0.0.9").reason)
+
+    assert generate_packets(plan)[1] == kinds
+    assert decisions["spoof"] == {"HMAC verification failed"}
+    assert decisions["unauthorized"] == {GROUND_ID_NOT_AUTHORIZED}
+    assert decisions["replay"] == {REPLAY_DETECTED}
+    assert "Command accepted" not in decisions["malformed"]
+
+
+def test_flood_paces_and_counts_sends():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as receiver:
+        receiver.bind(("127.0.0.1", 0))
+        plan = FloodPlan(
+            endpoint=receiver.getsockname(),
+            mix=FloodMix(),
+            rate=500.0,
+            duration=0.1,
+            pool_size=16,
+            seed=1,
+        )
+        report = flood(plan)
+
+    assert 40 <= report.attempted <= 60
+    assert report.sent + sum(report.errors.values()) == report.attempted
+    assert sum(report.by_kind.values()) == report.attempted
@@ -0,0 +1,68 @@
+import io
+import socket
+
+from ccsds.packet_parser import CCSDSPacketParser
+from ground import ground_station
+from ground.ground_station import GroundStation, read_commands
+
+KEY = b"ground-test-key"
+
+
+def receive_all(sock, count):
+    parser = CCSDSPacketParser()
+    return [parser.parse(sock.recv(8192)) for _ in range(count)]
+
+
+def test_send_reports_sequence_of_transmitted_packet(tmp_path, monkeypatch, telemetry):
+    monkeypatch.chdir(tmp_path)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as receiver:
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2)
+        with GroundStation(KEY) as station:
+            station.telemetry = telemetry
+            station.send("CMD: ONE", receiver.getsockname())
+            station.send("CMD: TWO", receiver.getsockname())
+
+        packets = receive_all(receiver, 2)
+
+    assert [packet.sequence_count for packet in packets] == [0, 1]
+    assert [context["sequence"] for _, _, context in telemetry.events] == [0, 1]
+
+
+def test_send_many_streams_commands_over_one_socket(tmp_path, monkeypatch, telemetry):
+    monkeypatch.chdir(tmp_path)
+    stream = io.StringIO("# pass plan\nCMD: A\n\nCMD: B\nCMD: C\n")
+    state = tmp_path / "sequence.json"
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as receiver:
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2)
+        with GroundStation(KEY, sequence_state=state) as station:
+            station.telemetry = telemetry
+            sent = station.send_many(
+                read_commands(stream), receiver.getsockname(), rate=500, chunk_size=2
+            )
+
+        packets = receive_all(receiver, 3)
+
+    assert sent == 3
+    assert [packet.command for packet in packets] == ["CMD: A", "CMD: B", "CMD: C"]
+    assert [context["commands"] for _, _, context in telemetry.events] == [2, 1]
+    assert GroundStation(KEY, sequence_state=state).builder.sequence_count == 3
+
+
+def test_paced_chunks_are_signed_just_in_time(tmp_path, monkeypatch, telemetry):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(ground_station, "SIGN_AHEAD_SECONDS", 0.05)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as receiver:
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2)
+        with GroundStation(KEY) as station:
+            station.telemetry = telemetry
+            sent = station.send_many(
+                [f"CMD: {index}" for index in range(12)], receiver.getsockname(), rate=100
+            )
+
+        packets = receive_all(receiver, 12)
+
+    assert sent == 12 and [packet.sequence_count for packet in packets] == list(range(12))
+    assert [context["commands"] for _, _, context in telemetry.events] == [5, 5, 2]
@@ -21,3 +21,26 @@ def test_hmac_rejects_bad_signature():
     signature = signer.sign(payload)
     tampered = signature[:-1] + bytes([signature[-1] ^ 0xFF])
     assert not verifier.verify(payload, tampered)
+
+
+def test_hmac_accepts_buffer_views():
+    key = b"test-key"
+    payload = bytearray(b"command payload")
+    signer = HMACSigner(key)
+    verifier = HMACVerifier(key)
+
+    signature = signer.sign(memoryview(payload))
+    assert signature == signer.sign(bytes(payload))
+    assert verifier.verify(memoryview(payload), memoryview(signature))
+
+
+def test_hmac_batch_round_trip():
+    key = b"test-key"
+    payloads = [b"first", b"second", b"third"]
+    signer = HMACSigner(key)
+    verifier = HMACVerifier(key)
+
+    signatures = signer.sign_many(payloads)
+    signatures[1] = bytes(32)
+
+    assert verifier.verify_many(zip(payloads, signatures, strict=True)) == [True, False, True]
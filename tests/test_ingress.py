@@ -0,0 +1,83 @@
+import asyncio
+import sys
+import threading
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+from satellite.ingress import Datagram, IngressQueue, OverflowPolicy
+from satellite.metrics import BusMetrics
+from satellite.ratelimit import TokenBucketLimiter
+from satellite.replay import ReplayGuard
+from satellite.satellite_bus import SatelliteBus
+
+
+def test_drop_oldest_keeps_latest_datagrams():
+    async def scenario():
+        queue = IngressQueue(2, OverflowPolicy.DROP_OLDEST)
+        for index in range(4):
+            queue.put((bytes([index]), "10.0.0.1"))
+        return queue, [await queue.get(), await queue.get()]
+
+    queue, items = asyncio.run(scenario())
+    assert [packet for packet, _ in items] == [b"\x02", b"\x03"]
+    assert queue.stats.received == 4
+    assert queue.stats.dropped == 2
+
+
+def test_drop_newest_rejects_arrivals_when_full():
+    async def scenario():
+        queue = IngressQueue(2, OverflowPolicy.DROP_NEWEST)
+        accepted = [queue.put((bytes([index]), "10.0.0.1")) for index in range(3)]
+        return queue, accepted, [await queue.get(), await queue.get()]
+
+    queue, accepted, items = asyncio.run(scenario())
+    assert accepted == [True, True, False]
+    assert [packet for packet, _ in items] == [b"\x00", b"\x01"]
+    assert queue.stats.dropped == 1
+
+
+def test_concurrent_consumers_keep_exact_counts(telemetry):
+    key = b"consumer-test-key"
+    stations = [f"GS-{index}" for index in range(4)]
+    bus = SatelliteBus(
+        key,
+        stations,
+        ("127.0.0.1", 0),
+        telemetry=telemetry,
+        replay_guard=ReplayGuard(),
+        rate_limiter=TokenBucketLimiter(rate=1e9, burst=1e9, max_sources=4),
+        metrics=BusMetrics(),
+    )
+    forger = CCSDSPacketBuilder(b"not-the-key")
+    errors = []
+
+    def consumer(station):
+        builder = CCSDSPacketBuilder(key)
+        try:
+            for index in range(300):
+                source = f"10.0.{index % 7}.{index % 13}"
+                batch = [
+                    Datagram(builder.build(f"CMD: PING {index}", station), source),
+                    Datagram(forger.build(f"CMD: FORGE {index}", station), source),
+                ]
+                if index % 2:
+                    bus.handle_batch(batch)
+                else:
+                    for datagram in batch:
+                        bus.handle(datagram)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=consumer, args=(station,)) for station in stations]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert (bus.stats.received, bus.stats.accepted, bus.stats.rejected) == (2400, 1200, 1200)
+    assert (bus.metrics.received, bus.metrics.accepted) == (2400, 1200)
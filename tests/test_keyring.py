@@ -0,0 +1,122 @@
+import json
+import os
+import time
+
+import pytest
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+from crypto.keyring import Keyring, KeyringError
+from satellite.firewall import SatelliteFirewall
+from satellite.prefilter import GROUND_ID_NOT_AUTHORIZED
+from satellite.rotation import KeyringWatcher
+
+
+def write_keyring(path, **stations):
+    document = {"ground_stations": stations}
+    path.write_text(json.dumps(document), encoding="utf-8")
+
+
+def bump_mtime(path, seconds):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + int(seconds * 1e9)))
+
+
+def test_firewall_verifies_each_station_with_its_own_key(tmp_path, telemetry):
+    path = tmp_path / "keyring.json"
+    write_keyring(
+        path,
+        **{
+            "GS-ALPHA": {"key_id": "a1", "key": "alpha-secret"},
+            "GS-BETA": {"key_id": "b1", "key_hex": b"beta-secret".hex()},
+        },
+    )
+    firewall = SatelliteFirewall(
+        b"shared", ["GS-ALPHA", "GS-BETA", "GS-GAMMA"], telemetry, keyring=Keyring(path)
+    )
+
+    alpha = CCSDSPacketBuilder(b"alpha-secret").build("CMD: ONE", "GS-ALPHA")
+    beta = CCSDSPacketBuilder(b"beta-secret").build("CMD: TWO", "GS-BETA")
+    crossed = CCSDSPacketBuilder(b"alpha-secret").build("CMD: THREE", "GS-BETA")
+    unkeyed = CCSDSPacketBuilder(b"shared").build("CMD: FOUR", "GS-GAMMA")
+
+    assert firewall.inspect(alpha, "10.0.0.1").accepted
+    assert firewall.inspect(beta, "10.0.0.1").accepted
+    assert not firewall.inspect(crossed, "10.0.0.1").accepted
+    assert not firewall.inspect(unkeyed, "10.0.0.1").accepted
+    batch = firewall.inspect_batch([(alpha, "10.0.0.1"), (crossed, "10.0.0.1")])
+    assert [decision.accepted for decision in batch] == [True, False]
+
+
+def test_rotation_honours_previous_key_for_the_overlap(tmp_path):
+    path = tmp_path / "keyring.json"
+    write_keyring(
+        path,
+        **{"GS-ALPHA": {"key_id": "a1", "key": "old"}, "GS-BETA": {"key_id": "b1", "key": "b"}},
+    )
+    clock = [1000.0]
+    keyring = Keyring(path, overlap=60.0, clock=lambda: clock[0])
+    beta_verifier = keyring.lookup(b"GS-BETA").current.verifier
+    packet = CCSDSPacketBuilder(b"old").build("CMD: PING", "GS-ALPHA")
+    message, signature = packet[:-32], packet[-32:]
+
+    write_keyring(
+        path,
+        **{"GS-ALPHA": {"key_id": "a2", "key": "new"}, "GS-BETA": {"key_id": "b1", "key": "b"}},
+    )
+
+    assert keyring.reload() == ["GS-ALPHA"]
+    assert keyring.lookup(b"GS-ALPHA").previous.key_id == "a1"
+    assert keyring.lookup(b"GS-BETA").current.verifier is beta_verifier
+    assert keyring.verify(b"GS-ALPHA", message, signature)
+    clock[0] += 61.0
+    assert not keyring.verify(b"GS-ALPHA", message, signature)
+
+
+def test_bad_reload_keeps_loaded_keys_and_is_reported(tmp_path, telemetry):
+    path = tmp_path / "keyring.json"
+    write_keyring(path, **{"GS-ALPHA": {"key_id": "a1", "key": "alpha"}})
+    keyring = Keyring(path)
+    watcher = KeyringWatcher(keyring, telemetry, interval=0.01)
+    try:
+        path.write_text("{not json", encoding="utf-8")
+        bump_mtime(path, 1)
+        with pytest.raises(KeyringError):
+            keyring.reload()
+        assert keyring.lookup(b"GS-ALPHA").current.key_id == "a1"
+
+        write_keyring(path, **{"GS-ALPHA": {"key_id": "a2", "key": "rotated"}})
+        bump_mtime(path, 2)
+        deadline = time.monotonic() + 2
+        while "Keyring reloaded" not in telemetry.messages() and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.close()
+
+    assert keyring.lookup(b"GS-ALPHA").current.key_id == "a2"
+    reloaded = [ctx for _, msg, ctx in telemetry.events if msg == "Keyring reloaded"]
+    assert reloaded[0]["trigger"] == "file change" and reloaded[0]["rotated"] == ["GS-ALPHA"]
+
+
+def test_allow_list_follows_the_keyring_across_reloads(tmp_path, telemetry):
+    path = tmp_path / "keyring.json"
+    write_keyring(path, **{"GS-ALPHA": {"key_id": "a1", "key": "alpha"}})
+    keyring = Keyring(path)
+    firewall = SatelliteFirewall(b"shared", ["GS-DEFAULT"], telemetry, keyring=keyring)
+    watcher = KeyringWatcher(
+        keyring, telemetry, interval=60, on_reload=firewall.refresh_ground_stations
+    )
+    beta = CCSDSPacketBuilder(b"beta").build("CMD: PING", "GS-BETA")
+    try:
+        assert firewall.allowed_ground_stations == {"GS-ALPHA"}
+        assert firewall.inspect(beta, "10.0.0.1").reason == GROUND_ID_NOT_AUTHORIZED
+
+        write_keyring(path, **{"GS-BETA": {"key_id": "b1", "key": "beta"}})
+        assert watcher.reload("signal")
+
+        assert firewall.allowed_ground_stations == {"GS-BETA"}
+        assert firewall.inspect(beta, "10.0.0.1").accepted
+        alpha = CCSDSPacketBuilder(b"alpha").build("CMD: PING", "GS-ALPHA")
+        assert firewall.inspect(alpha, "10.0.0.1").reason == GROUND_ID_NOT_AUTHORIZED
+    finally:
+        watcher.close()
+        firewall.close()
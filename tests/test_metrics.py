@@ -0,0 +1,77 @@
+import json
+import urllib.request
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+from satellite.firewall import SatelliteFirewall
+from satellite.metrics import (
+    ALLOW_LIST,
+    BUCKET_BOUNDS,
+    HMAC,
+    PARSE,
+    TELEMETRY,
+    BusMetrics,
+    LatencyHistogram,
+    MetricsExporter,
+)
+from satellite.prefilter import PACKET_TOO_SHORT
+
+KEY = b"metrics-test-key"
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = LatencyHistogram()
+    for _ in range(99):
+        histogram.observe(3e-6)
+    histogram.observe(0.5)
+
+    assert histogram.count == 100
+    assert histogram.quantile(0.5) == 4e-6
+    assert histogram.quantile(1.0) > 0.5
+
+
+def test_slow_observations_keep_summaries_finite():
+    metrics = BusMetrics()
+    metrics.record_execution("ORIENT", "completed", 12.0)
+    metrics.record_execution("ORIENT", "completed", 120.0)
+
+    summary = json.loads(json.dumps(metrics.summary(), allow_nan=False))
+
+    assert summary["executions"]["ORIENT"]["p50_us"] == round(BUCKET_BOUNDS[-2] * 1e6, 2)
+    assert summary["executions"]["ORIENT"]["p99_us"] == round(BUCKET_BOUNDS[-1] * 1e6, 2)
+
+
+def test_firewall_records_decisions_and_stage_latencies(telemetry):
+    metrics = BusMetrics()
+    firewall = SatelliteFirewall(KEY, ["GS-ALPHA"], telemetry, metrics=metrics)
+    builder = CCSDSPacketBuilder(KEY)
+
+    firewall.inspect(builder.build("PING", "GS-ALPHA"), "10.0.0.1")
+    firewall.inspect(b"\x00", "10.0.0.1")
+    firewall.inspect_batch([(builder.build("STATUS", "GS-ALPHA"), "10.0.0.1")] * 2)
+
+    assert (metrics.received, metrics.accepted) == (4, 3)
+    assert metrics.rejected == {PACKET_TOO_SHORT: 1}
+    assert metrics.stages[ALLOW_LIST].count == 4
+    assert metrics.stages[PARSE].count == 3
+    assert metrics.stages[HMAC].count == 3
+    assert metrics.stages[TELEMETRY].count == 2
+    text = metrics.render()
+    assert "satellite_bus_packets_received_total 4" in text
+    assert f'satellite_bus_packets_rejected_total{{reason="{PACKET_TOO_SHORT}"}} 1' in text
+    assert 'satellite_bus_stage_latency_seconds_count{stage="hmac"} 3' in text
+
+
+def test_exporter_serves_prometheus_text_and_reports_summary(telemetry):
+    metrics = BusMetrics()
+    metrics.record(True, "Command accepted")
+    exporter = MetricsExporter(metrics, telemetry, port=0, summary_interval=3600)
+    host, port = exporter.server.address
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:  # noqa: S310
+            body = response.read().decode()
+    finally:
+        exporter.close()
+
+    assert "satellite_bus_packets_accepted_total 1" in body
+    assert telemetry.messages() == ["Metrics endpoint listening", "Bus metrics summary"]
+    assert telemetry.events[-1][2]["accepted"] == 1
@@ -0,0 +1,44 @@
+import threading
+
+from satellite.profiling import ProfileController, SamplingProfiler
+
+
+def _spin(stop):
+    while not stop.is_set():
+        sum(range(100))
+
+
+def test_sampler_collapses_other_thread_stacks(tmp_path):
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin, args=(stop,), name="spinner")
+    worker.start()
+    profiler = SamplingProfiler(interval=0.001)
+    try:
+        for _ in range(5):
+            profiler.sample()
+    finally:
+        stop.set()
+        worker.join()
+    profiler.write(tmp_path / "out.collapsed")
+
+    assert profiler.samples == 5
+    assert any(stack.startswith("spinner;") and "_spin" in stack for stack in profiler.stacks)
+    assert (tmp_path / "out.collapsed").read_text().strip()
+
+
+def test_controller_runs_one_session_and_writes_results(tmp_path, telemetry):
+    controller = ProfileController(tmp_path, telemetry, duration=0.05, interval=0.005)
+
+    assert controller.trigger(memory=True)
+    assert not controller.trigger()
+    assert controller.route({})[0] == 409
+    controller.wait()
+
+    assert telemetry.messages() == ["Profile written"]
+    context = telemetry.events[0][2]
+    assert context["samples"] > 0
+    assert tmp_path.joinpath(context["stacks"]).exists()
+    assert tmp_path.joinpath(context["memory"]).exists()
+    assert controller.route({"seconds": "soon"})[0] == 400
+    assert controller.route({"seconds": "0.01", "memory": "0"})[0] == 202
+    controller.close()
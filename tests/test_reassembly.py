@@ -0,0 +1,120 @@
+from datetime import UTC, datetime
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+from ccsds.reassembly import (
+    REASSEMBLY_MEMORY_EXHAUSTED,
+    REASSEMBLY_TIMED_OUT,
+    SEGMENT_BUFFERED,
+    SEGMENT_OUT_OF_SEQUENCE,
+    SEGMENT_WITHOUT_FIRST,
+    SegmentReassembler,
+)
+from satellite.firewall import SatelliteFirewall
+from satellite.prefilter import FRAGMENTED_PACKET
+from satellite.replay import REPLAY_DETECTED, ReplayGuard
+
+KEY = b"reassembly-test-key"
+TIMESTAMP = datetime(2024, 1, 1, tzinfo=UTC)
+TABLE_LOAD = "TBL: LOAD " + "0123456789ABCDEF" * 300
+
+
+def test_segments_reassemble_into_the_signed_standalone_packet():
+    segments = CCSDSPacketBuilder(KEY).build_segmented(
+        TABLE_LOAD, "GS-ALPHA", max_segment_bytes=512, timestamp=TIMESTAMP
+    )
+    standalone = CCSDSPacketBuilder(KEY).build(TABLE_LOAD, "GS-ALPHA", timestamp=TIMESTAMP)
+    reassembler = SegmentReassembler()
+
+    results = [reassembler.add(segment, "10.0.0.1", now=0.0) for segment in segments]
+
+    assert len(segments) == 10 and max(map(len, segments)) == 512
+    assert results[:-1] == [SEGMENT_BUFFERED] * 9
+    assert bytes(results[-1]) == standalone
+    assert len(reassembler) == 0 and reassembler.buffered_bytes == 0
+
+
+def test_firewall_verifies_the_whole_command_and_rejects_bad_segments(telemetry):
+    firewall = SatelliteFirewall(
+        KEY,
+        ["GS-ALPHA"],
+        telemetry,
+        replay_guard=ReplayGuard(),
+        reassembler=SegmentReassembler(),
+    )
+    builder = CCSDSPacketBuilder(KEY)
+    segments = builder.build_segmented(TABLE_LOAD, "GS-ALPHA", max_segment_bytes=1024)
+    tampered = builder.build_segmented(TABLE_LOAD, "GS-ALPHA", max_segment_bytes=1024)
+    tampered[2] = tampered[2][:-1] + b"!"
+
+    decisions = [firewall.inspect(segment, "10.0.0.1") for segment in segments]
+    replayed = [firewall.inspect(segment, "10.0.0.1") for segment in segments]
+    forged = [firewall.inspect(segment, "10.0.0.1") for segment in tampered]
+    skipped = [firewall.inspect(segment, "10.0.0.2") for segment in (segments[0], segments[2])]
+
+    assert all(decision.pending for decision in decisions[:-1])
+    assert decisions[-1].accepted and decisions[-1].packet.command == TABLE_LOAD
+    assert replayed[-1].reason == REPLAY_DETECTED
+    assert forged[-1].reason == "HMAC verification failed"
+    assert [decision.reason for decision in skipped] == [SEGMENT_BUFFERED, SEGMENT_OUT_OF_SEQUENCE]
+    assert firewall.inspect(segments[1], "10.0.0.2").reason == SEGMENT_WITHOUT_FIRST
+    plain = SatelliteFirewall(KEY, ["GS-ALPHA"], telemetry)
+    assert plain.inspect(segments[0], "10.0.0.1").reason == FRAGMENTED_PACKET
+
+
+def test_endless_first_segments_stay_within_the_memory_budget(telemetry):
+    reassembler = SegmentReassembler(
+        max_packet_bytes=8192, max_buffered_bytes=64 << 10, max_streams_per_source=2, timeout=5.0
+    )
+    firewall = SatelliteFirewall(KEY, ["GS-ALPHA"], telemetry, reassembler=reassembler)
+    first, *_ = CCSDSPacketBuilder(KEY).build_segmented(
+        "X" * 7000, "GS-ALPHA", max_segment_bytes=256
+    )
+
+    reasons = [
+        firewall.inspect(first, f"10.1.{index // 256}.{index % 256}", now=float(index % 2)).reason
+        for index in range(1000)
+    ]
+    repeated = [firewall.inspect(first, "10.0.0.9", now=1.0).reason for _ in range(3)]
+    while_full = reassembler.buffered_bytes
+
+    assert reasons.count(SEGMENT_BUFFERED) == 9 and reassembler.stats.dropped == 994
+    assert while_full <= 64 << 10 and len(reassembler) == 9
+    assert repeated == [REASSEMBLY_MEMORY_EXHAUSTED] * 3
+    assert firewall.inspect(first, "10.0.0.9", now=10.0).reason == SEGMENT_BUFFERED
+    assert len(reassembler) == 1
+    for apid, expected in ((101, SEGMENT_BUFFERED), (102, REASSEMBLY_MEMORY_EXHAUSTED)):
+        other, *_ = CCSDSPacketBuilder(KEY, apid=apid).build_segmented(
+            "X" * 7000, "GS-ALPHA", max_segment_bytes=256
+        )
+        assert reassembler.add(other, "10.0.0.9", now=10.0) == expected
+    assert firewall.rejections.counts[REASSEMBLY_TIMED_OUT] == 9
+    assert firewall.rejections.counts[REASSEMBLY_MEMORY_EXHAUSTED] == 994
+
+
+def test_spoofed_first_segments_cannot_lock_out_other_sources(telemetry):
+    reassembler = SegmentReassembler(
+        max_packet_bytes=8192, max_buffered_bytes=64 << 10, max_streams_per_source=4
+    )
+    firewall = SatelliteFirewall(
+        KEY, ["GS-ALPHA"], telemetry, replay_guard=ReplayGuard(), reassembler=reassembler
+    )
+    spoofed = [
+        CCSDSPacketBuilder(b"not-the-key", apid=apid).build_segmented(
+            "X" * 7000, "GS-ALPHA", max_segment_bytes=256
+        )[0]
+        for apid in range(100, 104)
+    ]
+    for index in range(16):
+        for first in spoofed:
+            firewall.inspect(first, f"10.6.6.{index}")
+    held = reassembler.buffered_bytes
+
+    segments = CCSDSPacketBuilder(KEY).build_segmented(
+        "TBL: LOAD " + "A" * 1500, "GS-ALPHA", max_segment_bytes=256
+    )
+    decisions = [firewall.inspect(segment, "10.0.0.1") for segment in segments]
+
+    assert held <= 64 << 10 and reassembler.stats.evicted > 0
+    assert all(decision.pending for decision in decisions[:-1]) and decisions[-1].accepted
+    assert firewall.inspect(spoofed[0], "10.6.6.0").reason == REASSEMBLY_MEMORY_EXHAUSTED
+    assert reassembler.buffered_bytes <= 64 << 10
@@ -0,0 +1,134 @@
+import json
+import multiprocessing
+import random
+
+import pytest
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+from satellite.firewall import SatelliteFirewall
+from satellite.replay import (
+    REPLAY_DETECTED,
+    REPLAY_STATE_EXHAUSTED,
+    SEQUENCE_OUTSIDE_WINDOW,
+    STALE_TIMESTAMP,
+    ReplayGuard,
+    SharedReplayState,
+)
+
+KEY = b"replay-test-key"
+NOW = 1_700_000_000
+
+
+def test_window_rejects_duplicates_and_accepts_reordering():
+    guard = ReplayGuard(window_size=8)
+
+    assert guard.check("GS-ALPHA", 100, 5, NOW, now=NOW) is None
+    assert guard.check("GS-ALPHA", 100, 7, NOW, now=NOW) is None
+    assert guard.check("GS-ALPHA", 100, 6, NOW, now=NOW) is None
+    assert guard.check("GS-ALPHA", 100, 6, NOW, now=NOW) == REPLAY_DETECTED
+    assert guard.check("GS-ALPHA", 101, 6, NOW, now=NOW) is None
+    assert guard.check("GS-ALPHA", 100, 20, NOW, now=NOW) is None
+    assert guard.check("GS-ALPHA", 100, 7, NOW, now=NOW) == SEQUENCE_OUTSIDE_WINDOW
+
+
+def test_window_handles_sequence_wrap_and_sender_restart():
+    guard = ReplayGuard()
+
+    assert guard.check("GS-ALPHA", 100, 16383, NOW, now=NOW) is None
+    assert guard.check("GS-ALPHA", 100, 0, NOW, now=NOW) is None
+    assert guard.check("GS-ALPHA", 100, 16383, NOW, now=NOW) == REPLAY_DETECTED
+    assert guard.check("GS-ALPHA", 100, 0, NOW + 5, now=NOW + 5) is None
+    assert guard.check("GS-ALPHA", 100, 1, NOW, now=NOW + 5) == REPLAY_DETECTED
+
+
+def test_fresh_capture_is_rejected_after_the_counter_wraps():
+    guard = ReplayGuard()
+
+    assert guard.check("GS-ALPHA", 100, 10, NOW, now=NOW) is None
+    for step in range(1, 5):
+        sequence = (10 + step * 4096) % 16384
+        assert guard.check("GS-ALPHA", 100, sequence, NOW + step, now=NOW + step) is None
+    assert guard.check("GS-ALPHA", 100, 4106, NOW + 1, now=NOW + 60) == REPLAY_DETECTED
+    assert guard.check("GS-ALPHA", 100, 11, NOW + 4, now=NOW + 60) is None
+
+
+def _check_in_worker(shared, snapshot_path, results):
+    guard = ReplayGuard(snapshot_path=snapshot_path, shared=shared)
+    results.put(guard.check("GS-ALPHA", 100, 5, NOW, now=NOW))
+    guard.close()
+
+
+def test_workers_sharing_replay_state_reject_each_others_packets(tmp_path):
+    context = multiprocessing.get_context("fork")
+    shared = SharedReplayState(context)
+    snapshot_path = tmp_path / "replay_state.json"
+    results = context.Queue()
+    worker = context.Process(target=_check_in_worker, args=(shared, snapshot_path, results))
+    worker.start()
+    worker.join(timeout=10)
+    other_worker = ReplayGuard(snapshot_path=snapshot_path, shared=shared)
+
+    assert results.get(timeout=5) is None
+    assert other_worker.check("GS-ALPHA", 100, 5, NOW, now=NOW) == REPLAY_DETECTED
+    assert other_worker.check("GS-ALPHA", 100, 6, NOW, now=NOW) is None
+    assert other_worker.check("GS-ALPHA", 100, 6, NOW, now=NOW) == REPLAY_DETECTED
+    other_worker.close()
+    assert json.loads(snapshot_path.read_text())["windows"][0]["top"] == 6
+
+
+def test_shared_windows_decide_exactly_like_local_ones():
+    context = multiprocessing.get_context("fork")
+    local = ReplayGuard(window_size=100)
+    shared = ReplayGuard(window_size=100, shared=SharedReplayState(context, window_size=100))
+    rng = random.Random(7)  # noqa: S311 - reproducible traffic, not cryptography
+    checks = [
+        (f"GS-{rng.randrange(3)}", rng.randrange(2), rng.randrange(16384), NOW + rng.randrange(4))
+        for _ in range(5000)
+    ]
+
+    for station, apid, sequence, timestamp in checks:
+        expected = local.check(station, apid, sequence, timestamp, now=NOW)
+        assert shared.check(station, apid, sequence, timestamp, now=NOW) == expected
+    assert sorted(shared.snapshot()["windows"], key=str) == sorted(
+        local.snapshot()["windows"], key=str
+    )
+    with pytest.raises(ValueError):
+        ReplayGuard(shared=SharedReplayState(context, window_size=100))
+
+
+def test_shared_state_rejects_senders_it_cannot_track():
+    guard = ReplayGuard(shared=SharedReplayState(multiprocessing.get_context("fork"), slots=2))
+
+    assert guard.check("GS-ALPHA", 100, 1, NOW, now=NOW) is None
+    assert guard.check("GS-ALPHA", 101, 1, NOW, now=NOW) is None
+    assert guard.check("GS-BETA", 100, 1, NOW, now=NOW) == REPLAY_STATE_EXHAUSTED
+    assert guard.check("GS-" + "X" * 70, 100, 1, NOW, now=NOW) == REPLAY_STATE_EXHAUSTED
+    assert guard.check("GS-ALPHA", 100, 1, NOW, now=NOW) == REPLAY_DETECTED
+
+
+def test_stale_timestamps_are_rejected():
+    guard = ReplayGuard(freshness_seconds=30)
+
+    assert guard.check("GS-ALPHA", 100, 1, NOW - 31, now=NOW) == STALE_TIMESTAMP
+
+
+def test_snapshot_survives_restart(tmp_path):
+    path = tmp_path / "replay_state.json"
+    guard = ReplayGuard(snapshot_path=path)
+    assert guard.check("GS-ALPHA", 100, 3, NOW, now=NOW) is None
+    guard.close()
+
+    restored = ReplayGuard(snapshot_path=path)
+    assert restored.check("GS-ALPHA", 100, 3, NOW, now=NOW) == REPLAY_DETECTED
+
+
+def test_firewall_rejects_replayed_packet(telemetry):
+    firewall = SatelliteFirewall(KEY, ["GS-ALPHA"], telemetry=telemetry, replay_guard=ReplayGuard())
+    packet = CCSDSPacketBuilder(KEY).build("CMD: ORIENT +10", "GS-ALPHA")
+
+    assert firewall.inspect(packet, "10.0.0.1").accepted
+    replayed = firewall.inspect(packet, "10.0.0.9")
+
+    assert not replayed.accepted
+    assert replayed.reason == REPLAY_DETECTED
+    assert telemetry.messages()[-1] == "CRITICAL SECURITY ALERT: Replay Attempt Detected"
@@ -0,0 +1,148 @@
+import asyncio
+import itertools
+from collections import Counter
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+from satellite.ingress import Datagram, OverflowPolicy
+from satellite.metrics import BusMetrics
+from satellite.satellite_bus import BusRunOptions, SatelliteBus, parse_args
+from satellite.scheduler import NORMAL, PRIORITY, UNCLASSIFIED, AdmissionScheduler
+
+KEY = b"scheduler-test-key"
+STATIONS = ("GS-ALPHA", "GS-BETA")
+
+
+def datagram(builder, command, ground_id, source="10.0.0.1"):
+    return Datagram(builder.build(command, ground_id), source)
+
+
+def test_a_flooded_ground_id_cannot_delay_another_station(telemetry):
+    builder = CCSDSPacketBuilder(KEY)
+    forger = CCSDSPacketBuilder(b"not-the-key")
+    scheduler = AdmissionScheduler(STATIONS, max_depth=64)
+    metrics = BusMetrics()
+    metrics.ingress = scheduler.stats
+    bus = SatelliteBus(
+        KEY, STATIONS, ("127.0.0.1", 0), telemetry=telemetry, metrics=metrics, scheduler=scheduler
+    )
+
+    for index in range(2000):
+        scheduler.put(datagram(forger, f"CMD: FLOOD {index}", "GS-BETA", "10.9.9.9"))
+        if index % 400 == 399:
+            scheduler.put(datagram(builder, f"CMD: PING {index}", "GS-ALPHA"))
+    inspected_before = []
+    while scheduler.qsize():
+        for decision in bus.handle_batch(scheduler.get_nowait_batch(16)):
+            if decision.accepted:
+                inspected_before.append(bus.stats.received - len(inspected_before))
+
+    assert len(inspected_before) == 5 and max(inspected_before) <= 32
+    assert bus.stats.accepted == 5 and bus.stats.received == 69
+    assert scheduler.stats.queue_dropped == {(NORMAL, "GS-BETA"): 1936}
+    assert metrics.queue_dropped == 1936
+    assert (
+        'satellite_bus_admission_dropped_total{ground_station="GS-BETA",class="normal"} 1936'
+        in metrics.render()
+    )
+
+
+def test_priority_apids_weights_and_segments_choose_the_queue():
+    builder = CCSDSPacketBuilder(KEY)
+    scheduler = AdmissionScheduler(
+        STATIONS,
+        priority_apids=[7],
+        weights={"GS-ALPHA": 2.0},
+        quantum=len(builder.build("CMD: BULK 000", "GS-ALPHA")),
+    )
+    safety = CCSDSPacketBuilder(KEY, apid=7)
+    segments = builder.build_segmented("TBL: LOAD " + "A" * 600, "GS-BETA", max_segment_bytes=128)
+
+    for index in range(30):
+        scheduler.put(datagram(builder, f"CMD: BULK {index:03}", "GS-ALPHA"))
+        scheduler.put(datagram(builder, f"CMD: BULK {index:03}", "GS-BETA"))
+    scheduler.put(datagram(builder, "CMD: SPOOF", "GS-MALLORY"))
+    scheduler.put(datagram(safety, "CMD: SAFE_MODE", "GS-BETA"))
+    for segment in segments:
+        scheduler.put(Datagram(segment, "10.0.0.2"))
+
+    assert scheduler.depths() == {
+        (PRIORITY, "GS-BETA"): 1,
+        (NORMAL, "GS-ALPHA"): 30,
+        (NORMAL, "GS-BETA"): 30 + len(segments),
+        (NORMAL, UNCLASSIFIED): 1,
+    }
+    admitted = [scheduler.classify(item)[1] for item in scheduler.get_nowait_batch(31)]
+    assert scheduler.classify(Datagram(segments[-1], "10.0.0.2")) == (NORMAL, "GS-BETA")
+    assert admitted[0] == "GS-BETA"
+    shares = Counter(admitted[1:])
+    assert admitted[1:5] == ["GS-ALPHA", "GS-ALPHA", "GS-BETA", UNCLASSIFIED]
+    assert shares == {"GS-ALPHA": 20, "GS-BETA": 9, UNCLASSIFIED: 1}
+
+
+def test_async_mode_and_options_use_the_scheduler(telemetry):
+    args = parse_args(
+        [
+            "--fair-queuing",
+            "--queue-depth",
+            "8",
+            "--priority-apids",
+            "7",
+            "9",
+            "--priority-share",
+            "0.5",
+            "--queue-weights",
+            "GS-ALPHA=3",
+            "--overflow-policy",
+            "drop-oldest",
+        ]
+    )
+    options = BusRunOptions(
+        fair_queuing=args.fair_queuing,
+        queue_depth=args.queue_depth,
+        priority_apids=tuple(args.priority_apids),
+        priority_share=args.priority_share,
+        queue_weights=tuple(args.queue_weights),
+        overflow_policy=OverflowPolicy(args.overflow_policy),
+    )
+    scheduler = options.make_scheduler(STATIONS)
+    builder = CCSDSPacketBuilder(KEY)
+
+    async def scenario():
+        waiter = asyncio.create_task(scheduler.get())
+        await asyncio.sleep(0)
+        for index in range(10):
+            scheduler.put(datagram(builder, f"CMD: STEP {index}", "GS-ALPHA"))
+        first = await waiter
+        return first, scheduler.get_nowait_batch(100)
+
+    first, rest = asyncio.run(scenario())
+
+    assert BusRunOptions().make_scheduler(STATIONS) is None
+    assert scheduler.priority_apids == {7, 9} and scheduler.max_depth == 8
+    assert scheduler.priority_share == 0.5
+    assert b"STEP 2" in first.packet and b"STEP 9" in rest[-1].packet and len(rest) == 7
+    assert scheduler.stats.dropped == 2 and scheduler.qsize() == 0
+
+
+def test_a_spoofed_priority_flood_cannot_starve_normal_traffic():
+    builder = CCSDSPacketBuilder(KEY)
+    forger = CCSDSPacketBuilder(b"not-the-key", apid=7)
+    positions = {}
+    for share in (1.0, 0.75):
+        scheduler = AdmissionScheduler(
+            STATIONS, priority_apids=[7], max_depth=1000, priority_share=share, priority_burst=0
+        )
+        for index in range(1000):
+            scheduler.put(datagram(forger, f"CMD: FLOOD {index:04}", "GS-ALPHA", "10.9.9.9"))
+            if index % 50 == 0:
+                scheduler.put(datagram(builder, f"CMD: PING {index:04}", "GS-ALPHA"))
+        admitted = scheduler.get_nowait_batch(2000)
+        positions[share] = [
+            position
+            for position, item in enumerate(admitted)
+            if scheduler.classify(item)[0] == NORMAL
+        ]
+
+    assert positions[1.0][0] == 1000
+    assert len(positions[0.75]) == 20 and positions[0.75][-1] < 80
+    assert all(later - earlier <= 4 for earlier, later in itertools.pairwise(positions[0.75]))
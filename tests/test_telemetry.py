@@ -0,0 +1,64 @@
+import json
+import logging
+
+from satellite.satellite_bus import BusRunOptions
+from satellite.telemetry import TelemetryLogger
+
+
+def read_events(path):
+    return [json.loads(line.split(" | ", 2)[2]) for line in path.read_text().splitlines()]
+
+
+def test_background_telemetry_flushes_on_close(tmp_path):
+    path = tmp_path / "telemetry.log"
+    telemetry = TelemetryLogger(str(path), background=True, console=False)
+
+    for index in range(100):
+        telemetry.info("Command accepted", sequence=index)
+    telemetry.close()
+
+    events = read_events(path)
+    assert [event["sequence"] for event in events] == list(range(100))
+    assert all(event["message"] == "Command accepted" for event in events)
+    assert telemetry.dropped == 0
+
+
+def test_background_telemetry_counts_drops_when_queue_is_full(tmp_path):
+    path = tmp_path / "telemetry.log"
+    telemetry = TelemetryLogger(str(path), background=True, queue_size=1, console=False)
+
+    for index in range(2000):
+        telemetry.warning("Packet Decode Failure", sequence=index)
+    telemetry.close()
+
+    events = read_events(path)
+    written = [event for event in events if event["message"] == "Packet Decode Failure"]
+    notices = [event for event in events if event["message"] == "Telemetry events dropped"]
+    assert telemetry.dropped > 0
+    assert len(written) + telemetry.dropped == 2000
+    assert sum(notice["dropped"] for notice in notices) == telemetry.dropped
+
+
+def test_each_logger_keeps_its_own_path_and_console_setting(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    first = TelemetryLogger()
+    second = BusRunOptions(console_telemetry=False).make_telemetry()
+    custom = TelemetryLogger(str(tmp_path / "custom.log"), console=False)
+
+    consoles = [
+        [type(handler) for handler in telemetry.logger.handlers].count(logging.StreamHandler)
+        for telemetry in (first, second, custom)
+    ]
+    first.info("First")
+    second.info("Second")
+    custom.info("Custom")
+    for telemetry in (first, second, custom):
+        telemetry.close()
+
+    assert consoles == [1, 0, 0]
+    assert '"First"' in capsys.readouterr().err
+    assert [event["message"] for event in read_events(tmp_path / "custom.log")] == ["Custom"]
+    assert [event["message"] for event in read_events(tmp_path / "telemetry.log")] == [
+        "First",
+        "Second",
+    ]
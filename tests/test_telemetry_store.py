@@ -0,0 +1,85 @@
+import json
+import logging
+
+from cli import satcli
+from satellite.telemetry import TelemetryLogger, TelemetryStoreSink
+from telemetry_store.reader import TelemetryFilter, TelemetryStoreReader
+from telemetry_store.writer import TelemetryStoreWriter
+
+
+def fill_store(directory, count=300, **options):
+    writer = TelemetryStoreWriter(directory, stream="bus", **options)
+    for index in range(count):
+        writer.append(
+            logging.CRITICAL if index % 10 == 0 else logging.INFO,
+            1000.0 + index,
+            (
+                "CRITICAL SECURITY ALERT: Uplink Spoof Attempt Detected"
+                if index % 10 == 0
+                else "Command accepted"
+            ),
+            {"source_ip": f"10.0.0.{index % 3}", "ground_station_id": "GS-ALPHA", "seq": index},
+        )
+    writer.close()
+    return writer
+
+
+def test_segments_rotate_compress_and_read_back_in_order(tmp_path):
+    writer = fill_store(tmp_path, max_segment_bytes=4096, max_segment_seconds=100.0)
+
+    assert writer.segments > 3
+    assert not list(tmp_path.glob("*.tlm")) and len(list(tmp_path.glob("*.tlm.gz"))) == (
+        writer.segments
+    )
+    events = list(TelemetryStoreReader(tmp_path).query())
+    assert [event.context["seq"] for event in events] == list(range(300))
+    assert events[1].source_ip == "10.0.0.1" and events[1].ground_station_id == "GS-ALPHA"
+
+
+def test_query_filters_without_decoding_other_segments(tmp_path):
+    fill_store(tmp_path, max_segment_seconds=50.0)
+    reader = TelemetryStoreReader(tmp_path)
+
+    alerts = list(
+        reader.query(
+            TelemetryFilter(
+                start=1100.0,
+                end=1200.0,
+                min_level=logging.WARNING,
+                messages=("Spoof",),
+                source_ips=("10.0.0.1",),
+            )
+        )
+    )
+
+    assert [event.context["seq"] for event in alerts] == [100, 130, 160, 190]
+    assert reader.stats.segments == 6 and reader.stats.segments_skipped == 4
+    assert reader.stats.records_scanned < 150
+
+
+def test_store_sink_expands_batches_and_cli_counts_them(tmp_path, capsys):
+    store = tmp_path / "store"
+    telemetry = TelemetryLogger(
+        str(tmp_path / "telemetry.log"),
+        background=True,
+        console=False,
+        sinks=[TelemetryStoreSink(TelemetryStoreWriter(store))],
+    )
+    telemetry.warning(
+        "Firewall batch inspected",
+        packets=2,
+        events=[
+            {"level": "CRITICAL", "message": "Spoof Attempt", "source_ip": "10.9.9.9"},
+            {"level": "INFO", "message": "Command accepted", "source_ip": "10.0.0.1"},
+        ],
+    )
+    telemetry.close()
+
+    satcli.main(["telemetry", "query", str(store), "--source-ip", "10.9.9.9", "--count"])
+    summary = json.loads(capsys.readouterr().out)
+    satcli.main(["telemetry", "query", str(store), "--level", "WARNING"])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert summary["matched"] == 1 and summary["by_message"] == {"Spoof Attempt": 1}
+    assert [line["message"] for line in lines] == ["Firewall batch inspected", "Spoof Attempt"]
+    assert lines[0]["packets"] == 2 and "events" not in lines[0]
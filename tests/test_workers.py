@@ -0,0 +1,93 @@
+import os
+import signal
+import socket
+import time
+
+from ccsds.packet_builder import CCSDSPacketBuilder
+from satellite.satellite_bus import BusRunOptions, BusStats
+from satellite.workers import STAT_FIELDS, WorkerSupervisor, aggregate_stats
+
+KEY = b"workers-test-key"
+
+
+def test_aggregate_stats_splits_shared_slots_per_worker():
+    shared = [5, 4, 1, 7, 7, 0]
+
+    per_worker = aggregate_stats(shared, workers=2)
+
+    assert STAT_FIELDS == ("received", "accepted", "rejected")
+    assert per_worker == [BusStats(5, 4, 1), BusStats(7, 7, 0)]
+
+
+def wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def free_udp_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_killed_workers_are_respawned_with_backoff_and_their_stats_retired(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    endpoint = ("127.0.0.1", free_udp_port())
+    supervisor = WorkerSupervisor(
+        KEY,
+        ["GS-ALPHA"],
+        endpoint,
+        workers=1,
+        options=BusRunOptions(replay_protection=False, console_telemetry=False),
+        stats_interval=0.05,
+        restart_delay=1.0,
+        min_uptime=5.0,
+    )
+    builder = CCSDSPacketBuilder(KEY)
+    try:
+        supervisor._spawn(0, now=100.0)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            # Junk until the worker has bound the port, then one real command.
+            assert wait_for(
+                lambda: sender.sendto(b"\x00" * 8, endpoint)
+                and aggregate_stats(supervisor._shared, 1)[0].received
+            )
+            sender.sendto(builder.build("CMD: PING", "GS-ALPHA"), endpoint)
+            assert wait_for(lambda: aggregate_stats(supervisor._shared, 1)[0].accepted == 1)
+        first = supervisor._processes[0]
+        first_pid = first.pid
+
+        os.kill(first_pid, signal.SIGKILL)
+        first.join(timeout=5)
+        supervisor._restart_exited(now=101.0)
+
+        retired = supervisor.retired
+        assert retired.accepted == 1 and retired.rejected >= 1
+        assert retired.received == retired.accepted + retired.rejected
+        assert aggregate_stats(supervisor._shared, 1) == [BusStats(0, 0, 0)]
+        assert supervisor._processes[0] is None and supervisor.restarts == 0
+        supervisor._restart_exited(now=102.9)
+        assert supervisor._processes[0] is None
+        supervisor._restart_exited(now=103.0)
+        second = supervisor._processes[0]
+        assert second is not None and second.pid != first_pid and second.is_alive()
+        assert supervisor.restarts == 1
+
+        os.kill(second.pid, signal.SIGKILL)
+        second.join(timeout=5)
+        supervisor._restart_exited(now=104.0)
+        assert supervisor._restart_at[0] == 108.0
+
+        supervisor._restart_exited(now=108.0)
+        third = supervisor._processes[0]
+        os.kill(third.pid, signal.SIGKILL)
+        third.join(timeout=5)
+        supervisor._restart_exited(now=200.0)
+        assert supervisor._processes[0] is not None and supervisor.restarts == 3
+    finally:
+        supervisor._stop_all()
+
+    log = (tmp_path / "telemetry.log").read_text()
+    assert log.count("Satellite bus worker exited; restarting") == 3